@@ -0,0 +1,293 @@
+#!/usr/bin/env python3
+"""
+ODIN AI Agent System - Admission Control
+Queue limitlerine göre enqueue kabulü ve backpressure durumu.
+
+Limitler .agent/config/queue.json > queue bölümünden okunur:
+
+    maxPending     : Pending'e eklemede uygulanır (aşağıdaki politika)
+    maxInProgress  : Claim'de uygulanır (odin kick / odin run yeni task almaz)
+    maxFailed      : Sadece backpressure'da görünür
+    maxDeadLetter  : Backpressure'da görünür; shed bu limiti aşmaz
+
+Failed / dead-letter operatör incelemesi beklediğinden bu queue'lardan
+task atılmaz; dolmaları üreticilere yavaşlama sinyali olarak verilir.
+
+Pending dolduğunda davranış queue.json > admission.policy ile seçilir:
+
+    reject : Ekleme reddedilir (QueueFullError)
+    block  : Yer açılana kadar beklenir; blockTimeout aşılırsa reddedilir
+    shed   : En son çalışacak task'lar (sıra anahtarı en büyük olanlar,
+             yeni gelenler dahil) dead-letter'a atılır; dead-letter'da
+             maxDeadLetter'a kadar yer yoksa reject gibi reddedilir
+
+Backpressure seviyesi queue başına doluluk oranından hesaplanır:
+
+    ok   : Tüm queue'lar highWatermark oranının altında
+    slow : En az bir queue highWatermark'ı aştı (üreticiler yavaşlamalı)
+    full : En az bir queue limitte
+
+Sayılar store sayaçlarından (O(1)) okunur. Tekrar kontrolü (dedup), verilen
+ID'lerin çakışma kontrolü, limit kontrolü ve ekleme aynı store kilidi
+altında yapılır (JSON / SQLite: process'ler arası dosya kilidi). block
+politikasında kilit yalnızca beklerken bırakılır; kontroller her denemede
+yeniden yapılır. Daemon istemcisi işlemin tamamını daemon'a tek istek
+olarak gönderir, daemon aynı fonksiyonu kendi kilidi altında çalıştırır.
+
+Version: 1.0.0
+"""
+
+import heapq
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from scheduler import schedule_key
+
+# Queue → queue.json > queue anahtarı
+LIMIT_KEYS = {
+    "pending": "maxPending",
+    "in-progress": "maxInProgress",
+    "failed": "maxFailed",
+    "dead-letter": "maxDeadLetter",
+}
+
+POLICIES = ("reject", "block", "shed")
+PRESSURE_LEVELS = ("ok", "slow", "full")
+
+DEFAULT_POLICY = "reject"
+DEFAULT_BLOCK_TIMEOUT = 30
+DEFAULT_POLL_INTERVAL = 0.5
+DEFAULT_HIGH_WATERMARK = 0.8
+
+
+class QueueFullError(RuntimeError):
+    """Queue limiti dolu; task'lar eklenmedi"""
+
+    def __init__(self, status: str, count: int, limit: int, incoming: int):
+        self.status = status
+        self.count = count
+        self.limit = limit
+        self.incoming = incoming
+        super().__init__(f"{status} queue dolu ({count}/{limit}), {incoming} task eklenemedi")
+
+
+class AdmissionPolicy:
+    """Queue limitleri ve pending dolu olduğunda uygulanacak politika"""
+
+    def __init__(
+        self,
+        limits: Optional[Dict[str, int]] = None,
+        policy: str = DEFAULT_POLICY,
+        block_timeout: float = DEFAULT_BLOCK_TIMEOUT,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+        high_watermark: float = DEFAULT_HIGH_WATERMARK,
+    ):
+        if policy not in POLICIES:
+            raise ValueError(f"Geçersiz admission politikası: {policy} (geçerli: {', '.join(POLICIES)})")
+        if not 0 < high_watermark <= 1:
+            raise ValueError("highWatermark (0, 1] aralığında olmalı")
+        self.limits = {status: int(n) for status, n in (limits or {}).items() if n}
+        self.policy = policy
+        self.block_timeout = block_timeout
+        self.poll_interval = poll_interval
+        self.high_watermark = high_watermark
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any], policy: Optional[str] = None) -> "AdmissionPolicy":
+        queue = config.get("queue", {})
+        admission = config.get("admission", {})
+        return cls(
+            {status: queue.get(key) for status, key in LIMIT_KEYS.items()},
+            policy or admission.get("policy", DEFAULT_POLICY),
+            admission.get("blockTimeout", DEFAULT_BLOCK_TIMEOUT),
+            admission.get("pollInterval", DEFAULT_POLL_INTERVAL),
+            admission.get("highWatermark", DEFAULT_HIGH_WATERMARK),
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Daemon isteği için JSON'a yazılabilir hali (from_dict ile geri okunur)"""
+        return {
+            "limits": self.limits,
+            "policy": self.policy,
+            "block_timeout": self.block_timeout,
+            "poll_interval": self.poll_interval,
+            "high_watermark": self.high_watermark,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "AdmissionPolicy":
+        return cls(**data)
+
+    def room(self, store, status: str) -> Optional[int]:
+        """Queue'da kalan yer (limit yoksa None)"""
+        limit = self.limits.get(status)
+        if limit is None:
+            return None
+        return max(0, limit - store.count(status))
+
+
+def queue_pressure(counts: Dict[str, int], policy: AdmissionPolicy) -> Dict[str, Any]:
+    """
+    Sayılardan backpressure durumu
+
+    Returns:
+        {"level": "ok" | "slow" | "full",
+         "queues": {durum: {"count", "limit", "ratio", "state"}}}
+    """
+    queues = {}
+    level = 0
+    for status, limit in policy.limits.items():
+        count = counts.get(status, 0)
+        ratio = count / limit
+        state = 2 if count >= limit else 1 if ratio >= policy.high_watermark else 0
+        level = max(level, state)
+        queues[status] = {
+            "count": count,
+            "limit": limit,
+            "ratio": round(ratio, 4),
+            "state": PRESSURE_LEVELS[state],
+        }
+    return {"level": PRESSURE_LEVELS[level], "queues": queues}
+
+
+def backpressure(store, policy: AdmissionPolicy) -> Dict[str, Any]:
+    """Store sayaçlarından backpressure durumu"""
+    return queue_pressure(store.counts(), policy)
+
+
+def admit(
+    store,
+    tasks: List[Dict[str, Any]],
+    policy: AdmissionPolicy,
+    status: str = "pending",
+    timeout: Optional[float] = None,
+    sleep: Callable[[float], None] = time.sleep,
+    dedup=None,
+    unique_ids: Optional[Iterable[str]] = None,
+) -> Dict[str, Any]:
+    """
+    Task'ları tekrar kontrolü, limit ve politikaya göre queue'ya ekle
+
+    Toplu eklemede yeni task'ların tamamı kabul edilir ya da (reject /
+    block) hiçbiri eklenmez. Task'lar her denemede kopyalanır; sonuçtaki
+    `tasks` eklenen kopyalardır.
+
+    Args:
+        timeout: block politikası için bekleme süresi (None: blockTimeout)
+        sleep: Bekleme fonksiyonu (test / simülasyon için)
+        dedup: DedupPolicy (None: tekrar kontrolü yok)
+        unique_ids: Herhangi bir queue'da zaten varsa eklenmeyecek ID'ler
+
+    Returns:
+        {"admitted": n, "tasks": [eklenen task'lar],
+         "duplicates": [(task, queue, mevcut task)], "merged": [birleştirilenler],
+         "conflicts": {ID: queue}, "shed": [dead-letter'a atılanlar], "waited": saniye}
+
+    Raises:
+        QueueFullError: reject / block politikasında yer yoksa, shed'de
+                        dead-letter dolu ise
+    """
+    # Kilidi başka process'te olan store (daemon istemcisi): tek istek
+    remote_admit = getattr(store, "admit", None)
+    if remote_admit is not None:
+        return remote_admit(tasks, policy, status, timeout, dedup, unique_ids)
+
+    unique_ids = [str(task_id) for task_id in unique_ids or ()]
+    limit = policy.limits.get(status)
+    timeout = policy.block_timeout if timeout is None else timeout
+    deadline = time.monotonic() + (timeout if policy.policy == "block" else 0)
+    start = time.monotonic()
+    while True:
+        with store.locked():
+            batch = _prepare(store, tasks, dedup, unique_ids)
+            fresh = batch["tasks"]
+            if limit is not None and policy.policy == "shed":
+                return _admit_shed(store, batch, policy, limit, status)
+            count = store.count(status) if limit is not None else 0
+            if limit is None or count + len(fresh) <= limit:
+                _write(store, status, batch)
+                batch["waited"] = round(time.monotonic() - start, 3)
+                return batch
+        # Limitten büyük bir grup hiçbir zaman sığmaz
+        if len(fresh) > limit or time.monotonic() >= deadline:
+            raise QueueFullError(status, count, limit, len(fresh))
+        sleep(policy.poll_interval)
+
+
+def _prepare(store, tasks: List[Dict[str, Any]], dedup, unique_ids: List[str]) -> Dict[str, Any]:
+    """Kilit altında: çakışan ID'leri ve tekrarları ayıkla (store'a yazmaz)"""
+    from dedup import plan_dedup
+
+    fresh = [dict(t) for t in tasks]
+    conflicts = store.locate(unique_ids) if unique_ids else {}
+    if conflicts:
+        fresh = [t for t in fresh if str(t["id"]) not in conflicts]
+    duplicates: List[tuple] = []
+    merged: List[Dict[str, Any]] = []
+    if dedup is not None:
+        fresh, duplicates, merged = plan_dedup(store, fresh, dedup)
+    return {
+        "admitted": len(fresh),
+        "tasks": fresh,
+        "duplicates": duplicates,
+        "merged": merged,
+        "conflicts": conflicts,
+        "shed": [],
+        "waited": 0.0,
+    }
+
+
+def _write(store, status: str, batch: Dict[str, Any]) -> None:
+    """Birleştirilen tekrarları ve yeni task'ları yaz"""
+    if batch["merged"]:
+        store.append_many("pending", batch["merged"])
+    if batch["tasks"]:
+        store.append_many(status, batch["tasks"])
+
+
+def _admit_shed(store, batch: Dict[str, Any], policy: AdmissionPolicy, limit: int, status: str) -> Dict[str, Any]:
+    """
+    Yer açmak için en son çalışacak task'ları dead-letter'a at (kilit altında)
+
+    Adaylar yeni gelenler + queue'da sıra anahtarı en büyük `fazla` task'tır;
+    queue'nun geri kalanı sıralanmaz. Atılacaklar dead-letter'a sığmıyorsa
+    hiçbir şey yazılmadan reddedilir.
+    """
+    tasks = batch["tasks"]
+    count = store.count(status)
+    excess = count + len(tasks) - limit
+    if excess <= 0:
+        _write(store, status, batch)
+        return batch
+
+    def key(task: Dict[str, Any]) -> float:
+        return schedule_key(task, store.aging_interval)
+
+    incoming_ids = {id(t) for t in tasks}
+    existing = heapq.nlargest(excess, store.iter_query(status), key=key)
+    # Eşitlikte yeni gelen atılır (nlargest önce gelene öncelik verir)
+    victims = heapq.nlargest(excess, tasks + existing, key=key)
+    victim_ids = {id(t) for t in victims}
+
+    dead_letter_room = policy.room(store, "dead-letter")
+    if dead_letter_room is not None and len(victims) > dead_letter_room:
+        raise QueueFullError("dead-letter", store.count("dead-letter"), policy.limits["dead-letter"], len(tasks))
+
+    now = datetime.now().isoformat()
+    for task in victims:
+        task["status"] = "dead-letter"
+        task["reason"] = f"Shed: {status} queue dolu ({limit})"
+        task["movedAt"] = now
+
+    batch["tasks"] = [t for t in tasks if id(t) not in victim_ids]
+    batch["admitted"] = len(batch["tasks"])
+    batch["shed"] = victims
+    refused = [t for t in victims if id(t) in incoming_ids]
+    _write(store, status, batch)
+    if refused:
+        store.append_many("dead-letter", refused)
+    for task in victims:
+        if id(task) not in incoming_ids:
+            store.move(task, status, "dead-letter")
+    return batch
@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+ODIN AI Agent System - Worker Pool Autoscaler
+Worker pool'un eşzamanlılığını (aktif slot sayısı) yük altında büyütüp
+küçülten karar mekanizması.
+
+Kurallar .agent/config/queue.json > scaling bölümünden okunur:
+
+    scaleUpThreshold    : Pending derinliği bu değere ulaşınca büyü
+    scaleUpCount        : Her büyümede eklenen slot
+    scaleDownThreshold  : Slot kullanımı (yumuşatılmış) bunun altına düşünce 1 slot küçül
+    idleTimeout         : Bu kadar saniye hiç kullanılmayan slot kapatılır
+    minWorkers          : Alt sınır (üst sınır: execution.maxConcurrentTasks)
+    cooldown            : Son ölçeklemeden sonra küçülmeden önce beklenecek süre
+    evaluationInterval  : Karar aralığı (saniye)
+
+Histerezis: büyüme pending derinliğine, küçülme kullanım oranına bakar;
+kullanım üstel hareketli ortalama ile yumuşatılır. Büyüme her
+değerlendirmede yapılabilir (patlamalara hızlı tepki), küçülme ise son
+ölçeklemeden `cooldown` saniye sonra başlar. Böylece anlık dalgalanmalarda
+slot sayısı sürekli inip çıkmaz.
+
+Sınıf saat kullanmaz; zaman çağıran tarafından verilir. Aynı kod hem
+`odin run --autoscale` içinde hem de benchmark simülasyonunda çalışır.
+
+Version: 1.0.0
+"""
+
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+DEFAULT_SCALE_UP_THRESHOLD = 20
+DEFAULT_SCALE_DOWN_THRESHOLD = 0.3
+DEFAULT_SCALE_UP_COUNT = 2
+DEFAULT_IDLE_TIMEOUT = 1800
+DEFAULT_MIN_WORKERS = 1
+DEFAULT_COOLDOWN = 30
+DEFAULT_EVALUATION_INTERVAL = 5
+
+# Kullanım oranı yumuşatma katsayısı (1: yumuşatma yok)
+DEFAULT_SMOOTHING = 0.3
+
+
+class ScalingPolicy:
+    """Ölçekleme parametreleri"""
+
+    def __init__(
+        self,
+        scale_up_threshold: float = DEFAULT_SCALE_UP_THRESHOLD,
+        scale_down_threshold: float = DEFAULT_SCALE_DOWN_THRESHOLD,
+        scale_up_count: int = DEFAULT_SCALE_UP_COUNT,
+        idle_timeout: float = DEFAULT_IDLE_TIMEOUT,
+        min_workers: int = DEFAULT_MIN_WORKERS,
+        cooldown: float = DEFAULT_COOLDOWN,
+        evaluation_interval: float = DEFAULT_EVALUATION_INTERVAL,
+        smoothing: float = DEFAULT_SMOOTHING,
+    ):
+        if scale_up_count < 1 or min_workers < 1:
+            raise ValueError("scaleUpCount ve minWorkers en az 1 olmalı")
+        if not 0 < smoothing <= 1:
+            raise ValueError("smoothing (0, 1] aralığında olmalı")
+        self.scale_up_threshold = scale_up_threshold
+        self.scale_down_threshold = scale_down_threshold
+        self.scale_up_count = scale_up_count
+        self.idle_timeout = idle_timeout
+        self.min_workers = min_workers
+        self.cooldown = cooldown
+        self.evaluation_interval = evaluation_interval
+        self.smoothing = smoothing
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> "ScalingPolicy":
+        scaling = config.get("scaling", {})
+        return cls(
+            scaling.get("scaleUpThreshold", DEFAULT_SCALE_UP_THRESHOLD),
+            scaling.get("scaleDownThreshold", DEFAULT_SCALE_DOWN_THRESHOLD),
+            scaling.get("scaleUpCount", DEFAULT_SCALE_UP_COUNT),
+            scaling.get("idleTimeout", DEFAULT_IDLE_TIMEOUT),
+            scaling.get("minWorkers", DEFAULT_MIN_WORKERS),
+            scaling.get("cooldown", DEFAULT_COOLDOWN),
+            scaling.get("evaluationInterval", DEFAULT_EVALUATION_INTERVAL),
+            scaling.get("smoothing", DEFAULT_SMOOTHING),
+        )
+
+
+class Autoscaler:
+    """
+    Aktif slot hedefi (target) ve ölçekleme olayları
+
+    Slotlar sıralı kabul edilir: k. slot, aynı anda en az k task
+    çalıştığında kullanılmış sayılır. En yüksek slot `idleTimeout` boyunca
+    kullanılmadıysa kapatılır.
+    """
+
+    def __init__(self, policy: ScalingPolicy, max_slots: int, now: float = 0.0):
+        self.policy = policy
+        self.max_slots = max_slots
+        self.min_slots = min(policy.min_workers, max_slots)
+        self.target = self.min_slots
+        self.utilization = 0.0
+        self.events: List[Dict[str, Any]] = []
+
+        self._last_used = [now] * max_slots
+        self._last_eval = now
+        self._last_scale = now - policy.cooldown
+        self._capacity_seconds = 0.0
+        self._last_observe = now
+
+    def observe(self, now: float, busy: int, pending: Callable[[], int]) -> Optional[Dict[str, Any]]:
+        """
+        Pool durumunu bildir; ölçekleme olduysa olayı döndür
+
+        Args:
+            now: Saat (saniye, monoton)
+            busy: Çalışan task sayısı
+            pending: Pending derinliği (yalnızca karar anında çağrılır)
+        """
+        self._capacity_seconds += self.target * max(0.0, now - self._last_observe)
+        self._last_observe = now
+        for slot in range(min(busy, self.max_slots)):
+            self._last_used[slot] = now
+
+        if now - self._last_eval < self.policy.evaluation_interval:
+            return None
+        self._last_eval = now
+
+        sample = min(1.0, busy / self.target) if self.target else 1.0
+        alpha = self.policy.smoothing
+        self.utilization = alpha * sample + (1 - alpha) * self.utilization
+
+        depth = pending()
+
+        # Boş slot varken büyümek işe yaramaz (task'lar limit / bağımlılık bekliyor)
+        if depth >= self.policy.scale_up_threshold and busy >= self.target and self.target < self.max_slots:
+            target = min(self.max_slots, self.target + self.policy.scale_up_count)
+            return self._scale(now, "scale-up", target, depth, f"pending {depth} >= {self.policy.scale_up_threshold:g}")
+
+        cooled = now - self._last_scale >= self.policy.cooldown
+        if cooled and depth < self.policy.scale_up_threshold and self.target > self.min_slots:
+            idle = self.target
+            while idle > self.min_slots and now - self._last_used[idle - 1] >= self.policy.idle_timeout:
+                idle -= 1
+            if idle < self.target:
+                return self._scale(now, "idle-reap", idle, depth, f"{self.target - idle} slot {self.policy.idle_timeout:g}s boşta")
+
+            if self.utilization < self.policy.scale_down_threshold:
+                return self._scale(
+                    now, "scale-down", self.target - 1, depth,
+                    f"kullanım {self.utilization:.0%} < {self.policy.scale_down_threshold:.0%}",
+                )
+        return None
+
+    def _scale(self, now: float, action: str, target: int, depth: int, reason: str) -> Dict[str, Any]:
+        event = {
+            "time": datetime.now().isoformat(),
+            "clock": round(now, 3),
+            "action": action,
+            "from": self.target,
+            "to": target,
+            "pending": depth,
+            "utilization": round(self.utilization, 4),
+            "reason": reason,
+        }
+        self.target = target
+        self._last_scale = now
+        # Yeni açılan slotlar boşta sayılmaya şimdi başlar
+        for slot in range(event["from"], target):
+            self._last_used[slot] = now
+        self.events.append(event)
+        return event
+
+    def summary(self) -> Dict[str, Any]:
+        """Olay sayıları ve toplam kapasite (slot·saniye)"""
+        actions: Dict[str, int] = {}
+        for event in self.events:
+            actions[event["action"]] = actions.get(event["action"], 0) + 1
+        targets = [self.min_slots] + [event["to"] for event in self.events]
+        return {
+            "target": self.target,
+            "min": min(targets),
+            "max": max(targets),
+            "events": actions,
+            "slotSeconds": round(self._capacity_seconds, 3),
+        }
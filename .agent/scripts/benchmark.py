@@ -0,0 +1,1430 @@
+#!/usr/bin/env python3
+"""
+Odin AI Agent System - Benchmarks
+Queue ve CLI performans ölçümleri.
+
+Her benchmark geçici bir dizinde çalışır; gerçek .agent/queue dosyalarına
+dokunmaz.
+
+Version: 1.0.0
+"""
+
+import contextlib
+import heapq
+import io
+import json
+import math
+import multiprocessing
+import os
+import random
+import shlex
+import shutil
+import sqlite3
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+PROJECT_ROOT = SCRIPTS_DIR.parent.parent
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+from circuit_breaker import CircuitBreaker  # noqa: E402
+from dedup import content_hash  # noqa: E402
+from queue_store import QueueStore, create_store  # noqa: E402
+from scanner import RESULTS_FILE, update_scan  # noqa: E402
+
+
+# ============================================================================
+# YARDIMCI FONKSİYONLAR
+# ============================================================================
+
+def print_success(msg: str):
+    print(f"✅ {msg}")
+
+
+def print_error(msg: str):
+    print(f"❌ {msg}")
+
+
+def print_info(msg: str):
+    print(f"ℹ️  {msg}")
+
+
+def parse_options(args: List[str], defaults: Dict[str, Any]) -> Dict[str, Any]:
+    """--key value argümanlarını defaults tiplerine göre çözümle"""
+    options = dict(defaults)
+    i = 0
+    while i < len(args):
+        key = args[i].lstrip("-").replace("-", "_")
+        if key not in options or i + 1 >= len(args):
+            raise ValueError(f"Bilinmeyen veya eksik argüman: {args[i]}")
+        options[key] = type(defaults[key])(args[i + 1])
+        i += 2
+    return options
+
+
+# ============================================================================
+# CLAIM BENCHMARK
+# ============================================================================
+
+def _claim_worker(queue_dir: str, config: Dict[str, Any], worker_id: str, results) -> None:
+    """Queue boşalana kadar claim yap, alınan ID'leri döndür"""
+    store = create_store(Path(queue_dir), config)
+    claimed = []
+    while True:
+        task = store.claim(worker_id)
+        if task is None:
+            break
+        claimed.append(task["id"])
+    store.close()
+    results.put((worker_id, claimed))
+
+
+def cmd_claims(args):
+    """
+    Eşzamanlı claim stres testi
+
+    N task ekler, W process aynı anda queue boşalana kadar claim yapar.
+    Kaybolan veya iki kez alınan task olmadığını doğrular.
+    """
+    options = parse_options(args, {"tasks": 2000, "workers": 24, "backend": "json"})
+    config = {"storage": {"backend": options["backend"]}}
+
+    tmp_dir = Path(tempfile.mkdtemp(prefix="odin-bench-"))
+    try:
+        store = create_store(tmp_dir, config)
+        seeded = [f"t{i:06d}" for i in range(options["tasks"])]
+        for task_id in seeded:
+            store.append("pending", {"id": task_id, "description": "bench", "agent": "backend", "priority": "normal"})
+        store.close()
+
+        print_info(
+            f"{options['tasks']} task, {options['workers']} worker, backend={options['backend']}"
+        )
+
+        results = multiprocessing.Queue()
+        workers = [
+            multiprocessing.Process(
+                target=_claim_worker,
+                args=(str(tmp_dir), config, f"w{i}", results),
+            )
+            for i in range(options["workers"])
+        ]
+
+        start = time.perf_counter()
+        for worker in workers:
+            worker.start()
+        per_worker = dict(results.get() for _ in workers)
+        for worker in workers:
+            worker.join()
+        elapsed = time.perf_counter() - start
+
+        claimed = [task_id for ids in per_worker.values() for task_id in ids]
+        duplicates = len(claimed) - len(set(claimed))
+        lost = set(seeded) - set(claimed)
+
+        store = create_store(tmp_dir, config)
+        in_progress = store.count("in-progress")
+        pending = store.count("pending")
+        store.close()
+
+        print(f"   Süre:          {elapsed:.2f}s")
+        print(f"   Claim/sn:      {len(claimed) / elapsed:.0f}")
+        print(f"   Worker başına: min {min(map(len, per_worker.values()))}, "
+              f"max {max(map(len, per_worker.values()))}")
+        print(f"   Queue:         pending={pending}, in-progress={in_progress}")
+
+        if duplicates or lost or pending or in_progress != len(seeded):
+            print_error(f"Tutarsızlık: {duplicates} çift claim, {len(lost)} kayıp task")
+            return 1
+
+        print_success("Kayıp veya çift claim yok")
+        return 0
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+
+# ============================================================================
+# ENQUEUE BENCHMARK
+# ============================================================================
+
+def _enqueue_worker(queue_dir: str, config: Dict[str, Any], worker_id: str, contents: int,
+                    policy: Dict[str, Any], barrier, results) -> None:
+    """Aynı içerikleri diğer worker'larla eşzamanlı ekle, eklenenleri say"""
+    from admission import AdmissionPolicy, QueueFullError, admit
+    from dedup import DedupPolicy
+
+    store = create_store(Path(queue_dir), config)
+    admission = AdmissionPolicy.from_dict(policy)
+    dedup = DedupPolicy("reject")
+    added = full = 0
+    barrier.wait()
+    for i in range(contents):
+        task = {"id": f"{worker_id}-{i:05d}", "description": f"Görev {i}", "agent": "backend", "priority": "normal"}
+        try:
+            added += admit(store, [task], admission, dedup=dedup)["admitted"]
+        except QueueFullError:
+            full += 1
+    store.close()
+    results.put((worker_id, added, full))
+
+
+def _enqueue_drainer(queue_dir: str, config: Dict[str, Any], interval: float, stop, results) -> None:
+    """Pending'den claim yaparak yer aç; görülen en büyük pending sayısını döndür"""
+    store = create_store(Path(queue_dir), config)
+    peak = 0
+    while not stop.is_set():
+        with store.locked():
+            peak = max(peak, store.count("pending"))
+        store.claim("drainer")
+        time.sleep(interval)
+    store.close()
+    results.put(("drainer", peak, 0))
+
+
+def cmd_enqueue(args):
+    """
+    Eşzamanlı ekleme (dedup + admission) regresyon testi
+
+    W process aynı N içeriği aynı anda reject politikalı dedup ile ekler.
+    Her içerik pending + in-progress'te en fazla bir kez bulunmalı; --limit
+    verilirse (maxPending) pending limiti hiç aşmamalı. Limitte bir drainer
+    process claim yaparak yer açar (block politikası bekleyip ekler).
+    """
+    options = parse_options(args, {
+        "contents": 200, "workers": 8, "limit": 0, "policy": "reject",
+        "timeout": 10.0, "drain_interval": 0.002, "backend": "json",
+    })
+    config = {"storage": {"backend": options["backend"]}}
+    from admission import AdmissionPolicy
+
+    policy = AdmissionPolicy(
+        {"pending": options["limit"]}, options["policy"], block_timeout=options["timeout"], poll_interval=0.01,
+    ).to_dict()
+
+    tmp_dir = Path(tempfile.mkdtemp(prefix="odin-bench-"))
+    try:
+        create_store(tmp_dir, config).close()
+        print_info(
+            f"{options['contents']} içerik x {options['workers']} worker, limit={options['limit'] or 'yok'}, "
+            f"politika={options['policy']}, backend={options['backend']}"
+        )
+
+        results = multiprocessing.Queue()
+        barrier = multiprocessing.Barrier(options["workers"])
+        stop = multiprocessing.Event()
+        workers = [
+            multiprocessing.Process(
+                target=_enqueue_worker,
+                args=(str(tmp_dir), config, f"w{i}", options["contents"], policy, barrier, results),
+            )
+            for i in range(options["workers"])
+        ]
+        drainer = None
+        if options["limit"]:
+            drainer = multiprocessing.Process(
+                target=_enqueue_drainer, args=(str(tmp_dir), config, options["drain_interval"], stop, results),
+            )
+            drainer.start()
+
+        start = time.perf_counter()
+        for worker in workers:
+            worker.start()
+        outcomes = [results.get() for _ in workers]
+        for worker in workers:
+            worker.join()
+        elapsed = time.perf_counter() - start
+        peak = 0
+        if drainer is not None:
+            stop.set()
+            peak = results.get()[1]
+            drainer.join()
+
+        store = create_store(tmp_dir, config)
+        active = store.query("pending") + store.query("in-progress")
+        pending = store.count("pending")
+        store.close()
+
+        added = sum(n for _, n, _ in outcomes)
+        full = sum(n for _, _, n in outcomes)
+        hashes = [content_hash(t) for t in active]
+        duplicates = len(hashes) - len(set(hashes))
+        over_limit = options["limit"] and max(peak, pending) > options["limit"]
+
+        print(f"   Süre:          {elapsed:.2f}s")
+        print(f"   Eklenen:       {added} (içerik: {len(set(hashes))}), dolu: {full}")
+        print(f"   Queue:         pending={pending}, in-progress={len(active) - pending}")
+        if options["limit"]:
+            print(f"   En yüksek:     pending={max(peak, pending)}/{options['limit']}")
+
+        if duplicates or added != len(active) or over_limit:
+            print_error(
+                f"Tutarsızlık: {duplicates} tekrar görev, {added - len(active)} fazla ekleme"
+                + (f", pending limiti aşıldı ({max(peak, pending)}/{options['limit']})" if over_limit else "")
+            )
+            return 1
+        if not options["limit"] and added != options["contents"]:
+            print_error(f"Eksik ekleme: {added}/{options['contents']}")
+            return 1
+
+        print_success("Tekrar görev yok, pending limiti aşılmadı")
+        return 0
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+
+# ============================================================================
+# STARTUP BENCHMARK
+# ============================================================================
+
+STARTUP_COMMANDS = "status --plain,list --plain,status,list,version,--help"
+# --plain komutları typer/rich import etmez; diğerleri (özellikle --help) eder
+DEFAULT_PLAIN_BUDGET_MS = 200.0
+DEFAULT_STARTUP_BUDGET_MS = 500.0
+
+
+def _copy_project(tmp_dir: Path) -> Path:
+    """odin.py ve .agent/{scripts,config} dizinlerini geçici dizine kopyala"""
+    shutil.copy2(PROJECT_ROOT / "odin.py", tmp_dir / "odin.py")
+    for name in ("scripts", "config"):
+        shutil.copytree(
+            PROJECT_ROOT / ".agent" / name,
+            tmp_dir / ".agent" / name,
+            ignore=shutil.ignore_patterns("__pycache__"),
+        )
+    return tmp_dir / "odin.py"
+
+
+def _run_odin(odin: Path, command: str, importtime: bool = False) -> subprocess.CompletedProcess:
+    args = [sys.executable] + (["-X", "importtime"] if importtime else []) + [str(odin)] + command.split()
+    env = dict(os.environ, ODIN_NO_DAEMON="1")
+    return subprocess.run(args, capture_output=True, text=True, env=env, cwd=str(odin.parent))
+
+
+def parse_importtime(stderr: str) -> List[Dict[str, Any]]:
+    """
+    `python -X importtime` çıktısını çözümle
+
+    Returns:
+        [{"module", "self_us", "cumulative_us", "depth"}, ...]
+    """
+    entries = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        try:
+            self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+            entries.append({
+                "module": name.strip(),
+                "self_us": int(self_us),
+                "cumulative_us": int(cumulative_us),
+                "depth": (len(name) - len(name.lstrip()) - 1) // 2,
+            })
+        except ValueError:
+            continue
+    return entries
+
+
+def cmd_startup(args):
+    """
+    CLI başlangıç süresi ölçümü
+
+    Her komut için duvar saati süresini (medyan / min) ve
+    `python -X importtime` ile en pahalı üst seviye import'ları raporlar.
+    Ölçülen her komut bir bütçeye tabidir; aşılırsa 1 döner (regresyon
+    kontrolü). Yalnızca --plain komutları typer/rich import etmez, bu yüzden
+    iki ayrı bütçe vardır: --plain-budget-ms (--plain komutları) ve
+    --budget-ms (typer üzerinden giden diğer komutlar). 0 kontrolü kapatır.
+    """
+    options = parse_options(args, {
+        "runs": 10,
+        "top": 8,
+        "budget_ms": DEFAULT_STARTUP_BUDGET_MS,
+        "plain_budget_ms": DEFAULT_PLAIN_BUDGET_MS,
+        "commands": STARTUP_COMMANDS,
+    })
+    commands = [c.strip() for c in options["commands"].split(",") if c.strip()]
+
+    tmp_dir = Path(tempfile.mkdtemp(prefix="odin-bench-"))
+    try:
+        odin = _copy_project(tmp_dir)
+        print_info(f"{len(commands)} komut, {options['runs']} tekrar, python {sys.version.split()[0]}")
+
+        over_budget = []
+        failed = []
+        for command in commands:
+            profile = _run_odin(odin, command, importtime=True)
+            if profile.returncode != 0:
+                error = (profile.stderr.strip().splitlines() or ["?"])[-1]
+                print_error(f"odin {command}: çıkış kodu {profile.returncode} ({error})")
+                failed.append(command)
+                continue
+
+            timings = []
+            for _ in range(options["runs"]):
+                start = time.perf_counter()
+                _run_odin(odin, command)
+                timings.append((time.perf_counter() - start) * 1000)
+
+            median = statistics.median(timings)
+            imports = parse_importtime(profile.stderr)
+            total_import_ms = sum(e["cumulative_us"] for e in imports if e["depth"] == 0) / 1000
+
+            print(f"\n   odin {command}")
+            print(f"   Süre:     medyan {median:.1f} ms, min {min(timings):.1f} ms")
+            print(f"   Import:   {total_import_ms:.1f} ms ({len(imports)} modül)")
+            top_level = sorted(
+                (e for e in imports if e["depth"] == 0),
+                key=lambda e: e["cumulative_us"],
+                reverse=True,
+            )
+            for entry in top_level[:options["top"]]:
+                print(f"      {entry['cumulative_us'] / 1000:7.1f} ms  {entry['module']}")
+
+            budget = options["plain_budget_ms"] if "--plain" in command.split() else options["budget_ms"]
+            if budget and median > budget:
+                over_budget.append((command, median, budget))
+
+        print()
+        if over_budget:
+            for command, median, budget in over_budget:
+                print_error(f"odin {command}: {median:.1f} ms > bütçe {budget:.0f} ms")
+            return 1
+        if failed:
+            return 1
+
+        print_success("Startup ölçümü tamamlandı")
+        return 0
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+
+# ============================================================================
+# WORKER POOL BENCHMARK
+# ============================================================================
+
+# Stub agent: argv[1] süre kadar uyur, task id'si --fail-every'ye bölünüyorsa
+# çıkış kodu 1 döner
+STUB_AGENT = (
+    "import json, sys, time; task = json.loads(sys.argv[2]); time.sleep(float(sys.argv[1])); "
+    "n = int(task['id'][1:]); every = int(sys.argv[3]); sys.exit(1 if every and n % every == 0 else 0)"
+)
+
+
+def cmd_pool(args):
+    """
+    Worker pool testi (stub agent komutuyla)
+
+    Farklı agent tiplerinde N task ekler, `odin run --drain` ile aynı
+    supervisor'ı çalıştırır. Tüm task'ların bittiğini ve eşzamanlılık
+    limitlerinin hiç aşılmadığını doğrular; slot kullanımı ve bekleme
+    sürelerini raporlar.
+    """
+    from worker_pool import PoolLimits, WorkerPool
+
+    options = parse_options(args, {
+        "tasks": 60, "types": 6, "duration": 0.2, "fail_every": 0,
+        "parallel": 10, "agents": 5, "per_type": 3, "backend": "json",
+    })
+    config = {"storage": {"backend": options["backend"]}}
+    limits = PoolLimits(options["parallel"], options["agents"], options["per_type"])
+
+    tmp_dir = Path(tempfile.mkdtemp(prefix="odin-bench-"))
+    try:
+        store = create_store(tmp_dir / "queue", config)
+        now = datetime.now().isoformat()
+        store.append_many("pending", [
+            {"id": f"t{i:06d}", "description": "bench", "agent": f"agent-{i % options['types']}",
+             "priority": "normal", "created_at": now}
+            for i in range(options["tasks"])
+        ])
+
+        command = " ".join(shlex.quote(part) for part in (
+            sys.executable, "-c", STUB_AGENT, str(options["duration"]), "{task}", str(options["fail_every"]),
+        ))
+        pool = WorkerPool(store, tmp_dir, limits, command=command, poll_interval=0.05, log_dir=tmp_dir / "logs")
+
+        print_info(
+            f"{options['tasks']} task, {options['types']} agent tipi, limitler: "
+            f"{limits.max_concurrent} slot / {limits.max_agents} tip / tip başına {limits.max_per_type}"
+        )
+        summary = pool.run(drain=True)
+
+        expected_failed = sum(1 for i in range(options["tasks"]) if options["fail_every"] and i % options["fail_every"] == 0)
+        counts = store.counts()
+        # Tek slot'a düşen ideal süre: task süresi * task sayısı / efektif paralellik
+        parallelism = min(limits.max_concurrent, limits.max_agents * limits.max_per_type)
+        ideal = options["duration"] * options["tasks"] / parallelism
+        store.close()
+
+        wait = summary["wait"]
+        peak = summary["peak"]
+        print(f"   Süre:          {summary['elapsed']:.2f}s (ideal ~{ideal:.2f}s)")
+        print(f"   Task/sn:       {summary['claimed'] / summary['elapsed']:.1f}")
+        per_slot = ", ".join(f"{slot['utilization']:.0%}" for slot in summary["slots"])
+        print(f"   Kullanım:      ortalama {summary['utilization']:.0%}, slot başına {per_slot}")
+        print(f"   Bekleme:       ortalama {wait.get('mean', 0):.2f}s, p95 {wait.get('p95', 0):.2f}s, max {wait.get('max', 0):.2f}s")
+        print(f"   Tepe:          {peak['running']} task, {peak['agents']} tip, tip başına {peak['perType']}")
+        print(f"   Queue:         completed={counts['completed']}, failed={counts['failed']}, "
+              f"pending={counts['pending']}, in-progress={counts['in-progress']}")
+
+        errors = []
+        if peak["running"] > limits.max_concurrent:
+            errors.append(f"maxConcurrentTasks aşıldı ({peak['running']})")
+        if peak["agents"] > limits.max_agents:
+            errors.append(f"maxParallelAgents aşıldı ({peak['agents']})")
+        if peak["perType"] > limits.max_per_type:
+            errors.append(f"maxAgentsPerType aşıldı ({peak['perType']})")
+        if counts["pending"] or counts["in-progress"] or counts["failed"] != expected_failed:
+            errors.append("Bitmemiş veya beklenmeyen şekilde başarısız task var")
+        if errors:
+            print_error("; ".join(errors))
+            return 1
+
+        print_success("Tüm task'lar bitti, limitler aşılmadı")
+        return 0
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+
+# ============================================================================
+# AUTOSCALE SİMÜLASYONU
+# ============================================================================
+
+def _poisson(rng: random.Random, lam: float) -> int:
+    """Poisson dağılımlı sayı (Knuth; küçük lam için)"""
+    if lam <= 0:
+        return 0
+    limit, k, p = math.exp(-lam), 0, 1.0
+    while True:
+        p *= rng.random()
+        if p <= limit:
+            return k
+        k += 1
+
+
+# Saniye başına yeni task sayısı: (t, süre, rng) → n
+LOAD_PROFILES = {
+    # Sabit orta yük
+    "steady": lambda t, duration, rng: _poisson(rng, 0.6),
+    # Düşük taban yük + her 300 saniyede 60 task'lık patlama
+    "burst": lambda t, duration, rng: _poisson(rng, 0.1) + (60 if t % 300 == 10 else 0),
+    # İlk yarıda 0 → 1.5 task/sn artan, sonra azalan yük
+    "ramp": lambda t, duration, rng: _poisson(rng, 1.5 * (1 - abs(2 * t / duration - 1))),
+    # Rastgele zamanlarda 20-80 task'lık dalgalar
+    "spiky": lambda t, duration, rng: _poisson(rng, 0.05) + (rng.randint(20, 80) if rng.random() < 0.006 else 0),
+}
+
+
+def _simulate(arrivals: List[List[float]], duration: int, max_slots: int, policy) -> Dict[str, Any]:
+    """
+    Ayrık zamanlı (1 sn) pool simülasyonu
+
+    Args:
+        arrivals: Her saniye için gelen task'ların çalışma süreleri
+        policy: Sabit slot sayısı (int) veya ScalingPolicy
+    """
+    from autoscaler import Autoscaler
+
+    scaler = Autoscaler(policy, max_slots) if not isinstance(policy, int) else None
+    pending: List[Tuple[int, float]] = []   # (geliş zamanı, çalışma süresi)
+    running: List[Tuple[float, int]] = []   # heap: (bitiş zamanı, geliş zamanı)
+    latencies: List[float] = []
+    waits: List[float] = []
+    busy_seconds = 0.0
+    slot_seconds = 0.0
+    head = 0
+
+    t = 0
+    # Yük bittikten sonra queue boşalana kadar devam et (en fazla 2x süre)
+    while t < duration or ((head < len(pending) or running) and t < 2 * duration):
+        while running and running[0][0] <= t:
+            finished, arrived = heapq.heappop(running)
+            latencies.append(finished - arrived)
+        if t < duration:
+            pending.extend((t, service) for service in arrivals[t])
+
+        if scaler is not None:
+            scaler.observe(t, len(running), lambda: len(pending) - head)
+            target = scaler.target
+        else:
+            target = policy
+
+        while len(running) < target and head < len(pending):
+            arrived, service = pending[head]
+            head += 1
+            waits.append(t - arrived)
+            heapq.heappush(running, (t + service, arrived))
+
+        busy_seconds += len(running)
+        slot_seconds += target
+        t += 1
+
+    return {
+        "completed": len(latencies),
+        "makespan": t,
+        "throughput": len(latencies) / t if t else 0.0,
+        "p50": _quantile(latencies, 0.5),
+        "p95": _quantile(latencies, 0.95),
+        "wait_p95": _quantile(waits, 0.95),
+        "slot_seconds": slot_seconds,
+        "efficiency": busy_seconds / slot_seconds if slot_seconds else 0.0,
+        "events": len(scaler.events) if scaler is not None else 0,
+    }
+
+
+def _quantile(values: List[float], q: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * (len(ordered) - 1)))]
+
+
+def cmd_autoscale(args):
+    """
+    Autoscale politikalarını yük profilleri üzerinde karşılaştır
+
+    Her profil için aynı geliş / çalışma süresi dizisi (seed) tüm
+    politikalara oynatılır. Politikalar: sabit en fazla slot, sabit yarı
+    slot, queue.json > scaling kuralları ve histerezissiz aynı kurallar.
+    """
+    from autoscaler import ScalingPolicy
+
+    options = parse_options(args, {
+        "duration": 1800, "service": 8.0, "max_slots": 10, "seed": 1,
+        "idle_timeout": 120.0, "profiles": ",".join(LOAD_PROFILES),
+    })
+    profiles = [p.strip() for p in options["profiles"].split(",") if p.strip()]
+    unknown = [p for p in profiles if p not in LOAD_PROFILES]
+    if unknown:
+        raise ValueError(f"Bilinmeyen profil: {', '.join(unknown)} (mevcut: {', '.join(LOAD_PROFILES)})")
+
+    config_file = PROJECT_ROOT / ".agent" / "config" / "queue.json"
+    config = json.loads(config_file.read_text(encoding="utf-8")) if config_file.exists() else {}
+    configured = ScalingPolicy.from_config(config)
+    # Simülasyon süresi kısa olduğundan idleTimeout ayrıca verilir
+    configured.idle_timeout = options["idle_timeout"]
+    no_hysteresis = ScalingPolicy(
+        configured.scale_up_threshold, configured.scale_down_threshold, configured.scale_up_count,
+        configured.idle_timeout, configured.min_workers, cooldown=0, evaluation_interval=1, smoothing=1.0,
+    )
+    max_slots = options["max_slots"]
+    policies = [
+        ("static-max", max_slots),
+        ("static-half", max(1, max_slots // 2)),
+        ("autoscale", configured),
+        ("no-hysteresis", no_hysteresis),
+    ]
+
+    print_info(
+        f"{options['duration']}s simülasyon, ortalama çalışma {options['service']:g}s, "
+        f"en fazla {max_slots} slot, seed={options['seed']}"
+    )
+    for profile in profiles:
+        rng = random.Random(f"{options['seed']}:{profile}")
+        arrivals = [
+            [rng.expovariate(1 / options["service"]) for _ in range(LOAD_PROFILES[profile](t, options["duration"], rng))]
+            for t in range(options["duration"])
+        ]
+        total = sum(len(a) for a in arrivals)
+        print(f"\n📈 {profile} ({total} task)")
+        print(f"   {'Politika':15} {'Biten':>6} {'Task/sn':>8} {'p50 (s)':>8} {'p95 (s)':>8} "
+              f"{'Bekleme p95':>12} {'Slot·sn':>9} {'Verim':>6} {'Olay':>5}")
+        for name, policy in policies:
+            r = _simulate(arrivals, options["duration"], max_slots, policy)
+            print(f"   {name:15} {r['completed']:6} {r['throughput']:8.3f} {r['p50']:8.1f} {r['p95']:8.1f} "
+                  f"{r['wait_p95']:12.1f} {r['slot_seconds']:9.0f} {r['efficiency']:6.0%} {r['events']:5}")
+    return 0
+
+
+# ============================================================================
+# LEASE BENCHMARK
+# ============================================================================
+
+def cmd_leases(args):
+    """
+    Süresi dolan lease taraması: index'li vs tüm in-progress taraması
+
+    N in-progress task'tan E tanesinin lease'i dolmuş olarak eklenir.
+    Her tarama turunda backend'in lease index'i ile QueueStore'un tam
+    taramalı varsayılanı karşılaştırılır; sonuçların aynı olduğu ve
+    reclaim'in yalnızca dolan task'ları pending'e döndürdüğü doğrulanır.
+    """
+    options = parse_options(args, {"tasks": 20000, "expired": 50, "sweeps": 20, "backend": "json"})
+    config = {"storage": {"backend": options["backend"]}}
+
+    tmp_dir = Path(tempfile.mkdtemp(prefix="odin-bench-"))
+    try:
+        store = create_store(tmp_dir, config)
+        now = time.time()
+        expired = set(random.Random(1).sample(range(options["tasks"]), options["expired"]))
+        store.append_many("in-progress", [
+            {
+                "id": f"t{i:06d}",
+                "description": "bench",
+                "agent": "backend",
+                "status": "in-progress",
+                "claimed_by": "bench",
+                "lease_expires_at": datetime.fromtimestamp(now + (-60 if i in expired else 3600)).isoformat(),
+            }
+            for i in range(options["tasks"])
+        ])
+        print_info(f"{options['tasks']} in-progress, {options['expired']} dolmuş lease, backend={options['backend']}")
+
+        timings = {}
+        for name, sweep in (
+            ("index", lambda: store.expired_leases(now)),
+            ("tam tarama", lambda: QueueStore.expired_leases(store, now)),
+        ):
+            sweep()  # İlk turda index / cache kurulur
+            start = time.perf_counter()
+            for _ in range(options["sweeps"]):
+                found = {t["id"] for t in sweep()}
+            timings[name] = (time.perf_counter() - start) / options["sweeps"]
+            if found != {f"t{i:06d}" for i in expired}:
+                print_error(f"{name}: {len(found)} dolmuş lease bulundu, beklenen {len(expired)}")
+                return 1
+            print(f"   {name:<12} {timings[name] * 1000:8.2f} ms / tarama")
+
+        reclaimed = store.reclaim_expired(now)
+        counts = store.counts()
+        store.close()
+        print(f"   Hızlanma:     {timings['tam tarama'] / max(timings['index'], 1e-9):.0f}x")
+        print(f"   Reclaim:      pending={len(reclaimed['pending'])}, in-progress={counts['in-progress']}")
+
+        if len(reclaimed["pending"]) != len(expired) or counts["in-progress"] != options["tasks"] - len(expired):
+            print_error("Reclaim sonrası queue sayıları tutarsız")
+            return 1
+        print_success("Dolan lease'ler tam taramayla aynı, reclaim doğru")
+        return 0
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+
+def cmd_dedup(args):
+    """
+    Tekrar araması: hash index'i vs pending / in-progress taraması
+
+    N pending task'ın içinden ve dışından rastgele içeriklerle arama yapılır;
+    backend'in index'li find_duplicates'i ile QueueStore'un tam taramalı
+    varsayılanının aynı eşleşmeleri bulduğu doğrulanır.
+    """
+    options = parse_options(args, {"tasks": 20000, "lookups": 200, "backend": "json"})
+    config = {"storage": {"backend": options["backend"]}}
+
+    tmp_dir = Path(tempfile.mkdtemp(prefix="odin-bench-"))
+    try:
+        store = create_store(tmp_dir, config)
+        store.append_many("pending", [
+            {"id": f"t{i:06d}", "description": f"Görev {i}", "agent": "backend", "status": "pending"}
+            for i in range(options["tasks"])
+        ])
+        rng = random.Random(1)
+        probes = [
+            {"description": f"  GÖREV {rng.randrange(options['tasks'] * 2)} ", "agent": "Backend"}
+            for _ in range(options["lookups"])
+        ]
+        hashes = [content_hash(t) for t in probes]
+        print_info(f"{options['tasks']} pending, {options['lookups']} arama, backend={options['backend']}")
+
+        timings = {}
+        results = {}
+        for name, lookup in (
+            ("index", lambda digest: store.find_duplicates([digest])),
+            ("tam tarama", lambda digest: QueueStore.find_duplicates(store, [digest])),
+        ):
+            lookup(hashes[0])  # İlk aramada index / cache kurulur
+            runs = hashes if name == "index" else hashes[:max(1, len(hashes) // 20)]
+            start = time.perf_counter()
+            results[name] = {digest: match[1]["id"] for digest in runs for match in lookup(digest).values()}
+            timings[name] = (time.perf_counter() - start) / len(runs)
+            print(f"   {name:<12} {timings[name] * 1000:8.3f} ms / arama")
+        store.close()
+
+        print(f"   Hızlanma:     {timings['tam tarama'] / max(timings['index'], 1e-9):.0f}x")
+        print(f"   Hit:          {len(results['index'])}/{len(hashes)}")
+        sampled = results["tam tarama"]
+        if any(results["index"].get(digest) != task_id for digest, task_id in sampled.items()):
+            print_error("Index ile tam tarama farklı task'lar buldu")
+            return 1
+        if not results["index"]:
+            print_error("Hiç tekrar bulunamadı (normalizasyon hatalı)")
+            return 1
+        print_success("Index eşleşmeleri tam taramayla aynı")
+        return 0
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+
+# ============================================================================
+# CIRCUIT BREAKER BENCHMARK
+# ============================================================================
+
+def _circuit_recorder(state_file: str, config: Dict[str, Any], agents: List[str], records: int, seed: int, results) -> None:
+    """Rastgele agent'lara sonuç kaydet, kaydedilenleri say"""
+    breaker = CircuitBreaker(Path(state_file), config)
+    rng = random.Random(seed)
+    counts: Dict[str, List[int]] = {agent: [0, 0] for agent in agents}
+    for _ in range(records):
+        agent = rng.choice(agents)
+        success = rng.random() < 0.7
+        breaker.record(agent, success, rng.random())
+        counts[agent][0 if success else 1] += 1
+    results.put(counts)
+
+
+def _circuit_prober(state_file: str, config: Dict[str, Any], agent: str, token: str, barrier, results) -> None:
+    """Tüm process'lerle aynı anda probe hakkı iste"""
+    breaker = CircuitBreaker(Path(state_file), config)
+    barrier.wait()
+    results.put(breaker.acquire(agent, token))
+
+
+def cmd_circuits(args):
+    """
+    Circuit breaker: karar gecikmesi ve eşzamanlı güncelleme doğruluğu
+
+    1. blocked_agents / acquire (CLOSED) kararının süresi; jq kuruluysa
+       circuit.sh'ın yaptığı gibi jq process'i ile durum okumaya göre.
+    2. W process aynı circuits.json'a M sonuç yazar; toplam sayaçların
+       kayıpsız olduğu doğrulanır.
+    3. Bekleme süresi dolmuş OPEN circuit'e W process aynı anda probe
+       ister; halfOpenMaxCalls'tan fazlasına izin verilmediği doğrulanır.
+    """
+    options = parse_options(args, {"agents": 26, "decisions": 20000, "workers": 8, "records": 200, "probes": 2})
+    agents = [f"agent-{i:02d}" for i in range(options["agents"])]
+    # Sayaç testi sırasında circuit'ler açılıp kapanabilir; sonuçlar her durumda sayılır
+    config = {"global": {"maxFailures": 3, "resetTimeout": 60, "halfOpenMaxCalls": options["probes"]}}
+
+    tmp_dir = Path(tempfile.mkdtemp(prefix="odin-bench-"))
+    try:
+        state_file = tmp_dir / "circuits.json"
+        breaker = CircuitBreaker(state_file, config)
+        for agent in agents[::4]:
+            for _ in range(3):
+                breaker.record(agent, False, 1.0)
+        print_info(
+            f"{len(agents)} agent ({len(breaker.blocked_agents())} OPEN), "
+            f"{options['workers']} process x {options['records']} sonuç, halfOpenMaxCalls={options['probes']}"
+        )
+
+        closed = agents[1]
+        for name, decide in (
+            ("blocked_agents", breaker.blocked_agents),
+            ("allows", lambda: breaker.allows(closed)),
+            ("acquire CLOSED", lambda: breaker.acquire(closed, "t")),
+        ):
+            start = time.perf_counter()
+            for _ in range(options["decisions"]):
+                decide()
+            print(f"   {name:<15} {(time.perf_counter() - start) / options['decisions'] * 1e6:8.2f} µs / karar")
+        if shutil.which("jq"):
+            runs = 20
+            start = time.perf_counter()
+            for _ in range(runs):
+                subprocess.run(["jq", "-r", f'.circuits."{closed}".state', str(state_file)], capture_output=True, check=True)
+            print(f"   {'jq (circuit.sh)':<15} {(time.perf_counter() - start) / runs * 1e6:8.2f} µs / karar")
+
+        # Eşzamanlı sayaç güncellemeleri
+        results = multiprocessing.Queue()
+        workers = [
+            multiprocessing.Process(
+                target=_circuit_recorder,
+                args=(str(state_file), config, agents, options["records"], seed, results),
+            )
+            for seed in range(options["workers"])
+        ]
+        start = time.perf_counter()
+        for worker in workers:
+            worker.start()
+        expected: Dict[str, List[int]] = {agent: [0, 0] for agent in agents}
+        for _ in workers:
+            for agent, (ok, failed) in results.get().items():
+                expected[agent][0] += ok
+                expected[agent][1] += failed
+        for worker in workers:
+            worker.join()
+        elapsed = time.perf_counter() - start
+        total = options["workers"] * options["records"]
+        print(f"   Kayıt:          {total / elapsed:.0f} sonuç/sn ({elapsed:.2f}s)")
+
+        circuits = json.loads(state_file.read_text(encoding="utf-8"))["circuits"]
+        seeded = {agent: 3 if agent in agents[::4] else 0 for agent in agents}
+        mismatched = [
+            agent for agent in agents
+            if circuits.get(agent, {}).get("totalSuccesses", 0) != expected[agent][0]
+            or circuits.get(agent, {}).get("totalFailures", 0) != expected[agent][1] + seeded[agent]
+        ]
+        if mismatched:
+            print_error(f"Kayıp güncelleme: {', '.join(mismatched)}")
+            return 1
+        print_success(f"{total} sonucun hepsi sayaçlarda")
+
+        # HALF_OPEN probe kabulü
+        probe_agent = "probe-target"
+        breaker = CircuitBreaker(state_file, {"global": dict(config["global"], resetTimeout=0)})
+        for _ in range(3):
+            breaker.record(probe_agent, False, 1.0)
+        barrier = multiprocessing.Barrier(options["workers"])
+        probers = [
+            multiprocessing.Process(
+                target=_circuit_prober,
+                args=(str(state_file), breaker.config, probe_agent, f"p{i}", barrier, results),
+            )
+            for i in range(options["workers"])
+        ]
+        for prober in probers:
+            prober.start()
+        admitted = sum(1 for _ in probers if results.get())
+        for prober in probers:
+            prober.join()
+        print(f"   Probe:          {admitted}/{options['workers']} kabul, durum {breaker.state(probe_agent)}")
+        if admitted != min(options["probes"], options["workers"]):
+            print_error(f"HALF_OPEN {admitted} probe kabul etti (beklenen {options['probes']})")
+            return 1
+        print_success("HALF_OPEN probe sayısı halfOpenMaxCalls ile sınırlı")
+        return 0
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+
+# ============================================================================
+# SCAN BENCHMARK
+# ============================================================================
+
+def _timed_scan(root: Path, force: bool = False) -> Tuple[float, bool]:
+    start = time.perf_counter()
+    _, changed = update_scan(str(root), force=force)
+    return time.perf_counter() - start, changed
+
+
+def cmd_scan(args):
+    """
+    Artımlı proje taraması (odin update)
+
+    D dizin x F dosyalık sentetik projede tam tarama, değişmemiş ağaçta
+    artımlı tarama ve tek dosya eklendikten sonraki tarama ölçülür.
+    Artımlı sonucun tam taramayla aynı olduğu doğrulanır.
+    """
+    options = parse_options(args, {"dirs": 2000, "files": 10, "runs": 10, "budget_ms": 100.0})
+
+    tmp_dir = Path(tempfile.mkdtemp(prefix="odin-bench-"))
+    try:
+        root = tmp_dir / "project"
+        for d in range(options["dirs"]):
+            sub = root / "src" / f"pkg{d // 100:02d}" / f"mod{d:05d}"
+            sub.mkdir(parents=True)
+            for f in range(options["files"]):
+                (sub / f"file{f}.{('py', 'ts', 'md')[f % 3]}").write_text("x")
+        (root / "package.json").write_text(json.dumps({"dependencies": {"react": "18"}}))
+        total = options["dirs"] * options["files"]
+        print_info(f"{options['dirs']} dizin, {total} dosya")
+
+        elapsed, _ = _timed_scan(root, force=True)
+        print(f"   Tam tarama:        {elapsed * 1000:8.1f} ms")
+        # Yeni yazılan dizinlerin mtime'ı henüz kesinleşmedi (racy); bir tur bekle
+        time.sleep(2.1)
+        _timed_scan(root)
+
+        timings = [_timed_scan(root) for _ in range(options["runs"])]
+        unchanged = statistics.median(t for t, _ in timings)
+        print(f"   Değişiklik yok:    {unchanged * 1000:8.1f} ms (medyan, {options['runs']} tur)")
+
+        (root / "src" / "pkg00" / "mod00000" / "new.go").write_text("package main")
+        elapsed, changed = _timed_scan(root)
+        incremental = json.loads((root / RESULTS_FILE).read_text(encoding="utf-8"))
+        print(f"   Tek dosya eklendi: {elapsed * 1000:8.1f} ms (yeniden yazıldı: {changed})")
+
+        _timed_scan(root, force=True)
+        full = json.loads((root / RESULTS_FILE).read_text(encoding="utf-8"))
+        incremental.pop("scan_date")
+        full.pop("scan_date")
+
+        if any(changed for _, changed in timings):
+            print_error("Değişmeyen projede çıktılar yeniden yazıldı")
+            return 1
+        if not changed or incremental != full:
+            print_error("Artımlı tarama tam taramadan farklı sonuç verdi")
+            return 1
+        print_success("Artımlı sonuç tam taramayla aynı")
+        if options["budget_ms"] and unchanged * 1000 > options["budget_ms"]:
+            print_error(f"Değişmeyen proje taraması bütçeyi aştı ({options['budget_ms']:g} ms)")
+            return 1
+        return 0
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+
+# ============================================================================
+# VECTOR SEARCH BENCHMARK
+# ============================================================================
+
+def _fill_vector_db(db_path: Path, count: int, dim: int, rng, sample=None) -> None:
+    """Sentetik completed task'lar; embedding'ler sample(n) ile (varsayılan: rastgele)"""
+    sample = sample or (lambda n: rng.standard_normal((n, dim), dtype="float32"))
+    conn = sqlite3.connect(db_path)
+    payload = json.dumps({"requirements": ["Node.js", "Express"], "context": {"route": "/login"}})
+    for start in range(0, count, 10000):
+        vectors = sample(min(10000, count - start)).astype("float32")
+        conn.executemany(
+            "INSERT INTO tasks (id, description, agent, type, status, payload_json, result_json, "
+            "metadata_json, embedding) VALUES (?, ?, 'backend', 'feature', 'completed', ?, '{}', '{}', ?)",
+            ((f"t{start + i:07d}", f"Görev {start + i}", payload, vector.tobytes()) for i, vector in enumerate(vectors)),
+        )
+    conn.commit()
+    conn.close()
+
+
+def _legacy_search(memory, query, top_k: int, limit: int) -> List[str]:
+    """Eski arama: satır başına frombuffer + cosine, tüm JSON'lar çözülür"""
+    import numpy as np
+
+    conn = sqlite3.connect(memory.db_path)
+    rows = conn.execute(
+        "SELECT id, description, agent, type, status, priority, created_at, completed_at, payload_json, "
+        "result_json, metadata_json, embedding FROM tasks WHERE status IN (?) LIMIT ?",
+        ("completed", limit),
+    ).fetchall()
+    conn.close()
+    results = []
+    for row in rows:
+        similarity = memory._cosine_similarity(query, np.frombuffer(row[11], dtype=np.float32))
+        results.append({
+            "id": row[0],
+            "similarity": float(similarity),
+            "payload": json.loads(row[8]),
+            "result": json.loads(row[9]),
+            "metadata": json.loads(row[10]),
+        })
+    results.sort(key=lambda x: x["similarity"], reverse=True)
+    return [r["id"] for r in results[:top_k]]
+
+
+def _drop_page_cache(paths: List[Path]) -> bool:
+    """Dosyaları işletim sistemi sayfa önbelleğinden çıkar (Linux; yoksa False)"""
+    if not hasattr(os, "posix_fadvise"):
+        return False
+    for path in paths:
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        finally:
+            os.close(fd)
+    return True
+
+
+def cmd_vectors(args):
+    """
+    Vector memory araması: memory-mapped matris + argpartition vs satır döngüsü
+
+    Her boyut için rastgele embedding'li bir DB oluşturulur; matris ilk
+    aramada BLOB'lardan kurulur (kurulum). Soğuk arama yeni bir VectorMemory
+    ile, DB ve matris sayfa önbelleğinden çıkarıldıktan sonra ölçülür. Eski
+    döngü en fazla --baseline-max satırda ölçülür, daha büyük boyutlar için
+    süresi doğrusal olarak tahmin edilir (~). Ölçülen boyutlarda iki
+    yöntemin aynı top_k'yı bulduğu doğrulanır.
+    """
+    options = parse_options(args, {
+        "sizes": "10000,100000,1000000", "dim": 384, "queries": 20, "top_k": 5, "baseline_max": 100000,
+    })
+    try:
+        import numpy as np
+        from vector_memory import VectorMemory
+    except ImportError as e:
+        print_error(f"numpy gerekli: {e}")
+        return 1
+
+    sizes = [int(size) for size in options["sizes"].split(",") if size.strip()]
+    rng = np.random.default_rng(1)
+    queries = rng.standard_normal((options["queries"], options["dim"]), dtype="float32")
+    print_info(f"boyut={options['dim']}, {options['queries']} sorgu, top_k={options['top_k']}")
+    print(f"   {'vektör':>9} {'kurulum':>11} {'soğuk':>11} {'sıcak':>11} {'eski döngü':>13} {'hızlanma':>9}")
+
+    mismatches = 0
+    cold_cache = True
+    for size in sizes:
+        tmp_dir = Path(tempfile.mkdtemp(prefix="odin-bench-"))
+        try:
+            memory = VectorMemory(str(tmp_dir / "vector-memory.db"), model_name=None)
+            _fill_vector_db(memory.db_path, size, options["dim"], rng)
+
+            start = time.perf_counter()
+            memory.search_embedding(queries[0], top_k=options["top_k"])
+            setup = time.perf_counter() - start
+
+            cold_cache = _drop_page_cache([memory.db_path, memory.vectors_path])
+            start = time.perf_counter()
+            VectorMemory(str(memory.db_path), model_name=None).search_embedding(queries[0], top_k=options["top_k"])
+            cold = time.perf_counter() - start
+
+            timings = []
+            for query in queries:
+                start = time.perf_counter()
+                found = memory.search_embedding(query, top_k=options["top_k"])
+                timings.append(time.perf_counter() - start)
+            matrix = statistics.median(timings)
+
+            limit = min(size, options["baseline_max"])
+            start = time.perf_counter()
+            legacy = _legacy_search(memory, queries[-1], options["top_k"], limit)
+            loop = (time.perf_counter() - start) * size / limit
+            if limit == size and legacy != [r["id"] for r in found]:
+                mismatches += 1
+
+            estimate = "~" if limit < size else " "
+            print(
+                f"   {size:>9} {setup * 1000:8.1f} ms {cold * 1000:8.1f} ms {matrix * 1000:8.1f} ms "
+                f"{estimate}{loop * 1000:9.1f} ms {loop / matrix:8.0f}x"
+            )
+        finally:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    if not cold_cache:
+        print_info("posix_fadvise yok: soğuk arama sayfa önbelleği boşaltılmadan ölçüldü")
+    if mismatches:
+        print_error(f"{mismatches} boyutta matris araması eski döngüden farklı sonuç verdi")
+        return 1
+    print_success("Matris araması eski döngüyle aynı top_k'yı buldu")
+    return 0
+
+
+class _HashEncoder:
+    """Model yerine metin hash'inden deterministik vektör (yazma yolunu ölçmek için)"""
+
+    def __init__(self, dim: int):
+        self.dim = dim
+        self.encoded = 0
+
+    def encode(self, texts, batch_size: int = 32, convert_to_numpy: bool = True, show_progress_bar: bool = False):
+        import zlib
+
+        import numpy as np
+
+        single = isinstance(texts, str)
+        self.encoded += 1 if single else len(texts)
+        vectors = np.stack([
+            np.random.default_rng(zlib.crc32(text.encode("utf-8"))).standard_normal(self.dim, dtype="float32")
+            for text in ([texts] if single else texts)
+        ])
+        return vectors[0] if single else vectors
+
+
+def cmd_backfill(args):
+    """
+    Vector memory toplu indeksleme: add_tasks (batch encode + tek transaction)
+    vs task başına add_task
+
+    --model verilmezse embedding'ler hash'ten üretilir (sentence-transformers
+    gerekmez, yazma yolu ölçülür); verilirse gerçek model kullanılır. Task
+    başına yol en fazla --baseline task'ta ölçülür, süresi doğrusal olarak
+    tahmin edilir (~).
+    """
+    options = parse_options(args, {
+        "tasks": 100000, "baseline": 1000, "batch_size": 64, "processes": 0, "model": "", "dim": 384,
+    })
+    try:
+        from vector_memory import VectorMemory
+    except ImportError as e:
+        print_error(f"numpy gerekli: {e}")
+        return 1
+
+    tasks = _synthetic_tasks(options["tasks"])
+
+    def open_memory(db_path: Path):
+        if options["model"]:
+            return VectorMemory(str(db_path), model_name=options["model"])
+        memory = VectorMemory(str(db_path), model_name=None)
+        memory.model = _HashEncoder(options["dim"])
+        return memory
+
+    tmp_dir = Path(tempfile.mkdtemp(prefix="odin-bench-"))
+    try:
+        encoder = options["model"] or f"hash (boyut={options['dim']})"
+        print_info(f"{len(tasks)} task, encoder={encoder}, batch={options['batch_size']}")
+
+        memory = open_memory(tmp_dir / "batched.db")
+        if memory.model is None:
+            print_error(f"Model yüklenemedi: {options['model']}")
+            return 1
+        start = time.perf_counter()
+        success, fail = memory.add_tasks(tasks, batch_size=options["batch_size"], processes=options["processes"])
+        batched = time.perf_counter() - start
+        timings = memory.last_timings
+
+        single = open_memory(tmp_dir / "single.db")
+        limit = min(len(tasks), options["baseline"])
+        start = time.perf_counter()
+        for task in tasks[:limit]:
+            single.add_task(task)
+        per_task = (time.perf_counter() - start) * len(tasks) / limit
+
+        estimate = "~" if limit < len(tasks) else ""
+        print(f"   add_tasks:  {batched:8.2f} sn (encode {timings['encode']:.2f} sn, yazma {timings['write']:.2f} sn)")
+        print(f"   add_task:   {estimate}{per_task:8.2f} sn ({per_task / len(tasks) * 1000:.2f} ms / task)")
+        print(f"   Hızlanma:   {per_task / batched:.0f}x")
+
+        if (success, fail) != (len(tasks), 0) or memory.get_stats()["vector_rows"] != len(tasks):
+            print_error(f"Eksik indeksleme: {success} başarılı, {fail} başarısız")
+            return 1
+        print_success(f"{success} task tek transaction'da yazıldı")
+        return 0
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+
+def _synthetic_tasks(count: int) -> List[Dict[str, Any]]:
+    """Vector memory benchmark'ları için completed task'lar"""
+    return [
+        {
+            "id": f"t{i:07d}", "description": f"Görev {i}: endpoint {i % 97} için doğrulama ekle",
+            "agent": ("backend", "frontend", "security")[i % 3], "type": "feature", "status": "completed",
+            "payload": {"requirements": ["Node.js", "Express"], "context": {"route": f"/api/{i % 50}"}},
+        }
+        for i in range(count)
+    ]
+
+
+def cmd_reindex(args):
+    """
+    Artımlı yeniden indeksleme (index_completed_tasks)
+
+    İlk indekslemeden sonra değişmemiş queue ve --churn oranında task'ı
+    değişmiş / silinmiş / yeni queue yeniden indekslenir. Sadece yeni ve
+    metni değişen task'ların encode edildiği, silinenlerin DB'den
+    kalktığı doğrulanır. Encoder: hash (bkz. backfill).
+    """
+    options = parse_options(args, {"tasks": 50000, "churn": 0.01, "dim": 384, "budget_ms": 0.0})
+    try:
+        from vector_memory import VectorMemory
+    except ImportError as e:
+        print_error(f"numpy gerekli: {e}")
+        return 1
+
+    tmp_dir = Path(tempfile.mkdtemp(prefix="odin-bench-"))
+    try:
+        memory = VectorMemory(str(tmp_dir / "vector-memory.db"), model_name=None)
+        memory.model = encoder = _HashEncoder(options["dim"])
+        queue_file = tmp_dir / "tasks-completed.json"
+        tasks = _synthetic_tasks(options["tasks"])
+
+        def reindex():
+            queue_file.write_text(json.dumps({"tasks": tasks}, ensure_ascii=False), encoding="utf-8")
+            encoder.encoded = 0
+            start = time.perf_counter()
+            with contextlib.redirect_stdout(io.StringIO()):
+                memory.index_completed_tasks(str(queue_file))
+            return time.perf_counter() - start, encoder.encoded
+
+        print_info(f"{len(tasks)} task, değişim oranı {options['churn']:g}")
+        full, full_encoded = reindex()
+        print(f"   İlk indeksleme:    {full:8.2f} sn ({full_encoded} encode)")
+
+        unchanged, unchanged_encoded = reindex()
+        print(f"   Değişiklik yok:    {unchanged:8.2f} sn ({unchanged_encoded} encode)")
+
+        n = max(1, int(len(tasks) * options["churn"]))
+        for task in tasks[:n]:
+            task["description"] += " (güncellendi)"
+        for task in tasks[n:2 * n]:
+            task["status"] = "failed"  # Embedding metni aynı: encode edilmez
+        removed = {task["id"] for task in tasks[-n:]}
+        tasks = tasks[:-n] + [dict(task, id=f"new{i:07d}") for i, task in enumerate(_synthetic_tasks(n))]
+        churned, churned_encoded = reindex()
+        print(f"   Değişim sonrası:   {churned:8.2f} sn ({churned_encoded} encode, {n} silindi)")
+
+        stats = memory.get_stats()
+        if unchanged_encoded or churned_encoded != 2 * n:
+            print_error(f"Beklenmeyen encode sayısı: {unchanged_encoded} / {churned_encoded} (beklenen 0 / {2 * n})")
+            return 1
+        if stats["total_tasks"] != len(tasks) or stats["vector_rows"] != len(tasks):
+            print_error(f"DB queue ile eşit değil: {stats['total_tasks']} task, {len(tasks)} beklenen")
+            return 1
+        if stats["by_status"].get("failed") != n or removed & {r["id"] for r in memory.search_embedding(
+                encoder.encode(tasks[0]["description"]), top_k=len(tasks), min_similarity=-1, statuses=None)}:
+            print_error("Durum güncellemesi veya silme eksik")
+            return 1
+        print_success("Sadece yeni / değişen task'lar encode edildi, silinenler kaldırıldı")
+        if options["budget_ms"] and unchanged * 1000 > options["budget_ms"]:
+            print_error(f"Değişmeyen queue indekslemesi bütçeyi aştı ({options['budget_ms']:g} ms)")
+            return 1
+        return 0
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+
+def cmd_ann(args):
+    """
+    IVF (ANN) index'i: nprobe başına recall@k ve gecikme, tam aramaya karşı
+
+    Embedding'ler --clusters merkezli bir karışımdan üretilir (gerçek
+    embedding'ler gibi kümelenir; --spread küme genişliği). Sorgular aynı
+    karışımdan, DB'de olmayan noktalardır. recall@k: IVF sonuçlarının tam
+    aramanın top_k'sı içindeki oranı.
+    """
+    options = parse_options(args, {
+        "size": 100000, "dim": 384, "clusters": 1000, "spread": 1.0, "queries": 100, "top_k": 10,
+        "nlist": 0, "nprobes": "1,2,4,8,16,32,64",
+    })
+    try:
+        import numpy as np
+        from vector_memory import VectorMemory
+    except ImportError as e:
+        print_error(f"numpy gerekli: {e}")
+        return 1
+
+    rng = np.random.default_rng(1)
+    centers = rng.standard_normal((options["clusters"], options["dim"]), dtype="float32")
+
+    def sample(n):
+        noise = rng.standard_normal((n, options["dim"]), dtype="float32") * options["spread"]
+        return centers[rng.integers(0, len(centers), n)] + noise
+
+    tmp_dir = Path(tempfile.mkdtemp(prefix="odin-bench-"))
+    try:
+        memory = VectorMemory(str(tmp_dir / "vector-memory.db"), model_name=None)
+        _fill_vector_db(memory.db_path, options["size"], options["dim"], rng, sample)
+        queries = sample(options["queries"])
+        top_k = options["top_k"]
+
+        def run(nprobe):
+            timings, found = [], []
+            for query in queries:
+                start = time.perf_counter()
+                found.append({r["id"] for r in memory.search_embedding(query, top_k=top_k, nprobe=nprobe)})
+                timings.append(time.perf_counter() - start)
+            return statistics.median(timings), found
+
+        memory.search_embedding(queries[0], nprobe=0)  # Matris kurulumu
+        exact_time, exact = run(0)
+
+        start = time.perf_counter()
+        nlist = memory.build_index(options["nlist"] or None)
+        print_info(
+            f"{options['size']} vektör, boyut={options['dim']}, {options['clusters']} küme, "
+            f"nlist={nlist} (kurulum {time.perf_counter() - start:.1f} sn), top_k={top_k}"
+        )
+        print(f"   {'nprobe':>7} {'recall@' + str(top_k):>10} {'gecikme':>11} {'hızlanma':>9}")
+        print(f"   {'tam':>7} {1:10.3f} {exact_time * 1000:8.2f} ms {1:8.1f}x")
+
+        for nprobe in [int(n) for n in options["nprobes"].split(",") if n.strip()]:
+            elapsed, found = run(nprobe)
+            hits = sum(len(a & e) for a, e in zip(found, exact))
+            recall = hits / max(1, sum(len(e) for e in exact))
+            print(f"   {nprobe:>7} {recall:10.3f} {elapsed * 1000:8.2f} ms {exact_time / elapsed:8.1f}x")
+        return 0
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+
+# ============================================================================
+# CLI
+# ============================================================================
+
+def print_help():
+    """Yardım menüsü"""
+    print("""
+Odin AI Agent System - Benchmarks
+
+Kullanım:
+  python benchmark.py <command> [--option value ...]
+
+Komutlar:
+  claims    Eşzamanlı claim stres testi
+            --tasks 2000 --workers 24 --backend json|sqlite
+  enqueue   Eşzamanlı ekleme: dedup + maxPending tek kilit altında mı
+            --contents 200 --workers 8 --limit 0 --policy reject|block|shed
+            --timeout 10 --drain-interval 0.002 --backend json|sqlite
+  startup   CLI başlangıç süresi (duvar saati + python -X importtime)
+            --runs 10 --top 8 --budget-ms 500 --plain-budget-ms 200 (0: kontrol yok)
+            --commands "status --plain,list --plain,status,list,version,--help"
+  pool      Worker pool testi (stub agent, limit ve kullanım kontrolü)
+            --tasks 60 --types 6 --duration 0.2 --fail-every 0
+            --parallel 10 --agents 5 --per-type 3 --backend json|sqlite
+  autoscale Autoscale politikalarının yük profilleri üzerinde simülasyonu
+            --duration 1800 --service 8 --max-slots 10 --seed 1
+            --idle-timeout 120 --profiles steady,burst,ramp,spiky
+  leases    Süresi dolan lease taraması (index vs tam tarama) ve reclaim
+            --tasks 20000 --expired 50 --sweeps 20 --backend json|sqlite
+  dedup     Tekrar araması (hash index vs tam tarama)
+            --tasks 20000 --lookups 200 --backend json|sqlite
+  circuits  Circuit breaker karar süresi, eşzamanlı kayıt ve probe doğruluğu
+            --agents 26 --decisions 20000 --workers 8 --records 200 --probes 2
+  scan      Artımlı proje taraması (tam / değişmemiş / tek dosya değişmiş)
+            --dirs 2000 --files 10 --runs 10 --budget-ms 100
+  vectors   Vector memory araması (kurulum / soğuk / sıcak vs satır döngüsü)
+            --sizes 10000,100000,1000000 --dim 384 --queries 20 --top-k 5
+            --baseline-max 100000
+  backfill  Toplu indeksleme (add_tasks: batch encode + tek transaction vs add_task)
+            --tasks 100000 --baseline 1000 --batch-size 64 --processes 0
+            --model "" (hash encoder) --dim 384
+  reindex   Artımlı yeniden indeksleme (değişmemiş / %churn değişmiş queue)
+            --tasks 50000 --churn 0.01 --dim 384 --budget-ms 0
+  ann       IVF index'i: nprobe başına recall@k ve gecikme (tam aramaya karşı)
+            --size 100000 --dim 384 --clusters 1000 --spread 1.0 --queries 100
+            --top-k 10 --nlist 0 (√size) --nprobes 1,2,4,8,16,32,64
+  help      Bu yardım menüsü
+
+Örnekler:
+  python benchmark.py claims
+  python benchmark.py claims --workers 48 --backend sqlite
+  python benchmark.py enqueue --limit 20 --policy block --backend sqlite
+  python benchmark.py startup --plain-budget-ms 150 --budget-ms 400
+  python benchmark.py pool --tasks 200 --duration 0.05 --fail-every 7
+  python benchmark.py autoscale --profiles burst,spiky
+  python benchmark.py leases --backend sqlite
+  python benchmark.py dedup --backend sqlite
+  python benchmark.py circuits --workers 16
+  python benchmark.py scan --dirs 10000
+  python benchmark.py vectors --sizes 10000,100000
+  python benchmark.py backfill --model all-MiniLM-L6-v2 --tasks 10000
+  python benchmark.py reindex --tasks 50000 --budget-ms 5000
+  python benchmark.py ann --size 1000000 --nprobes 8,16,32
+    """)
+    return 0
+
+
+def main():
+    """Ana entry point"""
+    if len(sys.argv) < 2:
+        print_help()
+        return 1
+
+    command = sys.argv[1]
+    args = sys.argv[2:]
+
+    commands = {
+        'claims': cmd_claims,
+        'enqueue': cmd_enqueue,
+        'startup': cmd_startup,
+        'pool': cmd_pool,
+        'autoscale': cmd_autoscale,
+        'leases': cmd_leases,
+        'dedup': cmd_dedup,
+        'circuits': cmd_circuits,
+        'scan': cmd_scan,
+        'vectors': cmd_vectors,
+        'backfill': cmd_backfill,
+        'reindex': cmd_reindex,
+        'ann': cmd_ann,
+        'help': lambda _args: print_help(),
+    }
+
+    if command not in commands:
+        print_error(f"Bilinmeyen komut: {command}")
+        print_help()
+        return 1
+
+    try:
+        return commands[command](args)
+    except ValueError as e:
+        print_error(str(e))
+        return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
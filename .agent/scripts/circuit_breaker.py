@@ -0,0 +1,592 @@
+#!/usr/bin/env python3
+"""
+ODIN AI Agent System - Circuit Breaker
+Agent circuit'leri: durum okuma önbelleği ve karar motoru.
+
+Durum .agent/state/circuits.json'da, eşikler .agent/config/circuit-breaker.json'da
+tutulur (global + thresholds.agents.<agent> ile agent bazında override).
+
+circuits.json process içinde önbelleğe alınır; her okumada yalnızca
+dosyanın (mtime, boyut, inode) imzasına bakılır, değiştiyse yeniden
+parse edilir. Yazmalar (CircuitBreaker ve circuit.sh) tmp + rename ile
+yapıldığından her yazma yeni bir inode üretir; aynı mtime tick'inde yapılan
+yazmalar da yakalanır.
+
+    get_all_circuits(path)        # agent → circuit kaydı (tek okuma)
+    get_circuit_state(agent, path)
+    get_open_agents(path)
+
+Aynı dosya için tüm çağıranlar (odin CLI, worker pool, daemon) aynı
+önbelleği paylaşır. Dönen kayıtlar salt okunurdur.
+
+CircuitBreaker (worker pool ve odin kick process içinde kullanır):
+
+    CLOSED ──(ardışık hata >= maxFailures
+    │         veya pencere hata / yavaş çağrı oranı eşiği aştı)──► OPEN
+    │                                                              │
+    │                                        nextRetryTime geçti   │
+    │                                                              ▼
+    └──(successThreshold başarılı probe)── HALF_OPEN ◄── acquire (probe)
+                                               │
+                                               └──(probe hata)──► OPEN
+
+    blocked_agents()     # şu an task verilemeyen agent'lar (kilitsiz, önbellekten)
+    acquire(agent, token)  # task başlamadan önce; HALF_OPEN'da probe hakkı ayırır
+    record(agent, ok, duration, token)  # sonuç
+    release(agent, token)  # sonuç yazılmadan bırakılan probe
+
+Kayan pencere `window` saniyedir ve `windowBuckets` dilime bölünür; her
+dilim [başlangıç, çağrı, hata, yavaş, toplam süre] tutar. Pencere oranları
+en az `minimumCalls` çağrı varsa değerlendirilir; `slowCallDuration` (s)
+üzerindeki çağrılar yavaş sayılır (0: kapalı).
+
+HALF_OPEN'da aynı anda en fazla halfOpenMaxCalls probe çalışır; probe
+`timeout` saniye içinde sonuç bildirmezse hakkı düşer. Güncellemeler
+circuits.lock altında oku-değiştir-yaz ile yapılır; eşzamanlı worker'lar
+birbirinin sayaçlarını ezmez. CLOSED circuit için acquire kilit almaz.
+
+Version: 1.1.0
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Set, Tuple
+
+CIRCUIT_STATES = ("CLOSED", "OPEN", "HALF_OPEN")
+DEFAULT_STATE = "CLOSED"
+
+# Proje köküne göre
+CIRCUITS_FILE = Path(".agent") / "state" / "circuits.json"
+CONFIG_FILE = Path(".agent") / "config" / "circuit-breaker.json"
+
+DEFAULT_MAX_FAILURES = 3
+DEFAULT_TIMEOUT = 300
+DEFAULT_RESET_TIMEOUT = 60
+DEFAULT_HALF_OPEN_MAX_CALLS = 1
+DEFAULT_SUCCESS_THRESHOLD = 1
+DEFAULT_WINDOW = 600
+DEFAULT_WINDOW_BUCKETS = 10
+DEFAULT_FAILURE_RATE = 0.5
+DEFAULT_MINIMUM_CALLS = 10
+DEFAULT_SLOW_CALL_RATE = 0.8
+
+# Circuit'i olmayan (yönlendirilmemiş) task'lar
+EXEMPT_AGENTS = frozenset({"auto"})
+
+# Dilim alanları: [başlangıç, çağrı, hata, yavaş, toplam süre]
+_START, _CALLS, _FAILURES, _SLOW, _LATENCY = range(5)
+
+
+class CircuitStateCache:
+    """circuits.json'un bellekteki kopyası (dosya değişince yeniden okunur)"""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._stat_path = str(self.path)
+        self._lock = threading.Lock()
+        self._signature: Optional[Tuple[int, int, int]] = None
+        self._circuits: Dict[str, Dict[str, Any]] = {}
+        self._states: Dict[str, str] = {}
+        self._open: FrozenSet[str] = frozenset()
+        self.reloads = 0
+
+    def _refresh(self) -> None:
+        try:
+            st = os.stat(self._stat_path)
+        except FileNotFoundError:
+            signature = None
+        else:
+            signature = (st.st_mtime_ns, st.st_size, st.st_ino)
+        if signature == self._signature:
+            return
+
+        with self._lock:
+            if signature == self._signature:
+                return
+            circuits: Dict[str, Dict[str, Any]] = {}
+            if signature is not None:
+                try:
+                    data = json.loads(self.path.read_text(encoding="utf-8"))
+                except (OSError, ValueError):
+                    # Yarım yazılmış dosya: son geçerli durum kullanılır,
+                    # bir sonraki okumada tekrar denenir
+                    return
+                circuits = data.get("circuits", {}) if isinstance(data, dict) else {}
+            self._circuits = circuits
+            self._states = {
+                agent: circuit.get("state", DEFAULT_STATE)
+                for agent, circuit in circuits.items()
+                if isinstance(circuit, dict)
+            }
+            self._open = frozenset(agent for agent, state in self._states.items() if state == "OPEN")
+            self._signature = signature
+            self.reloads += 1
+
+    def circuits(self) -> Dict[str, Dict[str, Any]]:
+        """Tüm circuit kayıtları (agent → kayıt)"""
+        self._refresh()
+        return self._circuits
+
+    def state(self, agent: str) -> str:
+        """Agent'ın circuit durumu (kaydı yoksa CLOSED)"""
+        self._refresh()
+        return self._states.get(agent, DEFAULT_STATE)
+
+    def open_agents(self) -> FrozenSet[str]:
+        """Circuit'i OPEN olan agent'lar"""
+        self._refresh()
+        return self._open
+
+
+# Yol metni → önbellek (aynı dosyaya farklı yazılmış yollar tek önbelleği paylaşır)
+_caches: Dict[str, CircuitStateCache] = {}
+_caches_lock = threading.Lock()
+
+
+def state_cache(path: Path) -> CircuitStateCache:
+    """Dosya için paylaşılan önbellek"""
+    cache = _caches.get(str(path))
+    if cache is None:
+        absolute = Path(path).absolute()
+        with _caches_lock:
+            shared = next((c for c in _caches.values() if c.path == absolute), None) or CircuitStateCache(absolute)
+            cache = _caches.setdefault(str(path), shared)
+    return cache
+
+
+def get_all_circuits(path: Path) -> Dict[str, Dict[str, Any]]:
+    """Tüm agent circuit kayıtları (dosya değişmediyse bellekten)"""
+    return state_cache(path).circuits()
+
+
+def get_circuit_state(agent: str, path: Path) -> str:
+    """Agent'ın circuit durumu: CLOSED, OPEN veya HALF_OPEN"""
+    return state_cache(path).state(agent)
+
+
+def get_open_agents(path: Path) -> List[str]:
+    """Circuit'i OPEN olan agent tipleri"""
+    return sorted(state_cache(path).open_agents())
+
+
+# ============================================================================
+# KARAR MOTORU
+# ============================================================================
+
+def _iso(ts: float) -> str:
+    return datetime.fromtimestamp(ts, timezone.utc).isoformat(timespec="milliseconds").replace("+00:00", "Z")
+
+
+def _epoch(value: Any) -> float:
+    from scheduler import parse_timestamp
+
+    return parse_timestamp(value)
+
+
+class CircuitPolicy:
+    """Bir agent'ın circuit eşikleri"""
+
+    def __init__(
+        self,
+        enabled: bool = True,
+        max_failures: int = DEFAULT_MAX_FAILURES,
+        timeout: float = DEFAULT_TIMEOUT,
+        reset_timeout: float = DEFAULT_RESET_TIMEOUT,
+        half_open_max_calls: int = DEFAULT_HALF_OPEN_MAX_CALLS,
+        success_threshold: int = DEFAULT_SUCCESS_THRESHOLD,
+        window: float = DEFAULT_WINDOW,
+        window_buckets: int = DEFAULT_WINDOW_BUCKETS,
+        failure_rate: float = DEFAULT_FAILURE_RATE,
+        minimum_calls: int = DEFAULT_MINIMUM_CALLS,
+        slow_call_duration: float = 0,
+        slow_call_rate: float = DEFAULT_SLOW_CALL_RATE,
+    ):
+        if min(max_failures, half_open_max_calls, success_threshold, window_buckets, minimum_calls) < 1:
+            raise ValueError("Circuit eşikleri en az 1 olmalı")
+        if window <= 0 or reset_timeout < 0:
+            raise ValueError("window > 0 ve resetTimeout >= 0 olmalı")
+        if not 0 < failure_rate <= 1 or not 0 < slow_call_rate <= 1:
+            raise ValueError("Oran eşikleri (0, 1] aralığında olmalı")
+        self.enabled = enabled
+        self.max_failures = max_failures
+        self.timeout = timeout
+        self.reset_timeout = reset_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self.success_threshold = success_threshold
+        self.window = window
+        self.window_buckets = window_buckets
+        self.bucket_width = window / window_buckets
+        self.failure_rate = failure_rate
+        self.minimum_calls = minimum_calls
+        self.slow_call_duration = slow_call_duration
+        self.slow_call_rate = slow_call_rate
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any], agent: Optional[str] = None) -> "CircuitPolicy":
+        """circuit-breaker.json'dan (global + agent override)"""
+        values = dict(config.get("global", {}))
+        if agent:
+            values.update(config.get("thresholds", {}).get("agents", {}).get(agent, {}))
+        recovery = config.get("recovery", {})
+        return cls(
+            enabled=values.get("enabled", True),
+            max_failures=values.get("maxFailures", DEFAULT_MAX_FAILURES),
+            timeout=values.get("timeout", DEFAULT_TIMEOUT),
+            reset_timeout=values.get("resetTimeout", DEFAULT_RESET_TIMEOUT),
+            half_open_max_calls=values.get("halfOpenMaxCalls", recovery.get("halfOpenCallLimit", DEFAULT_HALF_OPEN_MAX_CALLS)),
+            success_threshold=values.get("successThreshold", recovery.get("successThreshold", DEFAULT_SUCCESS_THRESHOLD)),
+            window=values.get("window", DEFAULT_WINDOW),
+            window_buckets=values.get("windowBuckets", DEFAULT_WINDOW_BUCKETS),
+            failure_rate=values.get("failureRateThreshold", DEFAULT_FAILURE_RATE),
+            minimum_calls=values.get("minimumCalls", DEFAULT_MINIMUM_CALLS),
+            slow_call_duration=values.get("slowCallDuration", 0),
+            slow_call_rate=values.get("slowCallRateThreshold", DEFAULT_SLOW_CALL_RATE),
+        )
+
+
+def window_stats(circuit: Dict[str, Any], policy: CircuitPolicy, now: float) -> Dict[str, Any]:
+    """Penceredeki çağrı / hata / yavaş çağrı sayıları ve oranları"""
+    cutoff = now - policy.window
+    calls = failures = slow = 0
+    latency = 0.0
+    for bucket in circuit.get("window") or []:
+        if bucket[_START] + policy.bucket_width > cutoff:
+            calls += bucket[_CALLS]
+            failures += bucket[_FAILURES]
+            slow += bucket[_SLOW]
+            latency += bucket[_LATENCY]
+    return {
+        "calls": calls,
+        "failures": failures,
+        "slow": slow,
+        "failureRate": round(failures / calls, 4) if calls else 0.0,
+        "slowRate": round(slow / calls, 4) if calls else 0.0,
+        "meanLatency": round(latency / calls, 3) if calls else 0.0,
+    }
+
+
+def load_config(project_root: Path) -> Dict[str, Any]:
+    """Proje kökündeki circuit-breaker.json (yoksa varsayılanlar)"""
+    try:
+        return json.loads((Path(project_root) / CONFIG_FILE).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+def _live_probes(circuit: Dict[str, Any], now: float) -> Dict[str, float]:
+    return {token: expires for token, expires in (circuit.get("probes") or {}).items() if expires > now}
+
+
+class CircuitBreaker:
+    """
+    Agent circuit'lerinin karar motoru
+
+    Okumalar paylaşılan CircuitStateCache'ten yapılır; durum değiştiren
+    çağrılar circuits.lock altında dosyanın güncel halini okuyup atomik
+    olarak (tmp + os.replace) yazar.
+    """
+
+    def __init__(
+        self,
+        state_file: Path,
+        config: Optional[Dict[str, Any]] = None,
+        clock: Callable[[], float] = time.time,
+    ):
+        from queue_store import FileLock
+
+        self.state_file = Path(state_file)
+        self.config = config or {}
+        self.clock = clock
+        self.enabled = self.config.get("global", {}).get("enabled", True)
+        self._cache = state_cache(self.state_file)
+        self._lock = FileLock(self.state_file.with_suffix(".lock"))
+        self._policies: Dict[str, CircuitPolicy] = {}
+        # blocked_agents için önbellekten türetilen (agent → (OPEN bitişi, probe bitişleri))
+        self._derived_from: Optional[Dict[str, Dict[str, Any]]] = None
+        self._derived: Dict[str, Tuple[float, List[float]]] = {}
+
+    @classmethod
+    def from_project(cls, project_root: Path, **kwargs: Any) -> "CircuitBreaker":
+        """Proje kökündeki circuits.json + circuit-breaker.json"""
+        return cls(Path(project_root) / CIRCUITS_FILE, load_config(project_root), **kwargs)
+
+    def policy(self, agent: str) -> CircuitPolicy:
+        policy = self._policies.get(agent)
+        if policy is None:
+            policy = self._policies[agent] = CircuitPolicy.from_config(self.config, agent)
+        return policy
+
+    def _exempt(self, agent: Optional[str]) -> bool:
+        return not self.enabled or not agent or agent in EXEMPT_AGENTS
+
+    # ------------------------------------------------------------------------
+    # Okuma (kilitsiz)
+    # ------------------------------------------------------------------------
+
+    def _derive(self) -> Dict[str, Tuple[float, List[float]]]:
+        circuits = self._cache.circuits()
+        if circuits is not self._derived_from:
+            derived = {}
+            for agent, circuit in circuits.items():
+                if not isinstance(circuit, dict):
+                    continue
+                state = circuit.get("state", DEFAULT_STATE)
+                if state == "OPEN":
+                    # nextRetryTime'sız OPEN (elle açılmış): reset'e kadar kapalı
+                    derived[agent] = (_epoch(circuit.get("nextRetryTime")) or float("inf"), [])
+                elif state == "HALF_OPEN":
+                    derived[agent] = (0.0, sorted((circuit.get("probes") or {}).values()))
+            self._derived, self._derived_from = derived, circuits
+        return self._derived
+
+    def blocked_agents(self, now: Optional[float] = None) -> Set[str]:
+        """
+        Şu an task verilemeyen agent'lar
+
+        OPEN ve bekleme süresi dolmamış ya da HALF_OPEN ve probe hakları dolu
+        olanlar. Bekleme süresi dolmuş OPEN circuit engellenmez: ilk acquire
+        onu HALF_OPEN'a geçirip probe başlatır.
+        """
+        if not self.enabled:
+            return set()
+        now = self.clock() if now is None else now
+        blocked = set()
+        for agent, (retry_at, probes) in self._derive().items():
+            if now < retry_at or sum(1 for expires in probes if expires > now) >= self.policy(agent).half_open_max_calls:
+                blocked.add(agent)
+        return blocked
+
+    def allows(self, agent: Optional[str], now: Optional[float] = None) -> bool:
+        """Agent'a şu an task verilebilir mi? (probe hakkı ayırmaz)"""
+        return self._exempt(agent) or agent not in self.blocked_agents(now)
+
+    def state(self, agent: str) -> str:
+        return self._cache.state(agent)
+
+    def snapshot(self, agent: str, now: Optional[float] = None) -> Dict[str, Any]:
+        """Agent circuit'i + pencere istatistikleri"""
+        now = self.clock() if now is None else now
+        circuit = dict(self._cache.circuits().get(agent) or {})
+        circuit.setdefault("state", DEFAULT_STATE)
+        circuit["windowStats"] = window_stats(circuit, self.policy(agent), now)
+        circuit["liveProbes"] = len(_live_probes(circuit, now))
+        circuit.pop("window", None)
+        circuit.pop("probes", None)
+        return circuit
+
+    # ------------------------------------------------------------------------
+    # Güncelleme (kilitli)
+    # ------------------------------------------------------------------------
+
+    def _update(self, agent: str, change: Callable[[Dict[str, Any], CircuitPolicy, float], Any]) -> Any:
+        """circuits.json'u kilit altında oku, agent kaydını değiştir, atomik yaz"""
+        with self._lock.acquire():
+            try:
+                data = json.loads(self.state_file.read_text(encoding="utf-8"))
+            except FileNotFoundError:
+                data = {}
+            except (OSError, ValueError):
+                # Bozuk dosya: son geçerli durumdan devam
+                data = {"circuits": {a: dict(c) for a, c in self._cache.circuits().items()}}
+            if not isinstance(data, dict):
+                data = {}
+            circuits = data.setdefault("circuits", {})
+            before = circuits.get(agent)
+            circuit = dict(before) if isinstance(before, dict) else {}
+            circuit.setdefault("state", DEFAULT_STATE)
+            circuit.setdefault("failCount", 0)
+            now = self.clock()
+            result = change(circuit, self.policy(agent), now)
+            if circuit != before:
+                circuits[agent] = circuit
+                data["lastUpdated"] = _iso(now)
+                self.state_file.parent.mkdir(parents=True, exist_ok=True)
+                tmp = self.state_file.with_suffix(f".{os.getpid()}.tmp")
+                tmp.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8")
+                os.replace(tmp, self.state_file)
+            return result
+
+    @staticmethod
+    def _trip(circuit: Dict[str, Any], policy: CircuitPolicy, now: float, reason: str) -> None:
+        circuit["state"] = "OPEN"
+        circuit["openedAt"] = _iso(now)
+        circuit["nextRetryTime"] = _iso(now + policy.reset_timeout)
+        circuit["tripReason"] = reason
+        circuit["halfOpenSuccesses"] = 0
+        circuit.pop("probes", None)
+
+    @staticmethod
+    def _close(circuit: Dict[str, Any]) -> None:
+        circuit["state"] = "CLOSED"
+        circuit["failCount"] = 0
+        circuit["nextRetryTime"] = None
+        circuit["halfOpenSuccesses"] = 0
+        # Kapanışta pencere sıfırlanır; eski hatalar circuit'i hemen tekrar açmasın
+        circuit["window"] = []
+        circuit.pop("probes", None)
+        circuit.pop("tripReason", None)
+
+    def acquire(self, agent: Optional[str], token: str = "") -> bool:
+        """
+        Agent'a task verilmeden önce çağrılır
+
+        CLOSED circuit için dosyaya dokunmaz. Bekleme süresi dolmuş OPEN
+        circuit HALF_OPEN'a geçer; HALF_OPEN'da halfOpenMaxCalls'a kadar
+        probe hakkı `token` (ör. task ID) adına ayrılır.
+
+        Returns:
+            True: task başlatılabilir
+        """
+        if self._exempt(agent) or self._cache.state(agent) == "CLOSED":
+            return True
+        if agent in self.blocked_agents():
+            return False
+
+        def change(circuit: Dict[str, Any], policy: CircuitPolicy, now: float) -> bool:
+            state = circuit["state"]
+            if state == "CLOSED":
+                return True
+            if state == "OPEN":
+                retry_at = _epoch(circuit.get("nextRetryTime"))
+                if not retry_at or now < retry_at:
+                    return False
+                circuit["state"] = "HALF_OPEN"
+                circuit["halfOpenSuccesses"] = 0
+                circuit["probes"] = {}
+            probes = _live_probes(circuit, now)
+            if len(probes) >= policy.half_open_max_calls:
+                circuit["probes"] = probes
+                return False
+            probes[token or f"probe-{now}"] = now + policy.timeout
+            circuit["probes"] = probes
+            return True
+
+        return self._update(agent, change)
+
+    def release(self, agent: Optional[str], token: str) -> None:
+        """Sonucu bildirilmeyecek probe hakkını bırak (ör. lease kaybedildi)"""
+        if self._exempt(agent) or self._cache.state(agent) != "HALF_OPEN":
+            return
+
+        def change(circuit: Dict[str, Any], policy: CircuitPolicy, now: float) -> None:
+            probes = dict(circuit.get("probes") or {})
+            if probes.pop(token, None) is not None:
+                circuit["probes"] = probes
+
+        self._update(agent, change)
+
+    def record(self, agent: Optional[str], success: bool, duration: float = 0.0, token: str = "") -> str:
+        """
+        Task sonucunu kaydet
+
+        Returns:
+            Kayıttan sonraki circuit durumu
+        """
+        if self._exempt(agent):
+            return DEFAULT_STATE
+
+        def change(circuit: Dict[str, Any], policy: CircuitPolicy, now: float) -> str:
+            slow = bool(policy.slow_call_duration) and duration >= policy.slow_call_duration
+            start = now - now % policy.bucket_width
+            cutoff = now - policy.window
+            buckets = [b for b in circuit.get("window") or [] if b[_START] + policy.bucket_width > cutoff]
+            if not buckets or buckets[-1][_START] != start:
+                buckets.append([start, 0, 0, 0, 0.0])
+            bucket = buckets[-1]
+            bucket[_CALLS] += 1
+            bucket[_FAILURES] += 0 if success else 1
+            bucket[_SLOW] += 1 if slow else 0
+            bucket[_LATENCY] = round(bucket[_LATENCY] + duration, 3)
+            circuit["window"] = buckets
+
+            if success:
+                circuit["totalSuccesses"] = int(circuit.get("totalSuccesses") or 0) + 1
+                circuit["lastSuccessTime"] = _iso(now)
+            else:
+                circuit["totalFailures"] = int(circuit.get("totalFailures") or 0) + 1
+                circuit["lastFailureTime"] = _iso(now)
+
+            state = circuit["state"]
+            if state == "HALF_OPEN":
+                probes = dict(circuit.get("probes") or {})
+                probes.pop(token, None)
+                circuit["probes"] = probes
+                if not success:
+                    circuit["failCount"] += 1
+                    self._trip(circuit, policy, now, "probe failed")
+                else:
+                    circuit["halfOpenSuccesses"] = int(circuit.get("halfOpenSuccesses") or 0) + 1
+                    if circuit["halfOpenSuccesses"] >= policy.success_threshold:
+                        self._close(circuit)
+            elif state == "CLOSED":
+                circuit["failCount"] = 0 if success else circuit["failCount"] + 1
+                stats = window_stats(circuit, policy, now)
+                if circuit["failCount"] >= policy.max_failures:
+                    self._trip(circuit, policy, now, f"{circuit['failCount']} consecutive failures")
+                elif stats["calls"] >= policy.minimum_calls:
+                    if stats["failureRate"] >= policy.failure_rate:
+                        self._trip(circuit, policy, now, f"failure rate {stats['failureRate']:.0%}")
+                    elif policy.slow_call_duration and stats["slowRate"] >= policy.slow_call_rate:
+                        self._trip(circuit, policy, now, f"slow call rate {stats['slowRate']:.0%}")
+            # OPEN: açılmadan önce başlamış task'ların sonuçları yalnızca sayılır
+            return circuit["state"]
+
+        return self._update(agent, change)
+
+
+# ============================================================================
+# CLI
+# ============================================================================
+
+def main():
+    """
+    Kullanım:
+        python circuit_breaker.py list [project_root]
+        python circuit_breaker.py allow <agent> [project_root]
+        python circuit_breaker.py record <agent> ok|fail [duration] [project_root]
+        python circuit_breaker.py stats <agent> [project_root]
+
+    `list` tüm circuit'leri 'agent<TAB>durum<TAB>failCount' satırları olarak
+    yazar (dashboard.sh gibi script'ler için). `allow` agent'a task
+    verilebiliyorsa 0, değilse 1 ile çıkar (HALF_OPEN'da probe hakkı ayırır).
+    `record` sonucu kaydedip yeni durumu yazar; `stats` pencere
+    istatistiklerini JSON olarak yazar.
+    """
+    args = sys.argv[1:]
+    command = args[0] if args else None
+    usage = {"list": 0, "allow": 1, "stats": 1, "record": 2}
+    if command not in usage or len(args) - 1 < usage[command]:
+        print(main.__doc__)
+        return 1
+
+    if command == "list":
+        project_root = Path(args[1]) if len(args) > 1 else Path(".")
+        for agent, circuit in sorted(get_all_circuits(project_root / CIRCUITS_FILE).items()):
+            sys.stdout.write(f"{agent}\t{circuit.get('state', DEFAULT_STATE)}\t{circuit.get('failCount', 0)}\n")
+        return 0
+
+    agent = args[1]
+    if command == "record":
+        if args[2] not in ("ok", "fail"):
+            print(main.__doc__)
+            return 1
+        rest = args[3:]
+        duration = float(rest.pop(0)) if rest and rest[0].replace(".", "", 1).isdigit() else 0.0
+        breaker = CircuitBreaker.from_project(Path(rest[0]) if rest else Path("."))
+        print(breaker.record(agent, args[2] == "ok", duration))
+        return 0
+
+    breaker = CircuitBreaker.from_project(Path(args[2]) if len(args) > 2 else Path("."))
+    if command == "allow":
+        return 0 if breaker.acquire(agent, f"cli-{os.getpid()}") else 1
+    print(json.dumps(breaker.snapshot(agent), indent=2, ensure_ascii=False))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+ODIN AI Agent System - Fast CLI Path
+Script / hook çağrıları için typer ve rich yüklemeden çalışan odin komutları.
+
+`--plain` ile çağrılan okuma komutları (status, list) odin.py tarafından
+typer import edilmeden önce buraya yönlendirilir. Çıktı makine okunurdur:
+satır başına bir kayıt, alanlar TAB ile ayrılır, başlık satırı yoktur.
+
+    $ odin status --plain
+    pending	3
+    in-progress	1
+    ...
+    total	4
+
+    $ odin list --plain -s completed --since 1d --limit 100
+    <id>	<agent>	<priority>	<created_at>	<description>
+
+    $ odin backpressure --plain
+    level	slow
+    pending	850	1000	0.85	slow
+    ...
+
+Version: 1.0.0
+"""
+
+import json
+import os
+import sys
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+from queue_store import QUEUE_STATUSES, create_store, parse_since
+
+
+# ============================================================================
+# STORE
+# ============================================================================
+
+def load_queue_config(project_root: Path) -> Dict[str, Any]:
+    """Queue konfigürasyonunu oku (.agent/config/queue.json)"""
+    config_file = project_root / ".agent" / "config" / "queue.json"
+    if config_file.exists():
+        return json.loads(config_file.read_text(encoding="utf-8"))
+    return {}
+
+
+def daemon_socket(project_root: Path, config: Dict[str, Any]) -> Path:
+    """Daemon socket yolu (queue.json > daemon.socket)"""
+    return project_root / config.get("daemon", {}).get("socket", ".agent/state/odin.sock")
+
+
+def open_store(project_root: Path, config: Dict[str, Any]):
+    """
+    Queue store'u aç
+
+    `odin serve` çalışıyorsa daemon'a bağlanır; ODIN_NO_DAEMON=1 ile
+    dosyalara doğrudan erişim zorlanabilir.
+    """
+    socket_path = daemon_socket(project_root, config)
+    if os.environ.get("ODIN_NO_DAEMON") != "1" and socket_path.exists():
+        from queue_daemon import connect  # Socket yoksa socketserver yüklenmez
+        store = connect(socket_path)
+        if store is not None:
+            return store
+    return create_store(project_root / ".agent" / "queue", config)
+
+
+# ============================================================================
+# PLAIN ÇIKTI
+# ============================================================================
+
+def _field(value: Any) -> str:
+    """TAB / satır sonu içermeyen alan"""
+    return str(value if value is not None else "").replace("\t", " ").replace("\n", " ")
+
+
+def format_counts(counts: Dict[str, int]) -> List[str]:
+    """status çıktısı: '<durum>\\t<sayı>' satırları + toplam"""
+    lines = [f"{status}\t{counts.get(status, 0)}" for status in QUEUE_STATUSES]
+    lines.append(f"total\t{sum(counts.get(status, 0) for status in QUEUE_STATUSES)}")
+    return lines
+
+
+def format_stats(status: str, stats: Dict[str, Any]) -> List[str]:
+    """status --detail çıktısı: '<durum>\\tagent|priority\\t<değer>\\t<sayı>' satırları"""
+    lines = [f"{status}\tagent\t{_field(agent)}\t{n}" for agent, n in stats["agents"].items()]
+    lines.extend(f"{status}\tpriority\t{rank}\t{n}" for rank, n in stats["priorities"].items())
+    return lines
+
+
+def format_pressure(pressure: Dict[str, Any]) -> List[str]:
+    """backpressure çıktısı: 'level\t<seviye>' + '<durum>\t<sayı>\t<limit>\t<oran>\t<durum>' satırları"""
+    lines = [f"level\t{pressure['level']}"]
+    lines.extend(
+        f"{status}\t{q['count']}\t{q['limit']}\t{q['ratio']}\t{q['state']}"
+        for status, q in pressure["queues"].items()
+    )
+    return lines
+
+
+def format_task(task: Dict[str, Any]) -> str:
+    """Task satırı: id, agent, öncelik, oluşturma zamanı, açıklama"""
+    return "\t".join(_field(v) for v in (
+        task.get("id"),
+        task.get("agent"),
+        task.get("priority"),
+        task.get("created_at") or task.get("createdAt"),
+        task.get("description"),
+    ))
+
+
+def write_lines(lines: Iterable[str]) -> None:
+    """Satırları stdout'a yaz (pipe kapanırsa sessizce çık)"""
+    try:
+        for line in lines:
+            sys.stdout.write(line + "\n")
+        sys.stdout.flush()
+    except BrokenPipeError:
+        # `odin list --plain | head` gibi kullanımlar
+        sys.stderr.close()
+
+
+# ============================================================================
+# HIZLI YOL
+# ============================================================================
+
+def _option(args: List[str], names: Iterable[str], default: Optional[str]) -> Optional[str]:
+    """`--name value` veya `--name=value` değerini al"""
+    for i, arg in enumerate(args):
+        for name in names:
+            if arg == name and i + 1 < len(args):
+                return args[i + 1]
+            if arg.startswith(name + "="):
+                return arg.split("=", 1)[1]
+    return default
+
+
+def run_fast(argv: List[str], project_root: Path) -> Optional[int]:
+    """
+    `--plain` okuma komutlarını typer olmadan çalıştır
+
+    Returns:
+        Çıkış kodu; komut hızlı yolda desteklenmiyorsa None (typer'a bırakılır)
+    """
+    if len(argv) < 2 or "--plain" not in argv or "--help" in argv:
+        return None
+
+    command, args = argv[0], [a for a in argv[1:] if a != "--plain"]
+
+    if command == "status" and not args:
+        store = open_store(project_root, load_queue_config(project_root))
+        write_lines(format_counts(store.counts()))
+        return 0
+
+    if command == "backpressure" and not args:
+        from admission import AdmissionPolicy, backpressure
+        config = load_queue_config(project_root)
+        store = open_store(project_root, config)
+        write_lines(format_pressure(backpressure(store, AdmissionPolicy.from_config(config))))
+        return 0
+
+    if command == "list":
+        options = {
+            "status": ("--status", "-s"),
+            "limit": ("--limit", "-n"),
+            "offset": ("--offset",),
+            "since": ("--since",),
+            "agent": ("--agent", "-a"),
+            "priority": ("--priority", "-p"),
+            "tag": ("--tag", "-t"),
+        }
+        allowed = {name for names in options.values() for name in names}
+        if any(a.startswith("-") and a.split("=", 1)[0] not in allowed for a in args):
+            return None  # Diğer seçenekler typer tarafında işlenir
+        values = {key: _option(args, names, None) for key, names in options.items()}
+
+        status = values["status"] or "pending"
+        if status not in QUEUE_STATUSES:
+            sys.stderr.write(f"Geçersiz durum: {status}\n")
+            return 1
+        try:
+            limit = int(values["limit"] or 0)
+            offset = int(values["offset"] or 0)
+            since = parse_since(values["since"]) if values["since"] else None
+        except ValueError as e:
+            sys.stderr.write(f"{e}\n")
+            return 1
+        if limit < 0 or offset < 0:
+            sys.stderr.write("--limit ve --offset negatif olamaz\n")
+            return 1
+
+        store = open_store(project_root, load_queue_config(project_root))
+        write_lines(format_task(task) for task in store.iter_query(
+            status,
+            agent=values["agent"],
+            priority=values["priority"],
+            tag=values["tag"],
+            limit=limit or None,
+            offset=offset,
+            since=since,
+        ))
+        return 0
+
+    return None
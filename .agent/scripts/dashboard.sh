@@ -17,8 +17,10 @@ PROJECT_ROOT="$(cd "$SCRIPT_DIR/../.." && pwd)"
 
 # Data dosyaları
 CIRCUITS_FILE="$PROJECT_ROOT/.agent/state/circuits.json"
+QUEUE_STORE="$SCRIPT_DIR/queue_store.py"
+QUEUE_ARCHIVE="$SCRIPT_DIR/queue_archive.py"
 QUEUE_DIR="$PROJECT_ROOT/.agent/queue"
-DLQ_FILE="$QUEUE_DIR/tasks-dead-letter.json"
+PYTHON_CMD="${PYTHON:-python3}"
 
 # =============================================================================
 # RENKLER
@@ -53,44 +55,36 @@ get_circuit_half_open() {
     jq '[.circuits[].state | select(. == "HALF_OPEN")] | length' "$CIRCUITS_FILE" 2>/dev/null || echo "0"
 }
 
+# Queue sayıları queue_store.py'den okunur (tasks-<status>.json journal'ın
+# gerisinde kalabilir, sqlite backend'de hiç yoktur); render başına bir kez.
+# Rotasyonla arşive taşınan completed task'lar manifest'ten sayılır.
+load_queue_counts() {
+    QUEUE_COUNTS=$("$PYTHON_CMD" "$QUEUE_STORE" counts 2>/dev/null || echo "{}")
+    ARCHIVED_COUNT=$("$PYTHON_CMD" "$QUEUE_ARCHIVE" count "$QUEUE_DIR" 2>/dev/null || echo "0")
+}
+
+get_queue_count() {
+    jq --arg status "$1" '.[$status] // 0' <<< "${QUEUE_COUNTS:-null}" 2>/dev/null || echo "0"
+}
+
 get_queue_pending() {
-    if [[ -f "$QUEUE_DIR/tasks-pending.json" ]]; then
-        jq '.tasks | length' "$QUEUE_DIR/tasks-pending.json" 2>/dev/null || echo "0"
-    else
-        echo "0"
-    fi
+    get_queue_count pending
 }
 
 get_queue_in_progress() {
-    if [[ -f "$QUEUE_DIR/tasks-in-progress.json" ]]; then
-        jq '.tasks | length' "$QUEUE_DIR/tasks-in-progress.json" 2>/dev/null || echo "0"
-    else
-        echo "0"
-    fi
+    get_queue_count in-progress
 }
 
 get_queue_completed() {
-    if [[ -f "$QUEUE_DIR/tasks-completed.json" ]]; then
-        jq '.tasks | length' "$QUEUE_DIR/tasks-completed.json" 2>/dev/null || echo "0"
-    else
-        echo "0"
-    fi
+    echo $(( $(get_queue_count completed) + ${ARCHIVED_COUNT:-0} ))
 }
 
 get_queue_failed() {
-    if [[ -f "$QUEUE_DIR/tasks-failed.json" ]]; then
-        jq '.tasks | length' "$QUEUE_DIR/tasks-failed.json" 2>/dev/null || echo "0"
-    else
-        echo "0"
-    fi
+    get_queue_count failed
 }
 
 get_dlq_count() {
-    if [[ -f "$DLQ_FILE" ]]; then
-        jq '.tasks | length' "$DLQ_FILE" 2>/dev/null || echo "0"
-    else
-        echo "0"
-    fi
+    get_queue_count dead-letter
 }
 
 get_blocked_agents() {
@@ -100,11 +94,17 @@ get_blocked_agents() {
 }
 
 get_recent_completed() {
-    if [[ -f "$QUEUE_DIR/tasks-completed.json" ]]; then
-        jq -r '[.tasks[-5:][]
-                | "\(.completedAt // "Unknown") \(.agent // "unknown") \(.type // "task"] |
-                .[]' "$QUEUE_DIR/tasks-completed.json" 2>/dev/null | \
-        awk '{
+    local recent
+    # Sıcak queue'da 5'ten az task varsa eksik kalanlar en yeni arşiv segment'lerinden
+    recent=$({
+        if [[ "$(get_queue_count completed)" -lt 5 ]]; then
+            "$PYTHON_CMD" "$QUEUE_ARCHIVE" tail "$QUEUE_DIR" --limit 5 2>/dev/null
+        fi
+        "$PYTHON_CMD" "$QUEUE_STORE" cat completed 2>/dev/null | jq -c '.tasks[-5:][]' 2>/dev/null
+    } | jq -rs '.[-5:][]
+                | "\(.completedAt // "Unknown") \(.agent // "unknown") \(.type // "task")"' 2>/dev/null)
+    if [[ -n "$recent" ]]; then
+        echo "$recent" | awk '{
             gsub(/T/, " ", $1)
             gsub(/Z.*/, "", $1)
             split($1, parts, " ")
@@ -130,6 +130,7 @@ render_dashboard() {
     half_open=$(get_circuit_half_open)
 
     local pending in_progress completed failed
+    load_queue_counts
     pending=$(get_queue_pending)
     in_progress=$(get_queue_in_progress)
     completed=$(get_queue_completed)
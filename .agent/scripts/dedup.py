@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+"""
+ODIN AI Agent System - Task Deduplication
+Enqueue sırasında aynı içerikli task'ları bulmak için içerik hash'i.
+
+Hash; normalize edilmiş açıklama, agent ve payload'dan hesaplanır:
+
+    açıklama : NFKC + casefold, boşluklar tek boşluğa indirilir
+    agent    : küçük harf (boşsa "auto")
+    payload  : anahtarları sıralı, boşluksuz JSON
+
+Hash task'a yazılmaz, her seferinde içerikten hesaplanır; böylece
+normalizasyon değişse veya task elle düzenlense bile index bayatlamaz.
+Store'lar pending ve in-progress için hash → ID index'i tutar (JSON: replay
+cache'i, SQLite: content_hash kolonu, daemon: bellek); arama O(1)'dir.
+
+Politika (.agent/config/queue.json > dedup.policy, odin add --on-duplicate):
+
+    reject : Aynı içerikli aktif task varsa ekleme reddedilir
+    merge  : Mevcut pending task'a birleştirilir (yüksek öncelik ve
+             etiketler aktarılır, duplicate_count artar)
+    allow  : Kontrol yapılmaz
+
+Kümülatif isabet (hit) / ıska (miss) sayıları .agent/state/dedup-stats.json
+dosyasında tutulur.
+
+Version: 1.0.0
+"""
+
+import hashlib
+import json
+import os
+import re
+import unicodedata
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+# Tekrarını aradığımız (henüz bitmemiş) queue'lar
+DEDUP_STATUSES = ("pending", "in-progress")
+
+POLICIES = ("reject", "merge", "allow")
+DEFAULT_POLICY = "reject"
+DEFAULT_NEAR_THRESHOLD = 0.92
+DEFAULT_STATS_FILE = "dedup-stats.json"
+
+STAT_KEYS = ("hits", "misses", "merged", "rejected", "nearHits")
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_description(text: Any) -> str:
+    """Karşılaştırma için açıklama metni"""
+    text = unicodedata.normalize("NFKC", str(text or "")).casefold()
+    return _WHITESPACE.sub(" ", text).strip()
+
+
+def content_hash(task: Dict[str, Any]) -> str:
+    """Normalize edilmiş açıklama + agent + payload hash'i (128 bit, hex)"""
+    payload = task.get("payload")
+    parts = (
+        normalize_description(task.get("description")),
+        str(task.get("agent") or "auto").lower(),
+        json.dumps(payload if payload is not None else {}, sort_keys=True, ensure_ascii=False, separators=(",", ":")),
+    )
+    return hashlib.sha256("\x1f".join(parts).encode("utf-8")).hexdigest()[:32]
+
+
+class ContentIndex:
+    """
+    İçerik hash'i → task ID'leri
+
+    ID → hash eşlemesi de tutulur; güncellenen task'ın eski hash'i
+    index'ten düşer. Eski kayıtlarda aynı hash'e sahip birden fazla task
+    olabileceğinden hash başına bir ID kümesi tutulur.
+    """
+
+    def __init__(self):
+        self._ids: Dict[str, Set[str]] = {}
+        self._hashes: Dict[str, str] = {}
+
+    def put(self, task: Dict[str, Any]) -> None:
+        task_id = str(task["id"])
+        digest = content_hash(task)
+        previous = self._hashes.get(task_id)
+        if previous == digest:
+            return
+        if previous is not None:
+            self.discard(task_id)
+        self._hashes[task_id] = digest
+        self._ids.setdefault(digest, set()).add(task_id)
+
+    def discard(self, task_id: str) -> None:
+        digest = self._hashes.pop(str(task_id), None)
+        if digest is None:
+            return
+        ids = self._ids[digest]
+        ids.discard(str(task_id))
+        if not ids:
+            del self._ids[digest]
+
+    def get(self, digest: str) -> Optional[str]:
+        """Bu hash'e sahip bir task ID'si (yoksa None)"""
+        ids = self._ids.get(digest)
+        return min(ids) if ids else None
+
+    def __len__(self) -> int:
+        return len(self._hashes)
+
+
+class DedupPolicy:
+    """Tekrar politikası ve near-duplicate ayarları"""
+
+    def __init__(
+        self,
+        policy: str = DEFAULT_POLICY,
+        near: bool = False,
+        near_threshold: float = DEFAULT_NEAR_THRESHOLD,
+    ):
+        if policy not in POLICIES:
+            raise ValueError(f"Geçersiz dedup politikası: {policy} (geçerli: {', '.join(POLICIES)})")
+        if not 0 < near_threshold <= 1:
+            raise ValueError("nearThreshold (0, 1] aralığında olmalı")
+        self.policy = policy
+        self.near = near
+        self.near_threshold = near_threshold
+
+    @classmethod
+    def from_config(
+        cls,
+        config: Dict[str, Any],
+        policy: Optional[str] = None,
+        near: Optional[bool] = None,
+    ) -> "DedupPolicy":
+        dedup = config.get("dedup", {})
+        return cls(
+            policy or dedup.get("policy", DEFAULT_POLICY),
+            dedup.get("nearDuplicate", False) if near is None else near,
+            dedup.get("nearThreshold", DEFAULT_NEAR_THRESHOLD),
+        )
+
+
+def plan_dedup(
+    store,
+    tasks: List[Dict[str, Any]],
+    policy: DedupPolicy,
+) -> Tuple[List[Dict[str, Any]], List[tuple], List[Dict[str, Any]]]:
+    """
+    Aynı içerikli aktif task'ları ayıkla (store'a yazmaz)
+
+    Ekleme ile aynı kilit altında çağrılmalıdır (bkz. admission.admit).
+    Tekrarlar (task, queue, mevcut task) üçlüleridir; queue "batch" ise
+    eşleşme aynı toplu eklemedeki önceki kayıttır. merge politikasında
+    pending ve batch eşleşmelerine birleştirilir (batch kaydı yerinde
+    güncellenir); in-progress task değiştirilmez.
+
+    Returns:
+        (eklenecek task'lar, tekrarlar, pending'e yazılacak birleştirilmiş task'lar)
+    """
+    if policy.policy == "allow" or not tasks:
+        return tasks, [], []
+
+    hashes = [content_hash(t) for t in tasks]
+    matches = store.find_duplicates(set(hashes))
+    fresh, duplicates = [], []
+    merged: Dict[str, Dict[str, Any]] = {}
+    for task, digest in zip(tasks, hashes):
+        if digest not in matches:
+            matches[digest] = ("batch", task)
+            fresh.append(task)
+            continue
+        dup_status, existing = matches[digest]
+        duplicates.append((task, dup_status, existing))
+        if policy.policy == "merge" and dup_status != "in-progress":
+            combined = merge_duplicate(existing, task)
+            if dup_status == "batch":
+                existing.update(combined)
+            else:
+                matches[digest] = (dup_status, combined)
+                merged[combined["id"]] = combined
+    return fresh, duplicates, [*merged.values()]
+
+
+def merged_count(duplicates: List[tuple], policy: DedupPolicy) -> int:
+    """Birleştirilen tekrar sayısı (merge politikasında in-progress olmayanlar)"""
+    if policy.policy != "merge":
+        return 0
+    return sum(1 for _, dup_status, _ in duplicates if dup_status != "in-progress")
+
+
+def merge_duplicate(existing: Dict[str, Any], incoming: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Yeni task'ı mevcut olana birleştir
+
+    Daha acil öncelik ve yeni etiketler aktarılır; bağımlılıklar
+    değiştirilmez (birleştirme döngü oluşturmasın).
+    """
+    from scheduler import priority_rank
+
+    merged = dict(existing)
+    if priority_rank(incoming.get("priority")) < priority_rank(existing.get("priority")):
+        merged["priority"] = incoming.get("priority")
+    tags = list(existing.get("tags") or [])
+    tags.extend(t for t in incoming.get("tags") or [] if t not in tags)
+    merged["tags"] = tags
+    merged["duplicate_count"] = int(existing.get("duplicate_count") or 0) + 1
+    return merged
+
+
+def find_near_duplicates(
+    task: Dict[str, Any],
+    threshold: float,
+    db_path: Path,
+    top_k: int = 3,
+) -> Optional[List[Dict[str, Any]]]:
+    """
+    Vector memory'de benzer task'lar (cosine benzerliği >= threshold)
+
+    Returns:
+        Benzer task'lar; numpy / sentence-transformers yoksa None
+    """
+    try:
+        import vector_memory
+    except ImportError:
+        return None
+    if not vector_memory.MODEL_AVAILABLE or not Path(db_path).exists():
+        return None
+
+    memory = vector_memory.VectorMemory(str(db_path))
+    if memory.model is None:
+        return None
+    return memory.search(
+        memory._create_embedding_text(task),
+        top_k=top_k,
+        min_similarity=threshold,
+        statuses=None,
+    )
+
+
+# ============================================================================
+# İSTATİSTİKLER
+# ============================================================================
+
+def read_stats(path: Path) -> Dict[str, int]:
+    """Kümülatif dedup sayaçları"""
+    try:
+        data = json.loads(Path(path).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        data = {}
+    return {key: int(data.get(key, 0)) for key in STAT_KEYS}
+
+
+def record_stats(path: Path, **deltas: int) -> Dict[str, int]:
+    """Sayaçları artır (process'ler arası kilitli, atomik yazma)"""
+    from queue_store import FileLock
+
+    path = Path(path)
+    with FileLock(path.with_suffix(".lock")).acquire():
+        stats = read_stats(path)
+        for key, delta in deltas.items():
+            stats[key] += delta
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(stats, indent=2), encoding="utf-8")
+        os.replace(tmp, path)
+    return stats
+
+
+def hit_rate(stats: Dict[str, int]) -> float:
+    """İsabet oranı (hits / (hits + misses))"""
+    total = stats["hits"] + stats["misses"]
+    return stats["hits"] / total if total else 0.0
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+ODIN AI Agent System - Streaming JSON Reader
+Büyük JSON dosyalarını tamamını belleğe almadan okumak için.
+
+Dosya blok blok okunur; array elemanları `json.JSONDecoder.raw_decode` ile
+tek tek çözülür ve tüketildikçe tampondan atılır. Bellek kullanımı dosya
+boyutuna değil en büyük tek elemana bağlıdır.
+
+    with open("tasks-completed.json", encoding="utf-8") as f:
+        for task in iter_snapshot_tasks(f):
+            ...
+
+Version: 1.0.0
+"""
+
+import json
+import re
+from typing import Any, Iterator, TextIO
+
+# Tek seferde okunan blok boyutu
+READ_CHUNK_SIZE = 64 * 1024
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
+class JsonStreamReader:
+    """Dosyadan artımlı JSON okuyucu"""
+
+    def __init__(self, f: TextIO, initial: str = "", chunk_size: int = READ_CHUNK_SIZE):
+        """
+        Args:
+            f: Metin modunda açık dosya
+            initial: Dosyadan önceden okunmuş baş kısım (format tespiti için)
+            chunk_size: Blok boyutu
+        """
+        self.f = f
+        self.buffer = initial
+        self.pos = 0
+        self.eof = False
+        self.chunk_size = chunk_size
+        self._decoder = json.JSONDecoder()
+
+    def _fill(self) -> bool:
+        """Tampona yeni blok ekle (tüketilen kısım atılır); dosya bittiyse False"""
+        if self.eof:
+            return False
+        chunk = self.f.read(self.chunk_size)
+        if not chunk:
+            self.eof = True
+            return False
+        self.buffer = self.buffer[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Boşlukları atla ve sıradaki karakteri döndür (dosya sonu: '')"""
+        while True:
+            self.pos = _WHITESPACE.match(self.buffer, self.pos).end()
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, char: str) -> None:
+        """Sıradaki karakter `char` olmalı"""
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"JSON: '{char}' bekleniyordu, '{found or 'EOF'}' bulundu")
+        self.pos += 1
+
+    def value(self) -> Any:
+        """Sıradaki JSON değerini çöz"""
+        self.peek()
+        while True:
+            try:
+                item, end = self._decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                if not self._fill():
+                    raise
+                continue
+            # Tamponun sonunda biten sayı yarım okunmuş olabilir
+            if end == len(self.buffer) and self._fill():
+                continue
+            self.pos = end
+            return item
+
+    def iter_array(self) -> Iterator[Any]:
+        """Sıradaki array'in elemanlarını tek tek döndür"""
+        self.expect("[")
+        if self.peek() == "]":
+            self.pos += 1
+            return
+        while True:
+            yield self.value()
+            char = self.peek()
+            if char == ",":
+                self.pos += 1
+            elif char == "]":
+                self.pos += 1
+                return
+            elif not char:
+                raise ValueError("JSON array kapanmadan dosya bitti")
+            else:
+                raise ValueError(f"JSON array: ',' veya ']' bekleniyordu, '{char}' bulundu")
+
+
+def iter_snapshot_tasks(f: TextIO) -> Iterator[Any]:
+    """
+    Queue snapshot'ındaki task'ları sırayla döndür
+
+    {"tasks": [...], "metadata": {...}} ve düz [...] formatlarını destekler.
+    `tasks` dışındaki alanlar atlanır; `tasks` okunduktan sonra dosyanın
+    geri kalanı okunmaz.
+    """
+    reader = JsonStreamReader(f)
+    char = reader.peek()
+    if not char:
+        return
+    if char == "[":
+        yield from reader.iter_array()
+        return
+
+    reader.expect("{")
+    if reader.peek() == "}":
+        return
+    while True:
+        key = reader.value()
+        reader.expect(":")
+        if key == "tasks":
+            yield from reader.iter_array()
+            return
+        reader.value()
+        char = reader.peek()
+        if char == ",":
+            reader.pos += 1
+        elif char == "}":
+            return
+        else:
+            raise ValueError(f"JSON object: ',' veya '}}' bekleniyordu, '{char or 'EOF'}' bulundu")
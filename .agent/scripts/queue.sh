@@ -13,14 +13,14 @@ NC='\033[0m'
 
 # Base directory
 AGENT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")/.." && pwd)"
-QUEUE_DIR="$AGENT_DIR/queue"
+QUEUE_STORE="$AGENT_DIR/scripts/queue_store.py"
+PYTHON_CMD="${PYTHON:-python3}"
 
-# Queue files
-PENDING="$QUEUE_DIR/tasks-pending.json"
-IN_PROGRESS="$QUEUE_DIR/tasks-in-progress.json"
-COMPLETED="$QUEUE_DIR/tasks-completed.json"
-FAILED="$QUEUE_DIR/tasks-failed.json"
-DEAD_LETTER="$QUEUE_DIR/tasks-dead-letter.json"
+# Queue contents come from queue_store.py, never from tasks-<status>.json:
+# the snapshot lags behind the journal (and does not exist on sqlite)
+queue_json() {
+    "$PYTHON_CMD" "$QUEUE_STORE" cat "$1" 2>/dev/null || echo '{"tasks": []}'
+}
 
 # Show queue status
 show_status() {
@@ -29,11 +29,13 @@ show_status() {
     echo "================================"
     echo ""
 
-    pending=$(jq '.tasks | length' "$PENDING" 2>/dev/null || echo "0")
-    in_progress=$(jq '.tasks | length' "$IN_PROGRESS" 2>/dev/null || echo "0")
-    completed=$(jq '.tasks | length' "$COMPLETED" 2>/dev/null || echo "0")
-    failed=$(jq '.tasks | length' "$FAILED" 2>/dev/null || echo "0")
-    dead_letter=$(jq '.tasks | length' "$DEAD_LETTER" 2>/dev/null || echo "0")
+    local counts
+    counts=$("$PYTHON_CMD" "$QUEUE_STORE" counts 2>/dev/null || echo "{}")
+    pending=$(echo "$counts" | jq '.pending // 0')
+    in_progress=$(echo "$counts" | jq '.["in-progress"] // 0')
+    completed=$(echo "$counts" | jq '.completed // 0')
+    failed=$(echo "$counts" | jq '.failed // 0')
+    dead_letter=$(echo "$counts" | jq '.["dead-letter"] // 0')
 
     echo -e "${BLUE}Pending:${NC}     $pending"
     echo -e "${BLUE}In Progress:${NC} $in_progress"
@@ -46,14 +48,9 @@ show_status() {
 # List tasks in a queue
 list_queue() {
     local queue=$1
-    local file=""
 
     case $queue in
-        pending) file="$PENDING" ;;
-        in-progress) file="$IN_PROGRESS" ;;
-        completed) file="$COMPLETED" ;;
-        failed) file="$FAILED" ;;
-        dead-letter) file="$DEAD_LETTER" ;;
+        pending|in-progress|completed|failed|dead-letter) ;;
         *)
             echo "Unknown queue: $queue"
             echo "Available: pending, in-progress, completed, failed, dead-letter"
@@ -66,12 +63,13 @@ list_queue() {
     echo "================================"
     echo ""
 
-    local count=$(jq '.tasks | length' "$file" 2>/dev/null || echo "0")
+    local data=$(queue_json "$queue")
+    local count=$(echo "$data" | jq '.tasks | length' 2>/dev/null || echo "0")
     echo "Total: $count task(s)"
     echo ""
 
     if [ "$count" -gt 0 ]; then
-        jq -r '.tasks[] | "- \(.id): \(.title // .description // "No title") (Priority: \(.priority // "N/A"))"' "$file" 2>/dev/null
+        echo "$data" | jq -r '.tasks[] | "- \(.id): \(.title // .description // "No title") (Priority: \(.priority // "N/A"))"' 2>/dev/null
     else
         echo "No tasks in this queue."
     fi
@@ -85,7 +83,8 @@ show_dlq() {
     echo "================================"
     echo ""
 
-    local count=$(jq '.tasks | length' "$DEAD_LETTER" 2>/dev/null || echo "0")
+    local data=$(queue_json dead-letter)
+    local count=$(echo "$data" | jq '.tasks | length' 2>/dev/null || echo "0")
 
     if [ "$count" -eq 0 ]; then
         echo -e "${GREEN}✓ No tasks in DLQ!${NC}"
@@ -96,7 +95,7 @@ show_dlq() {
     echo -e "${RED}⚠ $count task(s) in DLQ${NC}"
     echo ""
 
-    jq -r '.tasks[] |
+    echo "$data" | jq -r '.tasks[] |
 "────────────────────────────────────
 ID: \(.id)
 Type: \(.type)
@@ -105,7 +104,7 @@ Moved to DLQ: \(.movedAt)
 Reason: \(.reason)
 Retries: \(.retries)/\(.maxRetries)
 Last Error: \(.lastError.message // .lastError // "N/A")
-────────────────────────────────────"' "$DEAD_LETTER" 2>/dev/null
+────────────────────────────────────"' 2>/dev/null
 
     echo ""
     echo "Suggested actions:"
@@ -118,7 +117,8 @@ Last Error: \(.lastError.message // .lastError // "N/A")
 
 # Review DLQ tasks interactively
 dlq_review() {
-    local count=$(jq '.tasks | length' "$DEAD_LETTER" 2>/dev/null || echo "0")
+    local data=$(queue_json dead-letter)
+    local count=$(echo "$data" | jq '.tasks | length' 2>/dev/null || echo "0")
 
     if [ "$count" -eq 0 ]; then
         echo "✓ No tasks in DLQ to review."
@@ -132,8 +132,8 @@ dlq_review() {
     echo "Tasks requiring manual attention:"
     echo ""
 
-    jq -r '.tasks[] |
-"\(.id) | \(.type) | \(.title // "No title") | \(.lastError.message // .lastError // "No error")"' "$DEAD_LETTER" 2>/dev/null | column -t -s '|'
+    echo "$data" | jq -r '.tasks[] |
+"\(.id) | \(.type) | \(.title // "No title") | \(.lastError.message // .lastError // "No error")"' 2>/dev/null | column -t -s '|'
 
     echo ""
     echo "Use: $0 dlq-retry <id> | dlq-skip <id> | dlq-delete <id>"
@@ -149,7 +149,7 @@ dlq_retry() {
     fi
 
     # Find task in DLQ
-    local task=$(jq ".tasks[] | select(.id == \"$task_id\")" "$DEAD_LETTER")
+    local task=$("$PYTHON_CMD" "$QUEUE_STORE" get dead-letter "$task_id" 2>/dev/null)
 
     if [ -z "$task" ]; then
         echo "Error: Task $task_id not found in DLQ"
@@ -158,11 +158,9 @@ dlq_retry() {
 
     echo "Moving task $task_id from DLQ to pending..."
 
-    # Remove from DLQ and add to pending
-    jq "(.tasks |= map(select(.id != \"$task_id\")))" "$DEAD_LETTER" > "$DEAD_LETTER.tmp" && mv "$DEAD_LETTER.tmp" "$DEAD_LETTER"
-
-    # Reset retry count and move to pending
-    jq "(.tasks += [$task | .retries = 0 | .claimedBy = null | .claimedAt = null])" "$PENDING" > "$PENDING.tmp" && mv "$PENDING.tmp" "$PENDING"
+    # Reset retry count and move to pending (one locked move)
+    echo "$task" | jq '.retries = 0 | .claimedBy = null | .claimedAt = null' | \
+        "$PYTHON_CMD" "$QUEUE_STORE" move dead-letter pending
 
     echo "✓ Task moved to pending queue. Will be retried."
 }
@@ -178,13 +176,16 @@ dlq_skip() {
 
     echo "Marking task $task_id as completed (skipped)..."
 
-    # Find and remove from DLQ, add to completed
-    local task=$(jq ".tasks[] | select(.id == \"$task_id\")" "$DEAD_LETTER")
+    # Find in DLQ and move to completed with skipped status
+    local task=$("$PYTHON_CMD" "$QUEUE_STORE" get dead-letter "$task_id" 2>/dev/null)
 
-    jq "(.tasks |= map(select(.id != \"$task_id\")))" "$DEAD_LETTER" > "$DEAD_LETTER.tmp" && mv "$DEAD_LETTER.tmp" "$DEAD_LETTER"
+    if [ -z "$task" ]; then
+        echo "Error: Task $task_id not found in DLQ"
+        exit 1
+    fi
 
-    # Add to completed with skipped status
-    jq "(.tasks += [$task | .completedAt = \"$(date -u +"%Y-%m-%dT%H:%M:%SZ")\" | .completedBy = \"manual\" | .result = {success: true, skipped: true}])" "$COMPLETED" > "$COMPLETED.tmp" && mv "$COMPLETED.tmp" "$COMPLETED"
+    echo "$task" | jq ".completedAt = \"$(date -u +"%Y-%m-%dT%H:%M:%SZ")\" | .completedBy = \"manual\" | .result = {success: true, skipped: true}" | \
+        "$PYTHON_CMD" "$QUEUE_STORE" move dead-letter completed
 
     echo "✓ Task marked as completed (skipped)."
 }
@@ -207,7 +208,7 @@ dlq_delete() {
         return
     fi
 
-    jq "(.tasks |= map(select(.id != \"$task_id\")))" "$DEAD_LETTER" > "$DEAD_LETTER.tmp" && mv "$DEAD_LETTER.tmp" "$DEAD_LETTER"
+    "$PYTHON_CMD" "$QUEUE_STORE" remove dead-letter "$task_id"
 
     echo "✓ Task deleted from DLQ."
 }
@@ -235,20 +236,8 @@ case "${1:-status}" in
     dlq-delete)
         dlq_delete "$2"
         ;;
-    pending)
-        jq '.tasks' "$PENDING" 2>/dev/null || echo "[]"
-        ;;
-    in-progress)
-        jq '.tasks' "$IN_PROGRESS" 2>/dev/null || echo "[]"
-        ;;
-    completed)
-        jq '.tasks' "$COMPLETED" 2>/dev/null || echo "[]"
-        ;;
-    failed)
-        jq '.tasks' "$FAILED" 2>/dev/null || echo "[]"
-        ;;
-    dead-letter)
-        jq '.tasks' "$DEAD_LETTER" 2>/dev/null || echo "[]"
+    pending|in-progress|completed|failed|dead-letter)
+        queue_json "$1" | jq '.tasks' 2>/dev/null || echo "[]"
         ;;
     *)
         echo "Usage: $0 [status|list <queue>|dlq|dlq-review|dlq-retry <id>|dlq-skip <id>|dlq-delete <id>]"
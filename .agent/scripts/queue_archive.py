@@ -0,0 +1,379 @@
+#!/usr/bin/env python3
+"""
+ODIN AI Agent System - Completed Task Archive
+Tamamlanmış task'ların zamana göre bölümlenmiş, sıkıştırılmış arşivi.
+
+`archive.window` saniyeden eski completed task'lar sıcak queue'dan alınıp
+gün veya hafta bölümlerine (segment) yazılır:
+
+    .agent/queue/archive/
+        manifest.json                   # Segment listesi ve zaman aralıkları
+        completed-2024-01-31.jsonl.gz   # partition: day
+        completed-2024-W05.jsonl.gz     # partition: week
+
+Segment'ler satır başına bir task içeren gzip'li JSON Lines dosyalarıdır;
+yeni task'lar mevcut segment'e ayrı bir gzip member olarak eklenir (dosya
+yeniden yazılmaz). Okuyucular manifest'e bakarak yalnızca istenen zaman
+aralığıyla kesişen segment'leri açar.
+
+Rotasyon sırası: segment'e yaz → manifest'i güncelle → sıcak queue'dan sil.
+Arada crash olursa task hem segment'te hem sıcak queue'da kalır; bir task
+her zaman aynı segment'e düştüğünden okuyucu tekrarları segment içinde id'ye
+göre eler ve sıcak queue'da duran id'leri atlayabilir (exclude_ids).
+
+Version: 1.0.0
+"""
+
+import gzip
+import json
+import os
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from scheduler import parse_timestamp
+
+ARCHIVE_STATUS = "completed"
+
+DEFAULT_ARCHIVE_DIR = "archive"
+DEFAULT_WINDOW = 7 * 86400
+DEFAULT_PARTITION = "day"
+DEFAULT_ROTATE_INTERVAL = 3600
+
+# Rotasyonda segment'e tek seferde yazılan en fazla task
+ROTATE_BATCH_SIZE = 5000
+
+PARTITIONS = ("day", "week")
+
+
+def finished_timestamp(task: Dict[str, Any]) -> float:
+    """Task'ın tamamlanma zamanı (yoksa oluşturma zamanı); bilinmiyorsa 0"""
+    for field in ("completed_at", "completedAt", "finished_at", "updated_at", "created_at", "createdAt"):
+        ts = parse_timestamp(task.get(field))
+        if ts:
+            return ts
+    return 0.0
+
+
+def partition_bounds(ts: float, partition: str) -> Tuple[str, datetime, datetime]:
+    """
+    Zaman damgasının düştüğü bölüm (UTC)
+
+    Returns:
+        (anahtar, başlangıç, bitiş) — bitiş hariç
+    """
+    moment = datetime.fromtimestamp(ts, timezone.utc)
+    day = moment.replace(hour=0, minute=0, second=0, microsecond=0)
+    if partition == "week":
+        start = day - timedelta(days=day.weekday())
+        year, week, _ = start.isocalendar()
+        return f"{year}-W{week:02d}", start, start + timedelta(days=7)
+    return day.strftime("%Y-%m-%d"), day, day + timedelta(days=1)
+
+
+class TaskArchive:
+    """Segment dosyaları + manifest"""
+
+    def __init__(self, archive_dir: Path, partition: str = DEFAULT_PARTITION):
+        if partition not in PARTITIONS:
+            raise ValueError(f"Bilinmeyen archive partition: {partition} (day, week)")
+        self.archive_dir = Path(archive_dir)
+        self.partition = partition
+
+    @property
+    def manifest_file(self) -> Path:
+        return self.archive_dir / "manifest.json"
+
+    def segment_file(self, key: str) -> Path:
+        return self.archive_dir / f"{ARCHIVE_STATUS}-{key}.jsonl.gz"
+
+    # ------------------------------------------------------------------------
+    # Manifest
+    # ------------------------------------------------------------------------
+
+    def load_manifest(self) -> Dict[str, Any]:
+        """Manifest'i oku (yoksa boş)"""
+        if not self.manifest_file.exists():
+            return {"version": "1.0.0", "segments": {}}
+        return json.loads(self.manifest_file.read_text(encoding="utf-8"))
+
+    def _write_manifest(self, manifest: Dict[str, Any]) -> None:
+        """Manifest'i atomik olarak yaz"""
+        tmp_file = self.manifest_file.with_suffix(".json.tmp")
+        tmp_file.write_text(json.dumps(manifest, indent=2, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp_file, self.manifest_file)
+
+    def segments(self, since: Optional[float] = None, until: Optional[float] = None) -> List[Dict[str, Any]]:
+        """Zaman aralığıyla kesişen segment'ler (eskiden yeniye)"""
+        selected = []
+        for key, segment in self.load_manifest().get("segments", {}).items():
+            if since is not None and parse_timestamp(segment["end"]) <= since:
+                continue
+            if until is not None and parse_timestamp(segment["start"]) >= until:
+                continue
+            selected.append(dict(segment, key=key))
+        return sorted(selected, key=lambda s: (s["start"], s["key"]))
+
+    # ------------------------------------------------------------------------
+    # Yazma
+    # ------------------------------------------------------------------------
+
+    def append(self, tasks: Iterable[Dict[str, Any]]) -> int:
+        """Task'ları bölümlerine göre segment'lere ekle ve manifest'i güncelle"""
+        groups: Dict[str, List[Dict[str, Any]]] = {}
+        bounds: Dict[str, Tuple[datetime, datetime]] = {}
+        for task in tasks:
+            key, start, end = partition_bounds(finished_timestamp(task), self.partition)
+            groups.setdefault(key, []).append(task)
+            bounds[key] = (start, end)
+        if not groups:
+            return 0
+
+        self.archive_dir.mkdir(parents=True, exist_ok=True)
+        manifest = self.load_manifest()
+        segments = manifest.setdefault("segments", {})
+
+        written = 0
+        for key, group in groups.items():
+            segment_file = self.segment_file(key)
+            payload = "".join(
+                json.dumps(task, ensure_ascii=False, separators=(",", ":")) + "\n" for task in group
+            ).encode("utf-8")
+            # "ab": mevcut segment'e yeni gzip member eklenir
+            with open(segment_file, "ab") as f:
+                f.write(gzip.compress(payload))
+                f.flush()
+                os.fsync(f.fileno())
+
+            stamps = [finished_timestamp(t) for t in group]
+            segment = segments.get(key) or {
+                "file": segment_file.name,
+                "start": bounds[key][0].isoformat(),
+                "end": bounds[key][1].isoformat(),
+                "count": 0,
+            }
+            segment["count"] += len(group)
+            segment["bytes"] = segment_file.stat().st_size
+            first = datetime.fromtimestamp(min(stamps), timezone.utc).isoformat()
+            last = datetime.fromtimestamp(max(stamps), timezone.utc).isoformat()
+            segment["first"] = min(segment.get("first", first), first)
+            segment["last"] = max(segment.get("last", last), last)
+            segments[key] = segment
+            written += len(group)
+
+        manifest["partition"] = self.partition
+        manifest["lastUpdated"] = datetime.now(timezone.utc).isoformat()
+        self._write_manifest(manifest)
+        return written
+
+    def rotate(self, store, window: float = DEFAULT_WINDOW, now: Optional[float] = None) -> Dict[str, int]:
+        """
+        `window` saniyeden eski completed task'ları arşive taşı
+
+        Args:
+            store: QueueStore
+            window: Sıcak queue'da tutulacak süre (saniye)
+            now: Şimdiki zaman (test için)
+
+        Returns:
+            {"archived": n, "kept": n}
+        """
+        cutoff = (now if now is not None else time.time()) - window
+        archived_ids: List[str] = []
+        kept = 0
+
+        with store.locked():
+            # Okuma sürerken queue değiştirilmez (sayfalı okuyan backend'lerde
+            # offset kayardı): task'lar parça parça arşive yazılır, sıcak
+            # queue'dan silme en sonda tek seferde yapılır
+            batch: List[Dict[str, Any]] = []
+            for task in store.iter_query(ARCHIVE_STATUS):
+                ts = finished_timestamp(task)
+                if ts and ts < cutoff and task.get("id") is not None:
+                    batch.append(task)
+                    archived_ids.append(str(task["id"]))
+                else:
+                    kept += 1
+                if len(batch) >= ROTATE_BATCH_SIZE:
+                    self.append(batch)
+                    batch = []
+            self.append(batch)
+
+            if archived_ids:
+                store.remove_many(ARCHIVE_STATUS, archived_ids)
+
+        self.archive_dir.mkdir(parents=True, exist_ok=True)
+        manifest = self.load_manifest()
+        manifest["lastRotation"] = datetime.fromtimestamp(cutoff + window, timezone.utc).isoformat()
+        self._write_manifest(manifest)
+
+        return {"archived": len(archived_ids), "kept": kept}
+
+    # ------------------------------------------------------------------------
+    # Okuma
+    # ------------------------------------------------------------------------
+
+    def iter_tasks(
+        self,
+        since: Optional[float] = None,
+        until: Optional[float] = None,
+        exclude_ids: Optional[Set[str]] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Aralıktaki arşivlenmiş task'lar (eskiden yeniye segment sırasıyla)
+
+        Args:
+            since / until: Tamamlanma zamanı aralığı (epoch saniye, until hariç)
+            exclude_ids: Atlanacak id'ler (ör. hâlâ sıcak queue'da olanlar)
+        """
+        for segment in self.segments(since, until):
+            for task in self._read_segment(segment, exclude_ids):
+                ts = finished_timestamp(task)
+                if since is not None and ts < since:
+                    continue
+                if until is not None and ts >= until:
+                    continue
+                yield task
+
+    def count(self, since: Optional[float] = None, until: Optional[float] = None) -> int:
+        """
+        Aralıkla kesişen segment'lerdeki task sayısı
+
+        Manifest'teki sayaçlardan gelir, segment açılmaz (dashboard gibi
+        sık okuyanlar için). Rotasyon crash'inde yinelenen task'lar sayılabilir.
+        """
+        return sum(segment.get("count", 0) for segment in self.segments(since, until))
+
+    def recent(self, limit: int, exclude_ids: Optional[Set[str]] = None) -> List[Dict[str, Any]]:
+        """En son tamamlanan `limit` arşiv task'ı (eskiden yeniye); sadece en yeni segment'ler açılır"""
+        tasks: List[Dict[str, Any]] = []
+        for segment in reversed(self.segments()):
+            if len(tasks) >= limit:
+                break
+            tasks = sorted(self._read_segment(segment, exclude_ids), key=finished_timestamp) + tasks
+        return tasks[-limit:] if limit > 0 else []
+
+    def locate(self, task_ids: Iterable[str]) -> Set[str]:
+        """
+        Arşivde bulunan ID'ler
+
+        Segment'ler yeniden eskiye okunur; tüm ID'ler bulununca durulur.
+        Bulunamayan ID için tüm arşiv taranır.
+        """
+        wanted = {str(task_id) for task_id in task_ids}
+        found: Set[str] = set()
+        for segment in reversed(self.segments()):
+            if found == wanted:
+                break
+            found.update(str(task.get("id")) for task in self._read_segment(segment) if str(task.get("id")) in wanted)
+        return found
+
+    def _read_segment(self, segment: Dict[str, Any], exclude_ids: Optional[Set[str]] = None) -> Iterator[Dict[str, Any]]:
+        """Segment'teki task'lar (segment içi tekrarlar id'ye göre elenir)"""
+        segment_file = self.archive_dir / segment["file"]
+        if not segment_file.exists():
+            return
+        seen: Set[str] = set()
+        with gzip.open(segment_file, "rt", encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                task = json.loads(line)
+                task_id = str(task.get("id"))
+                if task_id in seen or (exclude_ids and task_id in exclude_ids):
+                    continue
+                seen.add(task_id)
+                yield task
+
+
+def create_archive(queue_dir: Path, config: Dict[str, Any]) -> TaskArchive:
+    """queue.json > archive ayarlarına göre arşiv"""
+    archive_config = config.get("archive", {})
+    return TaskArchive(
+        Path(queue_dir) / archive_config.get("dir", DEFAULT_ARCHIVE_DIR),
+        partition=archive_config.get("partition", DEFAULT_PARTITION),
+    )
+
+
+def maybe_rotate(store, queue_dir: Path, config: Dict[str, Any], now: Optional[float] = None) -> Optional[Dict[str, int]]:
+    """
+    Otomatik rotasyon: archive.enabled ise ve son rotasyondan bu yana
+    archive.rotateInterval saniye geçtiyse çalışır
+
+    Returns:
+        rotate() sonucu; rotasyon yapılmadıysa None
+    """
+    archive_config = config.get("archive", {})
+    if not archive_config.get("enabled", False):
+        return None
+
+    now = now if now is not None else time.time()
+    archive = create_archive(queue_dir, config)
+    last_rotation = parse_timestamp(archive.load_manifest().get("lastRotation"))
+    if now - last_rotation < archive_config.get("rotateInterval", DEFAULT_ROTATE_INTERVAL):
+        return None
+    return archive.rotate(store, archive_config.get("window", DEFAULT_WINDOW), now=now)
+
+
+# ============================================================================
+# CLI
+# ============================================================================
+
+def main():
+    """
+    Kullanım:
+        python queue_archive.py segments [queue_dir]
+        python queue_archive.py cat [queue_dir] [--since ISO|2h|7d] [--until ISO]
+        python queue_archive.py count [queue_dir] [--since ISO|2h|7d] [--until ISO]
+        python queue_archive.py tail [queue_dir] [--limit N]
+
+    `cat` aralıktaki arşivlenmiş task'ları, `tail` en son arşivlenen N
+    task'ı JSON Lines olarak yazar; `count` manifest'ten task sayısını verir
+    (report.sh / dashboard.sh gibi script'ler için).
+    """
+    from queue_store import parse_since
+
+    args = sys.argv[1:]
+    if not args or args[0] not in ("segments", "cat", "count", "tail"):
+        print(main.__doc__)
+        return 1
+
+    options: Dict[str, Optional[float]] = {"since": None, "until": None}
+    limit = 10
+    positional = []
+    i = 1
+    while i < len(args):
+        if args[i] in ("--since", "--until") and i + 1 < len(args):
+            options[args[i][2:]] = parse_since(args[i + 1])
+            i += 2
+        elif args[i] == "--limit" and i + 1 < len(args):
+            limit = int(args[i + 1])
+            i += 2
+        else:
+            positional.append(args[i])
+            i += 1
+
+    queue_dir = Path(positional[0]) if positional else Path(".agent/queue")
+    config_file = queue_dir.parent / "config" / "queue.json"
+    config = json.loads(config_file.read_text(encoding="utf-8")) if config_file.exists() else {}
+    archive = create_archive(queue_dir, config)
+
+    if args[0] == "segments":
+        for segment in archive.segments(options["since"], options["until"]):
+            print(f"{segment['key']}\t{segment['count']}\t{segment.get('bytes', 0)}\t{segment['file']}")
+        return 0
+
+    if args[0] == "count":
+        print(archive.count(options["since"], options["until"]))
+        return 0
+
+    tasks = archive.recent(limit) if args[0] == "tail" else archive.iter_tasks(options["since"], options["until"])
+    for task in tasks:
+        sys.stdout.write(json.dumps(task, ensure_ascii=False) + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,788 @@
+#!/usr/bin/env python3
+"""
+ODIN AI Agent System - Queue Daemon
+`odin serve` için bellekte çalışan queue sunucusu.
+
+Daemon queue'ları, circuit durumlarını ve agent kayıtlarını bellekte tutar.
+Her mutasyon önce altta yatan store'a (JSON journal veya SQLite WAL)
+yazılır, sonra bellekteki kopyaya uygulanır; snapshot'lar periyodik olarak
+alınır (compaction). İstemciler yerel Unix socket üzerinden satır başına
+bir JSON istek / yanıt ile konuşur:
+
+    → {"op": "count", "status": "pending"}
+    ← {"ok": true, "result": 12}
+
+Daemon çalışıyorsa odin komutları RemoteQueueStore üzerinden otomatik
+olarak ona bağlanır; çalışmıyorsa dosyalara doğrudan erişilir.
+
+Lease'i dolan in-progress task'lar her `lease_sweep_interval` saniyede bir
+geri alınır (reclaim_expired); taramada yalnızca süresi dolanlar ziyaret edilir.
+
+Version: 1.0.0
+"""
+
+import json
+import os
+import signal
+import socket
+import socketserver
+import sys
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from admission import AdmissionPolicy, QueueFullError, admit
+from circuit_breaker import CircuitBreaker, get_all_circuits, get_circuit_state
+from dedup import DEDUP_STATUSES, ContentIndex, DedupPolicy
+from queue_store import QUEUE_STATUSES, AgentFilter, QueueStore, mark_claimed, task_matches
+from scheduler import DependencyGraph, LeaseIndex, PriorityScheduler
+
+# İstemci bağlantı zaman aşımı (saniye)
+CONNECT_TIMEOUT = 0.2
+REQUEST_TIMEOUT = 30
+
+# RemoteQueueStore.iter_query sayfa boyutu
+REMOTE_PAGE_SIZE = 500
+
+DEFAULT_SNAPSHOT_INTERVAL = 60
+DEFAULT_LEASE_SWEEP_INTERVAL = 5
+DEFAULT_SOCKET_FILE = "odin.sock"
+
+
+# ============================================================================
+# IN-MEMORY STORE
+# ============================================================================
+
+class MemoryQueueStore(QueueStore):
+    """
+    Bellekteki queue'lar + write-through backing store
+
+    Okumalar (load/get/count/query/claim seçimi) bellekten yapılır.
+    Yazmalar önce backing store'a (journal / WAL) gider, böylece daemon
+    kapansa bile hiçbir mutasyon kaybolmaz.
+
+    Bağımlılık grafı her mutasyonda artımlı güncellenir; claim heap'inde
+    yalnızca bağımlılıkları bitmiş (hazır) pending task'lar bulunur.
+    In-progress lease'leri bitiş zamanına göre ayrı bir heap'te tutulur.
+    """
+
+    backend = "memory"
+
+    def __init__(self, backing: QueueStore):
+        self.backing = backing
+        self.aging_interval = backing.aging_interval
+        self.lease_timeout = backing.lease_timeout
+        self.task_timeout = backing.task_timeout
+        self.stuck_timeout = backing.stuck_timeout
+        self.max_retries = backing.max_retries
+        self._lock = threading.RLock()
+        self._tasks: Dict[str, "OrderedDict[str, Dict[str, Any]]"] = {}
+        self._scheduler = PriorityScheduler(self.aging_interval)
+        self._graph = DependencyGraph(self._on_ready_change)
+        self._leases = LeaseIndex(self.stuck_timeout)
+        self._hashes = {status: ContentIndex() for status in DEDUP_STATUSES}
+        self.reload()
+
+    def reload(self) -> None:
+        """Tüm queue'ları backing store'dan yeniden yükle"""
+        with self._lock:
+            for status in QUEUE_STATUSES:
+                self._tasks[status] = OrderedDict(
+                    (str(t["id"]), t) for t in self.backing.load(status) if t.get("id") is not None
+                )
+            self._scheduler = PriorityScheduler(self.aging_interval)
+            self._graph = DependencyGraph(self._on_ready_change)
+            self._leases = LeaseIndex(self.stuck_timeout)
+            self._hashes = {status: ContentIndex() for status in DEDUP_STATUSES}
+            for status in QUEUE_STATUSES:
+                for task in self._tasks[status].values():
+                    self._graph.put(task, status)
+                    if status in self._hashes:
+                        self._hashes[status].put(task)
+            for task in self._tasks["in-progress"].values():
+                self._leases.push(task)
+
+    def locked(self, shared: bool = False):
+        return self._lock
+
+    # ------------------------------------------------------------------------
+    # Bellek güncellemeleri
+    # ------------------------------------------------------------------------
+
+    def _on_ready_change(self, task_id: str, ready: bool) -> None:
+        # Graf hazır kümesini değiştirdiğinde claim heap'i de güncellenir
+        if ready:
+            self._scheduler.push(self._tasks["pending"][task_id])
+        else:
+            self._scheduler.discard(task_id)
+
+    def _mem_put(self, status: str, task: Dict[str, Any]) -> None:
+        # Güncellenen task yerinde kalır (journal replay ile aynı)
+        self._tasks[status][str(task["id"])] = task
+        self._graph.put(task, status)
+        if status == "in-progress":
+            self._leases.push(task)
+        if status in self._hashes:
+            self._hashes[status].put(task)
+
+    def _mem_del(self, status: str, task_id: str) -> None:
+        if self._tasks[status].pop(str(task_id), None) is not None:
+            self._graph.remove(task_id, status)
+            if status == "in-progress":
+                self._leases.discard(str(task_id))
+            if status in self._hashes:
+                self._hashes[status].discard(str(task_id))
+
+    # ------------------------------------------------------------------------
+    # Yazma (write-through)
+    # ------------------------------------------------------------------------
+
+    def append(self, status: str, task: Dict[str, Any]) -> None:
+        with self._lock:
+            self.backing.append(status, task)
+            self._mem_put(status, dict(task))
+
+    def append_many(self, status: str, tasks: List[Dict[str, Any]]) -> None:
+        with self._lock:
+            self.backing.append_many(status, tasks)
+            for task in tasks:
+                self._mem_put(status, dict(task))
+
+    def remove(self, status: str, task_id: str) -> None:
+        with self._lock:
+            self.backing.remove(status, task_id)
+            self._mem_del(status, task_id)
+
+    def remove_many(self, status: str, task_ids: List[str]) -> None:
+        with self._lock:
+            self.backing.remove_many(status, task_ids)
+            for task_id in task_ids:
+                self._mem_del(status, task_id)
+
+    def move(self, task: Dict[str, Any], source: str, target: str) -> None:
+        with self._lock:
+            self.backing.move(task, source, target)
+            # Önce hedef: bağımlılar ara adımda yanlışlıkla hazır görünmesin
+            self._mem_put(target, dict(task))
+            self._mem_del(source, task["id"])
+
+    def save(self, status: str, tasks: List[Dict[str, Any]]) -> None:
+        with self._lock:
+            self.backing.save(status, tasks)
+            for task_id in list(self._tasks[status]):
+                self._mem_del(status, task_id)
+            for task in tasks:
+                if task.get("id") is not None:
+                    self._mem_put(status, dict(task))
+
+    def compact(self, status: str) -> None:
+        with self._lock:
+            self.backing.compact(status)
+
+    def claim(
+        self,
+        worker_id: str,
+        task_id: Optional[str] = None,
+        eligible: Optional[Callable[[Dict[str, Any]], bool]] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """Hazır task heap'inden O(log n) claim"""
+        with self._lock:
+            pending = self._tasks["pending"]
+            if task_id is not None:
+                chosen = task_id if self._graph.is_ready(task_id) else None
+                if chosen is not None and eligible is not None and not eligible(pending[chosen]):
+                    chosen = None
+            else:
+                chosen = self._scheduler.select(
+                    None if eligible is None else (lambda tid: eligible(pending[tid]))
+                )
+            if chosen is None:
+                return None
+
+            task = mark_claimed(dict(pending[chosen]), worker_id, self.lease_timeout)
+            self.move(task, "pending", "in-progress")
+            return task
+
+    def expired_leases(self, now: Optional[float] = None) -> List[Dict[str, Any]]:
+        """Lease heap'inden süresi dolanlar"""
+        now = time.time() if now is None else now
+        with self._lock:
+            return [dict(self._tasks["in-progress"][task_id]) for task_id in self._leases.due(now)]
+
+    def find_duplicates(self, hashes: Iterable[str]) -> Dict[str, Tuple[str, Dict[str, Any]]]:
+        """Bellekteki hash index'inden O(1) arama"""
+        found: Dict[str, Tuple[str, Dict[str, Any]]] = {}
+        with self._lock:
+            for digest in hashes:
+                for status in DEDUP_STATUSES:
+                    task_id = self._hashes[status].get(digest)
+                    if task_id is not None:
+                        found[digest] = (status, dict(self._tasks[status][task_id]))
+                        break
+        return found
+
+    # ------------------------------------------------------------------------
+    # Okuma (bellekten)
+    # ------------------------------------------------------------------------
+
+    def load(self, status: str) -> List[Dict[str, Any]]:
+        with self._lock:
+            return [dict(t) for t in self._tasks[status].values()]
+
+    def get(self, status: str, task_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            task = self._tasks[status].get(str(task_id))
+            return dict(task) if task is not None else None
+
+    def count(self, status: str) -> int:
+        return len(self._tasks[status])
+
+    def locate(self, task_ids: Iterable[str]) -> Dict[str, str]:
+        found: Dict[str, str] = {}
+        with self._lock:
+            for task_id in map(str, task_ids):
+                for status in QUEUE_STATUSES:
+                    if task_id in self._tasks[status]:
+                        found[task_id] = status
+                        break
+        return found
+
+    def blockers(self, task: Dict[str, Any]) -> Dict[str, str]:
+        with self._lock:
+            return self._graph.blockers(task)
+
+    def dependents(self, task_id: str) -> List[Dict[str, Any]]:
+        with self._lock:
+            return [dict(self._tasks["pending"][dep]) for dep in self._graph.dependents(task_id)]
+
+    def ready(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Hazır task'lar heap sırasıyla (O(hazır · log hazır))"""
+        with self._lock:
+            ids = self._scheduler.ordered()
+            if limit is not None:
+                ids = ids[:limit]
+            return [dict(self._tasks["pending"][task_id]) for task_id in ids]
+
+    def stats(self, status: str) -> Dict[str, Any]:
+        # Backing store sayaçları write-through ile güncel
+        with self._lock:
+            return self.backing.stats(status)
+
+    def recount(self, status: str) -> Dict[str, Any]:
+        with self._lock:
+            return self.backing.recount(status)
+
+    def query(
+        self,
+        status: str,
+        agent: Optional[str] = None,
+        priority: Optional[Any] = None,
+        tag: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        since: Optional[float] = None,
+    ) -> List[Dict[str, Any]]:
+        results = []
+        skipped = 0
+        with self._lock:
+            for task in self._tasks[status].values():
+                if not task_matches(task, agent, priority, tag, since):
+                    continue
+                if skipped < offset:
+                    skipped += 1
+                    continue
+                results.append(dict(task))
+                if limit is not None and len(results) >= limit:
+                    break
+        return results
+
+    def close(self) -> None:
+        with self._lock:
+            for status in QUEUE_STATUSES:
+                self.backing.compact(status)
+            self.backing.close()
+
+
+# ============================================================================
+# CIRCUIT / AGENT REGISTRY
+# ============================================================================
+
+class CachedJsonFile:
+    """Değiştiğinde (mtime/boyut) yeniden okunan JSON dosyası"""
+
+    def __init__(self, path: Path, default: Any):
+        self.path = Path(path)
+        self.default = default
+        self._signature = None
+        self._data = default
+
+    def get(self) -> Any:
+        try:
+            st = self.path.stat()
+        except FileNotFoundError:
+            self._signature, self._data = None, self.default
+            return self._data
+        signature = (st.st_mtime_ns, st.st_size)
+        if signature != self._signature:
+            try:
+                self._data = json.loads(self.path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                self._data = self.default
+            self._signature = signature
+        return self._data
+
+
+# ============================================================================
+# SUNUCU
+# ============================================================================
+
+class QueueDaemon:
+    """İstek dispatch'i ve periyodik snapshot"""
+
+    def __init__(
+        self,
+        store: MemoryQueueStore,
+        socket_path: Path,
+        circuits_file: Path,
+        agents_file: Path,
+        snapshot_interval: float = DEFAULT_SNAPSHOT_INTERVAL,
+        maintenance: Optional[Callable[[QueueStore], Any]] = None,
+        lease_sweep_interval: float = DEFAULT_LEASE_SWEEP_INTERVAL,
+        circuit_config: Optional[Dict[str, Any]] = None,
+    ):
+        """
+        Args:
+            maintenance: Her snapshot turunda çağrılan bakım işi
+                         (ör. completed arşiv rotasyonu)
+            lease_sweep_interval: Süresi dolan lease taraması aralığı (0: kapalı)
+            circuit_config: circuit-breaker.json içeriği (claim'de bloke agent'lar)
+        """
+        self.store = store
+        self.maintenance = maintenance
+        self.lease_sweep_interval = lease_sweep_interval
+        self.leases_reclaimed = 0
+        self.socket_path = Path(socket_path)
+        self.circuits_file = Path(circuits_file)
+        self.breaker = CircuitBreaker(self.circuits_file, circuit_config)
+        self.agents = CachedJsonFile(agents_file, {})
+        self.snapshot_interval = snapshot_interval
+        self.started_at = time.time()
+        self.requests_served = 0
+        self._server: Optional[socketserver.BaseServer] = None
+        self._stop = threading.Event()
+
+    # ------------------------------------------------------------------------
+    # İstekler
+    # ------------------------------------------------------------------------
+
+    def circuit_state(self, agent_type: str) -> str:
+        return get_circuit_state(agent_type, self.circuits_file)
+
+    def _circuit_allows(self, task: Dict[str, Any]) -> bool:
+        return self.breaker.allows(task.get("agent"))
+
+    def _claim_filter(self, request: Dict[str, Any]) -> Callable[[Dict[str, Any]], bool]:
+        """Circuit kontrolü + istemcinin gönderdiği agent filtresi"""
+        if not request.get("filter"):
+            return self._circuit_allows
+        agent_filter = AgentFilter.from_dict(request["filter"])
+        return lambda task: agent_filter(task) and self._circuit_allows(task)
+
+    def handle(self, request: Dict[str, Any]) -> Any:
+        """Tek isteği işle ve sonucu döndür"""
+        op = request.get("op")
+        store = self.store
+
+        handlers: Dict[str, Callable[[], Any]] = {
+            "ping": lambda: {
+                "pid": os.getpid(),
+                "uptime": time.time() - self.started_at,
+                "requests": self.requests_served,
+                "backend": store.backing.backend,
+                "reclaimed": self.leases_reclaimed,
+            },
+            "load": lambda: store.load(request["status"]),
+            "get": lambda: store.get(request["status"], request["id"]),
+            "locate": lambda: store.locate(request["ids"]),
+            "count": lambda: store.count(request["status"]),
+            "counts": lambda: store.counts(),
+            "stats": lambda: store.stats(request["status"]),
+            "recount": lambda: store.recount(request["status"]),
+            "ready": lambda: store.ready(request.get("limit")),
+            "blockers": lambda: store.blockers(request["task"]),
+            "dependents": lambda: store.dependents(request["id"]),
+            "duplicates": lambda: store.find_duplicates(request["hashes"]),
+            # Tekrar + limit kontrolü ve ekleme istemcide kilitsiz yapılamaz
+            "admit": lambda: self._admit(request),
+            "query": lambda: store.query(
+                request["status"],
+                agent=request.get("agent"),
+                priority=request.get("priority"),
+                tag=request.get("tag"),
+                limit=request.get("limit"),
+                offset=request.get("offset", 0),
+                since=request.get("since"),
+            ),
+            "append": lambda: store.append(request["status"], request["task"]),
+            "append_many": lambda: store.append_many(request["status"], request["tasks"]),
+            "remove": lambda: store.remove(request["status"], request["id"]),
+            "remove_many": lambda: store.remove_many(request["status"], request["ids"]),
+            "move": lambda: store.move(request["task"], request["source"], request["target"]),
+            "save": lambda: store.save(request["status"], request["tasks"]),
+            "compact": lambda: store.compact(request["status"]),
+            # Circuit OPEN olan agent'ların task'ları daemon tarafında elenir
+            "claim": lambda: store.claim(
+                request["worker"], task_id=request.get("task_id"), eligible=self._claim_filter(request)
+            ),
+            "heartbeat": lambda: store.heartbeat(request["id"], worker_id=request.get("worker")),
+            "reclaim": lambda: self._reclaim(),
+            "circuit": lambda: self.circuit_state(request["agent"]),
+            "circuits": lambda: get_all_circuits(self.circuits_file),
+            "agents": lambda: self.agents.get().get("agents", []),
+            "shutdown": self.shutdown,
+        }
+
+        if op not in handlers:
+            raise ValueError(f"Bilinmeyen işlem: {op}")
+        self.requests_served += 1
+        return handlers[op]()
+
+    # ------------------------------------------------------------------------
+    # Yaşam döngüsü
+    # ------------------------------------------------------------------------
+
+    def _admit(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """admission.admit'i store kilidi altında çalıştır (block'ta kilit beklerken bırakılır)"""
+        try:
+            return admit(
+                self.store,
+                request["tasks"],
+                AdmissionPolicy.from_dict(request["policy"]),
+                request.get("status", "pending"),
+                request.get("wait"),
+                dedup=DedupPolicy(request["dedup"]) if request.get("dedup") else None,
+                unique_ids=request.get("unique_ids"),
+            )
+        except QueueFullError as e:
+            return {"full": [e.status, e.count, e.limit, e.incoming]}
+
+    def _reclaim(self) -> Dict[str, List[str]]:
+        reclaimed = self.store.reclaim_expired()
+        self.leases_reclaimed += sum(len(ids) for ids in reclaimed.values())
+        return reclaimed
+
+    def _lease_loop(self) -> None:
+        """Süresi dolan lease'leri periyodik olarak geri al"""
+        while not self._stop.wait(self.lease_sweep_interval):
+            try:
+                self._reclaim()
+            except Exception as e:
+                sys.stderr.write(f"Lease taraması hatası: {type(e).__name__}: {e}\n")
+
+    def _snapshot_loop(self) -> None:
+        """Periyodik snapshot (journal / WAL compaction) ve bakım"""
+        while not self._stop.wait(self.snapshot_interval):
+            if self.maintenance is not None:
+                try:
+                    self.maintenance(self.store)
+                except Exception as e:
+                    sys.stderr.write(f"Daemon bakım hatası: {type(e).__name__}: {e}\n")
+            for status in QUEUE_STATUSES:
+                self.store.compact(status)
+
+    def serve_forever(self) -> None:
+        """Socket'i aç ve kapatılana kadar istekleri işle"""
+        daemon = self
+
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self):
+                for line in self.rfile:
+                    if not line.strip():
+                        continue
+                    try:
+                        response = {"ok": True, "result": daemon.handle(json.loads(line))}
+                    except Exception as e:
+                        response = {"ok": False, "error": f"{type(e).__name__}: {e}"}
+                    self.wfile.write(json.dumps(response, ensure_ascii=False).encode("utf-8") + b"\n")
+                    self.wfile.flush()
+
+        class Server(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+            daemon_threads = True
+
+        if self.socket_path.exists():
+            if DaemonClient(self.socket_path).ping() is not None:
+                raise RuntimeError(f"Daemon zaten çalışıyor: {self.socket_path}")
+            self.socket_path.unlink()  # Eski process'ten kalan socket
+
+        self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+        self._server = Server(str(self.socket_path), Handler)
+        os.chmod(str(self.socket_path), 0o600)
+
+        snapshot_thread = threading.Thread(target=self._snapshot_loop, daemon=True)
+        snapshot_thread.start()
+        if self.lease_sweep_interval > 0:
+            threading.Thread(target=self._lease_loop, daemon=True).start()
+
+        try:
+            self._server.serve_forever()
+        finally:
+            self._stop.set()
+            self._server.server_close()
+            self.store.close()
+            if self.socket_path.exists():
+                self.socket_path.unlink()
+
+    def shutdown(self) -> bool:
+        """Sunucuyu durdur (istek thread'inden çağrılabilir)"""
+        if self._server is not None:
+            threading.Thread(target=self._server.shutdown, daemon=True).start()
+        return True
+
+
+def run_daemon(
+    backing: QueueStore,
+    socket_path: Path,
+    circuits_file: Path,
+    agents_file: Path,
+    snapshot_interval: float = DEFAULT_SNAPSHOT_INTERVAL,
+    maintenance: Optional[Callable[[QueueStore], Any]] = None,
+    lease_sweep_interval: float = DEFAULT_LEASE_SWEEP_INTERVAL,
+    circuit_config: Optional[Dict[str, Any]] = None,
+) -> None:
+    """Daemon'u ön planda çalıştır (SIGTERM / SIGINT ile temiz kapanır)"""
+    daemon = QueueDaemon(
+        MemoryQueueStore(backing),
+        socket_path,
+        circuits_file,
+        agents_file,
+        snapshot_interval=snapshot_interval,
+        maintenance=maintenance,
+        lease_sweep_interval=lease_sweep_interval,
+        circuit_config=circuit_config,
+    )
+
+    def _terminate(signum, frame):
+        daemon.shutdown()
+
+    signal.signal(signal.SIGTERM, _terminate)
+    signal.signal(signal.SIGINT, _terminate)
+    daemon.serve_forever()
+
+
+# ============================================================================
+# İSTEMCİ
+# ============================================================================
+
+class DaemonError(RuntimeError):
+    """Daemon isteği başarısız oldu"""
+
+
+class DaemonClient:
+    """Daemon'a satır tabanlı JSON istek gönderen istemci"""
+
+    def __init__(self, socket_path: Path):
+        self.socket_path = Path(socket_path)
+
+    def request(self, op: str, request_timeout: float = REQUEST_TIMEOUT, **params: Any) -> Any:
+        """İstek gönder, yanıtın `result` alanını döndür"""
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            sock.settimeout(CONNECT_TIMEOUT)
+            sock.connect(str(self.socket_path))
+            sock.settimeout(request_timeout)
+            sock.sendall(json.dumps({"op": op, **params}, ensure_ascii=False).encode("utf-8") + b"\n")
+
+            chunks = []
+            while True:
+                chunk = sock.recv(65536)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+                if chunk.endswith(b"\n"):
+                    break
+        finally:
+            sock.close()
+
+        if not chunks:
+            raise DaemonError("Daemon yanıt vermedi")
+        response = json.loads(b"".join(chunks))
+        if not response.get("ok"):
+            raise DaemonError(response.get("error", "Bilinmeyen hata"))
+        return response.get("result")
+
+    def ping(self) -> Optional[Dict[str, Any]]:
+        """Daemon çalışıyorsa durum bilgisi, değilse None"""
+        if not hasattr(socket, "AF_UNIX") or not self.socket_path.exists():
+            return None
+        try:
+            return self.request("ping")
+        except (OSError, ValueError, DaemonError):
+            return None
+
+
+class RemoteQueueStore(QueueStore):
+    """
+    Daemon'a bağlanan QueueStore
+
+    `claim` için verilen `eligible` fonksiyonu socket üzerinden
+    gönderilemez; daemon aynı circuit kontrolünü kendi tarafında uygular.
+    AgentFilter ise veri olarak gönderilir.
+    """
+
+    backend = "daemon"
+
+    def __init__(self, client: DaemonClient):
+        self.client = client
+
+    def load(self, status: str) -> List[Dict[str, Any]]:
+        return self.client.request("load", status=status)
+
+    def get(self, status: str, task_id: str) -> Optional[Dict[str, Any]]:
+        return self.client.request("get", status=status, id=task_id)
+
+    def count(self, status: str) -> int:
+        return self.client.request("count", status=status)
+
+    def locate(self, task_ids: Iterable[str]) -> Dict[str, str]:
+        return self.client.request("locate", ids=list(task_ids))
+
+    def counts(self) -> Dict[str, int]:
+        return self.client.request("counts")
+
+    @staticmethod
+    def _stats(result: Dict[str, Any]) -> Dict[str, Any]:
+        # JSON'da int anahtarlar metne döner
+        result["priorities"] = {int(k): v for k, v in result.get("priorities", {}).items()}
+        return result
+
+    def stats(self, status: str) -> Dict[str, Any]:
+        return self._stats(self.client.request("stats", status=status))
+
+    def recount(self, status: str) -> Dict[str, Any]:
+        return self._stats(self.client.request("recount", status=status))
+
+    def ready(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        return self.client.request("ready", limit=limit)
+
+    def blockers(self, task: Dict[str, Any]) -> Dict[str, str]:
+        return self.client.request("blockers", task=task)
+
+    def dependents(self, task_id: str) -> List[Dict[str, Any]]:
+        return self.client.request("dependents", id=task_id)
+
+    def admit(
+        self,
+        tasks: List[Dict[str, Any]],
+        policy: AdmissionPolicy,
+        status: str = "pending",
+        timeout: Optional[float] = None,
+        dedup: Optional[DedupPolicy] = None,
+        unique_ids: Optional[Iterable[str]] = None,
+    ) -> Dict[str, Any]:
+        """admission.admit daemon'da tek istek olarak (istemcinin kilidi yok)"""
+        wait = policy.block_timeout if timeout is None else timeout
+        result = self.client.request(
+            "admit",
+            request_timeout=REQUEST_TIMEOUT + (wait if policy.policy == "block" else 0),
+            tasks=tasks,
+            policy=policy.to_dict(),
+            status=status,
+            wait=timeout,
+            dedup=dedup.policy if dedup is not None else None,
+            unique_ids=list(unique_ids) if unique_ids else None,
+        )
+        if "full" in result:
+            raise QueueFullError(*result["full"])
+        return result
+
+    def query(
+        self,
+        status: str,
+        agent: Optional[str] = None,
+        priority: Optional[Any] = None,
+        tag: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        since: Optional[float] = None,
+    ) -> List[Dict[str, Any]]:
+        return self.client.request(
+            "query", status=status, agent=agent, priority=priority, tag=tag,
+            limit=limit, offset=offset, since=since,
+        )
+
+    def iter_query(
+        self,
+        status: str,
+        agent: Optional[str] = None,
+        priority: Optional[Any] = None,
+        tag: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        since: Optional[float] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """Sonuçları REMOTE_PAGE_SIZE'lık sayfalar halinde çek"""
+        remaining = limit
+        while remaining is None or remaining > 0:
+            size = REMOTE_PAGE_SIZE if remaining is None else min(REMOTE_PAGE_SIZE, remaining)
+            page = self.query(status, agent, priority, tag, size, offset, since)
+            yield from page
+            if len(page) < size:
+                return
+            offset += len(page)
+            if remaining is not None:
+                remaining -= len(page)
+
+    def append(self, status: str, task: Dict[str, Any]) -> None:
+        self.client.request("append", status=status, task=task)
+
+    def append_many(self, status: str, tasks: List[Dict[str, Any]]) -> None:
+        self.client.request("append_many", status=status, tasks=tasks)
+
+    def remove(self, status: str, task_id: str) -> None:
+        self.client.request("remove", status=status, id=task_id)
+
+    def remove_many(self, status: str, task_ids: List[str]) -> None:
+        self.client.request("remove_many", status=status, ids=task_ids)
+
+    def move(self, task: Dict[str, Any], source: str, target: str) -> None:
+        self.client.request("move", task=task, source=source, target=target)
+
+    def save(self, status: str, tasks: List[Dict[str, Any]]) -> None:
+        self.client.request("save", status=status, tasks=tasks)
+
+    def compact(self, status: str) -> None:
+        self.client.request("compact", status=status)
+
+    def claim(
+        self,
+        worker_id: str,
+        task_id: Optional[str] = None,
+        eligible: Optional[Callable[[Dict[str, Any]], bool]] = None,
+    ) -> Optional[Dict[str, Any]]:
+        agent_filter = eligible.to_dict() if isinstance(eligible, AgentFilter) else None
+        return self.client.request("claim", worker=worker_id, task_id=task_id, filter=agent_filter)
+
+    def heartbeat(
+        self,
+        task_id: str,
+        worker_id: Optional[str] = None,
+        now: Optional[float] = None,
+    ) -> Optional[float]:
+        return self.client.request("heartbeat", id=task_id, worker=worker_id)
+
+    def reclaim_expired(self, now: Optional[float] = None) -> Dict[str, List[str]]:
+        return self.client.request("reclaim")
+
+    def find_duplicates(self, hashes: Iterable[str]) -> Dict[str, Tuple[str, Dict[str, Any]]]:
+        found = self.client.request("duplicates", hashes=list(hashes))
+        return {digest: (status, task) for digest, (status, task) in found.items()}
+
+
+def connect(socket_path: Path) -> Optional[RemoteQueueStore]:
+    """Daemon çalışıyorsa RemoteQueueStore döndür"""
+    client = DaemonClient(socket_path)
+    if client.ping() is None:
+        return None
+    return RemoteQueueStore(client)
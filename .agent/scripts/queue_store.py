@@ -0,0 +1,2020 @@
+#!/usr/bin/env python3
+"""
+ODIN AI Agent System - Queue Store
+Task queue depolama backend'leri.
+
+Backend, .agent/config/queue.json > storage.backend ile seçilir:
+  - json   : Snapshot + journal dosyaları (varsayılan)
+  - sqlite : SQLite (WAL) veritabanı, status/agent/priority/tag index'li
+
+JSON backend'de her queue durumu için iki dosya tutulur:
+  - tasks-<status>.json     : Snapshot (mevcut format, shell script'leri okur)
+  - tasks-<status>.journal  : Append-only mutasyon logu (JSON Lines)
+
+Ekleme/silme işlemleri journal'a tek satır olarak yazılır (O(1) I/O).
+Okuma, snapshot + journal replay ile yapılır. Journal boyutu eşiği
+aştığında snapshot'a katlanır (compaction).
+
+Claim, `dependencies` alanındaki task'lardan biri hâlâ bitmemiş bir
+queue'daysa (OPEN_STATUSES) task'ı atlar.
+SQLite backend'de pending task'ların bağımlılıkları task_deps tablosunda,
+bitmemiş bağımlılık sayısı tasks.unmet kolonunda tutulur; trigger'lar bir
+task bitmemiş queue'lara girip çıktıkça yalnızca ona bağlı satırları
+günceller. ready / claim / dependents index'ten okur. JSON backend'de kalıcı
+bir hazırlık index'i yoktur: ready grafı her çağrıda bitmemiş queue'lardan
+kurar (O(bitmemiş task)).
+
+Claim edilen task bir lease taşır (`lease_expires_at`); worker bunu
+heartbeat ile uzatır. Lease'i dolan task'lar reclaim_expired ile
+pending'e döner (`retry_count` artar) veya maxRetries aşıldıysa
+dead-letter'a taşınır. Süresi dolanlar backend'in lease index'inden
+bulunur (JSON: bellek içi heap, SQLite: (status, lease_expires) index'i).
+Lease alanı olmayan eski kayıtlar started_at + stuckTimeout'ta dolmuş sayılır.
+
+Task ID'leri ULID'dir (task_ids); SQLite backend --since sorgularını
+(status, id) aralığı olarak tarar, ULID olmayan eski ID'ler için created_at
+kullanılır.
+
+find_duplicates, pending / in-progress'te içerik hash'i (dedup.content_hash)
+aynı olan task'ları bulur (JSON: replay cache'inde hash index'i, SQLite:
+(content_hash, status) index'i).
+
+Version: 1.0.0
+"""
+
+import contextlib
+import json
+import os
+import sqlite3
+import sys
+import threading
+import time
+from collections import Counter, OrderedDict
+from datetime import datetime, timedelta, timezone
+from itertools import islice
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from dedup import DEDUP_STATUSES, ContentIndex, content_hash
+from json_stream import iter_snapshot_tasks
+from scheduler import (
+    DEFAULT_AGING_INTERVAL,
+    DONE_STATUS,
+    DependencyGraph,
+    LeaseIndex,
+    PriorityScheduler,
+    created_timestamp,
+    lease_expiry,
+    parse_timestamp,
+    priority_rank,
+    schedule_key,
+    task_created_at,
+    task_dependencies,
+)
+from task_ids import ULID_CEILING, ULID_LENGTH, new_task_id, ulid_floor
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+QUEUE_STATUSES = ["pending", "in-progress", "completed", "failed", "dead-letter"]
+
+# Bağımlılıkları bekleten (henüz bitmemiş) queue'lar
+OPEN_STATUSES = [status for status in QUEUE_STATUSES if status != DONE_STATUS]
+
+# Compaction varsayılanları (queue.json > storage ile override edilir)
+DEFAULT_COMPACT_MIN_BYTES = 256 * 1024
+DEFAULT_COMPACT_RATIO = 0.5
+
+# Lease varsayılanları (queue.json > monitoring / queue ile override edilir)
+DEFAULT_LEASE_TIMEOUT = 300     # monitoring.heartbeatTimeout
+DEFAULT_TASK_TIMEOUT = 900      # monitoring.taskTimeout (lease bu süreyi aşamaz)
+DEFAULT_STUCK_TIMEOUT = 600     # monitoring.stuckTimeout (lease'siz eski kayıtlar, started_at'tan)
+DEFAULT_MAX_RETRIES = 3         # queue.maxRetries (task'taki maxRetries önceliklidir)
+
+# SQLite backend varsayılan dosyası (queue dizinine göre)
+DEFAULT_SQLITE_FILE = "queue.db"
+
+# --since için göreli süre birimleri
+_SINCE_UNITS = {"s": 1, "m": 60, "h": 3600, "d": 86400, "w": 604800}
+
+
+def parse_since(value: str) -> float:
+    """
+    --since değerini epoch saniyeye çevir
+
+    Göreli ('30m', '2h', '7d') veya ISO tarih ('2024-01-31',
+    '2024-01-31T12:00:00') kabul edilir.
+    """
+    value = value.strip()
+    unit = value[-1:].lower()
+    if unit in _SINCE_UNITS and value[:-1].isdigit():
+        return time.time() - int(value[:-1]) * _SINCE_UNITS[unit]
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+    except ValueError:
+        raise ValueError(f"Geçersiz tarih: {value} (örn. 2h, 7d, 2024-01-31)") from None
+
+
+def task_matches(
+    task: Dict[str, Any],
+    agent: Optional[str] = None,
+    priority: Optional[Any] = None,
+    tag: Optional[str] = None,
+    since: Optional[float] = None,
+) -> bool:
+    """Task filtreye uyuyor mu? (since: oluşturma zamanı alt sınırı, epoch saniye)"""
+    if agent is not None and task.get("agent") != agent:
+        return False
+    if priority is not None and priority_rank(task.get("priority")) != priority_rank(priority):
+        return False
+    if tag is not None and tag not in (task.get("tags") or []):
+        return False
+    if since is not None and created_timestamp(task) < since:
+        return False
+    return True
+
+
+def counter_key(task: Dict[str, Any]) -> Tuple[str, int]:
+    """Sayaç anahtarı: (agent, öncelik seviyesi)"""
+    return (str(task.get("agent") or ""), priority_rank(task.get("priority")))
+
+
+def summarize_counters(counters: Dict[Tuple[str, int], int]) -> Dict[str, Any]:
+    """
+    (agent, öncelik) → sayı tablosundan özet
+
+    Returns:
+        {"total": n, "agents": {agent: n}, "priorities": {öncelik: n}}
+    """
+    agents: Dict[str, int] = Counter()
+    priorities: Dict[int, int] = Counter()
+    for (agent, rank), n in counters.items():
+        if n:
+            agents[agent] += n
+            priorities[rank] += n
+    return {
+        "total": sum(agents.values()),
+        "agents": dict(sorted(agents.items())),
+        "priorities": dict(sorted(priorities.items())),
+    }
+
+
+def mark_claimed(task: Dict[str, Any], worker_id: str, lease_timeout: float = DEFAULT_LEASE_TIMEOUT) -> Dict[str, Any]:
+    """Task'ı in-progress olarak işaretle ve lease ver"""
+    now = datetime.now()
+    task["status"] = "in-progress"
+    task["started_at"] = now.isoformat()
+    task["claimed_by"] = worker_id
+    task["heartbeat_at"] = now.isoformat()
+    task["lease_expires_at"] = (now + timedelta(seconds=lease_timeout)).isoformat()
+    return task
+
+
+def extend_lease(
+    task: Dict[str, Any],
+    lease_timeout: float,
+    task_timeout: Optional[float] = None,
+    now: Optional[float] = None,
+) -> float:
+    """
+    Heartbeat: lease'i now + lease_timeout'a uzat
+
+    Lease, started_at + task_timeout'u aşmaz; heartbeat atmaya devam eden
+    ama hiç bitmeyen task da sonunda geri alınır.
+
+    Returns:
+        Yeni lease bitişi (epoch saniye)
+    """
+    now = time.time() if now is None else now
+    expires = now + lease_timeout
+    started = parse_timestamp(task.get("started_at"))
+    if task_timeout and started:
+        expires = min(expires, started + task_timeout)
+    task["heartbeat_at"] = datetime.fromtimestamp(now).isoformat()
+    task["lease_expires_at"] = datetime.fromtimestamp(expires).isoformat()
+    return expires
+
+
+def release_lease(task: Dict[str, Any], max_retries: int, reason: str) -> str:
+    """
+    Lease'i dolan task'ı geri bırak
+
+    `retry_count` artırılır, claim alanları temizlenir. Hedef queue
+    döndürülür: retry_count maxRetries'a ulaştıysa dead-letter, aksi halde pending.
+    """
+    retries = int(task.get("retry_count") or 0) + 1
+    limit = int(task.get("maxRetries") or max_retries)
+    task["retry_count"] = retries
+    task["last_error"] = reason
+    task["last_worker"] = task.pop("claimed_by", None)
+    for key in ("started_at", "heartbeat_at", "lease_expires_at"):
+        task.pop(key, None)
+
+    if retries >= limit:
+        task["status"] = "dead-letter"
+        task["reason"] = f"Max retries exceeded ({limit})"
+        task["movedAt"] = datetime.now().isoformat()
+    else:
+        task["status"] = "pending"
+    return task["status"]
+
+
+def unclaim(task: Dict[str, Any]) -> Dict[str, Any]:
+    """Claim'i geri al: task pending'e döner, retry sayılmaz (ör. circuit probe hakkı yok)"""
+    for key in ("started_at", "claimed_by", "heartbeat_at", "lease_expires_at"):
+        task.pop(key, None)
+    task["status"] = "pending"
+    return task
+
+
+class AgentFilter:
+    """
+    Agent tipine göre claim filtresi
+
+    Fonksiyon yerine veri olduğundan daemon'a JSON olarak gönderilebilir
+    (RemoteQueueStore.claim). `only` verilirse sadece o tipler alınır;
+    `exclude` her durumda uygulanır. Agent'ı olmayan task'lar "auto" sayılır.
+    """
+
+    def __init__(self, exclude: Optional[Iterable[str]] = None, only: Optional[Iterable[str]] = None):
+        self.exclude = set(exclude or ())
+        self.only = set(only) if only is not None else None
+
+    def __call__(self, task: Dict[str, Any]) -> bool:
+        agent = task.get("agent") or "auto"
+        if agent in self.exclude:
+            return False
+        return self.only is None or agent in self.only
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "exclude": sorted(self.exclude),
+            "only": sorted(self.only) if self.only is not None else None,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "AgentFilter":
+        return cls(data.get("exclude"), data.get("only"))
+
+
+# ============================================================================
+# CROSS-PROCESS LOCK
+# ============================================================================
+
+class FileLock:
+    """
+    Process'ler arası dosya kilidi (fcntl.flock, Windows'ta msvcrt)
+
+    Aynı process içinde reentrant'tır: iç içe `with` blokları kilidi tekrar
+    almaz. Thread'ler arası koruma için ayrıca bir RLock tutulur.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._thread_lock = threading.RLock()
+        self._fd: Optional[int] = None
+        self._depth = 0
+
+    @contextlib.contextmanager
+    def acquire(self, shared: bool = False):
+        """Kilidi al (shared=True: okuma kilidi)"""
+        with self._thread_lock:
+            if self._depth == 0:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                fd = os.open(str(self.path), os.O_RDWR | os.O_CREAT, 0o644)
+                try:
+                    if fcntl is not None:
+                        fcntl.flock(fd, fcntl.LOCK_SH if shared else fcntl.LOCK_EX)
+                    else:
+                        while True:
+                            try:
+                                msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+                                break
+                            except OSError:
+                                continue
+                except BaseException:
+                    os.close(fd)
+                    raise
+                self._fd = fd
+            self._depth += 1
+            try:
+                yield
+            finally:
+                self._depth -= 1
+                if self._depth == 0:
+                    fd, self._fd = self._fd, None
+                    if fcntl is not None:
+                        fcntl.flock(fd, fcntl.LOCK_UN)
+                    else:
+                        os.lseek(fd, 0, os.SEEK_SET)
+                        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+                    os.close(fd)
+
+
+# ============================================================================
+# BASE STORE
+# ============================================================================
+
+class QueueStore:
+    """
+    Queue store arayüzü
+
+    Alt sınıflar en az load/save/append/remove metotlarını sağlar. Sorgu
+    metotlarının (get/count/query) buradaki varsayılanları tüm queue'yu
+    okur; index'li backend'ler bunları override eder.
+    """
+
+    backend = "base"
+    aging_interval: float = DEFAULT_AGING_INTERVAL
+    lease_timeout: float = DEFAULT_LEASE_TIMEOUT
+    task_timeout: float = DEFAULT_TASK_TIMEOUT
+    stuck_timeout: float = DEFAULT_STUCK_TIMEOUT
+    max_retries: int = DEFAULT_MAX_RETRIES
+
+    def load(self, status: str) -> List[Dict[str, Any]]:
+        raise NotImplementedError
+
+    def save(self, status: str, tasks: List[Dict[str, Any]]) -> None:
+        raise NotImplementedError
+
+    def append(self, status: str, task: Dict[str, Any]) -> None:
+        raise NotImplementedError
+
+    def remove(self, status: str, task_id: str) -> None:
+        raise NotImplementedError
+
+    def append_many(self, status: str, tasks: List[Dict[str, Any]]) -> None:
+        """Birden fazla task'ı tek seferde ekle"""
+        with self.locked():
+            for task in tasks:
+                self.append(status, task)
+
+    def remove_many(self, status: str, task_ids: List[str]) -> None:
+        """Birden fazla task'ı tek seferde sil"""
+        with self.locked():
+            for task_id in task_ids:
+                self.remove(status, task_id)
+
+    def move(self, task: Dict[str, Any], source: str, target: str) -> None:
+        """
+        Task'ı bir queue'dan diğerine taşı
+
+        Önce hedefe yazılır, sonra kaynaktan silinir: arada crash olursa
+        task kaybolmaz, en kötü ihtimalle iki queue'da birden görünür.
+        """
+        with self.locked():
+            self.append(target, task)
+            self.remove(source, task["id"])
+
+    def compact(self, status: str) -> None:
+        """Backend'e özel bakım (varsayılan: yok)"""
+
+    def locked(self, shared: bool = False):
+        """Store kilidi (varsayılan: kilitsiz)"""
+        return contextlib.nullcontext()
+
+    def claim(
+        self,
+        worker_id: str,
+        task_id: Optional[str] = None,
+        eligible: Optional[Callable[[Dict[str, Any]], bool]] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Pending task'ı atomik olarak in-progress'e al
+
+        Seçim ve taşıma aynı kilit altında yapılır; aynı anda çalışan
+        claim'ler aynı task'ı iki kez alamaz. ID verilmezse en yüksek
+        efektif öncelikli (aging dahil) uygun task seçilir.
+
+        Args:
+            worker_id: Task'ı alan worker
+            task_id: Belirli bir task (None: sıradaki uygun task)
+            eligible: Task alınabilir mi? (ör. circuit OPEN değil)
+
+        Bağımlılıkları bitmemiş task'lar her durumda atlanır.
+
+        Returns:
+            Alınan task veya None
+        """
+        with self.locked():
+            if task_id is not None:
+                task = self.get("pending", task_id)
+                if task is None or not self._claimable(task, eligible):
+                    return None
+            else:
+                candidates = [t for t in self.load("pending") if self._claimable(t, eligible)]
+                if not candidates:
+                    return None
+                task = min(candidates, key=lambda t: schedule_key(t, self.aging_interval))
+
+            mark_claimed(task, worker_id, self.lease_timeout)
+            self.move(task, "pending", "in-progress")
+            return task
+
+    def heartbeat(
+        self,
+        task_id: str,
+        worker_id: Optional[str] = None,
+        now: Optional[float] = None,
+    ) -> Optional[float]:
+        """
+        In-progress task'ın lease'ini uzat
+
+        Args:
+            task_id: Task ID
+            worker_id: Verilirse task'ı bu worker'ın tuttuğu doğrulanır
+
+        Returns:
+            Yeni lease bitişi (epoch saniye); task artık bu worker'da
+            değilse (reclaim edildi / bitti) None
+        """
+        with self.locked():
+            task = self.get("in-progress", task_id)
+            if task is None or (worker_id is not None and task.get("claimed_by") != worker_id):
+                return None
+            expires = extend_lease(task, self.lease_timeout, self.task_timeout, now)
+            self.append("in-progress", task)
+            return expires
+
+    def expired_leases(self, now: Optional[float] = None) -> List[Dict[str, Any]]:
+        """
+        Lease'i dolmuş in-progress task'lar
+
+        Varsayılan tüm queue'yu tarar; backend'ler lease index'i kullanır.
+        """
+        now = time.time() if now is None else now
+        return [
+            t for t in self.iter_query("in-progress")
+            if 0 < lease_expiry(t, self.stuck_timeout) <= now
+        ]
+
+    def reclaim_expired(self, now: Optional[float] = None) -> Dict[str, List[str]]:
+        """
+        Lease'i dolan task'ları pending'e (veya dead-letter'a) geri al
+
+        Returns:
+            {"pending": [ID, ...], "dead-letter": [ID, ...]}
+        """
+        reclaimed: Dict[str, List[str]] = {"pending": [], "dead-letter": []}
+        with self.locked():
+            for task in self.expired_leases(now):
+                target = release_lease(task, self.max_retries, f"lease expired ({task.get('claimed_by')})")
+                self.move(task, "in-progress", target)
+                reclaimed[target].append(str(task["id"]))
+        return reclaimed
+
+    def find_duplicates(self, hashes: Iterable[str]) -> Dict[str, Tuple[str, Dict[str, Any]]]:
+        """
+        İçerik hash'i aynı aktif task'lar (pending önce, sonra in-progress)
+
+        Varsayılan bu queue'ları tarar; backend'ler hash index'i kullanır.
+
+        Returns:
+            {hash: (queue, task)} — eşleşmeyen hash'ler yer almaz
+        """
+        wanted = set(hashes)
+        found: Dict[str, Tuple[str, Dict[str, Any]]] = {}
+        with self.locked(shared=True):
+            for status in DEDUP_STATUSES:
+                for task in self.iter_query(status):
+                    digest = content_hash(task)
+                    if digest in wanted and digest not in found:
+                        found[digest] = (status, task)
+        return found
+
+    def _claimable(self, task: Dict[str, Any], eligible: Optional[Callable[[Dict[str, Any]], bool]]) -> bool:
+        """Task uygun mu ve bağımlılıkları bitmiş mi? (ucuz kontrol önce)"""
+        if eligible is not None and not eligible(task):
+            return False
+        return not task_dependencies(task) or not self.blockers(task)
+
+    def blockers(self, task: Dict[str, Any]) -> Dict[str, str]:
+        """
+        Task'ın karşılanmamış bağımlılıkları: {bağımlılık ID: queue}
+
+        Bitmemiş queue'ların hiçbirinde olmayan bağımlılık tamamlanmış
+        (completed / arşiv) ya da silinmiş sayılır.
+        """
+        found = {}
+        for dep_id in task_dependencies(task):
+            for status in OPEN_STATUSES:
+                if self.get(status, dep_id) is not None:
+                    found[dep_id] = status
+                    break
+        return found
+
+    def dependents(self, task_id: str) -> List[Dict[str, Any]]:
+        """
+        `task_id`'ye bağımlı pending task'lar
+
+        Varsayılan pending'i tarar; SQLite task_deps index'ini, daemon
+        bellekteki grafı kullanır.
+        """
+        task_id = str(task_id)
+        return [t for t in self.iter_query("pending") if task_id in task_dependencies(t)]
+
+    def dependency_graph(self) -> DependencyGraph:
+        """
+        Bitmemiş queue'lardan bağımlılık grafını kur
+
+        Her çağrıda O(bitmemiş task) maliyetlidir; tüm grafa ihtiyaç duyan
+        işler (döngü kontrolü, `odin graph`) içindir. Hazır task'lar için
+        ready, bir task'a bağlı olanlar için dependents kullanılmalı.
+        """
+        with self.locked(shared=True):
+            return DependencyGraph.build((status, self.iter_query(status)) for status in OPEN_STATUSES)
+
+    def ready(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Bağımlılıkları bitmiş pending task'lar, çalışma sırasıyla
+
+        Varsayılan (JSON backend) grafı her çağrıda bitmemiş queue'lardan
+        yeniden kurar: O(bitmemiş task). Kalıcı bir hazırlık index'i yoktur;
+        SQLite backend'i `unmet` kolonunu, daemon artımlı grafı kullanır.
+        """
+        with self.locked(shared=True):
+            graph = self.dependency_graph()
+            tasks = [t for t in self.iter_query("pending") if graph.is_ready(str(t.get("id")))]
+        tasks.sort(key=lambda t: schedule_key(t, self.aging_interval))
+        return tasks[:limit] if limit is not None else tasks
+
+    def get(self, status: str, task_id: str) -> Optional[Dict[str, Any]]:
+        """ID'ye göre task bul"""
+        for task in self.load(status):
+            if task.get("id") == task_id:
+                return task
+        return None
+
+    def locate(self, task_ids: Iterable[str]) -> Dict[str, str]:
+        """
+        ID'lerin bulunduğu queue'lar: {id: queue}
+
+        Hiçbir queue'da olmayan ID'ler sonuçta yer almaz.
+        """
+        wanted = [str(task_id) for task_id in task_ids]
+        found: Dict[str, str] = {}
+        with self.locked(shared=True):
+            for status in QUEUE_STATUSES:
+                for task_id in wanted:
+                    if task_id not in found and self.get(status, task_id) is not None:
+                        found[task_id] = status
+        return found
+
+    def count(self, status: str) -> int:
+        """Queue'daki task sayısı"""
+        return len(self.load(status))
+
+    def counts(self) -> Dict[str, int]:
+        """Tüm queue'ların task sayıları"""
+        return {status: self.count(status) for status in QUEUE_STATUSES}
+
+    def stats(self, status: str) -> Dict[str, Any]:
+        """Queue sayaçları: {"total": n, "agents": {...}, "priorities": {...}}"""
+        return summarize_counters(Counter(counter_key(t) for t in self.load(status)))
+
+    def recount(self, status: str) -> Dict[str, Any]:
+        """Tutulan sayaçları task'lardan yeniden hesapla (onarım)"""
+        return self.stats(status)
+
+    def query(
+        self,
+        status: str,
+        agent: Optional[str] = None,
+        priority: Optional[Any] = None,
+        tag: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        since: Optional[float] = None,
+    ) -> List[Dict[str, Any]]:
+        """Filtreli, sayfalı task listesi (queue sırasıyla)"""
+        tasks = [t for t in self.load(status) if task_matches(t, agent, priority, tag, since)]
+        end = offset + limit if limit is not None else None
+        return tasks[offset:end]
+
+    def iter_query(
+        self,
+        status: str,
+        agent: Optional[str] = None,
+        priority: Optional[Any] = None,
+        tag: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        since: Optional[float] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        `query` ile aynı sonuçlar, tek tek üretilir
+
+        Büyük queue'ları listelemek için; backend'ler queue'nun tamamını
+        belleğe almadan okuyacak şekilde override eder.
+        """
+        yield from self.query(status, agent, priority, tag, limit, offset, since)
+
+    def export_json(self, queue_dir: Path) -> List[Path]:
+        """Tüm queue'ları mevcut JSON düzeninde (tasks-<status>.json) dışa aktar"""
+        target = JsonQueueStore(queue_dir)
+        exported = []
+        for status in QUEUE_STATUSES:
+            target.save(status, self.load(status))
+            exported.append(target.queue_file(status))
+        return exported
+
+    def close(self) -> None:
+        """Kaynakları serbest bırak"""
+
+
+# ============================================================================
+# JSON + JOURNAL STORE
+# ============================================================================
+
+class _ReplayState:
+    """Bir queue'nun process içi replay cache'i"""
+
+    __slots__ = ("snapshot_sig", "journal_ino", "offset", "snapshot", "tasks", "scheduler", "leases", "hashes")
+
+    def __init__(self, snapshot_sig, journal_ino, snapshot: Dict[str, Any]):
+        self.snapshot_sig = snapshot_sig
+        self.journal_ino = journal_ino
+        self.offset = 0
+        self.snapshot = snapshot
+        self.tasks: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        # Sadece claim yapılan queue için, ilk claim'de oluşturulur
+        self.scheduler: Optional[PriorityScheduler] = None
+        # Sadece in-progress için, ilk lease taramasında oluşturulur
+        self.leases: Optional[LeaseIndex] = None
+        # Sadece pending / in-progress için, ilk tekrar aramasında oluşturulur
+        self.hashes: Optional[ContentIndex] = None
+
+
+class JsonQueueStore(QueueStore):
+    """
+    Snapshot + journal tabanlı queue deposu
+
+    Journal kayıtları:
+        {"seq": 12, "op": "put", "task": {...}, "delta": [...]}   # Ekle / güncelle (id'ye göre)
+        {"seq": 13, "op": "del", "id": "abc123", "delta": [...]}  # Sil
+        {"seq": 13, "op": "mark"}                                 # Compaction sonrası başlangıç
+
+    Snapshot metadata'sındaki `journalSeq`, journal'ın hangi sıra numarasına
+    kadar snapshot'a katlandığını tutar. Replay sırasında bu değere eşit veya
+    küçük kayıtlar atlanır; böylece compaction yarıda kesilse bile aynı
+    kayıt iki kez uygulanmaz.
+
+    Sayaçlar: `tasks-<status>.counters` dosyası snapshot'taki (agent,
+    öncelik) sayılarını ve `journalSeq`'i tutar. Her journal kaydı sayaç
+    değişimini (`delta`: [[agent, öncelik, ±1], ...]) kendisiyle birlikte
+    taşır; kayıt ve sayaç değişimi aynı write ile yazıldığından ayrışamaz.
+    count/stats sadece sayaç dosyasını ve journal'ı okur, snapshot'ı okumaz.
+    """
+
+    backend = "json"
+
+    def __init__(
+        self,
+        queue_dir: Path,
+        compact_min_bytes: int = DEFAULT_COMPACT_MIN_BYTES,
+        compact_ratio: float = DEFAULT_COMPACT_RATIO,
+        aging_interval: float = DEFAULT_AGING_INTERVAL,
+        lease_timeout: float = DEFAULT_LEASE_TIMEOUT,
+        task_timeout: float = DEFAULT_TASK_TIMEOUT,
+        stuck_timeout: float = DEFAULT_STUCK_TIMEOUT,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+    ):
+        self.queue_dir = Path(queue_dir)
+        self.compact_min_bytes = compact_min_bytes
+        self.compact_ratio = compact_ratio
+        self.aging_interval = aging_interval
+        self.lease_timeout = lease_timeout
+        self.task_timeout = task_timeout
+        self.stuck_timeout = stuck_timeout
+        self.max_retries = max_retries
+        self._file_lock = FileLock(self.queue_dir / ".queue.lock")
+        self._replay_cache: Dict[str, _ReplayState] = {}
+
+    def locked(self, shared: bool = False):
+        """Tüm queue dosyaları için process'ler arası kilit"""
+        return self._file_lock.acquire(shared=shared)
+
+    # ------------------------------------------------------------------------
+    # Dosya yolları
+    # ------------------------------------------------------------------------
+
+    def queue_file(self, status: str) -> Path:
+        """Snapshot dosyası"""
+        return self.queue_dir / f"tasks-{status}.json"
+
+    def journal_file(self, status: str) -> Path:
+        """Journal dosyası"""
+        return self.queue_dir / f"tasks-{status}.journal"
+
+    def counters_file(self, status: str) -> Path:
+        """Sayaç dosyası"""
+        return self.queue_dir / f"tasks-{status}.counters"
+
+    # ------------------------------------------------------------------------
+    # Okuma
+    # ------------------------------------------------------------------------
+
+    def _read_snapshot(self, status: str) -> Dict[str, Any]:
+        """Snapshot'u oku ve {"tasks": [], "metadata": {}} yapısına getir"""
+        queue_file = self.queue_file(status)
+        if not queue_file.exists():
+            return {"tasks": [], "metadata": {}}
+
+        data = json.loads(queue_file.read_text(encoding="utf-8"))
+        # Queue yapısı: {"tasks": [], "metadata": {}} veya []
+        if isinstance(data, dict) and "tasks" in data:
+            data.setdefault("metadata", {})
+            return data
+        return {"tasks": data if isinstance(data, list) else [], "metadata": {}}
+
+    @staticmethod
+    def _read_journal(journal_file: Path, offset: int) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Journal'ı `offset`'ten itibaren oku
+
+        Returns:
+            (kayıtlar, son tam satırın bittiği offset) — yarım yazılmış son
+            satır tüketilmez, bir sonraki okumada tekrar denenir.
+        """
+        with open(journal_file, "rb") as f:
+            f.seek(offset)
+            data = f.read()
+
+        end = data.rfind(b"\n") + 1
+        records = []
+        for line in data[:end].splitlines():
+            if not line.strip():
+                continue
+            try:
+                records.append(json.loads(line))
+            except ValueError:
+                # Crash sırasında yarım kalan satır
+                continue
+        return records, offset + end
+
+    @staticmethod
+    def _task_key(task: Dict[str, Any], index: int) -> str:
+        """Replay için task anahtarı (id yoksa pozisyon)"""
+        task_id = task.get("id") if isinstance(task, dict) else None
+        return str(task_id) if task_id is not None else f"__index_{index}"
+
+    @staticmethod
+    def _file_signature(path: Path) -> Optional[Tuple[int, int, int]]:
+        """Dosya değişti mi kontrolü için (inode, boyut, mtime)"""
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            return None
+        return (st.st_ino, st.st_size, st.st_mtime_ns)
+
+    def _replay(self, status: str) -> Tuple[Dict[str, Any], "OrderedDict[str, Dict[str, Any]]"]:
+        """
+        Snapshot + journal replay → (snapshot, id → task)
+
+        Sonuç process içinde cache'lenir: snapshot değişmediyse journal'ın
+        yalnızca son okumadan sonra eklenen kısmı okunur.
+        """
+        snapshot_sig = self._file_signature(self.queue_file(status))
+        journal_file = self.journal_file(status)
+        journal_sig = self._file_signature(journal_file)
+
+        state = self._replay_cache.get(status)
+        if (
+            state is None
+            or state.snapshot_sig != snapshot_sig
+            or journal_sig is None
+            or state.journal_ino != journal_sig[0]
+            or journal_sig[1] < state.offset
+        ):
+            snapshot = self._read_snapshot(status)
+            state = _ReplayState(snapshot_sig, journal_sig[0] if journal_sig else None, snapshot)
+            for i, task in enumerate(snapshot["tasks"]):
+                state.tasks[self._task_key(task, i)] = task
+            self._replay_cache[status] = state
+
+        if journal_sig is not None and journal_sig[1] > state.offset:
+            records, state.offset = self._read_journal(journal_file, state.offset)
+            folded_seq = state.snapshot["metadata"].get("journalSeq", 0)
+            tasks = state.tasks
+            scheduler = state.scheduler
+            leases = state.leases
+            hashes = state.hashes
+            for record in records:
+                if record.get("seq", 0) <= folded_seq:
+                    continue
+                op = record.get("op")
+                if op == "put":
+                    task = record["task"]
+                    tasks[self._task_key(task, len(tasks))] = task
+                    if task.get("id") is not None:
+                        if scheduler is not None:
+                            scheduler.push(task)
+                        if leases is not None:
+                            leases.push(task)
+                        if hashes is not None:
+                            hashes.put(task)
+                elif op == "del":
+                    tasks.pop(str(record.get("id")), None)
+                    if scheduler is not None:
+                        scheduler.discard(str(record.get("id")))
+                    if leases is not None:
+                        leases.discard(str(record.get("id")))
+                    if hashes is not None:
+                        hashes.discard(str(record.get("id")))
+
+        return state.snapshot, state.tasks
+
+    def load(self, status: str) -> List[Dict[str, Any]]:
+        """Queue'daki tüm task'ları döndür (snapshot + journal)"""
+        with self.locked(shared=True):
+            _, tasks = self._replay(status)
+            # Cache'teki dict'ler çağıranın değişikliklerinden etkilenmesin
+            return [dict(task) for task in tasks.values()]
+
+    def get(self, status: str, task_id: str) -> Optional[Dict[str, Any]]:
+        """ID'ye göre task (replay cache'inden O(1))"""
+        with self.locked(shared=True):
+            _, tasks = self._replay(status)
+            task = tasks.get(str(task_id))
+            return dict(task) if task is not None else None
+
+    def locate(self, task_ids: Iterable[str]) -> Dict[str, str]:
+        """Replay cache'lerinden O(1) üyelik kontrolü"""
+        wanted = [str(task_id) for task_id in task_ids]
+        found: Dict[str, str] = {}
+        with self.locked(shared=True):
+            for status in QUEUE_STATUSES:
+                _, tasks = self._replay(status)
+                for task_id in wanted:
+                    if task_id not in found and task_id in tasks:
+                        found[task_id] = status
+        return found
+
+    def _journal_overlay(self, status: str) -> Tuple["OrderedDict[str, Dict[str, Any]]", Set[str]]:
+        """
+        Journal'ı snapshot'sız replay et
+
+        Returns:
+            (journal sonunda var olan task'lar, journal'da silinen anahtarlar)
+        """
+        journal_file = self.journal_file(status)
+        puts: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        deleted: Set[str] = set()
+        if not journal_file.exists():
+            return puts, deleted
+
+        records, _ = self._read_journal(journal_file, 0)
+        for record in records:
+            op = record.get("op")
+            if op == "put":
+                task = record["task"]
+                puts[self._task_key(task, -1)] = task
+            elif op == "del":
+                puts.pop(str(record.get("id")), None)
+                deleted.add(str(record.get("id")))
+        return puts, deleted
+
+    def iter_query(
+        self,
+        status: str,
+        agent: Optional[str] = None,
+        priority: Optional[Any] = None,
+        tag: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        since: Optional[float] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Snapshot'ı akış halinde okuyarak filtreli task'lar
+
+        Bellek kullanımı snapshot boyutundan bağımsızdır; yalnızca journal
+        (compaction ile sınırlı) belleğe alınır. Journal ve snapshot dosya
+        tanıtıcısı aynı kilit altında alınır, okuma kilitsiz devam eder
+        (snapshot atomik rename ile değiştiğinden açık dosya tutarlıdır).
+
+        Sıralama replay ile aynıdır: journal'da güncellenen task yerinde
+        kalır, silinip yeniden eklenen veya yeni task'lar sona eklenir.
+        Put/del kayıtları id başına son yazan kazanır mantığıyla
+        uygulandığından `journalSeq` filtresine gerek yoktur.
+        """
+        with self.locked(shared=True):
+            puts, deleted = self._journal_overlay(status)
+            try:
+                snapshot_file = open(self.queue_file(status), "r", encoding="utf-8")
+            except FileNotFoundError:
+                snapshot_file = None
+
+        def merged() -> Iterator[Dict[str, Any]]:
+            emitted: Set[str] = set()
+            if snapshot_file is not None:
+                with snapshot_file:
+                    for i, task in enumerate(iter_snapshot_tasks(snapshot_file)):
+                        key = self._task_key(task, i)
+                        if key in deleted:
+                            continue
+                        if key in puts:
+                            emitted.add(key)
+                            yield puts[key]
+                        else:
+                            yield task
+            for key, task in puts.items():
+                if key not in emitted:
+                    yield task
+
+        matches = (t for t in merged() if task_matches(t, agent, priority, tag, since))
+        yield from islice(matches, offset, offset + limit if limit is not None else None)
+
+    def claim(
+        self,
+        worker_id: str,
+        task_id: Optional[str] = None,
+        eligible: Optional[Callable[[Dict[str, Any]], bool]] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """Pending heap'inden O(log n) claim (ID verilirse doğrudan)"""
+        if task_id is not None:
+            return super().claim(worker_id, task_id=task_id, eligible=eligible)
+
+        with self.locked():
+            _, tasks = self._replay("pending")
+            state = self._replay_cache["pending"]
+            if state.scheduler is None:
+                state.scheduler = PriorityScheduler(self.aging_interval)
+                for task in tasks.values():
+                    if task.get("id") is not None:
+                        state.scheduler.push(task)
+
+            chosen = state.scheduler.select(lambda tid: self._claimable(tasks[tid], eligible))
+            if chosen is None:
+                return None
+
+            task = mark_claimed(dict(tasks[chosen]), worker_id, self.lease_timeout)
+            self.move(task, "pending", "in-progress")
+            return task
+
+    def find_duplicates(self, hashes: Iterable[str]) -> Dict[str, Tuple[str, Dict[str, Any]]]:
+        """Replay cache'indeki hash index'inden O(1) arama"""
+        wanted = list(hashes)
+        found: Dict[str, Tuple[str, Dict[str, Any]]] = {}
+        with self.locked(shared=True):
+            for status in DEDUP_STATUSES:
+                _, tasks = self._replay(status)
+                state = self._replay_cache[status]
+                if state.hashes is None:
+                    state.hashes = ContentIndex()
+                    for task in tasks.values():
+                        if task.get("id") is not None:
+                            state.hashes.put(task)
+                for digest in wanted:
+                    task_id = state.hashes.get(digest)
+                    if task_id is not None and digest not in found:
+                        found[digest] = (status, dict(tasks[task_id]))
+        return found
+
+    def expired_leases(self, now: Optional[float] = None) -> List[Dict[str, Any]]:
+        """Lease heap'inden süresi dolanlar (yalnızca dolanlar ziyaret edilir)"""
+        now = time.time() if now is None else now
+        with self.locked(shared=True):
+            _, tasks = self._replay("in-progress")
+            state = self._replay_cache["in-progress"]
+            if state.leases is None:
+                state.leases = LeaseIndex(self.stuck_timeout)
+                for task in tasks.values():
+                    if task.get("id") is not None:
+                        state.leases.push(task)
+            return [dict(tasks[task_id]) for task_id in state.leases.due(now)]
+
+    # ------------------------------------------------------------------------
+    # Journal yazma
+    # ------------------------------------------------------------------------
+
+    def _last_seq(self, status: str) -> int:
+        """Journal'daki son sıra numarası (dosyanın sonundan okunur)"""
+        journal_file = self.journal_file(status)
+        if not journal_file.exists() or journal_file.stat().st_size == 0:
+            # Journal hiç yoksa snapshot'taki değerden devam et
+            return self._read_snapshot(status)["metadata"].get("journalSeq", 0)
+
+        with open(journal_file, "rb") as f:
+            size = f.seek(0, os.SEEK_END)
+            chunk = 4096
+            while True:
+                start = max(0, size - chunk)
+                f.seek(start)
+                lines = f.read(size - start).splitlines()
+                # İlk satır kesik olabilir (dosya başında değilsek)
+                candidates = lines if start == 0 else lines[1:]
+                for line in reversed(candidates):
+                    try:
+                        return int(json.loads(line)["seq"])
+                    except (ValueError, KeyError, TypeError):
+                        continue
+                if start == 0:
+                    return 0
+                chunk *= 4
+
+    def _append_records(self, status: str, records: List[Dict[str, Any]]) -> None:
+        """Kayıtları journal'a tek write ile ekle"""
+        journal_file = self.journal_file(status)
+        journal_file.parent.mkdir(parents=True, exist_ok=True)
+
+        with self.locked():
+            seq = self._last_seq(status)
+            lines = []
+            for record in records:
+                seq += 1
+                lines.append(json.dumps({"seq": seq, **record}, ensure_ascii=False, separators=(",", ":")))
+
+            payload = ("\n".join(lines) + "\n").encode("utf-8")
+            fd = os.open(str(journal_file), os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            try:
+                os.write(fd, payload)
+            finally:
+                os.close(fd)
+
+            self._maybe_compact(status)
+
+    @staticmethod
+    def _put_record(task: Dict[str, Any], previous: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """put kaydı + sayaç değişimi (previous: aynı id'li mevcut task)"""
+        delta = [[*counter_key(task), 1]]
+        if previous is not None:
+            delta.append([*counter_key(previous), -1])
+        return {"op": "put", "task": task, "delta": delta}
+
+    @staticmethod
+    def _del_record(task_id: str, previous: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """del kaydı + sayaç değişimi (previous: silinen task, yoksa None)"""
+        delta = [[*counter_key(previous), -1]] if previous is not None else []
+        return {"op": "del", "id": task_id, "delta": delta}
+
+    def append(self, status: str, task: Dict[str, Any]) -> None:
+        """Task'ı queue'ya ekle (veya aynı id'li task'ı güncelle)"""
+        self.append_many(status, [task])
+
+    def append_many(self, status: str, tasks: List[Dict[str, Any]]) -> None:
+        """Task'ları tek journal write'ı ile ekle"""
+        if not tasks:
+            return
+        with self.locked():
+            # Güncelleme mi yeni kayıt mı: sayaçlar için mevcut durum gerekli
+            _, current = self._replay(status)
+            batch: Dict[str, Dict[str, Any]] = {}
+            records = []
+            for task in tasks:
+                key = self._task_key(task, -1)
+                records.append(self._put_record(task, batch.get(key, current.get(key))))
+                batch[key] = task
+            self._append_records(status, records)
+
+    def remove(self, status: str, task_id: str) -> None:
+        """Task'ı queue'dan sil"""
+        self.remove_many(status, [task_id])
+
+    def remove_many(self, status: str, task_ids: List[str]) -> None:
+        """Task'ları tek journal write'ı ile sil"""
+        if not task_ids:
+            return
+        with self.locked():
+            _, current = self._replay(status)
+            removed: Set[str] = set()
+            records = []
+            for task_id in map(str, task_ids):
+                previous = None if task_id in removed else current.get(task_id)
+                records.append(self._del_record(task_id, previous))
+                removed.add(task_id)
+            self._append_records(status, records)
+
+    def move(self, task: Dict[str, Any], source: str, target: str) -> None:
+        """
+        Task'ı bir queue'dan diğerine taşı (hedefe yaz, sonra kaynaktan sil)
+
+        Büyük queue'ları (ör. completed) her taşımada okumamak için, replay
+        cache'i sıcak değilse task'ın kaynakta `task` ile aynı agent /
+        öncelikte durduğu ve hedefte olmadığı varsayılır. Varsayım bozulursa
+        `odin status --recount` sayaçları düzeltir.
+        """
+        task_id = str(task["id"])
+        with self.locked():
+            previous = self._replay(target)[1].get(task_id) if target in self._replay_cache else None
+            self._append_records(target, [self._put_record(task, previous)])
+
+            if source in self._replay_cache:
+                current = self._replay(source)[1].get(task_id)
+            else:
+                current = task
+            self._append_records(source, [self._del_record(task_id, current)])
+
+    # ------------------------------------------------------------------------
+    # Snapshot yazma / compaction
+    # ------------------------------------------------------------------------
+
+    def _write_snapshot(self, status: str, snapshot: Dict[str, Any], tasks: List[Dict[str, Any]], seq: int) -> None:
+        """Snapshot'u atomik olarak yaz (tmp + rename)"""
+        queue_file = self.queue_file(status)
+        queue_file.parent.mkdir(parents=True, exist_ok=True)
+
+        now = datetime.now(timezone.utc).isoformat()
+        metadata = snapshot.get("metadata") or {
+            "version": "1.0.0",
+            "description": f"Tasks in {status} status",
+        }
+        metadata["lastUpdated"] = now
+        metadata["journalSeq"] = seq
+
+        data = dict(snapshot)
+        data["tasks"] = tasks
+        data["metadata"] = metadata
+        if "lastUpdated" in snapshot:
+            data["lastUpdated"] = now
+
+        tmp_file = queue_file.with_suffix(".json.tmp")
+        tmp_file.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp_file, queue_file)
+
+        # Sayaçlar journal sıfırlanmadan önce yazılır: arada crash olursa
+        # eski sayaç dosyası + journal'daki delta'lar yine doğru sonucu verir
+        self._write_counters(status, Counter(counter_key(t) for t in tasks), seq)
+
+        # Journal'ı sıfırla; son seq'i koruyan tek bir mark kaydı bırak
+        journal_file = self.journal_file(status)
+        tmp_journal = journal_file.with_suffix(".journal.tmp")
+        tmp_journal.write_text(json.dumps({"seq": seq, "op": "mark"}) + "\n", encoding="utf-8")
+        os.replace(tmp_journal, journal_file)
+
+    def save(self, status: str, tasks: List[Dict[str, Any]]) -> None:
+        """Queue'yu tamamen yeniden yaz (journal snapshot'a katlanır)"""
+        with self.locked():
+            snapshot = self._read_snapshot(status)
+            self._write_snapshot(status, snapshot, tasks, self._last_seq(status))
+
+    def compact(self, status: str) -> None:
+        """Journal'ı snapshot'a katla"""
+        with self.locked():
+            seq = self._last_seq(status)
+            snapshot, tasks = self._replay(status)
+            self._write_snapshot(status, snapshot, list(tasks.values()), seq)
+
+    # ------------------------------------------------------------------------
+    # Sayaçlar
+    # ------------------------------------------------------------------------
+
+    def _write_counters(self, status: str, counters: Dict[Tuple[str, int], int], seq: int) -> None:
+        """Sayaç dosyasını atomik olarak yaz"""
+        counters_file = self.counters_file(status)
+        tmp_file = counters_file.with_suffix(".counters.tmp")
+        tmp_file.write_text(json.dumps({
+            "journalSeq": seq,
+            "counts": [[agent, rank, n] for (agent, rank), n in sorted(counters.items()) if n],
+        }), encoding="utf-8")
+        os.replace(tmp_file, counters_file)
+
+    def _read_counters(self, status: str) -> Optional[Dict[Tuple[str, int], int]]:
+        """
+        Sayaç dosyası + journal delta'ları
+
+        Returns:
+            (agent, öncelik) → sayı; sayaç dosyası yoksa veya journal'da
+            delta'sı olmayan (eski formatta) kayıt varsa None
+        """
+        counters_file = self.counters_file(status)
+        try:
+            data = json.loads(counters_file.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            if self.queue_file(status).exists() or self.journal_file(status).exists():
+                return None
+            return {}  # Hiç kullanılmamış queue
+        except ValueError:
+            return None
+
+        folded_seq = data.get("journalSeq", 0)
+        counters: Dict[Tuple[str, int], int] = Counter(
+            {(agent, rank): n for agent, rank, n in data.get("counts", [])}
+        )
+        journal_file = self.journal_file(status)
+        if journal_file.exists():
+            records, _ = self._read_journal(journal_file, 0)
+            for record in records:
+                if record.get("seq", 0) <= folded_seq or record.get("op") == "mark":
+                    continue
+                if "delta" not in record:
+                    return None
+                for agent, rank, n in record["delta"]:
+                    counters[(agent, rank)] += n
+        return counters
+
+    def _counters(self, status: str) -> Dict[Tuple[str, int], int]:
+        """Güncel sayaçlar (sayaç dosyası kullanılamıyorsa yeniden sayılır)"""
+        with self.locked(shared=True):
+            counters = self._read_counters(status)
+        if counters is None:
+            with self.locked():
+                counters = self._recount(status)
+        return counters
+
+    def _recount(self, status: str) -> Dict[Tuple[str, int], int]:
+        """Snapshot + journal'dan say ve sayaç dosyasını yaz (kilit altında)"""
+        _, tasks = self._replay(status)
+        counters = Counter(counter_key(t) for t in tasks.values())
+        self.queue_dir.mkdir(parents=True, exist_ok=True)
+        self._write_counters(status, counters, self._last_seq(status))
+        return counters
+
+    def count(self, status: str) -> int:
+        """Queue'daki task sayısı (O(journal), snapshot okunmaz)"""
+        return sum(self._counters(status).values())
+
+    def stats(self, status: str) -> Dict[str, Any]:
+        return summarize_counters(self._counters(status))
+
+    def recount(self, status: str) -> Dict[str, Any]:
+        with self.locked():
+            return summarize_counters(self._recount(status))
+
+    def _maybe_compact(self, status: str) -> None:
+        """Journal snapshot'a göre çok büyüdüyse compaction yap"""
+        journal_file = self.journal_file(status)
+        queue_file = self.queue_file(status)
+        journal_size = journal_file.stat().st_size if journal_file.exists() else 0
+        snapshot_size = queue_file.stat().st_size if queue_file.exists() else 0
+
+        if journal_size < self.compact_min_bytes:
+            return
+        if journal_size >= snapshot_size * self.compact_ratio:
+            self.compact(status)
+
+
+# ============================================================================
+# SQLITE (WAL) STORE
+# ============================================================================
+
+class SqliteQueueStore(QueueStore):
+    """
+    SQLite (WAL) tabanlı queue deposu
+
+    Tüm queue'lar tek `tasks` tablosunda tutulur; `status` kolonu queue'yu
+    belirler. Task'ın tamamı `data` kolonunda JSON olarak saklanır, sorgu
+    için kullanılan alanlar (status, agent, priority, created_at, tags)
+    ayrıca index'li kolonlara yazılır.
+
+    Tek yazmalar kendi IMMEDIATE transaction'larında atomiktir. Birden
+    fazla adımlı kontrol + yazma (admission, dedup, toplu ekleme) için
+    locked() JsonQueueStore gibi DB'nin yanındaki dosya kilidini alır.
+    """
+
+    backend = "sqlite"
+
+    def __init__(
+        self,
+        db_path: Path,
+        import_from: Optional[Path] = None,
+        aging_interval: float = DEFAULT_AGING_INTERVAL,
+        lease_timeout: float = DEFAULT_LEASE_TIMEOUT,
+        task_timeout: float = DEFAULT_TASK_TIMEOUT,
+        stuck_timeout: float = DEFAULT_STUCK_TIMEOUT,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+    ):
+        """
+        Args:
+            db_path: SQLite dosya yolu
+            import_from: DB ilk kez oluşturuluyorsa JSON queue'ların
+                         okunacağı dizin (migration)
+            aging_interval: Öncelik aging aralığı (saniye, bkz. scheduler.py)
+            lease_timeout: Claim / heartbeat başına lease süresi (saniye)
+            task_timeout: Lease'in started_at'tan itibaren üst sınırı (saniye)
+            stuck_timeout: Lease alanı olmayan in-progress kayıtların süresi
+            max_retries: Lease dolunca dead-letter'a düşmeden önceki deneme sayısı
+        """
+        self.db_path = Path(db_path)
+        self.aging_interval = aging_interval
+        self.lease_timeout = lease_timeout
+        self.task_timeout = task_timeout
+        self.stuck_timeout = stuck_timeout
+        self.max_retries = max_retries
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._file_lock = FileLock(self.db_path.with_suffix(".lock"))
+        is_new = not self.db_path.exists()
+
+        # check_same_thread=False: daemon istekleri farklı thread'lerden
+        # gelir; erişim MemoryQueueStore kilidiyle sıralanır
+        self.conn = sqlite3.connect(
+            str(self.db_path), timeout=30, isolation_level=None, check_same_thread=False
+        )
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        # INSERT OR REPLACE'ın sildiği satır için de DELETE trigger'ı çalışsın
+        self.conn.execute("PRAGMA recursive_triggers=ON")
+        self._init_db()
+
+        if is_new and import_from is not None:
+            self.import_json(import_from)
+
+    def _init_db(self) -> None:
+        """Tablo ve index'leri oluştur"""
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS tasks (
+                id TEXT PRIMARY KEY,
+                status TEXT NOT NULL,
+                agent TEXT,
+                priority INTEGER,
+                created_at TEXT,
+                position INTEGER NOT NULL,
+                sched_key REAL,
+                data TEXT NOT NULL
+            );
+
+            CREATE INDEX IF NOT EXISTS idx_tasks_status_position ON tasks(status, position);
+            CREATE INDEX IF NOT EXISTS idx_tasks_status_agent ON tasks(status, agent);
+            CREATE INDEX IF NOT EXISTS idx_tasks_status_priority ON tasks(status, priority);
+            CREATE INDEX IF NOT EXISTS idx_tasks_created_at ON tasks(created_at);
+
+            CREATE TABLE IF NOT EXISTS task_tags (
+                task_id TEXT NOT NULL,
+                tag TEXT NOT NULL,
+                PRIMARY KEY (task_id, tag)
+            );
+
+            CREATE INDEX IF NOT EXISTS idx_task_tags_tag ON task_tags(tag);
+
+            CREATE TABLE IF NOT EXISTS task_deps (
+                task_id TEXT NOT NULL,
+                dep_id TEXT NOT NULL,
+                PRIMARY KEY (task_id, dep_id)
+            );
+
+            CREATE INDEX IF NOT EXISTS idx_task_deps_dep ON task_deps(dep_id);
+        """)
+
+        # Eski şemaya yeni kolonları ekle
+        columns = {row[1] for row in self.conn.execute("PRAGMA table_info(tasks)")}
+        if "sched_key" not in columns:
+            self.conn.execute("ALTER TABLE tasks ADD COLUMN sched_key REAL")
+            rows = self.conn.execute("SELECT id, data FROM tasks").fetchall()
+            self.conn.executemany(
+                "UPDATE tasks SET sched_key = ? WHERE id = ?",
+                [(schedule_key(json.loads(data), self.aging_interval), task_id) for task_id, data in rows],
+            )
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_tasks_status_sched ON tasks(status, sched_key)")
+        if "lease_expires" not in columns:
+            self.conn.execute("ALTER TABLE tasks ADD COLUMN lease_expires REAL")
+            rows = self.conn.execute("SELECT id, data FROM tasks WHERE status = 'in-progress'").fetchall()
+            self.conn.executemany(
+                "UPDATE tasks SET lease_expires = ? WHERE id = ?",
+                [(lease_expiry(json.loads(data), self.stuck_timeout) or None, task_id) for task_id, data in rows],
+            )
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_tasks_status_lease ON tasks(status, lease_expires)")
+        if "content_hash" not in columns:
+            self.conn.execute("ALTER TABLE tasks ADD COLUMN content_hash TEXT")
+            rows = self.conn.execute("SELECT id, data FROM tasks").fetchall()
+            self.conn.executemany(
+                "UPDATE tasks SET content_hash = ? WHERE id = ?",
+                [(content_hash(json.loads(data)), task_id) for task_id, data in rows],
+            )
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_tasks_hash_status ON tasks(content_hash, status)")
+        if "unmet" not in columns:
+            self.conn.execute("ALTER TABLE tasks ADD COLUMN unmet INTEGER NOT NULL DEFAULT 0")
+            rows = self.conn.execute("SELECT id, data FROM tasks WHERE status = 'pending'").fetchall()
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO task_deps (task_id, dep_id) VALUES (?, ?)",
+                [(task_id, dep) for task_id, data in rows for dep in task_dependencies(json.loads(data))],
+            )
+            self.conn.execute(f"""
+                UPDATE tasks SET unmet = (
+                    SELECT COUNT(*) FROM task_deps d JOIN tasks t ON t.id = d.dep_id
+                    WHERE d.task_id = tasks.id AND t.status != '{DONE_STATUS}'
+                )
+                WHERE id IN (SELECT task_id FROM task_deps)
+            """)
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_tasks_status_unmet ON tasks(status, unmet, sched_key)")
+        # --since: ULID'ler (status, id) aralığıyla, eski ID'ler kısmi index'le bulunur
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_tasks_status_id ON tasks(status, id)")
+        self.conn.execute(
+            f"CREATE INDEX IF NOT EXISTS idx_tasks_legacy_created ON tasks(status, created_at) WHERE length(id) != {ULID_LENGTH}"
+        )
+
+        # Sayaçlar: tasks tablosundaki her değişiklikte trigger'larla,
+        # aynı transaction içinde güncellenir. Trigger içinde ON CONFLICT
+        # kullanılmaz: dıştaki INSERT OR REPLACE onu REPLACE'e çevirip
+        # sayacı sıfırlar.
+        has_counters = self.conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'queue_counters'"
+        ).fetchone()
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS queue_counters (
+                status TEXT NOT NULL,
+                agent TEXT NOT NULL,
+                priority INTEGER NOT NULL,
+                count INTEGER NOT NULL DEFAULT 0,
+                PRIMARY KEY (status, agent, priority)
+            );
+
+            CREATE TRIGGER IF NOT EXISTS trg_tasks_count_insert AFTER INSERT ON tasks
+            BEGIN
+                INSERT INTO queue_counters (status, agent, priority, count)
+                SELECT NEW.status, COALESCE(NEW.agent, ''), COALESCE(NEW.priority, 0), 0
+                WHERE NOT EXISTS (
+                    SELECT 1 FROM queue_counters
+                    WHERE status = NEW.status AND agent = COALESCE(NEW.agent, '')
+                      AND priority = COALESCE(NEW.priority, 0)
+                );
+                UPDATE queue_counters SET count = count + 1
+                WHERE status = NEW.status AND agent = COALESCE(NEW.agent, '')
+                  AND priority = COALESCE(NEW.priority, 0);
+            END;
+
+            CREATE TRIGGER IF NOT EXISTS trg_tasks_count_delete AFTER DELETE ON tasks
+            BEGIN
+                UPDATE queue_counters SET count = count - 1
+                WHERE status = OLD.status AND agent = COALESCE(OLD.agent, '')
+                  AND priority = COALESCE(OLD.priority, 0);
+            END;
+
+            CREATE TRIGGER IF NOT EXISTS trg_tasks_count_update
+            AFTER UPDATE OF status, agent, priority ON tasks
+            BEGIN
+                UPDATE queue_counters SET count = count - 1
+                WHERE status = OLD.status AND agent = COALESCE(OLD.agent, '')
+                  AND priority = COALESCE(OLD.priority, 0);
+                INSERT INTO queue_counters (status, agent, priority, count)
+                SELECT NEW.status, COALESCE(NEW.agent, ''), COALESCE(NEW.priority, 0), 0
+                WHERE NOT EXISTS (
+                    SELECT 1 FROM queue_counters
+                    WHERE status = NEW.status AND agent = COALESCE(NEW.agent, '')
+                      AND priority = COALESCE(NEW.priority, 0)
+                );
+                UPDATE queue_counters SET count = count + 1
+                WHERE status = NEW.status AND agent = COALESCE(NEW.agent, '')
+                  AND priority = COALESCE(NEW.priority, 0);
+            END;
+        """)
+        if not has_counters:
+            for status in QUEUE_STATUSES:
+                self.recount(status)
+
+        # Hazırlık index'i: pending task'ların bağımlılıkları task_deps'te,
+        # bitmemiş bağımlılık sayısı tasks.unmet'te. Bir task bitmemiş
+        # queue'lara girip çıktıkça yalnızca ona bağlı satırların sayacı
+        # değişir (DependencyGraph ile aynı kural: completed'da veya hiç
+        # olmayan bağımlılık karşılanmıştır).
+        self.conn.executescript(f"""
+            CREATE TRIGGER IF NOT EXISTS trg_tasks_unmet_insert AFTER INSERT ON tasks
+            WHEN NEW.status != '{DONE_STATUS}'
+            BEGIN
+                UPDATE tasks SET unmet = unmet + 1
+                WHERE id IN (SELECT task_id FROM task_deps WHERE dep_id = NEW.id);
+            END;
+
+            CREATE TRIGGER IF NOT EXISTS trg_tasks_unmet_delete AFTER DELETE ON tasks
+            WHEN OLD.status != '{DONE_STATUS}'
+            BEGIN
+                UPDATE tasks SET unmet = unmet - 1
+                WHERE id IN (SELECT task_id FROM task_deps WHERE dep_id = OLD.id);
+            END;
+
+            CREATE TRIGGER IF NOT EXISTS trg_tasks_unmet_update AFTER UPDATE OF status ON tasks
+            WHEN (OLD.status = '{DONE_STATUS}') != (NEW.status = '{DONE_STATUS}')
+            BEGIN
+                UPDATE tasks SET unmet = unmet + (CASE WHEN NEW.status = '{DONE_STATUS}' THEN -1 ELSE 1 END)
+                WHERE id IN (SELECT task_id FROM task_deps WHERE dep_id = NEW.id);
+            END;
+        """)
+
+    # ------------------------------------------------------------------------
+    # Yazma
+    # ------------------------------------------------------------------------
+
+    def _put(self, status: str, task: Dict[str, Any], position: int) -> None:
+        """Tek task'ı yaz (transaction içinde çağrılır)"""
+        if task.get("id") is None:
+            task["id"] = new_task_id()
+        task_id = str(task["id"])
+
+        # Hazırlık index'i sadece pending task'lar için tutulur. Eski satırlar
+        # yazmadan önce silinir: kendine bağımlı task'ın trigger'ı kendi
+        # sayacını artırmasın (yeni satırın unmet'i 0'dan başlar)
+        self.conn.execute("DELETE FROM task_deps WHERE task_id = ?", (task_id,))
+
+        self.conn.execute(
+            """
+            INSERT OR REPLACE INTO tasks
+                (id, status, agent, priority, created_at, position, sched_key, lease_expires, content_hash, data)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            (
+                task_id,
+                status,
+                task.get("agent"),
+                priority_rank(task.get("priority")),
+                task_created_at(task),
+                position,
+                schedule_key(task, self.aging_interval),
+                (lease_expiry(task, self.stuck_timeout) or None) if status == "in-progress" else None,
+                content_hash(task),
+                json.dumps(task, ensure_ascii=False, separators=(",", ":")),
+            ),
+        )
+        self.conn.execute("DELETE FROM task_tags WHERE task_id = ?", (task_id,))
+        tags = task.get("tags") or []
+        if isinstance(tags, list):
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO task_tags (task_id, tag) VALUES (?, ?)",
+                [(task_id, str(tag)) for tag in tags],
+            )
+
+        deps = task_dependencies(task) if status == "pending" else []
+        if deps:
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO task_deps (task_id, dep_id) VALUES (?, ?)",
+                [(task_id, dep) for dep in deps],
+            )
+            self.conn.execute(
+                f"""
+                UPDATE tasks SET unmet = (
+                    SELECT COUNT(*) FROM task_deps d JOIN tasks t ON t.id = d.dep_id
+                    WHERE d.task_id = ?1 AND t.status != '{DONE_STATUS}'
+                )
+                WHERE id = ?1
+                """,
+                (task_id,),
+            )
+
+    def _next_position(self) -> int:
+        """Sıradaki queue pozisyonu (index'li MAX)"""
+        row = self.conn.execute("SELECT MAX(position) FROM tasks").fetchone()
+        return (row[0] or 0) + 1
+
+    def _delete(self, task_id: str) -> None:
+        self.conn.execute("DELETE FROM tasks WHERE id = ?", (task_id,))
+        self.conn.execute("DELETE FROM task_tags WHERE task_id = ?", (task_id,))
+        self.conn.execute("DELETE FROM task_deps WHERE task_id = ?", (task_id,))
+
+    def append(self, status: str, task: Dict[str, Any]) -> None:
+        """Task'ı queue'nun sonuna ekle (aynı id varsa taşınır)"""
+        with self._transaction():
+            self._put(status, task, self._next_position())
+
+    def append_many(self, status: str, tasks: List[Dict[str, Any]]) -> None:
+        """Task'ları tek transaction'da ekle"""
+        with self._transaction():
+            position = self._next_position()
+            for i, task in enumerate(tasks):
+                self._put(status, task, position + i)
+
+    def remove(self, status: str, task_id: str) -> None:
+        """Task'ı queue'dan sil"""
+        with self._transaction():
+            row = self.conn.execute(
+                "SELECT 1 FROM tasks WHERE id = ? AND status = ?", (task_id, status)
+            ).fetchone()
+            if row:
+                self._delete(task_id)
+
+    def remove_many(self, status: str, task_ids: List[str]) -> None:
+        """Task'ları tek transaction'da sil"""
+        with self._transaction():
+            for task_id in task_ids:
+                row = self.conn.execute(
+                    "SELECT 1 FROM tasks WHERE id = ? AND status = ?", (task_id, status)
+                ).fetchone()
+                if row:
+                    self._delete(task_id)
+
+    def move(self, task: Dict[str, Any], source: str, target: str) -> None:
+        """Task'ı tek transaction'da başka queue'ya taşı"""
+        with self._transaction():
+            self._put(target, task, self._next_position())
+
+    def save(self, status: str, tasks: List[Dict[str, Any]]) -> None:
+        """Queue'yu verilen task listesiyle değiştir"""
+        with self._transaction():
+            ids = [r[0] for r in self.conn.execute("SELECT id FROM tasks WHERE status = ?", (status,))]
+            for task_id in ids:
+                self._delete(task_id)
+            position = self._next_position()
+            for i, task in enumerate(tasks):
+                self._put(status, task, position + i)
+
+    def claim(
+        self,
+        worker_id: str,
+        task_id: Optional[str] = None,
+        eligible: Optional[Callable[[Dict[str, Any]], bool]] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """Hazır pending task'ı (sched_key index sırasıyla) tek IMMEDIATE transaction'da al"""
+        with self._transaction():
+            if task_id is not None:
+                rows = self.conn.execute(
+                    "SELECT data FROM tasks WHERE id = ? AND status = 'pending' AND unmet = 0", (task_id,)
+                )
+            else:
+                rows = self.conn.execute(
+                    "SELECT data FROM tasks WHERE status = 'pending' AND unmet = 0 ORDER BY sched_key"
+                )
+
+            for (data,) in rows:
+                task = json.loads(data)
+                if self._claimable(task, eligible):
+                    break
+            else:
+                return None
+
+            mark_claimed(task, worker_id, self.lease_timeout)
+            self._put("in-progress", task, self._next_position())
+            return task
+
+    def expired_leases(self, now: Optional[float] = None) -> List[Dict[str, Any]]:
+        """(status, lease_expires) index aralığından süresi dolanlar"""
+        now = time.time() if now is None else now
+        rows = self.conn.execute(
+            "SELECT data FROM tasks WHERE status = 'in-progress' AND lease_expires <= ? ORDER BY lease_expires",
+            (now,),
+        )
+        return [json.loads(data) for (data,) in rows]
+
+    def find_duplicates(self, hashes: Iterable[str]) -> Dict[str, Tuple[str, Dict[str, Any]]]:
+        """(content_hash, status) index'inden arama"""
+        wanted = list(dict.fromkeys(hashes))
+        found: Dict[str, Tuple[str, Dict[str, Any]]] = {}
+        rank = {status: i for i, status in enumerate(DEDUP_STATUSES)}
+        for start in range(0, len(wanted), 500):
+            chunk = wanted[start:start + 500]
+            rows = self.conn.execute(
+                f"""
+                SELECT content_hash, status, data FROM tasks
+                WHERE content_hash IN ({", ".join("?" * len(chunk))})
+                  AND status IN ({", ".join("?" * len(DEDUP_STATUSES))})
+                """,
+                (*chunk, *DEDUP_STATUSES),
+            )
+            for digest, status, data in rows:
+                if digest not in found or rank[status] < rank[found[digest][0]]:
+                    found[digest] = (status, json.loads(data))
+        return found
+
+    def heartbeat(
+        self,
+        task_id: str,
+        worker_id: Optional[str] = None,
+        now: Optional[float] = None,
+    ) -> Optional[float]:
+        """Lease'i tek IMMEDIATE transaction'da uzat"""
+        with self._transaction():
+            task = self.get("in-progress", task_id)
+            if task is None or (worker_id is not None and task.get("claimed_by") != worker_id):
+                return None
+            expires = extend_lease(task, self.lease_timeout, self.task_timeout, now)
+            # Sıra (position) ve etiketler değişmez; yalnızca lease alanları
+            self.conn.execute(
+                "UPDATE tasks SET lease_expires = ?, data = ? WHERE id = ?",
+                (expires, json.dumps(task, ensure_ascii=False, separators=(",", ":")), str(task_id)),
+            )
+            return expires
+
+    def reclaim_expired(self, now: Optional[float] = None) -> Dict[str, List[str]]:
+        """Süresi dolan lease'leri tek IMMEDIATE transaction'da geri al"""
+        reclaimed: Dict[str, List[str]] = {"pending": [], "dead-letter": []}
+        with self._transaction():
+            for task in self.expired_leases(now):
+                target = release_lease(task, self.max_retries, f"lease expired ({task.get('claimed_by')})")
+                self._put(target, task, self._next_position())
+                reclaimed[target].append(str(task["id"]))
+        return reclaimed
+
+    def compact(self, status: str) -> None:
+        """WAL'ı ana DB dosyasına katla"""
+        self.conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
+    def locked(self, shared: bool = False):
+        """Process'ler arası kilit (<db>.lock; kontrol + yazma dizileri için)"""
+        return self._file_lock.acquire(shared=shared)
+
+    def _transaction(self):
+        """BEGIN IMMEDIATE ... COMMIT / ROLLBACK"""
+        return _SqliteTransaction(self.conn)
+
+    # ------------------------------------------------------------------------
+    # Okuma (index'li sorgular)
+    # ------------------------------------------------------------------------
+
+    def load(self, status: str) -> List[Dict[str, Any]]:
+        return self.query(status)
+
+    def ready(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Hazır pending task'lar (status, unmet, sched_key) index'inden: O(hazır)"""
+        sql = "SELECT data FROM tasks WHERE status = 'pending' AND unmet = 0 ORDER BY sched_key, position"
+        params: Tuple[Any, ...] = ()
+        if limit is not None:
+            sql += " LIMIT ?"
+            params = (limit,)
+        return [json.loads(data) for (data,) in self.conn.execute(sql, params)]
+
+    def dependents(self, task_id: str) -> List[Dict[str, Any]]:
+        """task_deps index'inden: O(bağımlı task)"""
+        rows = self.conn.execute(
+            """
+            SELECT t.data FROM task_deps d JOIN tasks t ON t.id = d.task_id
+            WHERE d.dep_id = ? AND t.status = 'pending'
+            ORDER BY t.position
+            """,
+            (str(task_id),),
+        )
+        return [json.loads(data) for (data,) in rows]
+
+    def get(self, status: str, task_id: str) -> Optional[Dict[str, Any]]:
+        row = self.conn.execute(
+            "SELECT data FROM tasks WHERE id = ? AND status = ?", (task_id, status)
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def locate(self, task_ids: Iterable[str]) -> Dict[str, str]:
+        """Primary key üzerinden, 500'lük IN parçalarıyla"""
+        wanted = list(dict.fromkeys(str(task_id) for task_id in task_ids))
+        found: Dict[str, str] = {}
+        for start in range(0, len(wanted), 500):
+            chunk = wanted[start:start + 500]
+            rows = self.conn.execute(
+                f"SELECT id, status FROM tasks WHERE id IN ({', '.join('?' * len(chunk))})", chunk
+            )
+            found.update(rows.fetchall())
+        return found
+
+    def blockers(self, task: Dict[str, Any]) -> Dict[str, str]:
+        """Karşılanmamış bağımlılıklar (tek sorgu, primary key üzerinden)"""
+        deps = task_dependencies(task)
+        if not deps:
+            return {}
+        placeholders = ",".join("?" * len(deps))
+        rows = self.conn.execute(
+            f"SELECT id, status FROM tasks WHERE id IN ({placeholders}) AND status != ?",
+            (*deps, DONE_STATUS),
+        )
+        return dict(rows.fetchall())
+
+    def count(self, status: str) -> int:
+        row = self.conn.execute(
+            "SELECT COALESCE(SUM(count), 0) FROM queue_counters WHERE status = ?", (status,)
+        ).fetchone()
+        return row[0]
+
+    def stats(self, status: str) -> Dict[str, Any]:
+        rows = self.conn.execute(
+            "SELECT agent, priority, count FROM queue_counters WHERE status = ? AND count != 0", (status,)
+        )
+        return summarize_counters({(agent, rank): n for agent, rank, n in rows})
+
+    def recount(self, status: str) -> Dict[str, Any]:
+        with self._transaction():
+            self.conn.execute("DELETE FROM queue_counters WHERE status = ?", (status,))
+            self.conn.execute(
+                """
+                INSERT INTO queue_counters (status, agent, priority, count)
+                SELECT status, COALESCE(agent, ''), COALESCE(priority, 0), COUNT(*)
+                FROM tasks WHERE status = ? GROUP BY 1, 2, 3
+                """,
+                (status,),
+            )
+        return self.stats(status)
+
+    def query(
+        self,
+        status: str,
+        agent: Optional[str] = None,
+        priority: Optional[Any] = None,
+        tag: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        since: Optional[float] = None,
+    ) -> List[Dict[str, Any]]:
+        return list(self.iter_query(status, agent, priority, tag, limit, offset, since))
+
+    def iter_query(
+        self,
+        status: str,
+        agent: Optional[str] = None,
+        priority: Optional[Any] = None,
+        tag: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        since: Optional[float] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Index'li sorgu; satırlar cursor'dan okundukça üretilir
+
+        --since ULID ID'lerde (status, id) aralığı olarak taranır; ULID
+        olmayan eski ID'ler created_at üzerindeki kısmi index'ten gelir.
+        İki dal ayrık olduğundan UNION ALL tekrar üretmez.
+        """
+        sql = "SELECT t.data, t.position FROM tasks t"
+        params: List[Any] = []
+        if tag is not None:
+            sql += " JOIN task_tags g ON g.task_id = t.id AND g.tag = ?"
+            params.append(tag)
+
+        sql += " WHERE t.status = ?"
+        params.append(status)
+        if agent is not None:
+            sql += " AND t.agent = ?"
+            params.append(agent)
+        if priority is not None:
+            sql += " AND t.priority = ?"
+            params.append(priority_rank(priority))
+
+        if since is not None:
+            # created_at ISO metin olarak saklanır (datetime.now().isoformat());
+            # ULID dalında da uygulanır (created_at'i verilmiş içe aktarılan kayıtlar)
+            created = datetime.fromtimestamp(since).isoformat()
+            sql = (
+                f"SELECT data, position FROM ("
+                f"{sql} AND t.id >= ? AND t.id < ? AND length(t.id) = {ULID_LENGTH} AND t.created_at >= ?"
+                f" UNION ALL "
+                f"{sql} AND length(t.id) != {ULID_LENGTH} AND t.created_at >= ?"
+                f") t"
+            )
+            params = [*params, ulid_floor(since), ULID_CEILING, created, *params, created]
+
+        sql += " ORDER BY t.position LIMIT ? OFFSET ?"
+        params.extend([limit if limit is not None else -1, offset])
+
+        for row in self.conn.execute(sql, params):
+            yield json.loads(row[0])
+
+    # ------------------------------------------------------------------------
+    # JSON import
+    # ------------------------------------------------------------------------
+
+    def import_json(self, queue_dir: Path) -> int:
+        """Mevcut JSON queue'larını DB'ye aktar"""
+        source = JsonQueueStore(queue_dir)
+        imported = 0
+        for status in QUEUE_STATUSES:
+            tasks = source.load(status)
+            if tasks:
+                with self._transaction():
+                    position = self._next_position()
+                    for i, task in enumerate(tasks):
+                        self._put(status, task, position + i)
+                imported += len(tasks)
+        return imported
+
+    def close(self) -> None:
+        self.conn.close()
+
+
+class _SqliteTransaction:
+    """Yazma kilidini baştan alan (BEGIN IMMEDIATE) transaction context'i"""
+
+    def __init__(self, conn: sqlite3.Connection):
+        self.conn = conn
+
+    def __enter__(self):
+        self.conn.execute("BEGIN IMMEDIATE")
+        return self.conn
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.conn.execute("COMMIT")
+        else:
+            self.conn.execute("ROLLBACK")
+        return False
+
+
+# ============================================================================
+# FACTORY
+# ============================================================================
+
+def create_store(queue_dir: Path, config: Optional[Dict[str, Any]] = None) -> QueueStore:
+    """queue.json > storage ayarlarından store oluştur"""
+    storage = (config or {}).get("storage", {})
+    backend = storage.get("backend", "json")
+    queue = (config or {}).get("queue", {})
+    monitoring = (config or {}).get("monitoring", {})
+    options = {
+        "aging_interval": queue.get("agingInterval", DEFAULT_AGING_INTERVAL),
+        "lease_timeout": monitoring.get("heartbeatTimeout", DEFAULT_LEASE_TIMEOUT),
+        "task_timeout": monitoring.get("taskTimeout", DEFAULT_TASK_TIMEOUT),
+        "stuck_timeout": monitoring.get("stuckTimeout", DEFAULT_STUCK_TIMEOUT),
+        "max_retries": queue.get("maxRetries", DEFAULT_MAX_RETRIES),
+    }
+
+    if backend == "sqlite":
+        db_path = Path(queue_dir) / storage.get("sqliteFile", DEFAULT_SQLITE_FILE)
+        return SqliteQueueStore(db_path, import_from=Path(queue_dir), **options)
+
+    if backend != "json":
+        raise ValueError(f"Bilinmeyen queue backend: {backend} (geçerli: json, sqlite)")
+
+    return JsonQueueStore(
+        queue_dir,
+        compact_min_bytes=storage.get("journalCompactMinBytes", DEFAULT_COMPACT_MIN_BYTES),
+        compact_ratio=storage.get("journalCompactRatio", DEFAULT_COMPACT_RATIO),
+        **options,
+    )
+
+
+# ============================================================================
+# CLI
+# ============================================================================
+
+def _write_queue_json(tasks: Iterable[Dict[str, Any]]) -> None:
+    """Task'ları snapshot biçiminde ({"tasks": [...]}) akış halinde yaz"""
+    sys.stdout.write('{"tasks": [')
+    for i, task in enumerate(tasks):
+        sys.stdout.write((",\n" if i else "\n") + json.dumps(task, ensure_ascii=False))
+    sys.stdout.write("\n]}\n")
+
+
+def main() -> int:
+    """
+    Kullanım:
+        python queue_store.py export [dizin]          # Aktif backend → tasks-<status>.json
+        python queue_store.py import                  # JSON queue'ları SQLite'a aktar
+        python queue_store.py compact                 # Journal / WAL katla
+        python queue_store.py cat <status> [--since]  # Güncel queue: {"tasks": [...]}
+        python queue_store.py counts                  # {"pending": n, ...}
+        python queue_store.py get <status> <id>       # Tek task (yoksa çıkış kodu 1)
+        python queue_store.py move <kaynak> <hedef>   # stdin'deki task'ı taşı
+        python queue_store.py remove <status> <id>    # Task'ı sil
+
+    Shell script'leri tasks-<status>.json'u doğrudan okumaz: snapshot
+    journal'ın gerisinde kalabilir (sqlite backend'de hiç yoktur).
+    cat / counts / get / move / remove backend'den bağımsızdır ve
+    `odin serve` çalışıyorsa daemon üzerinden gider.
+    """
+    agent_dir = Path(__file__).resolve().parent.parent
+    queue_dir = agent_dir / "queue"
+    config_file = agent_dir / "config" / "queue.json"
+    config = json.loads(config_file.read_text(encoding="utf-8")) if config_file.exists() else {}
+
+    commands = {
+        "export": 0, "import": 0, "compact": 0,
+        "cat": 1, "counts": 0, "get": 2, "move": 2, "remove": 2,
+    }
+    args = sys.argv[2:]
+    if len(sys.argv) < 2 or sys.argv[1] not in commands or len(args) < commands[sys.argv[1]]:
+        print(main.__doc__)
+        return 1
+
+    command = sys.argv[1]
+    if command in ("cat", "get", "move", "remove"):
+        for status in args[:1] if command != "move" else args[:2]:
+            if status not in QUEUE_STATUSES:
+                sys.stderr.write(f"Geçersiz durum: {status} (geçerli: {', '.join(QUEUE_STATUSES)})\n")
+                return 1
+
+    if command in ("export", "import", "compact"):
+        store = create_store(queue_dir, config)
+    else:
+        from cli_fast import open_store  # Daemon'a bağlanabilen store
+        store = open_store(agent_dir.parent, config)
+
+    try:
+        if command == "export":
+            target = Path(args[0]) if args else queue_dir
+            for path in store.export_json(target):
+                print(f"✅ {path}")
+        elif command == "import":
+            if not isinstance(store, SqliteQueueStore):
+                print("❌ import sadece sqlite backend için geçerli")
+                return 1
+            print(f"✅ {store.import_json(queue_dir)} task aktarıldı")
+        elif command == "compact":
+            for status in QUEUE_STATUSES:
+                store.compact(status)
+            print("✅ Compaction tamamlandı")
+        elif command == "cat":
+            since = None
+            if "--since" in args:
+                try:
+                    since = parse_since(args[args.index("--since") + 1])
+                except (IndexError, ValueError) as e:
+                    sys.stderr.write(f"--since: {e}\n")
+                    return 1
+            _write_queue_json(store.iter_query(args[0], since=since))
+        elif command == "counts":
+            print(json.dumps(store.counts()))
+        elif command == "get":
+            task = store.get(args[0], args[1])
+            if task is None:
+                return 1
+            print(json.dumps(task, ensure_ascii=False))
+        else:
+            task = json.loads(sys.stdin.read()) if command == "move" else {"id": args[1]}
+            with store.locked():
+                if store.get(args[0], str(task.get("id"))) is None:
+                    sys.stderr.write(f"Task {task.get('id')} {args[0]} queue'sunda yok\n")
+                    return 1
+                if command == "move":
+                    store.move(task, args[0], args[1])
+                else:
+                    store.remove(args[0], str(task["id"]))
+    finally:
+        store.close()
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
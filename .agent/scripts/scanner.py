@@ -3,22 +3,241 @@
 ODIN AI Agent System - Project Scanner
 Proje dilini, framework'ünü, dosya ağacını tarar ve özet çıkarar.
 
-Version: 1.0.0
+Ağaç tek bir os.scandir yürüyüşüyle index'lenir (ScanManifest); tespitler
+dosya sistemi yerine bu index üzerinde yapılır. Manifest dizin başına
+mtime, alt dizin ve dosya (boyut, mtime) listesini tutar ve
+.agent/state/scan-manifest.json'a kaydedilir. Sonraki taramada her dizin
+yalnızca stat'lanır; mtime'ı değişmeyen dizin yeniden listelenmez (giriş
+eklenip silinmeden dizin mtime'ı değişmez). İçeriği okunan dosyaların
+(package.json) stat'ları ayrıca izlenir. Hiçbir şey değişmediyse tespit ve
+context.md / scan-results.json yazımı atlanır (update_scan).
+
+VCS dizinleri ve ODIN'in kendi çalışma dosyaları (.agent/state, queue,
+logs) taranmaz; taramanın çıktıları bir sonraki taramayı tetiklemesin.
+
+Version: 1.1.0
 """
 
 import os
 import json
 import re
+import time
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Iterator, Set, Tuple
 from datetime import datetime
 
+MANIFEST_FILE = ".agent/state/scan-manifest.json"
+CONTEXT_FILE = ".agent/context.md"
+RESULTS_FILE = ".agent/state/scan-results.json"
+MANIFEST_VERSION = 1
+
+# Taranmayan dizinler (proje köküne göre)
+SKIP_DIR_NAMES = {".git", ".hg", ".svn"}
+SKIP_PATHS = {".agent/state", ".agent/queue", ".agent/logs"}
+
+# Tarama sırasında değişen dizin aynı mtime tick'inde tekrar değişebilir;
+# bu kadar yeni mtime'lı dizinler bir sonraki taramada yeniden listelenir
+RACY_WINDOW_NS = 2_000_000_000
+
+# Tech stack için içeriği okunan config dosyası sayısı
+CONFIG_FILE_LIMIT = 20
+
+
+class ScanManifest:
+    """
+    Proje ağacının index'i
+
+        dirs  : dizin → [mtime_ns, alt dizinler]
+        files : dizin → {dosya: [boyut, mtime_ns]}
+
+    refresh() yalnızca mtime'ı değişen dizinleri yeniden listeler. Dosya
+    listeleri ayrı bir dosyada (scan-manifest.files.json) tutulur ve ancak
+    ağaç değiştiğinde okunur; değişmeyen projede yalnızca dizin mtime'ları
+    yüklenip stat'lanır.
+    """
+
+    def __init__(
+        self,
+        project_root: Path,
+        dirs: Optional[Dict[str, list]] = None,
+        watched: Optional[Dict[str, list]] = None,
+        files_generation: Optional[int] = None,
+    ):
+        self.project_root = Path(project_root)
+        self.path: Optional[Path] = None
+        self.dirs: Dict[str, list] = dirs or {}
+        # İçeriği okunan dosyaların stat'ları (göreli yol → [boyut, mtime_ns])
+        self.watched: Dict[str, list] = watched or {}
+        self.rescanned = 0
+        self._files: Optional[Dict[str, Dict[str, list]]] = None if dirs else {}
+        self._files_generation = files_generation
+        self._files_dirty = False
+
+    @staticmethod
+    def files_path(path: Path) -> Path:
+        return path.with_name(path.stem + ".files.json")
+
+    @classmethod
+    def load(cls, project_root: Path, path: Optional[Path] = None) -> "ScanManifest":
+        """Kayıtlı manifest (yoksa / uyumsuzsa boş)"""
+        path = Path(path) if path else Path(project_root) / MANIFEST_FILE
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            data = {}
+        if data.get("version") != MANIFEST_VERSION or data.get("project_root") != str(project_root):
+            return cls(project_root)
+        manifest = cls(project_root, data.get("dirs"), data.get("watched"), data.get("filesGeneration"))
+        manifest.path = path
+        return manifest
+
+    @property
+    def files(self) -> Dict[str, Dict[str, list]]:
+        """Dizin → dosyalar (ilk erişimde okunur)"""
+        if self._files is None:
+            try:
+                data = json.loads(self.files_path(self.path).read_text(encoding="utf-8"))
+            except (OSError, ValueError, TypeError):
+                data = {}
+            if "files" in data and data.get("generation") == self._files_generation:
+                self._files = data["files"]
+            else:
+                # Kayıp / ana manifest'le uyumsuz: dizinler yeniden listelenir
+                self._files = {}
+                for rel in self.dirs:
+                    self.dirs[rel], self._files[rel] = self._list(rel, -1)
+                self._files_dirty = True
+        return self._files
+
+    def save(self, path: Optional[Path] = None) -> None:
+        path = Path(path) if path else self.project_root / MANIFEST_FILE
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if self._files_dirty or self._files_generation is None:
+            # Önce dosya listeleri, sonra onlara işaret eden ana manifest
+            self._files_generation = time.time_ns()
+            self._write(self.files_path(path), {"generation": self._files_generation, "files": self.files})
+            self._files_dirty = False
+        self._write(path, {
+            "version": MANIFEST_VERSION,
+            "project_root": str(self.project_root),
+            "filesGeneration": self._files_generation,
+            "dirs": self.dirs,
+            "watched": self.watched,
+        })
+        self.path = path
+
+    @staticmethod
+    def _write(path: Path, data: Dict[str, Any]) -> None:
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(data, separators=(",", ":")), encoding="utf-8")
+        os.replace(tmp, path)
+
+    def refresh(self) -> bool:
+        """
+        Ağacı güncelle
+
+        Returns:
+            Dizin yapısı değiştiyse True
+        """
+        old = self.dirs
+        dirs: Dict[str, list] = {}
+        listed: Dict[str, Dict[str, list]] = {}
+        racy_after = time.time_ns() - RACY_WINDOW_NS
+        root = str(self.project_root)
+        stack = [""]
+        while stack:
+            rel = stack.pop()
+            try:
+                mtime = os.stat(f"{root}/{rel}" if rel else root).st_mtime_ns
+            except OSError:
+                continue
+            entry = old.get(rel)
+            if entry is None or entry[0] != mtime:
+                entry, listed[rel] = self._list(rel, -1 if mtime >= racy_after else mtime)
+            dirs[rel] = entry
+            if entry[1]:
+                stack.extend(f"{rel}/{name}" if rel else name for name in entry[1])
+
+        self.rescanned = len(listed)
+        changed = bool(listed) or len(dirs) != len(old)
+        if changed:
+            previous = self.files
+            files: Dict[str, Dict[str, list]] = {}
+            for rel in dirs:
+                if rel in listed:
+                    files[rel] = listed[rel]
+                elif rel in previous:
+                    files[rel] = previous[rel]
+                else:
+                    # Dosya listesi kayıp (eski / yarım manifest): yeniden listele
+                    dirs[rel], files[rel] = self._list(rel, -1)
+                    self.rescanned += 1
+            self._files = files
+            self._files_dirty = True
+        self.dirs = dirs
+        return changed
+
+    def _list(self, rel: str, mtime: int) -> Tuple[list, Dict[str, list]]:
+        subdirs: List[str] = []
+        files: Dict[str, list] = {}
+        try:
+            with os.scandir(os.path.join(self.project_root, rel)) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            child = f"{rel}/{entry.name}" if rel else entry.name
+                            if entry.name not in SKIP_DIR_NAMES and child not in SKIP_PATHS:
+                                subdirs.append(entry.name)
+                        else:
+                            st = entry.stat(follow_symlinks=False)
+                            files[entry.name] = [st.st_size, st.st_mtime_ns]
+                    except OSError:
+                        continue
+        except OSError:
+            pass
+        return [mtime, sorted(subdirs)], files
+
+    def refresh_watched(self, paths: Optional[List[str]] = None) -> bool:
+        """
+        İçeriği okunan dosyaların stat'larını güncelle; değiştiyse True
+
+        paths verilmezse önceki taramada izlenen dosyalara bakılır (ağaç
+        değişmediyse bu liste de değişmez).
+        """
+        watched: Dict[str, list] = {}
+        for rel in self.watched if paths is None else paths:
+            try:
+                st = os.stat(self.project_root / rel)
+            except OSError:
+                continue
+            watched[rel] = [st.st_size, st.st_mtime_ns]
+        changed = watched != self.watched
+        self.watched = watched
+        return changed
+
+    # ------------------------------------------------------------------------
+    # Sorgular
+    # ------------------------------------------------------------------------
+
+    def iter_dirs(self) -> Iterator[str]:
+        """Kök hariç tüm dizinler (göreli yol, sıralı)"""
+        return iter(sorted(rel for rel in self.dirs if rel))
+
+    def root_dirs(self) -> List[str]:
+        entry = self.dirs.get("")
+        return list(entry[1]) if entry else []
+
 
 class ProjectScanner:
     """Proje tarayıcı sınıfı"""
 
-    def __init__(self, project_root: str = "."):
+    def __init__(self, project_root: str = ".", manifest: Optional[ScanManifest] = None, verbose: bool = True):
         self.project_root = Path(project_root).resolve()
+        self.manifest = manifest
+        self.verbose = verbose
+        self._names: Set[str] = set()
+        self._suffixes: Set[str] = set()
+        self._config_files: Optional[List[str]] = None
         self.scan_results = {
             "scan_date": datetime.now().isoformat(),
             "project_root": str(self.project_root),
@@ -30,9 +249,73 @@ class ProjectScanner:
             "summary": ""
         }
 
+    def _log(self, message: str) -> None:
+        if self.verbose:
+            print(message)
+
+    def _build_index(self) -> None:
+        """Ad / uzantı / yol kümeleri (rglob yerine)"""
+        if self.manifest is None:
+            self.manifest = ScanManifest(self.project_root)
+            self.manifest.refresh()
+        names: Set[str] = set()
+        for rel, (_, subdirs) in self.manifest.dirs.items():
+            names.update(subdirs)
+            names.update(self.manifest.files.get(rel, ()))
+        suffixes = set()
+        for name in names:
+            # "a.tar.gz" → ".tar.gz", ".gz" (endswith eşlemesi)
+            dot = name.find(".")
+            while dot != -1:
+                suffixes.add(name[dot:])
+                dot = name.find(".", dot + 1)
+        self._names, self._suffixes = names, suffixes
+        self._config_files = None
+
+    def _exists(self, indicator: str) -> bool:
+        """Ağaçta indicator'a uyan dosya / dizin var mı (rglob eşdeğeri)"""
+        if indicator.startswith("."):
+            return indicator in self._suffixes
+        if "/" in indicator:
+            parent, name = indicator.rsplit("/", 1)
+            if name not in self._names:
+                return False
+            files = self.manifest.files
+            return any(
+                (rel == parent or rel.endswith("/" + parent)) and (name in subdirs or name in files.get(rel, ()))
+                for rel, (_, subdirs) in self.manifest.dirs.items()
+            )
+        return indicator in self._names
+
+    def config_files(self) -> List[str]:
+        """Tech stack için taranan config dosyaları (göreli yol; uzantı grubu, sonra yol sırası)"""
+        if self._config_files is None:
+            groups: List[List[str]] = [[], [], [], [], []]
+            files = self.manifest.files
+            for rel in sorted(self.manifest.dirs):
+                for name in sorted(files.get(rel, ())):
+                    path = f"{rel}/{name}" if rel else name
+                    for i, suffix in enumerate((".json", ".yaml", ".yml", ".toml")):
+                        if name.endswith(suffix):
+                            groups[i].append(path)
+                    if ".config." in name:
+                        groups[4].append(path)
+            self._config_files = [path for group in groups for path in group]
+        return self._config_files
+
+    def watched_files(self) -> List[str]:
+        """İçeriği okunan dosyalar (değişince yeniden tespit gerekir)"""
+        watched = [path for path in self.config_files()[:CONFIG_FILE_LIMIT] if path.endswith("package.json")]
+        if "package.json" not in watched:
+            watched.append("package.json")
+        return watched
+
     def scan(self) -> Dict[str, Any]:
         """Projesini tara ve sonuçları döndür"""
-        print(f"🔍 Proje taranıyor: {self.project_root}")
+        self._log(f"🔍 Proje taranıyor: {self.project_root}")
+
+        # 0. Ağaç index'i
+        self._build_index()
 
         # 1. Dil tespiti
         self._detect_language()
@@ -70,19 +353,15 @@ class ProjectScanner:
         detected_languages = []
 
         for lang, indicators in language_indicators:
-            for indicator in indicators:
-                # Dosya uzantısı için wildcard ekle
-                pattern = f"*{indicator}" if indicator.startswith('.') else indicator
-                if any(self.project_root.rglob(pattern)):
-                    detected_languages.append(lang)
-                    break
+            if any(self._exists(indicator) for indicator in indicators):
+                detected_languages.append(lang)
 
         if detected_languages:
             self.scan_results["language"] = detected_languages[0] if len(detected_languages) == 1 else "Multi-language"
-            print(f"   ✓ Dil: {self.scan_results['language']}")
+            self._log(f"   ✓ Dil: {self.scan_results['language']}")
         else:
             self.scan_results["language"] = "Unknown"
-            print(f"   ⚠ Dil tespit edilemedi")
+            self._log(f"   ⚠ Dil tespit edilemedi")
 
     def _detect_framework(self):
         """Framework tespit et"""
@@ -121,19 +400,16 @@ class ProjectScanner:
                                 detected_frameworks.append(framework)
                         elif "next" in content.lower():
                             detected_frameworks.append("Next.js")
-                else:
-                    # Dosya uzantısı için wildcard ekle
-                    pattern = f"*{indicator}" if indicator.startswith('.') else indicator
-                    if any(self.project_root.rglob(pattern)):
-                        detected_frameworks.append(framework)
-                        break
+                elif self._exists(indicator):
+                    detected_frameworks.append(framework)
+                    break
 
         if detected_frameworks:
             self.scan_results["framework"] = detected_frameworks[0] if len(detected_frameworks) == 1 else detected_frameworks
-            print(f"   ✓ Framework: {self.scan_results['framework']}")
+            self._log(f"   ✓ Framework: {self.scan_results['framework']}")
         else:
             self.scan_results["framework"] = "Unknown"
-            print(f"   ⚠ Framework tespit edilemedi")
+            self._log(f"   ⚠ Framework tespit edilemedi")
 
     def _detect_package_manager(self):
         """Package manager tespit et"""
@@ -155,27 +431,23 @@ class ProjectScanner:
             # Herhangi bir indicator dosyası var mı kontrol et
             for indicator in indicators:
                 # Proje root'unda veya herhangi bir alt dizinde ara
-                if (self.project_root / indicator).exists() or any(self.project_root.rglob(f"*/{indicator}")):
+                if self._exists(indicator):
                     self.scan_results["package_manager"] = pm
-                    print(f"   ✓ Package Manager: {pm}")
+                    self._log(f"   ✓ Package Manager: {pm}")
                     return
 
         self.scan_results["package_manager"] = "Unknown"
-        print(f"   ⚠ Package manager tespit edilemedi")
+        self._log(f"   ⚠ Package manager tespit edilemedi")
 
     def _detect_tech_stack(self):
         """Tech stack tespit et"""
         tech_stack = []
 
         # Config dosyalarını tara
-        config_files = list(self.project_root.rglob("*.json")) + \
-                       list(self.project_root.rglob("*.yaml")) + \
-                       list(self.project_root.rglob("*.yml")) + \
-                       list(self.project_root.rglob("*.toml")) + \
-                       list(self.project_root.rglob("*.config.*"))
+        config_files = [self.project_root / path for path in self.config_files()]
 
         # Klasör yapısından bilgi çıkar
-        dirs = [d.name for d in self.project_root.iterdir() if d.is_dir()]
+        dirs = self.manifest.root_dirs()
 
         # Web projesi indicator'ları
         web_indicators = {
@@ -202,7 +474,7 @@ class ProjectScanner:
                 tech_stack.append(f"Directory: {dir_name} ({desc})")
 
         # Config dosyalarından tech stack çıkar
-        for config_file in config_files[:20]:  # İlk 20 dosya
+        for config_file in config_files[:CONFIG_FILE_LIMIT]:  # İlk 20 dosya
             if config_file.name == "package.json":
                 try:
                     content = json.loads(config_file.read_text())
@@ -212,7 +484,7 @@ class ProjectScanner:
                     pass
 
         self.scan_results["tech_stack"] = tech_stack
-        print(f"   ✓ Tech Stack: {len(tech_stack)} bileşen tespit edildi")
+        self._log(f"   ✓ Tech Stack: {len(tech_stack)} bileşen tespit edildi")
 
     def _scan_file_structure(self):
         """Dosya yapısını tara"""
@@ -220,29 +492,25 @@ class ProjectScanner:
         dir_count = 0
         extensions = {}
 
-        # İlk 2 derinlikte tara
-        for item in self.project_root.rglob("*"):
-            if item.is_file():
-                file_count += 1
-                ext = item.suffix
+        # Index'ten sayılır; dosya sistemi yeniden gezilmez
+        for names in self.manifest.files.values():
+            file_count += len(names)
+            for name in names:
+                ext = os.path.splitext(name)[1]
                 if ext:
                     extensions[ext] = extensions.get(ext, 0) + 1
-
-                # Performans için ilk 1000 dosya
-                if file_count >= 1000:
-                    break
-            elif item.is_dir():
-                # .git, node_modules, __pycache__ gibi dizinleri atla
-                if not any(part.startswith('.') for part in item.parts):
-                    dir_count += 1
+        for path in self.manifest.iter_dirs():
+            # .git, __pycache__ gibi gizli dizinleri sayma
+            if not any(part.startswith('.') for part in path.split("/")):
+                dir_count += 1
 
         self.scan_results["file_structure"] = {
             "file_count": file_count,
             "dir_count": dir_count,
-            "extensions": dict(sorted(extensions.items(), key=lambda x: x[1], reverse=True)[:20])
+            "extensions": dict(sorted(extensions.items(), key=lambda x: (-x[1], x[0]))[:20])
         }
 
-        print(f"   ✓ Dosya Yapısı: {file_count} dosya, {dir_count} klasör")
+        self._log(f"   ✓ Dosya Yapısı: {file_count} dosya, {dir_count} klasör")
 
     def _generate_summary(self):
         """Özet oluştur"""
@@ -262,7 +530,7 @@ class ProjectScanner:
         summary += f". Toplam {file_count} dosya bulunuyor."
 
         self.scan_results["summary"] = summary
-        print(f"\n   📋 ÖZET: {summary}")
+        self._log(f"\n   📋 ÖZET: {summary}")
 
     def save_context(self, output_file: str = ".agent/context.md"):
         """Context dosyasını kaydet"""
@@ -325,33 +593,75 @@ This context is auto-generated by `scripts/scanner.py`. Please update it manuall
         output_path.parent.mkdir(parents=True, exist_ok=True)
         output_path.write_text(context_content)
 
-        print(f"\n✅ Context kaydedildi: {output_file}")
+        self._log(f"\n✅ Context kaydedildi: {output_file}")
 
     def save_json(self, output_file: str = ".agent/state/scan-results.json"):
         """JSON formatında kaydet"""
         output_path = self.project_root / output_file
         output_path.parent.mkdir(parents=True, exist_ok=True)
         output_path.write_text(json.dumps(self.scan_results, indent=2, ensure_ascii=False))
-        print(f"✅ JSON kaydedildi: {output_file}")
+        self._log(f"✅ JSON kaydedildi: {output_file}")
 
 
-def main():
-    """Ana fonksiyon"""
-    import sys
+def _without_date(results: Dict[str, Any]) -> Dict[str, Any]:
+    return {key: value for key, value in results.items() if key != "scan_date"}
 
-    # Proje root tespit et
-    if len(sys.argv) > 1:
-        project_root = sys.argv[1]
-    else:
-        project_root = "."
 
-    # Tara
-    scanner = ProjectScanner(project_root)
+def update_scan(project_root: str = ".", force: bool = False, verbose: bool = False) -> Tuple[Dict[str, Any], bool]:
+    """
+    Artımlı tarama: manifest'i güncelle, gerekiyorsa yeniden tespit et
+
+    Ağaç ve izlenen dosyalar değişmediyse önceki sonuçlar döndürülür (dosya
+    yazılmaz). Değiştiyse tespit index üzerinden yeniden yapılır; context.md
+    ve scan-results.json yalnızca sonuç farklıysa yazılır.
+
+    Args:
+        force: Manifest'i yok say, tüm ağacı yeniden listele ve çıktıları yaz
+
+    Returns:
+        (sonuçlar, çıktılar yeniden yazıldı mı)
+    """
+    root = Path(project_root).resolve()
+    manifest = ScanManifest(root) if force else ScanManifest.load(root)
+    try:
+        previous = json.loads((root / RESULTS_FILE).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        previous = None
+
+    tree_changed = manifest.refresh()
+    if not force and previous is not None and not tree_changed and not manifest.refresh_watched():
+        return previous, False
+
+    scanner = ProjectScanner(str(root), manifest, verbose)
     results = scanner.scan()
+    manifest.refresh_watched(scanner.watched_files())
+
+    changed = force or previous is None or _without_date(previous) != _without_date(results)
+    if changed:
+        scanner.save_context(CONTEXT_FILE)
+        scanner.save_json(RESULTS_FILE)
+    else:
+        results = previous
+    manifest.save()
+    return results, changed
+
+
+def main():
+    """
+    Kullanım:
+        python scanner.py [project_root] [--full]
+
+    Varsayılan artımlı taramadır (değişiklik yoksa dosyalar yazılmaz);
+    --full manifest'i yok sayıp tüm projeyi yeniden tarar.
+    """
+    import sys
+
+    args = [arg for arg in sys.argv[1:] if arg != "--full"]
+    project_root = args[0] if args else "."
 
-    # Kaydet
-    scanner.save_context()
-    scanner.save_json()
+    _, changed = update_scan(project_root, force="--full" in sys.argv[1:], verbose=True)
+    if not changed:
+        print("✓ Değişiklik yok, context güncel")
 
     print("\n🎉 Tarama tamamlandı!")
 
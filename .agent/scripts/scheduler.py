@@ -0,0 +1,430 @@
+#!/usr/bin/env python3
+"""
+ODIN AI Agent System - Task Scheduler
+Pending task'lar için öncelik sıralaması (aging destekli).
+
+Öncelik 1-10 aralığındadır (1=kritik, 10=düşük; bkz. schemas.TaskState).
+Bekleyen task'lar her `aging_interval` saniyede bir seviye yükselir; böylece
+sürekli yüksek öncelikli yük altında düşük öncelikli işler aç kalmaz.
+
+Aging tüm task'lar için aynı hızla işlediğinden sıralama anahtarı zamandan
+bağımsızdır:
+
+    effective(t)  = rank - (now - created) / interval
+    sıra anahtarı = created + rank * interval      (küçük olan önce)
+
+Bu sayede anahtar task eklenirken bir kez hesaplanır ve heap her pop'ta
+yeniden düzenlenmek zorunda kalmaz (O(log n)).
+
+`dependencies` alanı DependencyGraph ile izlenir: her pending task için
+karşılanmamış bağımlılık sayısı tutulur ve bir task completed'a geçtiğinde
+yalnızca ona bağlı task'ların sayacı düşürülür. Çalışmaya hazır task'lar
+(sayaç = 0) ayrı bir kümede durur; bulmak O(hazır) maliyetlidir.
+
+In-progress task'ların lease bitişleri LeaseIndex heap'inde tutulur; süresi
+dolan lease'leri bulmak tüm in-progress listesini taramaz (O(k log n)).
+
+Version: 1.0.0
+"""
+
+import heapq
+import itertools
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from task_ids import ulid_timestamp
+
+# Aging kapalıyken (interval=0) öncelik seviyeleri arasındaki mesafe;
+# herhangi bir zaman damgası farkından büyük olmalı
+STRICT_PRIORITY_SPAN = 1e12
+
+DEFAULT_AGING_INTERVAL = 300
+
+# CLI öncelikleri → schemas.TaskState öncelikleri (1=kritik, 10=düşük)
+PRIORITY_LEVELS = {
+    "critical": 1,
+    "high": 3,
+    "normal": 5,
+    "medium": 5,
+    "low": 8,
+}
+DEFAULT_PRIORITY = 5
+
+# Bağımlılığı karşılayan durum; diğer tüm queue'lar "bitmemiş" sayılır
+DONE_STATUS = "completed"
+
+
+def priority_rank(priority: Any) -> int:
+    """Öncelik değerini 1-10 aralığında sayıya çevir"""
+    if isinstance(priority, bool):
+        return DEFAULT_PRIORITY
+    if isinstance(priority, (int, float)):
+        return min(10, max(1, int(priority)))
+    if isinstance(priority, str):
+        if priority.strip().isdigit():
+            return min(10, max(1, int(priority.strip())))
+        return PRIORITY_LEVELS.get(priority.strip().lower(), DEFAULT_PRIORITY)
+    return DEFAULT_PRIORITY
+
+
+def task_created_at(task: Dict[str, Any]) -> str:
+    """Task oluşturma zamanı (odin: created_at, schema: createdAt)"""
+    return task.get("created_at") or task.get("createdAt") or ""
+
+
+def task_dependencies(task: Dict[str, Any]) -> List[str]:
+    """Task'ın bağımlılık ID'leri (odin: dependencies, schema: payload.dependencies)"""
+    deps = task.get("dependencies")
+    if deps is None and isinstance(task.get("payload"), dict):
+        deps = task["payload"].get("dependencies")
+    if not isinstance(deps, list):
+        return []
+    # Sıra korunur, tekrarlar sayaçları bozmasın diye atılır
+    return list(dict.fromkeys(str(d) for d in deps if d is not None and d != ""))
+
+
+def parse_timestamp(value: Any) -> float:
+    """ISO tarih metnini epoch saniyeye çevir; geçersizse 0"""
+    if not value:
+        return 0.0
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+    except (ValueError, TypeError, AttributeError):
+        return 0.0
+
+
+def created_timestamp(task: Dict[str, Any]) -> float:
+    """Task oluşturma zamanı (epoch saniye); alan yoksa ULID ID'den, bilinmiyorsa 0"""
+    return parse_timestamp(task_created_at(task)) or ulid_timestamp(task.get("id")) or 0.0
+
+
+def lease_expiry(task: Dict[str, Any], default_timeout: float) -> float:
+    """
+    In-progress task'ın lease bitişi (epoch saniye); lease yoksa 0
+
+    Lease alanı olmayan eski kayıtlarda started_at + default_timeout kullanılır.
+    """
+    expires = parse_timestamp(task.get("lease_expires_at"))
+    if expires:
+        return expires
+    started = parse_timestamp(task.get("started_at"))
+    return started + default_timeout if started else 0.0
+
+
+def schedule_key(task: Dict[str, Any], aging_interval: float = DEFAULT_AGING_INTERVAL) -> float:
+    """
+    Task'ın sıralama anahtarı (küçük olan önce çalışır)
+
+    Args:
+        task: Task objesi
+        aging_interval: Bir öncelik seviyesi kazanmak için gereken bekleme
+                        süresi (saniye). 0: aging kapalı, katı öncelik + FIFO.
+    """
+    span = aging_interval if aging_interval > 0 else STRICT_PRIORITY_SPAN
+    return created_timestamp(task) + priority_rank(task.get("priority")) * span
+
+
+class PriorityScheduler:
+    """
+    Lazy-deletion'lı min-heap
+
+    Silinen veya güncellenen task'ların eski heap kayıtları hemen
+    temizlenmez; pop sırasında `_entries` ile eşleşmeyen kayıtlar atlanır.
+    """
+
+    def __init__(self, aging_interval: float = DEFAULT_AGING_INTERVAL):
+        self.aging_interval = aging_interval
+        self._heap: List[Tuple[float, int, str]] = []
+        self._entries: Dict[str, Tuple[float, int]] = {}
+        self._counter = itertools.count()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, task_id: str) -> bool:
+        return task_id in self._entries
+
+    def key(self, task: Dict[str, Any]) -> float:
+        """Heap anahtarı (küçük olan önce)"""
+        return schedule_key(task, self.aging_interval)
+
+    def push(self, task: Dict[str, Any]) -> None:
+        """Task'ı ekle (aynı id varsa eski kayıt geçersiz olur)"""
+        task_id = str(task["id"])
+        entry = (self.key(task), next(self._counter))
+        self._entries[task_id] = entry
+        heapq.heappush(self._heap, (entry[0], entry[1], task_id))
+
+    def discard(self, task_id: str) -> None:
+        """Task'ı çıkar (O(1), heap kaydı lazy silinir)"""
+        self._entries.pop(str(task_id), None)
+
+    def _is_live(self, item: Tuple[float, int, str]) -> bool:
+        return self._entries.get(item[2]) == (item[0], item[1])
+
+    def select(self, eligible: Optional[Callable[[str], bool]] = None) -> Optional[str]:
+        """
+        Sıradaki uygun task'ın ID'si (task heap'te kalır)
+
+        Uygun olmayan task'lar atlanır ve geri eklenir; maliyet
+        O((k + 1) log n), k = atlanan task sayısı.
+        """
+        skipped = []
+        chosen = None
+        while self._heap:
+            item = heapq.heappop(self._heap)
+            if not self._is_live(item):
+                continue
+            skipped.append(item)
+            if eligible is None or eligible(item[2]):
+                chosen = item[2]
+                break
+
+        for item in skipped:
+            heapq.heappush(self._heap, item)
+        return chosen
+
+    def pop(self, eligible: Optional[Callable[[str], bool]] = None) -> Optional[str]:
+        """Sıradaki uygun task'ı çıkar ve ID'sini döndür"""
+        task_id = self.select(eligible)
+        if task_id is not None:
+            self.discard(task_id)
+        return task_id
+
+    def ordered(self) -> List[str]:
+        """Tüm task ID'leri çalışma sırasıyla (O(n log n), listeleme için)"""
+        return [task_id for task_id, _ in sorted(self._entries.items(), key=lambda x: x[1])]
+
+
+class LeaseIndex(PriorityScheduler):
+    """
+    In-progress lease'lerinin bitiş zamanına göre heap'i
+
+    Süresi dolanları bulmak O(k log n) (k = dolan lease sayısı); tüm
+    in-progress listesi taranmaz. Lease'i olmayan task'lar eklenmez.
+    """
+
+    def __init__(self, default_timeout: float):
+        super().__init__()
+        self.default_timeout = default_timeout
+
+    def key(self, task: Dict[str, Any]) -> float:
+        return lease_expiry(task, self.default_timeout)
+
+    def push(self, task: Dict[str, Any]) -> None:
+        if self.key(task) > 0:
+            super().push(task)
+        else:
+            self.discard(str(task["id"]))
+
+    def due(self, now: float) -> List[str]:
+        """Lease'i `now` itibarıyla dolmuş task ID'leri (index'te kalırlar)"""
+        found = []
+        popped = []
+        while self._heap and self._heap[0][0] <= now:
+            item = heapq.heappop(self._heap)
+            if self._is_live(item):
+                popped.append(item)
+                found.append(item[2])
+        for item in popped:
+            heapq.heappush(self._heap, item)
+        return found
+
+
+class DependencyGraph:
+    """
+    Pending task'ların bağımlılık grafı (artımlı ready-set)
+
+    Bir bağımlılık, bitmemiş bir queue'da (pending, in-progress, failed,
+    dead-letter) duruyorsa karşılanmamış sayılır. Hiçbirinde yoksa
+    tamamlanmış (completed veya arşivlenmiş) ya da silinmiş kabul edilir;
+    böylece completed geçmişini okumak gerekmez.
+
+    Durum değişikliklerinde sadece değişen task'a bağlı olanlar güncellenir.
+    `on_change(task_id, ready)` verilirse bir pending task hazır hale
+    geldiğinde / hazırlığını kaybettiğinde çağrılır.
+    """
+
+    def __init__(self, on_change: Optional[Callable[[str, bool], None]] = None):
+        self.on_change = on_change
+        self._status: Dict[str, str] = {}           # bitmemiş task → queue
+        self._deps: Dict[str, List[str]] = {}       # pending task → bağımlılıklar
+        self._waiting: Dict[str, int] = {}          # pending task → bitmemiş bağımlılık sayısı
+        self._dependents: Dict[str, Set[str]] = {}  # task → ona bağlı pending task'lar
+        self._ready: Set[str] = set()
+
+    @classmethod
+    def build(cls, tasks_by_status: Iterable[Tuple[str, Iterable[Dict[str, Any]]]]) -> "DependencyGraph":
+        """(durum, task'lar) çiftlerinden grafı kur (sıra önemsiz)"""
+        graph = cls()
+        for status, tasks in tasks_by_status:
+            for task in tasks:
+                if task.get("id") is not None:
+                    graph.put(task, status)
+        return graph
+
+    def __len__(self) -> int:
+        return len(self._deps)
+
+    # ------------------------------------------------------------------------
+    # Güncelleme
+    # ------------------------------------------------------------------------
+
+    def put(self, task: Dict[str, Any], status: str) -> List[str]:
+        """
+        Task'ı `status` queue'suna yerleştir (ekleme, güncelleme veya taşıma)
+
+        Returns:
+            Bu değişiklikle hazır hale gelen pending task ID'leri
+        """
+        return self._set(str(task["id"]), status, task)
+
+    def remove(self, task_id: str, status: str) -> List[str]:
+        """Task `status` queue'sundan silindi (başka queue'ya taşındıysa etkisiz)"""
+        task_id = str(task_id)
+        if self._status.get(task_id) != status:
+            return []
+        return self._set(task_id, None, None)
+
+    def _set(self, task_id: str, status: Optional[str], task: Optional[Dict[str, Any]]) -> List[str]:
+        old = self._status.get(task_id)
+        if old == "pending":
+            self._unregister(task_id)
+
+        was_open = old is not None
+        is_open = status is not None and status != DONE_STATUS
+        if is_open:
+            self._status[task_id] = status
+        else:
+            self._status.pop(task_id, None)
+
+        unblocked = []
+        if was_open != is_open:
+            delta = 1 if is_open else -1
+            for dependent in self._dependents.get(task_id, ()):
+                self._waiting[dependent] += delta
+                if self._waiting[dependent] == 0:
+                    unblocked.append(dependent)
+                    self._mark(dependent, True)
+                elif delta > 0 and self._waiting[dependent] == 1:
+                    self._mark(dependent, False)
+
+        if status == "pending":
+            self._register(task_id, task)
+        return unblocked
+
+    def _register(self, task_id: str, task: Dict[str, Any]) -> None:
+        deps = task_dependencies(task)
+        self._deps[task_id] = deps
+        self._waiting[task_id] = sum(1 for dep in deps if dep in self._status)
+        for dep in deps:
+            self._dependents.setdefault(dep, set()).add(task_id)
+        if self._waiting[task_id] == 0:
+            self._mark(task_id, True)
+
+    def _unregister(self, task_id: str) -> None:
+        for dep in self._deps.pop(task_id, ()):
+            dependents = self._dependents.get(dep)
+            if dependents is not None:
+                dependents.discard(task_id)
+                if not dependents:
+                    del self._dependents[dep]
+        self._waiting.pop(task_id, None)
+        if task_id in self._ready:
+            self._mark(task_id, False)
+
+    def _mark(self, task_id: str, ready: bool) -> None:
+        if ready:
+            self._ready.add(task_id)
+        else:
+            self._ready.discard(task_id)
+        if self.on_change is not None:
+            self.on_change(task_id, ready)
+
+    # ------------------------------------------------------------------------
+    # Sorgular
+    # ------------------------------------------------------------------------
+
+    def is_ready(self, task_id: str) -> bool:
+        return str(task_id) in self._ready
+
+    def ready_ids(self) -> Set[str]:
+        """Hazır pending task ID'leri (kopya)"""
+        return set(self._ready)
+
+    def status_of(self, task_id: str) -> Optional[str]:
+        """Bitmemiş task'ın queue'su; completed / bilinmiyorsa None"""
+        return self._status.get(str(task_id))
+
+    def dependencies(self, task_id: str) -> List[str]:
+        return list(self._deps.get(str(task_id), ()))
+
+    def dependents(self, task_id: str) -> List[str]:
+        """`task_id`'ye bağlı pending task'lar"""
+        return sorted(self._dependents.get(str(task_id), ()))
+
+    def pending_ids(self) -> List[str]:
+        return list(self._deps)
+
+    def blockers(self, task: Dict[str, Any]) -> Dict[str, str]:
+        """Task'ın karşılanmamış bağımlılıkları: {bağımlılık ID: queue}"""
+        return {dep: self._status[dep] for dep in task_dependencies(task) if dep in self._status}
+
+    def cycles(self) -> List[List[str]]:
+        """
+        Pending task'lar arasındaki bağımlılık döngüleri
+
+        Tarjan SCC (iteratif): birden fazla task'lı her bileşen ve kendine
+        bağımlı task bir döngüdür. Döngüdeki task'lar hiçbir zaman hazır olmaz.
+        """
+        index: Dict[str, int] = {}
+        low: Dict[str, int] = {}
+        on_stack: Set[str] = set()
+        stack: List[str] = []
+        found: List[List[str]] = []
+        counter = 0
+
+        def edges(node: str) -> List[str]:
+            return [dep for dep in self._deps.get(node, ()) if dep in self._deps]
+
+        for root in self._deps:
+            if root in index or self._waiting.get(root, 0) == 0:
+                continue
+            work = [(root, iter(edges(root)))]
+            index[root] = low[root] = counter
+            counter += 1
+            stack.append(root)
+            on_stack.add(root)
+
+            while work:
+                node, children = work[-1]
+                advanced = False
+                for child in children:
+                    if child not in index:
+                        index[child] = low[child] = counter
+                        counter += 1
+                        stack.append(child)
+                        on_stack.add(child)
+                        work.append((child, iter(edges(child))))
+                        advanced = True
+                        break
+                    if child in on_stack:
+                        low[node] = min(low[node], index[child])
+                if advanced:
+                    continue
+
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    low[parent] = min(low[parent], low[node])
+                if low[node] == index[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == node:
+                            break
+                    if len(component) > 1 or node in self._deps.get(node, ()):
+                        found.append(sorted(component))
+        return found
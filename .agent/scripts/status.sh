@@ -59,15 +59,14 @@ fi
 
 # Queue status
 echo "📦 Queue Status:"
+# Sayılar queue_store.py'den: tasks-<status>.json journal'ın gerisinde kalabilir
+QUEUE_COUNTS=$("${PYTHON:-python3}" "$AGENT_ROOT/scripts/queue_store.py" counts 2>/dev/null || echo "{}")
 for queue in pending in-progress completed failed dead-letter; do
-  QUEUE_FILE="$AGENT_ROOT/queue/tasks-$queue.json"
-  if [ -f "$QUEUE_FILE" ]; then
-    COUNT=$(jq -r '.tasks | length' "$QUEUE_FILE")
-    if [ "$queue" = "dead-letter" ] && [ "$COUNT" -gt 0 ]; then
-      printf "   %-15s %3d tasks 🔥\n" "$queue:" "$COUNT"
-    else
-      printf "   %-15s %3d tasks\n" "$queue:" "$COUNT"
-    fi
+  COUNT=$(jq -r --arg queue "$queue" '.[$queue] // 0' <<< "$QUEUE_COUNTS")
+  if [ "$queue" = "dead-letter" ] && [ "$COUNT" -gt 0 ]; then
+    printf "   %-15s %3d tasks 🔥\n" "$queue:" "$COUNT"
+  else
+    printf "   %-15s %3d tasks\n" "$queue:" "$COUNT"
   fi
 done
 echo ""
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+ODIN AI Agent System - Task Ingest
+Toplu task ekleme için okuma ve validasyon (odin add --from-file).
+
+Girdi JSON Lines (satır başına bir task) veya JSON array olabilir. Her kayıt
+schemas.TaskState'e göre doğrulanır ve odin queue formatına çevrilir.
+
+Version: 1.0.0
+"""
+
+import json
+import sys
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from json_stream import READ_CHUNK_SIZE, JsonStreamReader
+from scheduler import priority_rank
+
+
+# ============================================================================
+# OKUMA
+# ============================================================================
+
+def iter_records(path: str) -> Iterator[Tuple[int, Any, Optional[str]]]:
+    """
+    JSONL veya JSON array dosyasından kayıtları sırayla oku
+
+    Args:
+        path: Dosya yolu ('-' = stdin)
+
+    Yields:
+        (satır / eleman no, kayıt, parse hatası)
+    """
+    f = sys.stdin if path == "-" else open(Path(path), "r", encoding="utf-8")
+    try:
+        first_chunk = f.read(READ_CHUNK_SIZE)
+        if first_chunk.lstrip().startswith("["):
+            items = JsonStreamReader(f, initial=first_chunk).iter_array()
+            for index, item in enumerate(items, start=1):
+                yield index, item, None
+            return
+
+        # JSON Lines
+        pending = first_chunk
+        line_no = 0
+        while True:
+            *lines, pending = pending.split("\n")
+            for line in lines:
+                line_no += 1
+                if not line.strip():
+                    continue
+                try:
+                    yield line_no, json.loads(line), None
+                except json.JSONDecodeError as e:
+                    yield line_no, None, f"JSON parse hatası: {e}"
+            chunk = f.read(READ_CHUNK_SIZE)
+            if not chunk:
+                break
+            pending += chunk
+
+        if pending.strip():
+            line_no += 1
+            try:
+                yield line_no, json.loads(pending), None
+            except json.JSONDecodeError as e:
+                yield line_no, None, f"JSON parse hatası: {e}"
+    finally:
+        if f is not sys.stdin:
+            f.close()
+
+
+# ============================================================================
+# VALIDASYON
+# ============================================================================
+
+def to_task_state(record: Dict[str, Any], task_id: str, created_at: str) -> Dict[str, Any]:
+    """Odin kaydını schemas.TaskState alanlarına çevir"""
+    payload = record.get("payload")
+    if isinstance(payload, dict):
+        payload = dict(payload)
+        payload.setdefault("description", record.get("description", ""))
+    else:
+        payload = {
+            "description": record.get("description", ""),
+            "dependencies": record.get("dependencies", []),
+        }
+
+    return {
+        "id": task_id,
+        "type": record.get("type", "task"),
+        "agent": record.get("agent") or "auto",
+        "status": "pending",
+        "priority": priority_rank(record.get("priority")),
+        "createdAt": created_at,
+        "attempts": record.get("attempts", record.get("retry_count", 0)),
+        "maxAttempts": record.get("maxAttempts", 3),
+        "payload": payload,
+        "metadata": record.get("metadata") or {},
+    }
+
+
+def normalize_record(
+    record: Any,
+    new_id: Callable[[], str],
+    agent_types: List[str],
+) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+    """
+    Kaydı doğrula ve odin queue formatına çevir
+
+    Args:
+        record: Girdi kaydı (odin veya TaskState formatında)
+        new_id: ID üretici (kayıtta id yoksa)
+        agent_types: Geçerli agent tipleri
+
+    Returns:
+        (task, None) veya (None, hata mesajı)
+    """
+    from schemas import TaskState  # pydantic import'u sadece toplu eklemede
+
+    if not isinstance(record, dict):
+        return None, "Kayıt bir JSON objesi olmalı"
+
+    description = record.get("description")
+    if description is None and isinstance(record.get("payload"), dict):
+        description = record["payload"].get("description")
+    if not description:
+        return None, "description gerekli"
+
+    agent = record.get("agent") or "auto"
+    if agent != "auto" and agent not in agent_types:
+        return None, f"Geçersiz agent tipi: {agent}"
+
+    task_id = str(record.get("id") or new_id())
+    created_at = record.get("created_at") or record.get("createdAt") or datetime.now().isoformat()
+
+    try:
+        TaskState.model_validate(to_task_state(record, task_id, created_at))
+    except Exception as e:
+        return None, str(e).replace("\n", " ")
+
+    tags = record.get("tags") or []
+    if isinstance(tags, str):
+        tags = [t.strip() for t in tags.split(",") if t.strip()]
+
+    task = dict(record)
+    task.update({
+        "id": task_id,
+        "description": description,
+        "agent": agent,
+        "priority": record.get("priority", "normal"),
+        "tags": tags,
+        "status": "pending",
+        "created_at": created_at,
+        "retry_count": record.get("retry_count", 0),
+        "dependencies": record.get("dependencies") or (record.get("payload") or {}).get("dependencies", []),
+    })
+    return task, None
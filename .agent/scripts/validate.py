@@ -16,7 +16,10 @@ import sys
 from pathlib import Path
 from datetime import datetime, timedelta
 from typing import Optional, Dict, Any, Tuple
-import uuid
+
+from cli_fast import load_queue_config, open_store
+from queue_store import QUEUE_STATUSES
+from task_ids import new_task_id
 
 # Schema'ları import et
 try:
@@ -50,6 +53,12 @@ QUEUE_DIR = Path(".agent/queue")
 RETRY_STATE_FILE = Path(".agent/state/validation-retries.json")
 
 
+def get_queue_store():
+    """Queue store (odin serve çalışıyorsa daemon üzerinden)"""
+    project_root = QUEUE_DIR.parent.parent
+    return open_store(project_root, load_queue_config(project_root))
+
+
 # ============================================================================
 # RETRY STATE MANAGEMENT
 # ============================================================================
@@ -236,7 +245,7 @@ def create_dlq_entry(
 
             # DLQ task'a çevir
             dlq_task = DLQTask(
-                id=failed_task.get("id", str(uuid.uuid4())),
+                id=failed_task.get("id") or new_task_id(),
                 type=failed_task.get("type", "unknown"),
                 agent=failed_task.get("agent", "unknown"),
                 status="dead-letter",
@@ -269,25 +278,13 @@ def add_to_dlq(dlq_task: Dict[str, Any]) -> bool:
         Başarılı mı?
     """
 
-    dlq_file = QUEUE_DIR / "tasks-dead-letter.json"
-
-    # DLQ dosyasını oku veya oluştur
-    if dlq_file.exists():
-        try:
-            dlq_data = json.loads(dlq_file.read_text(encoding="utf-8"))
-        except Exception:
-            dlq_data = {"tasks": [], "metadata": {}}
-    else:
-        dlq_data = {"tasks": [], "metadata": {}}
-
-    # Task'ı ekle
-    dlq_data["tasks"].append(dlq_task)
-    dlq_data["metadata"]["lastUpdated"] = datetime.utcnow().isoformat() + "Z"
-    dlq_data["metadata"]["version"] = "1.0.0"
-
-    # Yaz
-    dlq_file.parent.mkdir(parents=True, exist_ok=True)
-    dlq_file.write_text(json.dumps(dlq_data, indent=2, ensure_ascii=False), encoding="utf-8")
+    # Journal'a tek kayıt (snapshot'ı yeniden yazmak journal'daki
+    # kayıtları ve sayaçları atlardı)
+    store = get_queue_store()
+    try:
+        store.append("dead-letter", dlq_task)
+    finally:
+        store.close()
 
     return True
 
@@ -417,28 +414,33 @@ def cmd_validate(args):
 def cmd_validate_state(args):
     """validate-state: State dosyalarını validate et"""
 
-    state_files = [
-        STATE_DIR / "circuits.json",
-        QUEUE_DIR / "tasks-pending.json",
-        QUEUE_DIR / "tasks-in-progress.json",
-        QUEUE_DIR / "tasks-completed.json",
-        QUEUE_DIR / "tasks-failed.json",
-        QUEUE_DIR / "tasks-dead-letter.json",
-    ]
+    circuits_file = STATE_DIR / "circuits.json"
 
     print("🔍 State dosyaları validate ediliyor...\n")
 
     all_passed = True
 
-    for state_file in state_files:
-        if state_file.exists():
-            result = validate_file(str(state_file))
-            print_validation_result(str(state_file), result, verbose=True)
+    if circuits_file.exists():
+        result = validate_file(str(circuits_file))
+        print_validation_result(str(circuits_file), result, verbose=True)
+        all_passed = result.is_valid
+    else:
+        print(f"⚠️ {circuits_file} (mevcut değil)")
+
+    # Queue'lar store üzerinden okunur: tasks-<status>.json snapshot'ı
+    # journal'ın gerisinde kalabilir (sqlite backend'de hiç yoktur)
+    store = get_queue_store()
+    try:
+        for status in QUEUE_STATUSES:
+            queue_file = QUEUE_DIR / f"tasks-{status}.json"
+            data = {"tasks": store.load(status), "metadata": {"version": "1.0.0"}}
+            result = validate_json(data, str(queue_file))
+            print_validation_result(f"{queue_file} ({store.backend})", result, verbose=True)
 
             if not result.is_valid:
                 all_passed = False
-        else:
-            print(f"⚠️ {state_file} (mevcut değil)")
+    finally:
+        store.close()
 
     return 0 if all_passed else 1
 
@@ -60,6 +60,12 @@ get_file_checksum() {
     fi
 }
 
+# Queue değişiklikleri journal'a (JSON backend) veya queue.db'ye (sqlite)
+# yazılır; tasks-<status>.json sadece compaction'da güncellenir
+queue_files() {
+    ls "$QUEUE_DIR"/tasks-*.json "$QUEUE_DIR"/tasks-*.journal "$QUEUE_DIR"/queue.db* 2>/dev/null || true
+}
+
 check_dependencies() {
     if ! command -v inotifywait &> /dev/null; then
         print_warning "inotifywait bulunamadı (inotify-tools package)"
@@ -98,7 +104,7 @@ cmd_watch() {
     declare -A last_checksum
 
     # İlk checksum'ları al
-    for queue_file in "$QUEUE_DIR"/tasks-*.json; do
+    for queue_file in $(queue_files); do
         if [[ -f "$queue_file" ]]; then
             filename=$(basename "$queue_file")
             last_checksum[$filename]=$(get_file_checksum "$queue_file")
@@ -112,7 +118,7 @@ cmd_watch() {
 
         while true; do
             # Değişiklikleri bekle
-            changes=$(inotifywait -q -e modify,create,delete --format '%w%f' "$QUEUE_DIR"/tasks-*.json 2>/dev/null || true)
+            changes=$(inotifywait -q -e modify,create,delete --format '%w%f' $(queue_files) 2>/dev/null || true)
 
             if [[ -n "$changes" ]]; then
                 print_info "Değişiklik tespit edildi: $changes"
@@ -124,7 +130,7 @@ cmd_watch() {
                 cmd_index
 
                 # Checksum'ları güncelle
-                for queue_file in "$QUEUE_DIR"/tasks-*.json; do
+                for queue_file in $(queue_files); do
                     if [[ -f "$queue_file" ]]; then
                         filename=$(basename "$queue_file")
                         last_checksum[$filename]=$(get_file_checksum "$queue_file")
@@ -142,7 +148,7 @@ cmd_watch() {
             sleep 10
 
             # Değişiklik kontrolü
-            for queue_file in "$QUEUE_DIR"/tasks-*.json; do
+            for queue_file in $(queue_files); do
                 if [[ -f "$queue_file" ]]; then
                     filename=$(basename "$queue_file")
                     current_checksum=$(get_file_checksum "$queue_file")
@@ -220,14 +226,9 @@ cmd_status() {
 
     # Queue dosyaları durumu
     echo ""
-    echo "📂 Queue Dosyaları:"
-    for queue_file in "$QUEUE_DIR"/tasks-*.json; do
-        if [[ -f "$queue_file" ]]; then
-            local filename=$(basename "$queue_file")
-            local count=$(jq '.tasks | length' "$queue_file" 2>/dev/null || echo "0")
-            echo "   • $filename: $count task"
-        fi
-    done
+    echo "📂 Queue'lar:"
+    "${PYTHON:-python3}" "${SCRIPT_DIR}/queue_store.py" counts 2>/dev/null | \
+        jq -r 'to_entries[] | "   • \(.key): \(.value) task"' 2>/dev/null || true
 }
 
 cmd_help() {
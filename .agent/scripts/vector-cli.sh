@@ -10,10 +10,12 @@
 # Komutlar:
 #   index [file]              - Task'ları indeksle
 #   index-all                 - Tüm queue'ları indeksle
-#   search <query> [k]        - Semantik arama
+#   search <query> [k]        - Semantik arama (--nprobe N: IVF listesi)
 #   stats                     - İstatistikler
 #   clear --confirm           - Tüm veriyi sil
 #   optimize                  - DB'yi optimize et
+#   ann-build [nlist]         - IVF (ANN) index'ini kur
+#   ann-drop                  - IVF index'ini kaldır
 #   test                      - Test çalıştır
 #   help                      - Yardım menüsü
 #
@@ -129,14 +131,14 @@ check_dependency() {
 # =============================================================================
 
 cmd_index() {
-    local tasks_file="${1:-.agent/queue/tasks-completed.json}"
-
     check_file
     check_dependency
 
-    print_info "Task'lar indeksleniyor: $tasks_file"
+    # Dosya verilmezse completed queue'su queue store'dan okunur
+    # (tasks-completed.json journal'ın gerisinde kalabilir)
+    print_info "Task'lar indeksleniyor: ${1:-completed queue}"
 
-    $PYTHON_CMD "$VECTOR_PY" index "$tasks_file"
+    $PYTHON_CMD "$VECTOR_PY" index "$@"
 }
 
 cmd_index_all() {
@@ -151,16 +153,17 @@ cmd_index_all() {
 cmd_search() {
     local query="$1"
     local top_k="${2:-5}"
+    shift 2 || true
 
     if [[ -z "$query" ]]; then
-        print_error "Kullanım: vector-cli.sh search <query> [top_k]"
+        print_error "Kullanım: vector-cli.sh search <query> [top_k] [--nprobe N]"
         return 1
     fi
 
     check_file
     check_dependency
 
-    $PYTHON_CMD "$VECTOR_PY" search "$query" "$top_k"
+    $PYTHON_CMD "$VECTOR_PY" search "$query" "$top_k" "$@"
 }
 
 cmd_stats() {
@@ -200,6 +203,22 @@ cmd_optimize() {
     $PYTHON_CMD "$VECTOR_PY" optimize
 }
 
+cmd_ann_build() {
+    check_file
+    check_python
+
+    print_info "IVF index'i kuruluyor..."
+
+    $PYTHON_CMD "$VECTOR_PY" ann-build "$@"
+}
+
+cmd_ann_drop() {
+    check_file
+    check_python
+
+    $PYTHON_CMD "$VECTOR_PY" ann-drop
+}
+
 cmd_test() {
     check_file
     check_dependency
@@ -217,12 +236,14 @@ ${YELLOW}Kullanım:${NC}
   $0 <command> [args]
 
 ${YELLOW}Komutlar:${NC}
-  ${GREEN}index [file]${NC}         Task'ları indeksle (varsayılan: tasks-completed.json)
+  ${GREEN}index [file]${NC}         Task'ları indeksle (varsayılan: completed queue'su)
   ${GREEN}index-all${NC}             Tüm queue dosyalarını indeksle
-  ${GREEN}search <query> [k]${NC}    Semantik arama (varsayılan top_k: 5)
+  ${GREEN}search <query> [k]${NC}    Semantik arama (varsayılan top_k: 5, --nprobe N)
   ${GREEN}stats${NC}                 İstatistikler
   ${GREEN}clear --confirm${NC}       Tüm veriyi sil
   ${GREEN}optimize${NC}              DB'yi optimize et
+  ${GREEN}ann-build [nlist]${NC}     IVF (ANN) index'ini kur (büyük geçmiş için)
+  ${GREEN}ann-drop${NC}              IVF index'ini kaldır
   ${GREEN}test${NC}                  Test çalıştır
   ${GREEN}help${NC}                  Bu yardım menüsünü göster
 
@@ -281,7 +302,7 @@ main() {
             cmd_index_all
             ;;
         search)
-            cmd_search "${2:-}" "${3:-5}"
+            cmd_search "${2:-}" "${3:-5}" "${@:4}"
             ;;
         stats)
             cmd_stats
@@ -292,6 +313,12 @@ main() {
         optimize)
             cmd_optimize
             ;;
+        ann-build)
+            cmd_ann_build "${@:2}"
+            ;;
+        ann-drop)
+            cmd_ann_drop
+            ;;
         test)
             cmd_test
             ;;
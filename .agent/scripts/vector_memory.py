@@ -6,18 +6,52 @@ Vektör Tabanlı Hafıza Sistemi - Tamamlanan task'ları semantik arama
 Bu sistem, tamamlanan task'ları vektörleştirir ve yeni task'lar geldiğinde
 semantik olarak en alakalı eski task'ları bulur.
 
-Version: 1.0.0
+Embedding'ler SQLite'ta (tasks.embedding) saklanır; arama ise DB'nin
+yanındaki vector-memory.vectors.f32 dosyasından yapılır. Bu dosya birim
+uzunluğa getirilmiş float32 satırlardan oluşan bitişik bir matristir ve
+np.memmap ile açılır; tasks.vector_row her task'ın matristeki satırıdır.
+Silinen satırın yerine son satır taşınır, matriste boşluk kalmaz.
+
+Matris DB'den türetilir: değiştirilmeden önce metadata'ya "dirty" yazılır.
+Yarıda kalan bir değişiklik, eksik dosya veya eski bir DB ilk aramada
+BLOB'lardan yeniden oluşturulur (optimize komutu da yeniden oluşturur).
+
+İsteğe bağlı ANN index'i (IVF-flat): matris satırları NumPy ile küresel
+k-means'le nlist listeye bölünür. Merkezler vector-memory.ivf.npy'de,
+her task'ın listesi tasks.ivf_list'te tutulur; eklenen task en yakın
+merkezin listesine girer, silinen task listesinden de düşer. Arama yalnızca
+sorguya en yakın nprobe listedeki satırları skorlar (listesi olmayan
+satırlar her zaman taranır). Index `ann-build` ile kurulur, optimize ile
+yeniden eğitilir; kurulmadıysa arama tamdır.
+
+Yeniden indeksleme artımlıdır: her satırda embedding metninin hash'i
+(text_hash), modelin adı ve task'ın geldiği queue dosyası (source) tutulur.
+Sadece yeni veya metni / modeli değişmiş task'lar encode edilir; diğerlerinin
+yalnızca kolonları (durum, sonuç vb.) güncellenir. Kaynak queue'dan kalkan
+task'lar DB'den ve matristen silinir; arşive taşınan (rotasyon) completed
+task'lar silinmez. Completed indekslenirken arşiv segment'leri de okunur;
+arşivdeki task'ların kaynağı archive/completed olur. Queue'lar tasks-<status>.json'dan değil
+queue store'dan (snapshot + journal / SQLite) okunur.
+
+Version: 1.4.0
 Author: Odin AI System
 """
 
+import hashlib
 import json
+import os
 import sqlite3
 import sys
+import time
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional, Set, Tuple
 import numpy as np
 from datetime import datetime
 
+from cli_fast import load_queue_config, open_store
+from queue_archive import ARCHIVE_STATUS, create_archive
+from queue_store import QUEUE_STATUSES, FileLock
+
 # ============================================================================
 # EMBEDDING MODEL
 # ============================================================================
@@ -40,6 +74,59 @@ Detaylı bilgi: https://www.sbert.net/
 """
 
 
+# Matris yeniden oluşturulurken SQLite'tan tek seferde okunan satır sayısı
+READ_CHUNK = 8192
+
+# Sorgu parametresi sınırına takılmamak için IN (...) başına ID sayısı
+IN_CHUNK = 500
+
+_ITEMSIZE = np.dtype(np.float32).itemsize
+
+# Toplu yazmada her task için yeni JSONEncoder kurulmasın
+_to_json = json.JSONEncoder(ensure_ascii=False).encode
+
+# Toplu eklemede model.encode'a tek seferde verilen metin sayısı
+DEFAULT_BATCH_SIZE = 64
+
+# IVF index: arama başına taranan liste sayısı, k-means eğitimi
+DEFAULT_NPROBE = 16
+KMEANS_ITERATIONS = 10
+TRAIN_PER_LIST = 64
+
+# Queue dizini (task'lar buradan queue store üzerinden okunur)
+QUEUE_DIR = Path(".agent/queue")
+ARCHIVE_SOURCE = f"archive/{ARCHIVE_STATUS}"
+
+
+def _normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    """Satırları birim uzunluğa getir; sıfır satırlar NaN olur (hiçbir eşiği geçmez)"""
+    norms = np.sqrt(np.einsum("ij,ij->i", matrix, matrix))[:, None]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return (matrix / norms).astype(np.float32, copy=False)
+
+
+def _nearest_centroids(vectors: np.ndarray, centroids: np.ndarray) -> np.ndarray:
+    """Her satırın en yakın (cosine) merkezi; bloklar halinde"""
+    nearest = np.empty(len(vectors), dtype=np.int64)
+    for start in range(0, len(vectors), READ_CHUNK):
+        scores = np.asarray(vectors[start:start + READ_CHUNK]) @ centroids.T
+        nearest[start:start + READ_CHUNK] = np.argmax(np.nan_to_num(scores, nan=-np.inf), axis=1)
+    return nearest
+
+
+def _kmeans(data: np.ndarray, k: int, iterations: int, rng) -> np.ndarray:
+    """Küresel k-means: birim uzunlukta k merkez (boş kalan merkez rastgele satırla yenilenir)"""
+    centroids = data[rng.choice(len(data), k, replace=False)]
+    for _ in range(iterations):
+        nearest = _nearest_centroids(data, centroids)
+        sums = np.zeros_like(centroids)
+        np.add.at(sums, nearest, data)
+        empty = np.bincount(nearest, minlength=k) == 0
+        sums[empty] = data[rng.choice(len(data), int(empty.sum()))]
+        centroids = _normalize_rows(sums)
+    return centroids
+
+
 # ============================================================================
 # VECTOR MEMORY CLASS
 # ============================================================================
@@ -55,7 +142,7 @@ class VectorMemory:
     def __init__(
         self,
         db_path: str = ".agent/state/vector-memory.db",
-        model_name: str = "all-MiniLM-L6-v2"
+        model_name: Optional[str] = "all-MiniLM-L6-v2"
     ):
         """
         VectorMemory başlat
@@ -65,16 +152,25 @@ class VectorMemory:
             model_name: Sentence-transformers model adı
                       - all-MiniLM-L6-v2: Hafif, hızlı (384 boyut)
                       - all-mpnet-base-v2: Daha准确 (768 boyut)
+                      - None: Model yüklenmez (sadece search_embedding)
         """
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.model_name = model_name
+        self.vectors_path = self.db_path.with_suffix(".vectors.f32")
+        self.ivf_path = self.db_path.with_suffix(".ivf.npy")
+        self._lock = FileLock(self.db_path.with_suffix(".lock"))
+        self._centroids = None  # (dosya imzası, merkezler)
+        self.last_timings: Dict[str, float] = {}  # Son add_tasks: encode / yazma süreleri (sn)
 
         # Embedding modelini yükle
-        if MODEL_AVAILABLE:
+        if model_name is None:
+            self.model = None
+            self.embedding_dim = 0
+        elif MODEL_AVAILABLE:
             try:
                 self.model = SentenceTransformer(model_name)
                 self.embedding_dim = self.model.get_sentence_embedding_dimension()
-                self.model_name = model_name
             except Exception as e:
                 print(f"❌ Model yükleme hatası: {e}")
                 self.model = None
@@ -107,10 +203,28 @@ class VectorMemory:
                 result_json TEXT,
                 embedding BLOB,
                 metadata_json TEXT,
-                indexed_at TEXT
+                indexed_at TEXT,
+                vector_row INTEGER,
+                ivf_list INTEGER,
+                text_hash TEXT,
+                model_name TEXT,
+                source TEXT
             )
         """)
 
+        # Eski DB'lere sonradan eklenen kolonlar
+        columns = {row[1] for row in cursor.execute("PRAGMA table_info(tasks)")}
+        added = {
+            'vector_row': 'INTEGER',
+            'ivf_list': 'INTEGER',
+            'text_hash': 'TEXT',
+            'model_name': 'TEXT',
+            'source': 'TEXT',
+        }
+        for column, type_ in added.items():
+            if column not in columns:
+                cursor.execute(f"ALTER TABLE tasks ADD COLUMN {column} {type_}")
+
         # Index'ler
         cursor.execute("""
             CREATE INDEX IF NOT EXISTS idx_agent
@@ -132,6 +246,26 @@ class VectorMemory:
             ON tasks(completed_at)
         """)
 
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_status_vector_row
+            ON tasks(status, vector_row)
+        """)
+
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_vector_row
+            ON tasks(vector_row)
+        """)
+
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_source
+            ON tasks(source)
+        """)
+
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_ivf_list
+            ON tasks(ivf_list, status, vector_row)
+        """)
+
         # Metadata tablosu (sistem bilgileri)
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS metadata (
@@ -142,8 +276,9 @@ class VectorMemory:
         """)
 
         # Schema version
-        self._set_metadata(conn, 'schema_version', '1.0.0')
-        self._set_metadata(conn, 'model_name', getattr(self, 'model_name', 'none'))
+        self._set_metadata(conn, 'schema_version', '1.3.0')
+        if self.model is not None:
+            self._set_metadata(conn, 'model_name', self.model_name)
 
         conn.commit()
         conn.close()
@@ -196,62 +331,159 @@ class VectorMemory:
             print(f"❌ Embedding hatası: {e}")
             return False
 
-        # SQLite'a kaydet
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
+        # SQLite'a ve matrise kaydet
         try:
-            cursor.execute("""
-                INSERT OR REPLACE INTO tasks
-                (id, description, agent, type, status, priority, created_at, completed_at,
-                 payload_json, result_json, embedding, metadata_json, indexed_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                task_id,
-                task.get('description', ''),
-                task.get('agent', ''),
-                task.get('type', ''),
-                task.get('status', ''),
-                task.get('priority', 5),
-                task.get('createdAt', ''),
-                task.get('completedAt', ''),
-                json.dumps(task.get('payload', {}), ensure_ascii=False),
-                json.dumps(task.get('result', {}), ensure_ascii=False),
-                embedding.tobytes(),  # Numpy array → bytes
-                json.dumps(task.get('metadata', {}), ensure_ascii=False),
-                datetime.utcnow().isoformat() + "Z"
-            ))
-
-            conn.commit()
+            self._store_tasks([task], [embedding])
             return True
-
         except Exception as e:
             print(f"❌ Task ekleme hatası: {e}")
             return False
 
-        finally:
-            conn.close()
-
-    def add_tasks(self, tasks: List[Dict[str, Any]]) -> Tuple[int, int]:
+    def _store_tasks(
+        self,
+        tasks: List[Dict[str, Any]],
+        embeddings: List[np.ndarray],
+        source: Optional[str] = None
+    ) -> None:
+        """Task'ları DB'ye, embedding'lerini matrise yaz (tek transaction)"""
+        with self._lock.acquire():
+            conn = sqlite3.connect(self.db_path)
+            try:
+                rows, dim = self._ensure_vectors(conn)
+                existing = self._vector_rows(conn, [task['id'] for task in tasks])
+                writes = []
+                entries = []
+                rebuild = False
+                for task, embedding in zip(tasks, embeddings):
+                    vector = np.asarray(embedding, dtype=np.float32).ravel()
+                    dim = dim or vector.size
+                    row = existing.get(task['id'])
+                    if vector.size != dim:
+                        # Farklı modelle üretilmiş: matrise girmez
+                        rebuild = rebuild or row is not None
+                        row = None
+                    else:
+                        if row is None:
+                            row, rows = rows, rows + 1
+                        writes.append((row, vector))
+                    existing[task['id']] = row
+                    entries.append((task, vector, row))
+
+                indexed_at = datetime.utcnow().isoformat() + "Z"
+                self._mark_dirty(conn)
+                normalized = self._write_vectors(writes, dim)
+                lists = dict(zip((row for row, _ in writes), self._assign_lists(conn, normalized)))
+                conn.executemany("""
+                    INSERT OR REPLACE INTO tasks
+                    (id, description, agent, type, status, priority, created_at, completed_at,
+                     payload_json, result_json, embedding, metadata_json, indexed_at, vector_row, ivf_list,
+                     text_hash, model_name, source)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """, [
+                    self._task_record(task, vector, indexed_at) + (
+                        row, lists.get(row), self._text_hash(task), self.model_name, source,
+                    )
+                    for task, vector, row in entries
+                ])
+                self._mark_clean(conn, rows, dim)
+                if rebuild:
+                    self._rebuild_vectors(conn)
+            finally:
+                conn.close()
+
+    def _task_record(self, task: Dict[str, Any], embedding: np.ndarray, indexed_at: str) -> tuple:
+        """tasks tablosu satırı (id ... indexed_at)"""
+        return (
+            task['id'],
+            task.get('description', ''),
+            task.get('agent', ''),
+            task.get('type', ''),
+            task.get('status', ''),
+            task.get('priority', 5),
+            task.get('createdAt', ''),
+            task.get('completedAt', ''),
+            _to_json(task.get('payload', {})),
+            _to_json(task.get('result', {})),
+            embedding.tobytes(),  # Numpy array → bytes
+            _to_json(task.get('metadata', {})),
+            indexed_at,
+        )
+
+    def _text_hash(self, task: Dict[str, Any]) -> str:
+        """Embedding metninin hash'i (değişmeyen task yeniden encode edilmez)"""
+        return hashlib.sha256(self._create_embedding_text(task).encode("utf-8")).hexdigest()[:32]
+
+    def add_tasks(
+        self,
+        tasks: List[Dict[str, Any]],
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        processes: int = 0,
+        source: Optional[str] = None
+    ) -> Tuple[int, int]:
         """
         Birden fazla task'ı toplu ekle
 
+        Tüm embedding metinleri batch_size'lık gruplar halinde encode edilir,
+        task'lar tek transaction'da (executemany) yazılır. Faz süreleri
+        self.last_timings'e yazılır ({'encode': sn, 'write': sn}).
+
         Args:
             tasks: Task listesi
+            batch_size: model.encode batch boyutu
+            processes: >1 ise encode sentence-transformers çoklu process
+                       havuzunda yapılır (CPU çekirdeği başına bir process)
+            source: Task'ların geldiği queue dosyası (sync_tasks silme kapsamı)
 
         Returns:
             (Başarılı sayısı, Başarısız sayısı)
         """
-        success_count = 0
-        fail_count = 0
+        self.last_timings = {'encode': 0.0, 'write': 0.0}
+        if not self.model:
+            print("❌ Embedding model yok, task eklenemiyor")
+            return 0, len(tasks)
 
-        for task in tasks:
-            if self.add_task(task):
-                success_count += 1
-            else:
-                fail_count += 1
+        valid = [task for task in tasks if task.get('id')]
+        fail_count = len(tasks) - len(valid)
+        if fail_count:
+            print(f"❌ {fail_count} task'ta ID yok")
+        if not valid:
+            return 0, fail_count
+
+        # Embedding yap
+        start = time.perf_counter()
+        try:
+            embeddings = self._encode([self._create_embedding_text(task) for task in valid], batch_size, processes)
+        except Exception as e:
+            print(f"❌ Embedding hatası: {e}")
+            return 0, len(tasks)
+        self.last_timings['encode'] = time.perf_counter() - start
 
-        return success_count, fail_count
+        # SQLite'a ve matrise kaydet
+        start = time.perf_counter()
+        try:
+            self._store_tasks(valid, list(embeddings), source)
+        except Exception as e:
+            print(f"❌ Task ekleme hatası: {e}")
+            return 0, len(tasks)
+        self.last_timings['write'] = time.perf_counter() - start
+
+        return len(valid), fail_count
+
+    def _encode(self, texts: List[str], batch_size: int, processes: int = 0) -> np.ndarray:
+        """Metinleri toplu encode et (processes > 1: çoklu process havuzu)"""
+        show_progress = len(texts) >= batch_size * 20
+        if processes > 1 and hasattr(self.model, 'start_multi_process_pool'):
+            pool = self.model.start_multi_process_pool(target_devices=["cpu"] * processes)
+            try:
+                return self.model.encode_multi_process(texts, pool, batch_size=batch_size)
+            finally:
+                self.model.stop_multi_process_pool(pool)
+        return self.model.encode(
+            texts,
+            batch_size=batch_size,
+            convert_to_numpy=True,
+            show_progress_bar=show_progress,
+        )
 
     def _create_embedding_text(self, task: Dict[str, Any]) -> str:
         """
@@ -300,7 +532,9 @@ class VectorMemory:
         top_k: int = 5,
         agent_filter: Optional[str] = None,
         type_filter: Optional[str] = None,
-        min_similarity: float = 0.0
+        min_similarity: float = 0.0,
+        statuses: Optional[Tuple[str, ...]] = ("completed",),
+        nprobe: Optional[int] = None
     ) -> List[Dict[str, Any]]:
         """
         Semantik arama
@@ -311,6 +545,9 @@ class VectorMemory:
             agent_filter: Sadece belirli agent'ları ara
             type_filter: Sadece belirli task type'ları ara
             min_similarity: Minimum benzerlik skoru (0-1)
+            statuses: Aranacak task durumları (None: hepsi)
+            nprobe: IVF index'inde taranacak liste sayısı
+                    (None: DEFAULT_NPROBE, 0: index kullanılmaz, tam arama)
 
         Returns:
             İlgili task'lar (benzerlik sıralı)
@@ -326,67 +563,168 @@ class VectorMemory:
             print(f"❌ Query embedding hatası: {e}")
             return []
 
-        # SQL sorgusu oluştur
-        sql = "SELECT id, description, agent, type, status, priority, created_at, completed_at, payload_json, result_json, metadata_json, embedding FROM tasks WHERE status = 'completed'"
+        return self.search_embedding(
+            query_embedding,
+            top_k=top_k,
+            agent_filter=agent_filter,
+            type_filter=type_filter,
+            min_similarity=min_similarity,
+            statuses=statuses,
+            nprobe=nprobe,
+        )
+
+    def search_embedding(
+        self,
+        query_embedding: np.ndarray,
+        top_k: int = 5,
+        agent_filter: Optional[str] = None,
+        type_filter: Optional[str] = None,
+        min_similarity: float = 0.0,
+        statuses: Optional[Tuple[str, ...]] = ("completed",),
+        nprobe: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Hazır embedding ile arama (parametreler search ile aynı)
+
+        Filtreler SQL'de uygulanır ve sadece matris satır numaraları okunur.
+        Adaylar memory-mapped matris üzerinde tek matris-vektör çarpımıyla
+        skorlanır; en iyi top_k argpartition ile seçilir ve JSON kolonları
+        yalnızca bu task'lar için okunur. IVF index'i varsa adaylar sorguya
+        en yakın nprobe listeyle sınırlanır. Boyutu matristen farklı (başka
+        modelle üretilmiş) vektörler aranmaz.
+        """
+        query = np.asarray(query_embedding, dtype=np.float32).ravel()
+        query_norm = float(np.linalg.norm(query))
+        if top_k <= 0 or query_norm == 0:
+            return []
+        query = query / query_norm
+
+        conditions = []
         params = []
 
+        if statuses:
+            conditions.append(f"status IN ({', '.join('?' * len(statuses))})")
+            params.extend(statuses)
+
         if agent_filter:
-            sql += " AND agent = ?"
+            conditions.append("agent = ?")
             params.append(agent_filter)
 
         if type_filter:
-            sql += " AND type = ?"
+            conditions.append("type = ?")
             params.append(type_filter)
 
-        # DB'den oku
         conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
 
         try:
-            cursor.execute(sql, params)
-            rows = cursor.fetchall()
+            for _ in range(2):
+                with self._lock.acquire(shared=True):
+                    state = self._vector_state(conn)
+                    if state is not None:
+                        return self._search_matrix(
+                            conn, state, query, top_k, conditions, params, min_similarity, nprobe
+                        )
+                # Matris eski: yeniden oluştur ve tekrar dene
+                with self._lock.acquire():
+                    self._ensure_vectors(conn)
+            return []
         except Exception as e:
             print(f"❌ DB okuma hatası: {e}")
+            return []
+        finally:
             conn.close()
+
+    def _search_matrix(
+        self,
+        conn,
+        state: Tuple[int, int],
+        query: np.ndarray,
+        top_k: int,
+        conditions: List[str],
+        params: List[Any],
+        min_similarity: float,
+        nprobe: Optional[int]
+    ) -> List[Dict[str, Any]]:
+        """Matris üzerinde skorla, kazananları DB'den oku (okuma kilidi altında)"""
+        rows, dim = state
+        if rows == 0 or query.size != dim:
             return []
 
-        conn.close()
+        centroids = self._load_centroids(conn, dim) if nprobe != 0 else None
+        nprobe = DEFAULT_NPROBE if nprobe is None else nprobe
+        if centroids is not None and 0 < nprobe < len(centroids):
+            # Sorguya en yakın nprobe liste + listesi olmayan satırlar
+            probed = np.argpartition(-(centroids @ query), nprobe - 1)[:nprobe]
+            # Diğer filtrelerin index'leri kapatılır ('+kolon'): plan idx_ivf_list'ten başlasın
+            conditions = [f"(ivf_list IN ({', '.join('?' * nprobe)}) OR ivf_list IS NULL)"] + [
+                "+" + condition for condition in conditions
+            ]
+            params = [int(i) for i in probed] + params
+
+        matrix = np.memmap(self.vectors_path, dtype=np.float32, mode="r", shape=(rows, dim))
+        try:
+            if conditions:
+                # Satır numaraları tek metin olarak gelir (satır başına tuple yerine)
+                packed = conn.execute(
+                    "SELECT group_concat(vector_row) FROM tasks WHERE vector_row IS NOT NULL AND "
+                    + " AND ".join(conditions),
+                    params,
+                ).fetchone()[0]
+                candidates = np.fromstring(packed or "", dtype=np.int64, sep=",")
+                if len(candidates) * 4 < rows:
+                    # Seçici filtre: sadece aday satırlar okunur
+                    candidates.sort()
+                    scores = matrix[candidates] @ query
+                else:
+                    scores = (matrix @ query)[candidates]
+            else:
+                candidates = None
+                scores = matrix @ query
+        finally:
+            del matrix
+
+        # Sıfır vektörler (NaN) hiçbir eşiği geçmez
+        scores[np.isnan(scores)] = -np.inf
+
+        # Eşiği geçenler arasından top_k
+        positions = np.flatnonzero(scores >= min_similarity)
+        if len(positions) > top_k:
+            positions = positions[np.argpartition(-scores[positions], top_k - 1)[:top_k]]
+        positions = positions[np.argsort(-scores[positions], kind="stable")]
+        if not len(positions):
+            return []
+        winners = positions if candidates is None else candidates[positions]
+
+        # Sadece kazananların detayları
+        cursor = conn.execute(
+            "SELECT vector_row, id, description, agent, type, status, priority, created_at, completed_at, "
+            "payload_json, result_json, metadata_json FROM tasks "
+            f"WHERE vector_row IN ({', '.join('?' * len(winners))})",
+            [int(row) for row in winners],
+        )
+        details = {row[0]: row[1:] for row in cursor.fetchall()}
 
-        # Benzerlik hesapla
         results = []
-        for row in rows:
+        for position, vector_row in zip(positions, winners):
             (task_id, description, agent, type_, status, priority,
              created_at, completed_at, payload_json, result_json,
-             metadata_json, embedding_bytes) = row
+             metadata_json) = details[int(vector_row)]
+            results.append({
+                'id': task_id,
+                'description': description,
+                'agent': agent,
+                'type': type_,
+                'status': status,
+                'priority': priority,
+                'similarity': float(scores[position]),
+                'created_at': created_at,
+                'completed_at': completed_at,
+                'payload': json.loads(payload_json) if payload_json else {},
+                'result': json.loads(result_json) if result_json else {},
+                'metadata': json.loads(metadata_json) if metadata_json else {}
+            })
 
-            # Embedding bytes → numpy array
-            try:
-                stored_embedding = np.frombuffer(embedding_bytes, dtype=np.float32)
-            except Exception:
-                continue
-
-            # Cosine similarity
-            similarity = self._cosine_similarity(query_embedding, stored_embedding)
-
-            if similarity >= min_similarity:
-                results.append({
-                    'id': task_id,
-                    'description': description,
-                    'agent': agent,
-                    'type': type_,
-                    'status': status,
-                    'priority': priority,
-                    'similarity': float(similarity),
-                    'created_at': created_at,
-                    'completed_at': completed_at,
-                    'payload': json.loads(payload_json) if payload_json else {},
-                    'result': json.loads(result_json) if result_json else {},
-                    'metadata': json.loads(metadata_json) if metadata_json else {}
-                })
-
-        # Sırala ve top_k döndür
-        results.sort(key=lambda x: x['similarity'], reverse=True)
-        return results[:top_k]
+        return results
 
     def _cosine_similarity(self, a: np.ndarray, b: np.ndarray) -> float:
         """Cosine similarity hesapla"""
@@ -401,18 +739,34 @@ class VectorMemory:
 
     def index_completed_tasks(
         self,
-        tasks_file: str = ".agent/queue/tasks-completed.json"
+        tasks_file: Optional[str] = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        processes: int = 0
     ) -> Tuple[int, int]:
         """
         Tamamlanmış task'ları vektör DB'ye indeksle
 
         Args:
-            tasks_file: Task queue dosyası
+            tasks_file: Task dosyası (None: completed queue'su store'dan).
+                        Queue dizinindeki tasks-<status>.json verilirse de
+                        queue store'dan okunur; snapshot journal'ın
+                        gerisinde kalabilir.
+            batch_size, processes: add_tasks'a aktarılır
 
         Returns:
             (Başarılı, Başarısız) sayısı
         """
+        if tasks_file is None:
+            return self.index_queue("completed", batch_size, processes)
+
         tasks_path = Path(tasks_file)
+        status = tasks_path.name[len("tasks-"):-len(".json")]
+        if (
+            tasks_path.name.startswith("tasks-") and tasks_path.suffix == ".json"
+            and status in QUEUE_STATUSES
+            and tasks_path.parent.resolve() == QUEUE_DIR.resolve()
+        ):
+            return self.index_queue(status, batch_size, processes)
 
         if not tasks_path.exists():
             print(f"⚠️ {tasks_file} bulunamadı")
@@ -426,44 +780,200 @@ class VectorMemory:
             print(f"❌ Dosya okuma hatası: {e}")
             return 0, 0
 
-        tasks = data.get('tasks', [])
+        return self._index_source(data.get('tasks', []), tasks_path.name, batch_size, processes)
 
-        if not tasks:
-            print("⚠️ İndekslenecek task yok")
-            return 0, 0
+    def index_queue(
+        self,
+        status: str = "completed",
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        processes: int = 0
+    ) -> Tuple[int, int]:
+        """
+        Bir queue'yu queue store üzerinden (snapshot + journal / SQLite) indeksle
+
+        Kaynak adı eski dosya tabanlı indekslemeyle aynıdır (tasks-<status>.json).
+        Completed queue'sunda arşiv segment'leri de (sıcak queue'da olmayan
+        task'lar) ARCHIVE_SOURCE kaynağı olarak indekslenir; sıcak kaynaktan
+        arşive geçen satırlar silinmez, encode edilmeden kaynağı değişir.
+
+        Returns:
+            (Başarılı, Başarısız) sayısı
+        """
+        project_root = QUEUE_DIR.parent.parent
+        config = load_queue_config(project_root)
+        store = open_store(project_root, config)
+        try:
+            tasks = store.load(status)
+        finally:
+            store.close()
+
+        if status != ARCHIVE_STATUS:
+            return self._index_source(tasks, f"tasks-{status}.json", batch_size, processes)
 
+        hot_ids = {str(task.get("id")) for task in tasks}
+        archived = list(create_archive(QUEUE_DIR, config).iter_tasks(exclude_ids=hot_ids))
+        keep_ids = {str(task.get("id")) for task in archived}
+        success, fail = self._index_source(tasks, f"tasks-{status}.json", batch_size, processes, keep_ids)
+
+        print(f"\n🗄️  Arşiv ({ARCHIVE_SOURCE}):")
+        archived_success, archived_fail = self._index_source(archived, ARCHIVE_SOURCE, batch_size, processes)
+        return success + archived_success, fail + archived_fail
+
+    def _index_source(
+        self,
+        tasks: List[Dict[str, Any]],
+        source: str,
+        batch_size: int,
+        processes: int,
+        keep_ids: Optional[Set[str]] = None
+    ) -> Tuple[int, int]:
+        """sync_tasks + özet çıktısı"""
         print(f"📊 {len(tasks)} task indeksleniyor...")
 
-        success, fail = self.add_tasks(tasks)
+        counts = self.sync_tasks(tasks, source, batch_size=batch_size, processes=processes, keep_ids=keep_ids)
+        success = counts['added'] + counts['updated']
+        fail = counts['failed']
 
         print(f"✅ {success}/{len(tasks)} task indekslendi")
+        print(
+            f"   {counts['added']} yeni/değişen (encode edildi), "
+            f"{counts['updated']} değişmemiş, {counts['removed']} silindi"
+        )
+        if counts['added']:
+            print(
+                f"⏱️  encode {self.last_timings['encode']:.2f} sn, "
+                f"yazma {self.last_timings['write']:.2f} sn"
+            )
         if fail > 0:
             print(f"⚠️ {fail} task başarısız")
 
         return success, fail
 
-    def index_all_queues(self) -> Dict[str, Tuple[int, int]]:
+    def sync_tasks(
+        self,
+        tasks: List[Dict[str, Any]],
+        source: str,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        processes: int = 0,
+        keep_ids: Optional[Set[str]] = None
+    ) -> Dict[str, int]:
         """
-        Tüm queue dosyalarını indeksle
+        Bir kaynağın (queue dosyası) task'larını DB ile eşitle
+
+        Embedding metni ve modeli aynı kalan task'lar encode edilmez, sadece
+        kolonları güncellenir. Bu kaynaktan indekslenmiş ama listede artık
+        olmayan task'lar silinir; keep_ids'teki (ör. arşive taşınmış) task'lar
+        listede olmasalar da kalır.
+
+        Returns:
+            {'added', 'updated', 'removed', 'failed'} sayıları
+        """
+        counts = {'added': 0, 'updated': 0, 'removed': 0, 'failed': 0}
+        current = {}
+        for task in tasks:
+            if task.get('id'):
+                current[task['id']] = task
+            else:
+                counts['failed'] += 1
+
+        conn = sqlite3.connect(self.db_path)
+        try:
+            stored = self._stored_hashes(conn, [*current])
+            gone = [
+                task_id for (task_id,) in conn.execute("SELECT id FROM tasks WHERE source = ?", (source,))
+                if task_id not in current and not (keep_ids and task_id in keep_ids)
+            ]
+        finally:
+            conn.close()
+
+        changed = []
+        unchanged = []
+        for task_id, task in current.items():
+            if stored.get(task_id) == (self._text_hash(task), self.model_name):
+                unchanged.append(task)
+            else:
+                changed.append(task)
+
+        if unchanged:
+            self._update_tasks(unchanged, source)
+            counts['updated'] = len(unchanged)
+        if gone:
+            self._remove_tasks(gone)
+            counts['removed'] = len(gone)
+        self.last_timings = {'encode': 0.0, 'write': 0.0}
+        if changed:
+            added, failed = self.add_tasks(changed, batch_size=batch_size, processes=processes, source=source)
+            counts['added'] = added
+            counts['failed'] += failed
+        return counts
+
+    def _stored_hashes(self, conn, task_ids: List[str]) -> Dict[str, Tuple[str, str]]:
+        """ID → (text_hash, model_name) (embedding'i olan mevcut task'lar)"""
+        found = {}
+        for i in range(0, len(task_ids), IN_CHUNK):
+            chunk = task_ids[i:i + IN_CHUNK]
+            found.update(
+                (task_id, (text_hash, model_name))
+                for task_id, text_hash, model_name in conn.execute(
+                    f"SELECT id, text_hash, model_name FROM tasks WHERE id IN ({', '.join('?' * len(chunk))})",
+                    chunk,
+                )
+            )
+        return found
+
+    def _update_tasks(self, tasks: List[Dict[str, Any]], source: str) -> None:
+        """Embedding'i değişmeyen task'ların kolonlarını güncelle (tek transaction, sadece farklı olanlar)"""
+        conn = sqlite3.connect(self.db_path)
+        try:
+            conn.executemany("""
+                UPDATE tasks SET
+                    description = ?1, agent = ?2, type = ?3, status = ?4, priority = ?5, created_at = ?6,
+                    completed_at = ?7, payload_json = ?8, result_json = ?9, metadata_json = ?10, source = ?11
+                WHERE id = ?12 AND NOT (
+                    description IS ?1 AND agent IS ?2 AND type IS ?3 AND status IS ?4 AND priority IS ?5
+                    AND created_at IS ?6 AND completed_at IS ?7 AND payload_json IS ?8 AND result_json IS ?9
+                    AND metadata_json IS ?10 AND source IS ?11
+                )
+            """, [
+                (
+                    task.get('description', ''),
+                    task.get('agent', ''),
+                    task.get('type', ''),
+                    task.get('status', ''),
+                    task.get('priority', 5),
+                    task.get('createdAt', ''),
+                    task.get('completedAt', ''),
+                    _to_json(task.get('payload', {})),
+                    _to_json(task.get('result', {})),
+                    _to_json(task.get('metadata', {})),
+                    source,
+                    task['id'],
+                )
+                for task in tasks
+            ])
+            conn.commit()
+        finally:
+            conn.close()
+
+    def index_all_queues(
+        self,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        processes: int = 0
+    ) -> Dict[str, Tuple[int, int]]:
+        """
+        Tüm queue'ları (completed, in-progress, failed) store üzerinden indeksle
+
+        Args:
+            batch_size, processes: add_tasks'a aktarılır
 
         Returns:
             Her queue için (success, fail) sayısı
         """
-        queue_dir = Path(".agent/queue")
         results = {}
 
-        queue_files = [
-            ("tasks-completed.json", "completed"),
-            ("tasks-in-progress.json", "in-progress"),
-            ("tasks-failed.json", "failed"),
-        ]
-
-        for filename, queue_type in queue_files:
-            file_path = queue_dir / filename
-            if file_path.exists():
-                print(f"\n📂 {filename} indeksleniyor...")
-                success, fail = self.index_completed_tasks(str(file_path))
-                results[queue_type] = (success, fail)
+        for queue_type in ("completed", "in-progress", "failed"):
+            print(f"\n📂 tasks-{queue_type} indeksleniyor...")
+            results[queue_type] = self.index_queue(queue_type, batch_size, processes)
 
         return results
 
@@ -499,6 +1009,8 @@ class VectorMemory:
         # Metadata
         schema_version = self._get_metadata(conn, 'schema_version')
         model_name = self._get_metadata(conn, 'model_name')
+        vector_rows = int(self._get_metadata(conn, 'vector_rows') or 0)
+        ivf_lists = int(self._get_metadata(conn, 'ivf_lists') or 0)
 
         conn.close()
 
@@ -510,6 +1022,8 @@ class VectorMemory:
             'last_indexed': last_indexed,
             'schema_version': schema_version,
             'model_name': model_name,
+            'vector_rows': vector_rows,
+            'ivf_lists': ivf_lists,
             'db_size_mb': self.db_path.stat().st_size / (1024 * 1024) if self.db_path.exists() else 0
         }
 
@@ -520,11 +1034,17 @@ class VectorMemory:
     def clear_all(self) -> bool:
         """Tüm task'ları sil"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            cursor.execute("DELETE FROM tasks")
-            conn.commit()
-            conn.close()
+            with self._lock.acquire():
+                conn = sqlite3.connect(self.db_path)
+                try:
+                    self._mark_dirty(conn)
+                    self.vectors_path.unlink(missing_ok=True)
+                    conn.execute("DELETE FROM tasks")
+                    self._set_metadata(conn, 'ivf_lists', '0')
+                    self._mark_clean(conn, 0, 0)
+                    self.ivf_path.unlink(missing_ok=True)
+                finally:
+                    conn.close()
             return True
         except Exception as e:
             print(f"❌ Temizleme hatası: {e}")
@@ -533,27 +1053,246 @@ class VectorMemory:
     def delete_task(self, task_id: str) -> bool:
         """Tek task sil"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            cursor.execute("DELETE FROM tasks WHERE id = ?", (task_id,))
-            conn.commit()
-            conn.close()
+            self._remove_tasks([task_id])
             return True
         except Exception as e:
             print(f"❌ Silme hatası: {e}")
             return False
 
+    def _remove_tasks(self, task_ids: List[str]) -> None:
+        """Task'ları DB'den ve matristen sil (boşluklara son satırlar taşınır)"""
+        with self._lock.acquire():
+            conn = sqlite3.connect(self.db_path)
+            try:
+                rows, dim = self._ensure_vectors(conn)
+                removed = sorted((row for row in self._vector_rows(conn, task_ids).values() if row is not None), reverse=True)
+                self._mark_dirty(conn)
+                if removed:
+                    row_bytes = dim * _ITEMSIZE
+                    with open(self.vectors_path, 'r+b') as f:
+                        # Büyükten küçüğe: taşınan son satır hiçbir zaman silinecek bir satır değildir
+                        for row in removed:
+                            last = rows - 1
+                            if row != last:
+                                f.seek(last * row_bytes)
+                                vector = f.read(row_bytes)
+                                f.seek(row * row_bytes)
+                                f.write(vector)
+                                conn.execute("UPDATE tasks SET vector_row = ? WHERE vector_row = ?", (row, last))
+                            rows = last
+                        f.truncate(rows * row_bytes)
+                conn.executemany("DELETE FROM tasks WHERE id = ?", [(task_id,) for task_id in task_ids])
+                self._mark_clean(conn, rows, dim)
+            finally:
+                conn.close()
+
     def optimize_db(self) -> bool:
-        """DB'yi optimize et (VACUUM)"""
+        """DB'yi optimize et (VACUUM), embedding matrisini ve IVF index'ini yeniden oluştur"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            conn.execute("VACUUM")
-            conn.close()
+            with self._lock.acquire():
+                conn = sqlite3.connect(self.db_path)
+                try:
+                    conn.execute("VACUUM")
+                    self._rebuild_vectors(conn)
+                    nlist = int(self._get_metadata(conn, 'ivf_lists') or 0)
+                    if nlist:
+                        self._build_ivf(conn, nlist)
+                finally:
+                    conn.close()
             return True
         except Exception as e:
             print(f"❌ Optimizasyon hatası: {e}")
             return False
 
+    # ========================================================================
+    # EMBEDDING MATRİSİ
+    # ========================================================================
+
+    def _vector_state(self, conn) -> Optional[Tuple[int, int]]:
+        """Matris DB ile uyumluysa (satır sayısı, boyut); değilse None"""
+        if self._get_metadata(conn, 'vector_sync') != 'clean':
+            return None
+        rows = int(self._get_metadata(conn, 'vector_rows') or 0)
+        dim = int(self._get_metadata(conn, 'vector_dim') or 0)
+        try:
+            size = self.vectors_path.stat().st_size
+        except OSError:
+            size = 0
+        return (rows, dim) if size == rows * dim * _ITEMSIZE else None
+
+    def _ensure_vectors(self, conn) -> Tuple[int, int]:
+        """Matris eskiyse yeniden oluştur (yazma kilidi altında)"""
+        state = self._vector_state(conn)
+        return state if state is not None else self._rebuild_vectors(conn)
+
+    def _rebuild_vectors(self, conn) -> Tuple[int, int]:
+        """
+        Matrisi SQLite'taki embedding'lerden yeniden yaz (yazma kilidi altında)
+
+        Boyut en çok kullanılan embedding boyutudur; diğer boyuttaki
+        embedding'ler matrise girmez.
+        """
+        found = conn.execute("""
+            SELECT length(embedding), COUNT(*) FROM tasks
+            WHERE length(embedding) > 0
+            GROUP BY 1 ORDER BY 2 DESC LIMIT 1
+        """).fetchone()
+        dim = found[0] // _ITEMSIZE if found else 0
+
+        self._mark_dirty(conn)
+        mapping = []
+        tmp = self.vectors_path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp, 'wb') as f:
+            if dim:
+                cursor = conn.execute("SELECT id, embedding FROM tasks WHERE length(embedding) = ?", (dim * _ITEMSIZE,))
+                while True:
+                    chunk = cursor.fetchmany(READ_CHUNK)
+                    if not chunk:
+                        break
+                    matrix = np.frombuffer(b"".join(row[1] for row in chunk), dtype=np.float32)
+                    f.write(_normalize_rows(matrix.reshape(len(chunk), dim)).tobytes())
+                    mapping.extend(enumerate((row[0] for row in chunk), start=len(mapping)))
+        os.replace(tmp, self.vectors_path)
+
+        conn.execute("UPDATE tasks SET vector_row = NULL WHERE vector_row IS NOT NULL")
+        conn.executemany("UPDATE tasks SET vector_row = ? WHERE id = ?", mapping)
+        self._mark_clean(conn, len(mapping), dim)
+        return len(mapping), dim
+
+    def _write_vectors(self, writes: List[Tuple[int, np.ndarray]], dim: int) -> np.ndarray:
+        """(satır, vektör) çiftlerini normalize ederek matrise yaz; normalize vektörleri döndür"""
+        if not writes:
+            return np.empty((0, dim), dtype=np.float32)
+        row_bytes = dim * _ITEMSIZE
+        vectors = _normalize_rows(np.stack([vector for _, vector in writes]))
+        rows = np.array([row for row, _ in writes])
+        # Ardışık satırlar (ör. sona eklenenler) tek write ile yazılır
+        breaks = np.flatnonzero(np.diff(rows) != 1) + 1
+        with open(self.vectors_path, 'r+b' if self.vectors_path.exists() else 'w+b') as f:
+            for start, end in zip(np.r_[0, breaks], np.r_[breaks, len(rows)]):
+                f.seek(int(rows[start]) * row_bytes)
+                f.write(vectors[start:end].tobytes())
+        return vectors
+
+    def _vector_rows(self, conn, task_ids: List[str]) -> Dict[str, Optional[int]]:
+        """Mevcut task'ların matris satırları"""
+        found = {}
+        for i in range(0, len(task_ids), IN_CHUNK):
+            chunk = task_ids[i:i + IN_CHUNK]
+            found.update(conn.execute(
+                f"SELECT id, vector_row FROM tasks WHERE id IN ({', '.join('?' * len(chunk))})",
+                chunk,
+            ).fetchall())
+        return found
+
+    def _mark_dirty(self, conn) -> None:
+        """Matris değişmeden önce: yarıda kalırsa ilk aramada yeniden oluşturulur"""
+        self._set_metadata(conn, 'vector_sync', 'dirty')
+        conn.commit()
+
+    def _mark_clean(self, conn, rows: int, dim: int) -> None:
+        """Bekleyen task değişiklikleriyle birlikte matris durumunu commit et"""
+        self._set_metadata(conn, 'vector_rows', str(rows))
+        self._set_metadata(conn, 'vector_dim', str(dim))
+        self._set_metadata(conn, 'vector_sync', 'clean')
+        conn.commit()
+
+    # ========================================================================
+    # ANN INDEX (IVF-FLAT)
+    # ========================================================================
+
+    def build_index(self, nlist: Optional[int] = None) -> int:
+        """
+        IVF index'ini kur (veya yeniden eğit)
+
+        Args:
+            nlist: Liste sayısı (None: √satır sayısı)
+
+        Returns:
+            Kurulan liste sayısı (matris boşsa 0)
+        """
+        with self._lock.acquire():
+            conn = sqlite3.connect(self.db_path)
+            try:
+                rows, _ = self._ensure_vectors(conn)
+                return self._build_ivf(conn, nlist or max(1, round(rows ** 0.5)))
+            finally:
+                conn.close()
+
+    def drop_index(self) -> None:
+        """IVF index'ini kaldır (arama tam taramaya döner)"""
+        with self._lock.acquire():
+            conn = sqlite3.connect(self.db_path)
+            try:
+                self._set_metadata(conn, 'ivf_lists', '0')
+                conn.execute("UPDATE tasks SET ivf_list = NULL WHERE ivf_list IS NOT NULL")
+                conn.commit()
+                self.ivf_path.unlink(missing_ok=True)
+            finally:
+                conn.close()
+
+    def _build_ivf(self, conn, nlist: int) -> int:
+        """Merkezleri eğit, tüm satırları listelere ata (yazma kilidi altında)"""
+        rows, dim = self._ensure_vectors(conn)
+        # Kurulum yarıda kalırsa index kapalı kalır
+        self._set_metadata(conn, 'ivf_lists', '0')
+        conn.commit()
+        if rows == 0:
+            return 0
+
+        matrix = np.memmap(self.vectors_path, dtype=np.float32, mode="r", shape=(rows, dim))
+        try:
+            rng = np.random.default_rng()
+            sample = np.sort(rng.choice(rows, min(rows, nlist * TRAIN_PER_LIST), replace=False))
+            data = matrix[sample]
+            data = data[~np.isnan(data).any(axis=1)]
+            nlist = max(1, min(nlist, len(data)))
+            if not len(data):
+                return 0
+            centroids = _kmeans(data, nlist, KMEANS_ITERATIONS, rng)
+            lists = _nearest_centroids(matrix, centroids)
+        finally:
+            del matrix
+
+        tmp = self.ivf_path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp, 'wb') as f:
+            np.save(f, centroids)
+        os.replace(tmp, self.ivf_path)
+
+        conn.execute("UPDATE tasks SET ivf_list = NULL WHERE ivf_list IS NOT NULL")
+        conn.executemany(
+            "UPDATE tasks SET ivf_list = ? WHERE vector_row = ?",
+            ((int(ivf_list), row) for row, ivf_list in enumerate(lists)),
+        )
+        self._set_metadata(conn, 'ivf_lists', str(nlist))
+        conn.commit()
+        return nlist
+
+    def _load_centroids(self, conn, dim: int) -> Optional[np.ndarray]:
+        """IVF merkezleri (index yoksa veya matrisle uyuşmuyorsa None)"""
+        nlist = int(self._get_metadata(conn, 'ivf_lists') or 0)
+        if not nlist:
+            return None
+        try:
+            stat = self.ivf_path.stat()
+        except OSError:
+            return None
+        signature = (stat.st_mtime_ns, stat.st_size)
+        if self._centroids is None or self._centroids[0] != signature:
+            try:
+                self._centroids = (signature, np.load(self.ivf_path))
+            except (OSError, ValueError):
+                return None
+        centroids = self._centroids[1]
+        return centroids if centroids.shape == (nlist, dim) else None
+
+    def _assign_lists(self, conn, vectors: np.ndarray) -> List[Optional[int]]:
+        """Yeni satırların IVF listeleri (index yoksa None)"""
+        centroids = self._load_centroids(conn, vectors.shape[1]) if len(vectors) else None
+        if centroids is None:
+            return [None] * len(vectors)
+        return [int(i) for i in _nearest_centroids(vectors, centroids)]
+
 
 # ============================================================================
 # CLI
@@ -582,11 +1321,22 @@ def cmd_index(args):
         print_info("Kurulum: pip install sentence-transformers")
         return 1
 
+    options = {"--batch-size": DEFAULT_BATCH_SIZE, "--processes": 0}
+    for name in options:
+        if name in args:
+            i = args.index(name)
+            if i + 1 >= len(args):
+                print_error(f"{name} için sayı gerekli")
+                return 1
+            options[name] = int(args[i + 1])
+            args = args[:i] + args[i + 2:]
+    batch_size, processes = options["--batch-size"], options["--processes"]
+
     vector_memory = VectorMemory()
 
     if len(args) > 0 and args[0] == "--all":
         # Tüm queue'ları indeksle
-        results = vector_memory.index_all_queues()
+        results = vector_memory.index_all_queues(batch_size, processes)
 
         print("\n📊 İndeksleme Özeti:")
         for queue_type, (success, fail) in results.items():
@@ -596,8 +1346,8 @@ def cmd_index(args):
 
     else:
         # Sadece completed tasks
-        tasks_file = args[0] if args else ".agent/queue/tasks-completed.json"
-        success, fail = vector_memory.index_completed_tasks(tasks_file)
+        tasks_file = args[0] if args else None
+        success, fail = vector_memory.index_completed_tasks(tasks_file, batch_size, processes)
 
         if fail == 0:
             return 0
@@ -611,8 +1361,17 @@ def cmd_search(args):
         print_error("sentence_transformers yüklü değil.")
         return 1
 
+    nprobe = None
+    if "--nprobe" in args:
+        i = args.index("--nprobe")
+        if i + 1 >= len(args):
+            print_error("--nprobe için sayı gerekli")
+            return 1
+        nprobe = int(args[i + 1])
+        args = args[:i] + args[i + 2:]
+
     if len(args) < 1:
-        print_error("Kullanım: python vector_memory.py search <query> [top_k]")
+        print_error("Kullanım: python vector_memory.py search <query> [top_k] [--nprobe N]")
         return 1
 
     query = args[0]
@@ -620,7 +1379,7 @@ def cmd_search(args):
 
     vector_memory = VectorMemory()
 
-    results = vector_memory.search(query, top_k=top_k)
+    results = vector_memory.search(query, top_k=top_k, nprobe=nprobe)
 
     if not results:
         print_warning(f"'{query}' için sonuç bulunamadı")
@@ -665,6 +1424,9 @@ def cmd_stats(args):
     print(f"   DB boyutu: {stats['db_size_mb']:.2f} MB")
     print(f"   Model: {stats['model_name']}")
     print(f"   Schema: {stats['schema_version']}")
+    print(f"   Matris: {stats['vector_rows']} satır")
+    if stats['ivf_lists']:
+        print(f"   ANN index: IVF, {stats['ivf_lists']} liste")
     print()
 
     if stats['by_status']:
@@ -718,6 +1480,30 @@ def cmd_optimize(args):
         return 1
 
 
+def cmd_ann_build(args):
+    """IVF index'ini kur"""
+    nlist = int(args[0]) if args else None
+    vector_memory = VectorMemory(model_name=None)
+
+    start = datetime.now()
+    nlist = vector_memory.build_index(nlist)
+    if not nlist:
+        print_warning("Matris boş, index kurulmadı")
+        return 1
+
+    elapsed = (datetime.now() - start).total_seconds()
+    print_success(f"IVF index kuruldu: {nlist} liste ({elapsed:.1f} sn)")
+    print_info(f"Arama varsayılan olarak {min(DEFAULT_NPROBE, nlist)} liste tarar (search --nprobe N)")
+    return 0
+
+
+def cmd_ann_drop(args):
+    """IVF index'ini kaldır"""
+    VectorMemory(model_name=None).drop_index()
+    print_success("IVF index kaldırıldı, arama tam taramaya döndü")
+    return 0
+
+
 def cmd_test(args):
     """Test çalıştır"""
     if not MODEL_AVAILABLE:
@@ -834,12 +1620,17 @@ Kullanım:
   python vector_memory.py <command> [args]
 
 Komutlar:
-  index [file]          Task'ları indeksle (varsayılan: tasks-completed.json)
-  index --all           Tüm queue dosyalarını indeksle
+  index [file]          Task'ları artımlı indeksle (varsayılan: completed queue'su + arşiv segment'leri)
+  index --all           Tüm queue'ları (completed, in-progress, failed) store üzerinden indeksle
+    [--batch-size 64]   encode batch boyutu
+    [--processes N]     encode için çoklu process havuzu (N > 1)
   search <query> [k]    Semantik arama (varsayılan top_k: 5)
+    [--nprobe N]        IVF index'inde taranacak liste (0: tam arama)
   stats                 İstatistikler
   clear --confirm       Tüm veriyi sil
-  optimize              DB'yi optimize et
+  optimize              DB'yi optimize et, embedding matrisini ve IVF index'ini yeniden oluştur
+  ann-build [nlist]     IVF (ANN) index'ini kur (varsayılan nlist: √task sayısı)
+  ann-drop              IVF index'ini kaldır
   test                  Test çalıştır
   help                  Bu yardım menüsü
 
@@ -850,6 +1641,10 @@ Komutlar:
   # Semantik arama
   python vector_memory.py search "authentication system"
   python vector_memory.py search "React form" 3
+  python vector_memory.py search "React form" 3 --nprobe 32
+
+  # Büyük geçmiş için ANN index
+  python vector_memory.py ann-build
 
   # İstatistikler
   python vector_memory.py stats
@@ -877,6 +1672,8 @@ def main():
         'stats': cmd_stats,
         'clear': cmd_clear,
         'optimize': cmd_optimize,
+        'ann-build': cmd_ann_build,
+        'ann-drop': cmd_ann_drop,
         'test': cmd_test,
         'help': print_help,
     }
@@ -0,0 +1,593 @@
+#!/usr/bin/env python3
+"""
+ODIN AI Agent System - Worker Pool
+`odin run` için task'ları claim edip agent process'lerine dağıtan supervisor.
+
+Limitler .agent/config/queue.json > execution bölümünden okunur:
+
+    maxConcurrentTasks : Aynı anda çalışan toplam task (slot sayısı)
+    maxParallelAgents  : Aynı anda çalışan farklı agent tipi sayısı
+    maxAgentsPerType   : Bir agent tipinden aynı anda çalışan task sayısı
+
+Her task ayrı bir process'te çalışır (varsayılan: agent.sh <agent> <task-json>).
+Supervisor tek thread'dir: process'leri başlatır, bitenleri toplar ve boşalan
+slot'ları doldurur. Claim filtresi (AgentFilter) o anki doluluğa göre
+kurulur, böylece limitler claim anında uygulanır; daemon üzerinden de
+çalışır.
+
+Çıkış kodu 0 olan task completed'a, diğerleri (ve zaman aşımına uğrayanlar)
+failed'a taşınır. Çıktılar .agent/logs/agents/<task-id>.log dosyasına yazılır.
+
+Sonuçlar (başarı ve süre) agent'ın circuit'ine process içinde kaydedilir
+(circuit_breaker.CircuitBreaker). Circuit'i OPEN olan agent'lar claim
+filtresinden dışlanır; bekleme süresi dolmuş circuit'te claim edilen task
+probe hakkı alamazsa pending'e geri bırakılır.
+
+queue.maxInProgress doluysa (başka supervisor / kick'lerle birlikte) yeni
+task alınmaz.
+
+Agent'ı "auto" olan (--agent'sız eklenen) task'lar claim edilmez: agent'ı
+orchestrator atar (odin kick), agent.sh "auto"yu tanımaz. Komut "auto"yu
+kendisi yönlendiriyorsa execution.claimAuto: true ile bu task'lar da alınır.
+
+Çalışan task'ların lease'leri monitoring.heartbeatInterval saniyede bir
+uzatılır; aynı aralıkta süresi dolan lease'ler (ör. çöken başka bir
+supervisor'ın task'ları) geri alınır. Lease'i kaybedilen (reclaim edilen)
+task'ın process'i öldürülür ve sonucu queue'ya yazılmaz.
+
+Autoscaler verilirse aktif slot sayısı maxConcurrentTasks yerine
+autoscaler.target'tır (bkz. autoscaler.py); ölçekleme olayları
+.agent/logs/scaling.jsonl dosyasına eklenir.
+
+Version: 1.0.0
+"""
+
+import json
+import os
+import shlex
+import signal
+import socket
+import statistics
+import subprocess
+import time
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from admission import AdmissionPolicy
+from autoscaler import Autoscaler, ScalingPolicy
+from circuit_breaker import CircuitBreaker
+from queue_store import AgentFilter, QueueStore, unclaim
+from scheduler import created_timestamp
+
+DEFAULT_COMMAND = ".agent/scripts/agent.sh {agent} {task}"
+DEFAULT_MAX_CONCURRENT_TASKS = 10
+DEFAULT_MAX_PARALLEL_AGENTS = 5
+DEFAULT_MAX_AGENTS_PER_TYPE = 3
+DEFAULT_POLL_INTERVAL = 1.0
+DEFAULT_HEARTBEAT_INTERVAL = 60
+
+# Agent'ı atanmamış task'ların agent değeri (orchestrator yönlendirir)
+UNROUTED_AGENT = "auto"
+
+# Çalışan process varken bitiş kontrol aralığı (saniye)
+REAP_INTERVAL = 0.05
+
+# failed task'a eklenen çıktı kuyruğu (byte)
+OUTPUT_TAIL_BYTES = 2000
+
+
+class PoolLimits:
+    """Eşzamanlılık limitleri"""
+
+    def __init__(
+        self,
+        max_concurrent: int = DEFAULT_MAX_CONCURRENT_TASKS,
+        max_agents: int = DEFAULT_MAX_PARALLEL_AGENTS,
+        max_per_type: int = DEFAULT_MAX_AGENTS_PER_TYPE,
+    ):
+        if min(max_concurrent, max_agents, max_per_type) < 1:
+            raise ValueError("Worker pool limitleri en az 1 olmalı")
+        self.max_concurrent = max_concurrent
+        self.max_agents = max_agents
+        self.max_per_type = max_per_type
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> "PoolLimits":
+        execution = config.get("execution", {})
+        return cls(
+            execution.get("maxConcurrentTasks", DEFAULT_MAX_CONCURRENT_TASKS),
+            execution.get("maxParallelAgents", DEFAULT_MAX_PARALLEL_AGENTS),
+            execution.get("maxAgentsPerType", DEFAULT_MAX_AGENTS_PER_TYPE),
+        )
+
+    def to_dict(self) -> Dict[str, int]:
+        return {
+            "maxConcurrentTasks": self.max_concurrent,
+            "maxParallelAgents": self.max_agents,
+            "maxAgentsPerType": self.max_per_type,
+        }
+
+
+def build_command(template: str, task: Dict[str, Any]) -> List[str]:
+    """
+    Komut şablonunu argümanlara çevir
+
+    Şablon shlex ile bölünür, sonra {agent}, {id} ve {task} (JSON) yer
+    tutucuları doldurulur; task içeriği shell tarafından yorumlanmaz.
+    """
+    values = {
+        "{agent}": str(task.get("agent") or UNROUTED_AGENT),
+        "{id}": str(task.get("id")),
+        "{task}": json.dumps(task, ensure_ascii=False),
+    }
+    args = []
+    for token in shlex.split(template):
+        for placeholder, value in values.items():
+            token = token.replace(placeholder, value)
+        args.append(token)
+    return args
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+
+class _Running:
+    """Çalışan task kaydı"""
+
+    def __init__(self, task: Dict[str, Any], slot: int, proc: subprocess.Popen, log_file):
+        self.task = task
+        self.slot = slot
+        self.proc = proc
+        self.log_file = log_file
+        self.agent = task.get("agent") or UNROUTED_AGENT
+        self.started = time.monotonic()
+        self.heartbeat = self.started
+        self.lost = False
+
+
+class WorkerPool:
+    """Task claim + process dağıtımı (tek thread'li supervisor)"""
+
+    def __init__(
+        self,
+        store: QueueStore,
+        project_root: Path,
+        limits: PoolLimits,
+        command: str = DEFAULT_COMMAND,
+        task_timeout: float = 0,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+        log_dir: Optional[Path] = None,
+        open_circuits: Optional[Callable[[], Iterable[str]]] = None,
+        on_event: Optional[Callable[[str, Dict[str, Any], int], None]] = None,
+        autoscaler: Optional[Autoscaler] = None,
+        scaling_log: Optional[Path] = None,
+        on_scale: Optional[Callable[[Dict[str, Any]], None]] = None,
+        heartbeat_interval: float = DEFAULT_HEARTBEAT_INTERVAL,
+        admission: Optional[AdmissionPolicy] = None,
+        breaker: Optional[CircuitBreaker] = None,
+        claim_auto: bool = False,
+    ):
+        """
+        Args:
+            store: Queue store (yerel veya daemon)
+            project_root: Agent process'lerinin çalışma dizini
+            limits: Eşzamanlılık limitleri
+            command: Komut şablonu ({agent}, {id}, {task})
+            task_timeout: Saniye; aşan process öldürülür (0: sınırsız)
+            poll_interval: Claim edilecek task yokken bekleme süresi
+            log_dir: Task çıktıları (varsayılan: .agent/logs/agents)
+            open_circuits: Circuit'i OPEN olan agent tipleri
+            on_event: ("start" | "finish", task, slot) olay kancası
+            autoscaler: Aktif slot sayısını yöneten autoscaler (None: sabit)
+            scaling_log: Ölçekleme olaylarının JSON Lines dosyası
+            on_scale: Ölçekleme olayı kancası
+            heartbeat_interval: Lease uzatma / süresi dolan lease tarama aralığı
+            admission: queue.maxInProgress doluyken claim yapılmaz
+            breaker: Task sonuçlarının kaydedildiği circuit breaker
+            claim_auto: Agent'ı "auto" olan task'ları da claim et ({agent} = "auto")
+        """
+        self.store = store
+        self.project_root = Path(project_root)
+        self.limits = limits
+        self.command = command
+        self.task_timeout = task_timeout
+        self.poll_interval = poll_interval
+        self.log_dir = Path(log_dir) if log_dir else self.project_root / ".agent" / "logs" / "agents"
+        self.open_circuits = open_circuits
+        self.on_event = on_event
+        self.autoscaler = autoscaler
+        self.scaling_log = Path(scaling_log) if scaling_log else None
+        self.on_scale = on_scale
+        self.heartbeat_interval = heartbeat_interval
+        self.admission = admission
+        self.breaker = breaker
+        self.claim_auto = claim_auto
+        self.worker_prefix = f"{socket.gethostname()}:{os.getpid()}"
+
+        self._running: Dict[int, _Running] = {}
+        self._stopping = False
+        self._claimed = 0
+        self._last_sweep = 0.0
+
+        # İstatistikler
+        self.started_at = 0.0
+        self.slot_busy = [0.0] * limits.max_concurrent
+        self.slot_tasks = [0] * limits.max_concurrent
+        self.wait_times: List[float] = []
+        self.results: Counter = Counter()
+        self.reclaimed: Counter = Counter()
+        self.deferred = 0
+        self.peak_running = 0
+        self.peak_agents = 0
+        self.peak_per_type = 0
+
+    # ------------------------------------------------------------------------
+    # Claim
+    # ------------------------------------------------------------------------
+
+    def claim_filter(self) -> Optional[AgentFilter]:
+        """
+        O anki doluluğa göre claim filtresi; hiçbir task alınamıyorsa None
+
+        Tipi limitine ulaşmış ve circuit'i OPEN olan agent'lar ile (claim_auto
+        kapalıysa) agent'ı atanmamış task'lar dışlanır; farklı tip sayısı
+        doluysa yalnızca zaten çalışan tipler alınır.
+        """
+        by_type = Counter(r.agent for r in self._running.values())
+        exclude = {agent for agent, n in by_type.items() if n >= self.limits.max_per_type}
+        if not self.claim_auto:
+            exclude.add(UNROUTED_AGENT)
+        if self.open_circuits is not None:
+            exclude.update(self.open_circuits())
+        if self.breaker is not None:
+            exclude.update(self.breaker.blocked_agents())
+
+        only = None
+        if len(by_type) >= self.limits.max_agents:
+            only = set(by_type) - exclude
+            if not only:
+                return None
+        return AgentFilter(exclude, only)
+
+    @property
+    def active_slots(self) -> int:
+        """Yeni task alınabilecek slot sayısı"""
+        return self.autoscaler.target if self.autoscaler is not None else self.limits.max_concurrent
+
+    def _free_slot(self) -> Optional[int]:
+        # Küçülmede fazla slot'lardaki task'lar kesilmez; bitince slot kapanır
+        if len(self._running) >= self.active_slots:
+            return None
+        for slot in range(self.limits.max_concurrent):
+            if slot not in self._running:
+                return slot
+        return None
+
+    def _fill(self, max_tasks: Optional[int]) -> int:
+        """Boş slot'ları doldur; başlatılan task sayısı"""
+        started = 0
+        while not self._stopping and (max_tasks is None or self._claimed < max_tasks):
+            slot = self._free_slot()
+            if slot is None:
+                break
+            agent_filter = self.claim_filter()
+            if agent_filter is None:
+                break
+            # Diğer worker'larla paylaşılan in-progress limiti
+            if self.admission is not None and self.admission.room(self.store, "in-progress") == 0:
+                break
+            task = self.store.claim(f"{self.worker_prefix}/slot-{slot}", eligible=agent_filter)
+            if task is None:
+                break
+            if self.breaker is not None and not self.breaker.acquire(task.get("agent"), str(task["id"])):
+                # HALF_OPEN probe hakları başka worker'larda: circuit artık filtrede
+                self.store.move(unclaim(task), "in-progress", "pending")
+                self.deferred += 1
+                continue
+
+            self._claimed += 1
+            created = created_timestamp(task)
+            if created:
+                self.wait_times.append(max(0.0, time.time() - created))
+            self._start(task, slot)
+            started += 1
+        return started
+
+    # ------------------------------------------------------------------------
+    # Process yönetimi
+    # ------------------------------------------------------------------------
+
+    def _start(self, task: Dict[str, Any], slot: int) -> None:
+        self.log_dir.mkdir(parents=True, exist_ok=True)
+        log_file = open(self.log_dir / f"{task['id']}.log", "ab")
+        env = dict(os.environ, ODIN_TASK_ID=str(task["id"]), ODIN_AGENT=str(task.get("agent") or UNROUTED_AGENT))
+        try:
+            proc = subprocess.Popen(
+                build_command(self.command, task),
+                cwd=str(self.project_root),
+                stdin=subprocess.DEVNULL,
+                stdout=log_file,
+                stderr=subprocess.STDOUT,
+                env=env,
+                # Zaman aşımında agent'ın alt process'leri de öldürülebilsin
+                start_new_session=(os.name == "posix"),
+            )
+        except OSError as e:
+            log_file.write(f"Başlatılamadı: {e}\n".encode("utf-8"))
+            log_file.close()
+            self._finish_task(task, None, f"Başlatılamadı: {e}", 0.0)
+            return
+
+        running = _Running(task, slot, proc, log_file)
+        self._running[slot] = running
+        self.emit("start", running)
+
+        by_type = Counter(r.agent for r in self._running.values())
+        self.peak_running = max(self.peak_running, len(self._running))
+        self.peak_agents = max(self.peak_agents, len(by_type))
+        self.peak_per_type = max(self.peak_per_type, max(by_type.values()))
+
+    def _kill(self, running: _Running) -> None:
+        try:
+            if os.name == "posix":
+                os.killpg(running.proc.pid, signal.SIGKILL)
+            else:
+                running.proc.kill()
+        except (ProcessLookupError, PermissionError):
+            pass
+        running.proc.wait()
+
+    def _reap(self) -> int:
+        """Biten / zaman aşımına uğrayan process'leri topla"""
+        finished = 0
+        now = time.monotonic()
+        for slot, running in list(self._running.items()):
+            code = running.proc.poll()
+            timed_out = False
+            if code is None:
+                if not self.task_timeout or now - running.started < self.task_timeout:
+                    continue
+                self._kill(running)
+                code, timed_out = running.proc.returncode, True
+
+            duration = now - running.started
+            del self._running[slot]
+            running.log_file.close()
+            self.slot_busy[slot] += duration
+            self.slot_tasks[slot] += 1
+
+            if running.lost:
+                running.task["status"] = "lost"
+                running.task["duration"] = round(duration, 3)
+                self.results["lost"] += 1
+                if self.breaker is not None:
+                    self.breaker.release(running.agent, str(running.task["id"]))
+                self.emit("finish", running)
+                finished += 1
+                continue
+
+            error = None
+            if timed_out:
+                error = f"Zaman aşımı ({self.task_timeout:g}s)"
+            elif code != 0:
+                error = f"Çıkış kodu {code}: {self._output_tail(running.task['id'])}"
+            self._finish_task(running.task, code, error, duration, timed_out)
+            self.emit("finish", running)
+            finished += 1
+        return finished
+
+    def _output_tail(self, task_id: str) -> str:
+        log_path = self.log_dir / f"{task_id}.log"
+        try:
+            with open(log_path, "rb") as f:
+                f.seek(max(0, log_path.stat().st_size - OUTPUT_TAIL_BYTES))
+                return f.read().decode("utf-8", errors="replace").strip()
+        except OSError:
+            return ""
+
+    def _finish_task(
+        self,
+        task: Dict[str, Any],
+        exit_code: Optional[int],
+        error: Optional[str],
+        duration: float,
+        timed_out: bool = False,
+    ) -> None:
+        """
+        Task'ı sonucuna göre completed / failed'a taşı
+
+        Lease bu arada dolup task başka worker'a geçtiyse (veya pending'e
+        döndüyse) sonuç yazılmaz. Sonuç agent'ın circuit'ine queue kilidi
+        bırakıldıktan sonra kaydedilir.
+        """
+        agent = task.get("agent")
+        with self.store.locked():
+            current = self.store.get("in-progress", task["id"])
+            if current is None or current.get("claimed_by") != task.get("claimed_by"):
+                task["status"] = "lost"
+                self.results["lost"] += 1
+                if self.breaker is not None:
+                    self.breaker.release(agent, str(task["id"]))
+                return
+            # Heartbeat'lerle güncellenen lease alanları da taşınsın
+            task.update(current)
+
+            now = datetime.now().isoformat()
+            task["finished_at"] = now
+            task["exit_code"] = exit_code
+            task["duration"] = round(duration, 3)
+            if error is None:
+                task["status"] = "completed"
+                task["completed_at"] = now
+                target = "completed"
+            else:
+                task["status"] = "failed"
+                task["error"] = error
+                target = "failed"
+            self.store.move(task, "in-progress", target)
+            self.results["timeout" if timed_out else target] += 1
+
+        if self.breaker is not None:
+            self.breaker.record(agent, error is None, duration, token=str(task["id"]))
+
+    # ------------------------------------------------------------------------
+    # Ana döngü
+    # ------------------------------------------------------------------------
+
+    def _heartbeat(self) -> None:
+        """Lease'leri uzat, kaybedilenleri öldür, süresi dolanları geri al"""
+        now = time.monotonic()
+        for running in list(self._running.values()):
+            if running.lost or now - running.heartbeat < self.heartbeat_interval:
+                continue
+            running.heartbeat = now
+            if self.store.heartbeat(running.task["id"], worker_id=running.task.get("claimed_by")) is None:
+                running.lost = True
+                self._kill(running)
+
+        if now - self._last_sweep >= self.heartbeat_interval:
+            self._last_sweep = now
+            for target, ids in self.store.reclaim_expired().items():
+                if ids:
+                    self.reclaimed[target] += len(ids)
+
+    def emit(self, event: str, running: _Running) -> None:
+        if self.on_event is not None:
+            self.on_event(event, running.task, running.slot)
+
+    def _autoscale(self) -> None:
+        event = self.autoscaler.observe(
+            time.monotonic(), len(self._running), lambda: self.store.count("pending")
+        )
+        if event is None:
+            return
+        if self.scaling_log is not None:
+            self.scaling_log.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.scaling_log, "a", encoding="utf-8") as f:
+                f.write(json.dumps(event, ensure_ascii=False) + "\n")
+        if self.on_scale is not None:
+            self.on_scale(event)
+
+    def stop(self) -> None:
+        """Yeni task alma; çalışanların bitmesini bekle"""
+        self._stopping = True
+
+    def run(self, max_tasks: Optional[int] = None, drain: bool = False) -> Dict[str, Any]:
+        """
+        Supervisor döngüsü
+
+        Args:
+            max_tasks: Bu kadar task claim edildikten sonra yeni task alma
+            drain: Alınabilecek task kalmayınca (ve çalışan yoksa) çık
+
+        Returns:
+            summary() istatistikleri
+        """
+        self.started_at = time.monotonic()
+        try:
+            while True:
+                self._heartbeat()
+                self._reap()
+                if self.autoscaler is not None:
+                    self._autoscale()
+                started = self._fill(max_tasks)
+
+                limit_reached = max_tasks is not None and self._claimed >= max_tasks
+                if not self._running and (self._stopping or limit_reached or (drain and not started)):
+                    break
+                if started:
+                    continue
+                time.sleep(REAP_INTERVAL if self._running else self.poll_interval)
+        finally:
+            # Kesintide çalışan process'ler öldürülmez; bitmeleri beklenir
+            while self._running:
+                self._reap()
+                time.sleep(REAP_INTERVAL)
+        return self.summary()
+
+    def unrouted_pending(self) -> int:
+        """Pending'de agent'ı atanmamış task sayısı (sayaçlardan; agent alanı boş olanlar dahil)"""
+        agents = self.store.stats("pending")["agents"]
+        return agents.get(UNROUTED_AGENT, 0) + agents.get("", 0)
+
+    def summary(self) -> Dict[str, Any]:
+        """Slot doluluğu, bekleme süreleri ve sonuç sayıları"""
+        elapsed = max(time.monotonic() - self.started_at, 1e-9) if self.started_at else 0.0
+        slots = [
+            {
+                "slot": slot,
+                "tasks": self.slot_tasks[slot],
+                "busy": round(self.slot_busy[slot], 3),
+                "utilization": round(self.slot_busy[slot] / elapsed, 4) if elapsed else 0.0,
+            }
+            for slot in range(self.limits.max_concurrent)
+        ]
+        wait = {"count": len(self.wait_times)}
+        if self.wait_times:
+            wait.update({
+                "mean": round(statistics.mean(self.wait_times), 3),
+                "p50": round(_percentile(self.wait_times, 50), 3),
+                "p95": round(_percentile(self.wait_times, 95), 3),
+                "max": round(max(self.wait_times), 3),
+            })
+        return {
+            "elapsed": round(elapsed, 3),
+            "limits": self.limits.to_dict(),
+            "claimed": self._claimed,
+            "completed": self.results["completed"],
+            "failed": self.results["failed"],
+            "timeout": self.results["timeout"],
+            "lost": self.results["lost"],
+            "deferred": self.deferred,
+            "reclaimed": dict(self.reclaimed),
+            "utilization": round(sum(s["utilization"] for s in slots) / len(slots), 4) if slots else 0.0,
+            "slots": slots,
+            "wait": wait,
+            "peak": {
+                "running": self.peak_running,
+                "agents": self.peak_agents,
+                "perType": self.peak_per_type,
+            },
+            "scaling": self.autoscaler.summary() if self.autoscaler is not None else None,
+            "unrouted": 0 if self.claim_auto else self.unrouted_pending(),
+        }
+
+
+def create_pool(
+    store: QueueStore,
+    project_root: Path,
+    config: Dict[str, Any],
+    autoscale: Optional[bool] = None,
+    **overrides: Any,
+) -> WorkerPool:
+    """
+    queue.json'dan worker pool oluştur
+
+    Args:
+        autoscale: Autoscaler kullan (None: queue.json > scaling.enabled)
+        overrides: WorkerPool argümanları (None olanlar yok sayılır)
+    """
+    execution = config.get("execution", {})
+    limits = overrides.pop("limits", None) or PoolLimits.from_config(config)
+    if autoscale is None:
+        autoscale = config.get("scaling", {}).get("enabled", False)
+
+    options: Dict[str, Any] = {
+        "limits": limits,
+        "command": execution.get("command", DEFAULT_COMMAND),
+        "task_timeout": config.get("monitoring", {}).get("taskTimeout", 0),
+        "poll_interval": execution.get("pollInterval", DEFAULT_POLL_INTERVAL),
+        "heartbeat_interval": config.get("monitoring", {}).get("heartbeatInterval", DEFAULT_HEARTBEAT_INTERVAL),
+        "admission": AdmissionPolicy.from_config(config),
+        "breaker": CircuitBreaker.from_project(project_root),
+        "claim_auto": execution.get("claimAuto", False),
+    }
+    if autoscale:
+        options["autoscaler"] = Autoscaler(ScalingPolicy.from_config(config), limits.max_concurrent, time.monotonic())
+        options["scaling_log"] = Path(project_root) / ".agent" / "logs" / "scaling.jsonl"
+    options.update({key: value for key, value in overrides.items() if value is not None})
+    return WorkerPool(store, project_root, **options)
@@ -7,18 +7,45 @@ Version: 1.0.0
 Usage: odin <command> [options]
 """
 
+import contextlib
 import json
-import uuid
+import os
+import sys
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, List
+from typing import Iterable, List, Optional
 
-import typer
-from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
-from rich.prompt import Prompt, Confirm
-from rich import print as rprint
+# Paths
+PROJECT_ROOT = Path(__file__).parent.resolve()
+STATE_DIR = PROJECT_ROOT / ".agent" / "state"
+QUEUE_DIR = PROJECT_ROOT / ".agent" / "queue"
+LIBRARY_DIR = PROJECT_ROOT / ".agent" / "library"
+CONFIG_DIR = PROJECT_ROOT / ".agent" / "config"
+SCRIPTS_DIR = PROJECT_ROOT / ".agent" / "scripts"
+
+# .agent/scripts modülleri (queue_store, schemas, ...)
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+if __name__ == "__main__":
+    # Script / hook çağrıları (status --plain, list --plain) typer ve rich
+    # yüklenmeden burada cevaplanır
+    from cli_fast import run_fast
+    _exit_code = run_fast(sys.argv[1:], PROJECT_ROOT)
+    if _exit_code is not None:
+        sys.exit(_exit_code)
+
+import typer  # noqa: E402
+
+from cli_fast import (  # noqa: E402
+    daemon_socket,
+    format_counts,
+    format_pressure,
+    format_stats,
+    format_task,
+    open_store,
+    write_lines,
+)
+from queue_store import QUEUE_STATUSES, create_store, parse_since  # noqa: E402
 
 # CLI app
 app = typer.Typer(
@@ -27,14 +54,29 @@ app = typer.Typer(
     no_args_is_help=True,
 )
 
+
+class _LazyConsole:
+    """rich Console'u ilk kullanımda oluşturur (import maliyeti sadece gerektiğinde)"""
+
+    _console = None
+
+    def __getattr__(self, name):
+        if _LazyConsole._console is None:
+            from rich.console import Console
+            _LazyConsole._console = Console()
+        return getattr(_LazyConsole._console, name)
+
+
 # Console
-console = Console()
+console = _LazyConsole()
 
-# Paths
-PROJECT_ROOT = Path(__file__).parent.resolve()
-STATE_DIR = PROJECT_ROOT / ".agent" / "state"
-QUEUE_DIR = PROJECT_ROOT / ".agent" / "queue"
-LIBRARY_DIR = PROJECT_ROOT / ".agent" / "library"
+PLAIN_HELP = "Makine okunur çıktı (TAB ayrılmış, rich kullanılmaz)"
+
+# Queue limiti dolu olduğunda odin add çıkış kodu (üreticiler ayırt edebilsin)
+EXIT_QUEUE_FULL = 3
+
+# Aynı içerikli aktif görev olduğu için eklenmedi (dedup.policy: reject)
+EXIT_DUPLICATE = 4
 
 # Agent types with circuits
 AGENT_TYPES = [
@@ -51,85 +93,155 @@ def get_queue_file(status: str) -> Path:
     return QUEUE_DIR / f"tasks-{status}.json"
 
 
+def load_queue_config() -> dict:
+    """Queue konfigürasyonunu oku (.agent/config/queue.json)"""
+    config_file = CONFIG_DIR / "queue.json"
+    if config_file.exists():
+        return json.loads(config_file.read_text(encoding="utf-8"))
+    return {}
+
+
+_store = None
+
+
+def get_daemon_socket(config: Optional[dict] = None) -> Path:
+    """Daemon socket yolu (queue.json > daemon.socket)"""
+    return daemon_socket(PROJECT_ROOT, load_queue_config() if config is None else config)
+
+
+def get_store():
+    """
+    Queue store'u al (ilk çağrıda oluşturulur)
+
+    `odin serve` çalışıyorsa istekler daemon'a gider; ODIN_NO_DAEMON=1
+    ile dosyalara doğrudan erişim zorlanabilir.
+    """
+    global _store
+    if _store is None:
+        _store = open_store(PROJECT_ROOT, load_queue_config())
+    return _store
+
+
+def fail(message: str, plain: bool = False, code: int = 1) -> None:
+    """Hata mesajı yaz ve çık (plain modda stderr'e düz metin)"""
+    if plain:
+        sys.stderr.write(f"{message}\n")
+    else:
+        console.print(f"[red]❌ {message}[/red]")
+    raise typer.Exit(code)
+
+
 def load_queue(status: str) -> List[dict]:
-    """Queue dosyasını oku"""
-    queue_file = get_queue_file(status)
-    if queue_file.exists():
-        data = json.loads(queue_file.read_text(encoding="utf-8"))
-        # Queue yapısını kontrol et: {"tasks": [], "metadata": {}} veya []
-        if isinstance(data, dict) and "tasks" in data:
-            return data.get("tasks", [])
-        return data if isinstance(data, list) else []
-    return []
+    """Queue dosyasını oku (snapshot + journal)"""
+    return get_store().load(status)
 
 
 def save_queue(status: str, tasks: List[dict]) -> None:
-    """Queue dosyasını yaz"""
-    queue_file = get_queue_file(status)
-    queue_file.parent.mkdir(parents=True, exist_ok=True)
-
-    # Dosya var mı kontrol et
-    if queue_file.exists():
-        data = json.loads(queue_file.read_text(encoding="utf-8"))
-        # Mevcut yapıyı koru
-        if isinstance(data, dict) and "metadata" in data:
-            data["tasks"] = tasks
-            data["lastUpdated"] = datetime.now().isoformat()
-            queue_file.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8")
-            return
+    """Queue dosyasını tamamen yeniden yaz (journal snapshot'a katlanır)"""
+    get_store().save(status, tasks)
 
-    # Yeni dosya: mevcut formatı kullan
-    from datetime import timezone
-    new_data = {
-        "tasks": tasks,
-        "metadata": {
-            "version": "1.0.0",
-            "lastUpdated": datetime.now(timezone.utc).isoformat(),
-            "description": f"Tasks in {status} status"
-        }
-    }
-    queue_file.write_text(json.dumps(new_data, indent=2, ensure_ascii=False), encoding="utf-8")
+
+def new_task_id() -> str:
+    """Yeni task ID'si (ULID: oluşturma zamanına göre sıralanır)"""
+    from task_ids import new_task_id as new_ulid
+    return new_ulid()
 
 
 def check_circuit(agent_type: str) -> str:
-    """Circuit breaker durumunu kontrol et"""
-    circuits_file = STATE_DIR / "circuits.json"
-    if circuits_file.exists():
-        circuits = json.loads(circuits_file.read_text(encoding="utf-8"))
-        circuit = circuits.get("circuits", {}).get(agent_type, {})
-        return circuit.get("state", "CLOSED")
-    return "CLOSED"
+    """Circuit breaker durumunu kontrol et (dosya değişmediyse bellekten)"""
+    from circuit_breaker import get_circuit_state
+    return get_circuit_state(agent_type, STATE_DIR / "circuits.json")
+
+
+def get_breaker():
+    """Circuit breaker karar motoru (circuits.json + circuit-breaker.json)"""
+    from circuit_breaker import CircuitBreaker
+    return CircuitBreaker.from_project(PROJECT_ROOT)
 
 
 @app.command()
 def add(
-    task: str = typer.Argument(..., help="Görev tanımı"),
+    task: Optional[str] = typer.Argument(None, help="Görev tanımı"),
     agent: Optional[str] = typer.Option(None, "--agent", "-a", help="Agent tipi"),
     priority: Optional[str] = typer.Option("normal", "--priority", "-p", help="Öncelik (low, normal, high, critical)"),
     tags: Optional[str] = typer.Option(None, "--tags", "-t", help="Etiketler (virgülle ayrılmış)"),
+    depends_on: Optional[str] = typer.Option(None, "--depends-on", "-d", help="Önce tamamlanması gereken görev ID'leri (virgülle ayrılmış)"),
+    from_file: Optional[str] = typer.Option(None, "--from-file", "-f", help="JSONL / JSON array dosyasından toplu ekle ('-' = stdin)"),
+    on_full: Optional[str] = typer.Option(None, "--on-full", help="Pending dolu ise: reject, block, shed (varsayılan: admission.policy)"),
+    timeout: Optional[float] = typer.Option(None, "--timeout", help="block politikasında en fazla bekleme (saniye)"),
+    on_duplicate: Optional[str] = typer.Option(None, "--on-duplicate", help="Aynı içerikli aktif görev varsa: reject, merge, allow (varsayılan: dedup.policy)"),
+    near: Optional[bool] = typer.Option(None, "--near/--no-near", help="Vector memory'de benzer görev uyarısı (varsayılan: dedup.nearDuplicate)"),
+    allow_missing_deps: bool = typer.Option(False, "--allow-missing-deps", help="Hiçbir queue'da / arşivde olmayan bağımlılık ID'lerini kabul et (karşılanmış sayılır)"),
+    plain: bool = typer.Option(False, "--plain", help=PLAIN_HELP),
 ):
     """
     Yeni görev ekle.
 
+    queue.json > queue.maxPending doluysa admission.policy uygulanır:
+    reject (reddet), block (yer açılana kadar bekle) veya shed (en son
+    çalışacak görevleri dead-letter'a at; dead-letter maxDeadLetter'da
+    ise reddet). Reddedilen eklemenin çıkış kodu 3'tür.
+
+    Açıklama + agent + payload'ı aynı olan pending / in-progress görev
+    varsa dedup.policy uygulanır: reject (çıkış kodu 4), merge (mevcut
+    göreve birleştir, ID'si yazılır) veya allow.
+
     Example:
         odin add "User authentication system oluştur" --agent backend --priority high
+        odin add "Login testlerini yaz" --agent testing --depends-on abc123
+        odin add --from-file tasks.jsonl
+        odin add "Lint hatalarını düzelt" --plain   # Sadece ID yazar
+        odin add "Rapor üret" --on-full block --timeout 60
+        odin add "Rapor üret" --on-duplicate merge --near
     """
+    try:
+        from admission import AdmissionPolicy
+        from dedup import DedupPolicy
+        config = load_queue_config()
+        admission = AdmissionPolicy.from_config(config, policy=on_full)
+        dedup = DedupPolicy.from_config(config, policy=on_duplicate, near=near)
+    except ValueError as e:
+        fail(str(e), plain)
+
+    if from_file:
+        add_from_file(
+            from_file, plain=plain, admission=admission, timeout=timeout, dedup=dedup,
+            allow_missing_deps=allow_missing_deps,
+        )
+        return
+
+    if not task:
+        fail("Görev tanımı veya --from-file gerekli", plain)
+
     # Agent validate et
     if agent and agent not in AGENT_TYPES:
-        console.print(f"[red]❌ Geçersiz agent tipi: {agent}[/red]")
-        console.print(f"[yellow]Geçerli agent'lar: {', '.join(AGENT_TYPES)}[/yellow]")
-        raise typer.Exit(1)
+        if not plain:
+            console.print(f"[yellow]Geçerli agent'lar: {', '.join(AGENT_TYPES)}[/yellow]")
+        fail(f"Geçersiz agent tipi: {agent}", plain)
 
-    # Circuit kontrolü
+    # Circuit kontrolü (plain modda soru sorulmaz, görev eklenmez)
     if agent:
         circuit_state = check_circuit(agent)
         if circuit_state == "OPEN":
+            if plain:
+                fail(f"Circuit OPEN: {agent} agent bloke", plain)
+            from rich.prompt import Confirm
             console.print(f"[red]🔴 Circuit OPEN: {agent} agent bloke[/red]")
             if not Confirm.ask("Yine de eklemek istiyor musunuz?"):
                 raise typer.Exit(0)
 
+    dependencies = [d.strip() for d in depends_on.split(",") if d.strip()] if depends_on else []
+    store = get_store()
+    missing = missing_dependencies(store, dependencies)
+    if missing and not allow_missing_deps:
+        fail(
+            f"Bilinmeyen bağımlılık: {', '.join(missing)} (hiçbir queue'da veya arşivde yok; "
+            "yine de eklemek için --allow-missing-deps)",
+            plain,
+        )
+
     # Task oluştur
-    task_id = str(uuid.uuid4())[:8]
+    task_id = new_task_id()
     new_task = {
         "id": task_id,
         "description": task,
@@ -139,139 +251,574 @@ def add(
         "status": "pending",
         "created_at": datetime.now().isoformat(),
         "retry_count": 0,
-        "dependencies": [],
+        "dependencies": dependencies,
     }
 
-    # Queue'ya ekle
-    pending_tasks = load_queue("pending")
-    pending_tasks.append(new_task)
-    save_queue("pending", pending_tasks)
+    # Queue'ya ekle (journal'a tek kayıt). Tekrar kontrolü, limit ve ekleme
+    # admit() içinde aynı kilit altında (daemon'da tek istekte) yapılır.
+    result = admit_tasks(store, [new_task], admission, timeout, plain, dedup)
+    if result["duplicates"]:
+        _, dup_status, existing = result["duplicates"][0]
+        if dedup.policy == "reject":
+            fail(f"Aynı içerikli görev zaten {dup_status}: {existing['id']}", plain, EXIT_DUPLICATE)
+        if plain:
+            write_lines([existing["id"]])
+            return
+        action = "birleştirildi" if dup_status == "pending" else "zaten çalışıyor, eklenmedi"
+        console.print(f"[yellow]♻️  Aynı içerikli görev {existing['id']} ({dup_status}): {action}[/yellow]")
+        return
+    if any(t["id"] == task_id for t in result["shed"]):
+        fail(f"Görev eklenmedi: pending dolu ve daha öncelikli görevler var ({task_id} dead-letter'a atıldı)", plain, EXIT_QUEUE_FULL)
+
+    if dedup.near:
+        warn_near_duplicates(new_task, dedup, plain)
+
+    if plain:
+        write_lines([task_id])
+        return
+
+    # Yeni ID'ye henüz kimse bağlı olamayacağından döngü oluşmaz; sadece
+    # bekleyen bağımlılıklar gösterilir
+    waiting = store.blockers(new_task) if dependencies else {}
+    dependency_line = ""
+    if dependencies:
+        dependency_line = "\n[cyan]Bağımlılıklar:[/cyan] " + ", ".join(
+            f"{dep} ({waiting.get(dep) or ('bulunamadı' if dep in missing else 'tamamlandı')})" for dep in dependencies
+        )
 
     # Çıktı
+    from rich.panel import Panel
     console.print(Panel.fit(
         f"[green]✅ Görev eklendi[/green]\n\n"
         f"[cyan]ID:[/cyan] {task_id}\n"
         f"[cyan]Görev:[/cyan] {task}\n"
         f"[cyan]Agent:[/cyan] {agent or 'auto'}\n"
-        f"[cyan]Öncelik:[/cyan] {priority}",
+        f"[cyan]Öncelik:[/cyan] {priority}"
+        f"{dependency_line}",
         title="📋 Yeni Görev",
         border_style="green"
     ))
 
 
+def warn_near_duplicates(task: dict, dedup, plain: bool) -> None:
+    """Vector memory'de benzer görev varsa uyar (ekleme engellenmez)"""
+    from dedup import DEFAULT_STATS_FILE, find_near_duplicates, record_stats
+
+    similar = find_near_duplicates(task, dedup.near_threshold, STATE_DIR / "vector-memory.db")
+    if not similar:
+        return
+    record_stats(STATE_DIR / DEFAULT_STATS_FILE, nearHits=1)
+    for match in similar:
+        if plain:
+            sys.stderr.write(f"near\t{match['id']}\t{match['similarity']:.3f}\t{match['status']}\n")
+        else:
+            console.print(
+                f"[yellow]🔎 Benzer görev: {match['id']} ({match['status']}, %{match['similarity'] * 100:.0f}) "
+                f"{match['description'][:60]}[/yellow]"
+            )
+
+
+def admit_tasks(
+    store,
+    tasks: List[dict],
+    admission,
+    timeout: Optional[float],
+    plain: bool,
+    dedup=None,
+    unique_ids=None,
+) -> dict:
+    """
+    Görevleri tekrar kontrolü + admission politikasıyla ekle; admit() sonucunu döndür
+
+    Tekrar / ID / limit kontrolü eklemeyle aynı kilit altında yapılır (bkz.
+    admission.admit). Queue doluysa ve politika reject / block ise
+    EXIT_QUEUE_FULL ile çıkılır. İsabet / ıska sayıları dedup-stats.json'a eklenir.
+    """
+    from admission import QueueFullError, admit
+    from dedup import DEFAULT_STATS_FILE, merged_count, record_stats
+
+    try:
+        result = admit(store, tasks, admission, timeout=timeout, dedup=dedup, unique_ids=unique_ids)
+    except QueueFullError as e:
+        fail(f"{e} (politika: {admission.policy})", plain, EXIT_QUEUE_FULL)
+
+    if dedup is not None and dedup.policy != "allow":
+        merged = merged_count(result["duplicates"], dedup)
+        record_stats(
+            STATE_DIR / DEFAULT_STATS_FILE,
+            hits=len(result["duplicates"]),
+            misses=len(tasks) - len(result["duplicates"]) - len(result["conflicts"]),
+            merged=merged,
+            rejected=len(result["duplicates"]) - merged,
+        )
+
+    if result["shed"]:
+        incoming = {t["id"] for t in tasks}
+        dropped = [t["id"] for t in result["shed"] if t["id"] not in incoming]
+        if dropped and not plain:
+            console.print(f"[yellow]⚠️  Yer açmak için dead-letter'a atılan: {', '.join(dropped)}[/yellow]")
+        if dropped and plain:
+            sys.stderr.write(f"shed\t{','.join(dropped)}\n")
+    if result["waited"] and not plain:
+        console.print(f"[dim]Pending'de yer açılması {result['waited']:.1f}s beklendi[/dim]")
+    return result
+
+
+def add_from_file(
+    path: str,
+    plain: bool = False,
+    admission=None,
+    timeout: Optional[float] = None,
+    dedup=None,
+    allow_missing_deps: bool = False,
+) -> None:
+    """
+    Toplu görev ekleme: tüm geçerli kayıtlar tek write / transaction ile eklenir
+
+    Tekrarlar hem dosya içinde hem aktif queue'larda aranır; merge
+    politikasında birleştirilir, reject'te hata olarak raporlanır.
+    Kayıtta verilen ID dosyada tekrar ediyorsa, herhangi bir queue'da
+    (completed dahil) veya completed arşivinde zaten varsa kayıt hata
+    olarak raporlanır (arşiv yalnızca ID verilmiş kayıtlar için okunur).
+    Bağımlılık ID'si dosyada, herhangi bir queue'da veya arşivde yoksa kayıt
+    (ve ona bağlı kayıtlar) reddedilir; allow_missing_deps ile kabul edilir.
+    Near-duplicate kontrolü toplu eklemede yapılmaz (kayıt başına embedding).
+    """
+    import time
+    from scheduler import task_dependencies
+    from task_ingest import iter_records, normalize_record
+
+    if path != "-" and not Path(path).exists():
+        fail(f"Dosya bulunamadı: {path}", plain)
+
+    start = time.perf_counter()
+    tasks = []
+    errors = []
+    seen_ids = set()
+    supplied_ids = set()
+
+    try:
+        for line_no, record, parse_error in iter_records(path):
+            if parse_error:
+                errors.append((line_no, parse_error))
+                continue
+            new_task, error = normalize_record(record, new_task_id, AGENT_TYPES)
+            if error:
+                errors.append((line_no, error))
+            elif new_task["id"] in seen_ids:
+                errors.append((line_no, f"Tekrarlanan ID: {new_task['id']}"))
+            else:
+                seen_ids.add(new_task["id"])
+                if record.get("id"):
+                    supplied_ids.add(new_task["id"])
+                tasks.append(new_task)
+    except ValueError as e:
+        errors.append(("?", f"Dosya okunamadı: {e}"))
+
+    if admission is None:
+        from admission import AdmissionPolicy
+        admission = AdmissionPolicy()
+
+    store = get_store()
+    parsed = time.perf_counter()
+    # Döngü kontrolü eklemeyle aynı kilit altında; block politikasında
+    # kilit tutulursa bekleme sırasında queue boşalamazdı (admit kilidi
+    # yalnızca beklerken bırakır)
+    blocking = admission.policy == "block"
+    with store.locked() if not blocking else contextlib.nullcontext():
+        # Arşivlenmiş ID tekrar kullanılırsa completed geçmişinde (list
+        # --archive, vector memory) aynı ID'li iki görev olurdu; rotasyon
+        # store kilidi altında yapıldığından kontrol kilit içinde
+        if supplied_ids:
+            from queue_archive import create_archive
+            archived = create_archive(QUEUE_DIR, load_queue_config()).locate(supplied_ids)
+            for task in tasks:
+                if task["id"] in archived:
+                    errors.append((task["id"], "ID zaten completed arşivinde"))
+            tasks = [t for t in tasks if t["id"] not in archived]
+        if any(task_dependencies(t) for t in tasks):
+            if not allow_missing_deps:
+                tasks = reject_missing_dependencies(store, tasks, errors)
+            tasks = reject_dependency_cycles(store, tasks, errors)
+        # Kayıtta verilen ID herhangi bir queue'da varsa eklenmez (admit
+        # kilit altında locate eder): JSON'da task iki queue'da birden
+        # görünür, SQLite'ta mevcut satırın (ör. completed) üzerine yazılırdı
+        result = admit_tasks(store, tasks, admission, timeout, plain, dedup, unique_ids=supplied_ids)
+    elapsed = time.perf_counter() - start
+
+    for task_id, status in result["conflicts"].items():
+        errors.append((task_id, f"ID zaten {status} queue'sunda"))
+    duplicates = result["duplicates"]
+    if dedup is not None and dedup.policy == "reject":
+        for task, dup_status, existing in duplicates:
+            errors.append((task["id"], f"Aynı içerikli görev zaten {dup_status}: {existing['id']}"))
+    batch_ids = {t["id"] for t in tasks}
+    for task in result["shed"]:
+        if task["id"] in batch_ids:
+            errors.append((task["id"], "Shed: pending dolu, dead-letter'a atıldı"))
+    misses = len(tasks) - len(duplicates) - len(result["conflicts"])
+    tasks = result["tasks"]
+
+    if plain:
+        # Eklenen ID'ler stdout'a, hatalar stderr'e
+        write_lines(task["id"] for task in tasks)
+        for line_no, error in errors:
+            sys.stderr.write(f"{line_no}\t{error}\n")
+        if errors:
+            raise typer.Exit(1)
+        return
+
+    for line_no, error in errors[:50]:
+        console.print(f"[red]❌ Kayıt {line_no}: {error}[/red]")
+    if len(errors) > 50:
+        console.print(f"[red]   ... ve {len(errors) - 50} hata daha[/red]")
+
+    from rich.panel import Panel
+    rate = len(tasks) / elapsed if elapsed > 0 else 0
+    dedup_line = ""
+    if dedup is not None and dedup.policy != "allow":
+        from dedup import merged_count
+        merged = merged_count(duplicates, dedup)
+        dedup_line = (
+            f"[yellow]♻️  {len(duplicates)} tekrar (hit), {misses} yeni (miss)"
+            f"{f', {merged} birleştirildi' if merged else ''}[/yellow]\n"
+        )
+    console.print(Panel.fit(
+        f"[green]✅ {len(tasks)} görev eklendi[/green]\n"
+        f"[red]❌ {len(errors)} kayıt hatalı[/red]\n"
+        f"{dedup_line}\n"
+        f"[cyan]Okuma + validasyon:[/cyan] {parsed - start:.2f}s\n"
+        f"[cyan]Yazma:[/cyan] {elapsed - (parsed - start):.2f}s\n"
+        f"[cyan]Hız:[/cyan] {rate:.0f} görev/sn",
+        title="📋 Toplu Ekleme",
+        border_style="green" if not errors else "yellow"
+    ))
+
+    if errors:
+        raise typer.Exit(1)
+
+
+def missing_dependencies(store, dependencies: Iterable[str]) -> List[str]:
+    """
+    Hiçbir queue'da ve completed arşivinde olmayan bağımlılık ID'leri
+
+    Scheduler bulunamayan bağımlılığı karşılanmış sayar (tamamlanıp
+    silinmiş olabilir); ekleme sırasında yazım hatası veya hiç var olmamış
+    ID'ler bu yüzden ayıklanır. Arşiv yalnızca queue'larda bulunamayan ID
+    varsa okunur.
+    """
+    wanted = set(dependencies)
+    if wanted:
+        wanted -= set(store.locate(wanted))
+    if wanted:
+        from queue_archive import create_archive
+        wanted -= create_archive(QUEUE_DIR, load_queue_config()).locate(wanted)
+    return sorted(wanted)
+
+
+def reject_missing_dependencies(store, tasks: List[dict], errors: List[tuple]) -> List[dict]:
+    """
+    Bilinmeyen bağımlılığı olan kayıtları ayıkla
+
+    Bağımlılık aynı dosyadaki bir kayıt olabilir; reddedilen kayda bağlı
+    kayıtlar da reddedilir (bağımlılıkları bulunamaz olurdu).
+    """
+    from scheduler import task_dependencies
+
+    batch_ids = {t["id"] for t in tasks}
+    missing = set(missing_dependencies(
+        store, {d for t in tasks for d in task_dependencies(t) if d not in batch_ids}
+    ))
+    rejected = {}
+    changed = bool(missing)
+    while changed:
+        changed = False
+        for task in tasks:
+            if task["id"] in rejected:
+                continue
+            unknown = [d for d in task_dependencies(task) if d in missing]
+            bad = next((d for d in task_dependencies(task) if d in rejected), None)
+            if unknown:
+                rejected[task["id"]] = f"Bilinmeyen bağımlılık: {', '.join(unknown)}"
+            elif bad is not None:
+                rejected[task["id"]] = f"Reddedilen göreve bağımlı: {bad}"
+            else:
+                continue
+            changed = True
+
+    for task in tasks:
+        if task["id"] in rejected:
+            errors.append((task["id"], rejected[task["id"]]))
+    return [t for t in tasks if t["id"] not in rejected]
+
+
+def reject_dependency_cycles(store, tasks: List[dict], errors: List[tuple]) -> List[dict]:
+    """
+    Bağımlılık döngüsü oluşturacak kayıtları ayıkla
+
+    Döngüdeki kayıtlar ve (dolaylı olarak) onlara bağlı kayıtlar reddedilir;
+    reddedilen bir göreve bağlı kayıt eklenseydi bağımlılığı yok sayılırdı.
+    """
+    from scheduler import task_dependencies
+
+    graph = store.dependency_graph()
+    for task in tasks:
+        graph.put(task, "pending")
+
+    batch_ids = {t["id"] for t in tasks}
+    rejected = {}
+    for cycle in graph.cycles():
+        for task_id in cycle:
+            if task_id in batch_ids:
+                rejected[task_id] = "Bağımlılık döngüsü: " + " → ".join(cycle + cycle[:1])
+
+    changed = bool(rejected)
+    while changed:
+        changed = False
+        for task in tasks:
+            if task["id"] in rejected:
+                continue
+            bad = next((d for d in task_dependencies(task) if d in rejected), None)
+            if bad is not None:
+                rejected[task["id"]] = f"Reddedilen göreve bağımlı: {bad}"
+                changed = True
+
+    for task in tasks:
+        if task["id"] in rejected:
+            errors.append((task["id"], rejected[task["id"]]))
+    return [t for t in tasks if t["id"] not in rejected]
+
+
+# odin list sütunları: (başlık, genişlik, stil)
+# Görev sütununun genişliği (0) terminalden hesaplanır (bkz. list_columns)
+LIST_COLUMNS = [("ID", 26, "cyan"), ("Görev", 0, "white"), ("Agent", 15, "blue"), ("Öncelik", 8, "yellow"), ("Tarih", 19, "dim")]
+MIN_DESCRIPTION_WIDTH = 24
+MAX_DESCRIPTION_WIDTH = 80
+PRIORITY_STYLES = {"critical": "red", "high": "dark_orange", "normal": "white", "low": "dim"}
+
+
+def list_columns(width: Optional[int] = None) -> List[tuple]:
+    """
+    Terminal genişliğine sığan liste sütunları
+
+    Görev sütunu kalan genişliği alır (en fazla MAX_DESCRIPTION_WIDTH).
+    MIN_DESCRIPTION_WIDTH'e sığmıyorsa Tarih sütunu gösterilmez; 80
+    sütunluk terminalde satır kaydırılmaz.
+    """
+    import shutil
+
+    width = width or shutil.get_terminal_size().columns
+    columns = LIST_COLUMNS
+    fixed = sum(w for _, w, _ in columns) + len(columns) - 1
+    if width - fixed < MIN_DESCRIPTION_WIDTH:
+        columns = columns[:-1]
+        fixed = sum(w for _, w, _ in columns) + len(columns) - 1
+    description = max(MIN_DESCRIPTION_WIDTH, min(MAX_DESCRIPTION_WIDTH, width - fixed))
+    return [(name, w or description, style) for name, w, style in columns]
+
+
+def format_list_row(values: List[str], styles: List[str], columns: List[tuple]) -> str:
+    """Sabit genişlikli liste satırı (rich markup); columns'ta olmayan değerler atlanır"""
+    from rich.markup import escape
+
+    cells = []
+    for value, (_, width, _), style in zip(values, columns, styles):
+        text = value if len(value) <= width else value[:width - 3] + "..."
+        cells.append(f"[{style}]{escape(text.ljust(width))}[/{style}]")
+    return " ".join(cells)
+
+
 @app.command()
 def list(
     status: Optional[str] = typer.Option("pending", "--status", "-s", help="Queue durumu (pending, in-progress, completed, failed, dead-letter)"),
+    limit: int = typer.Option(0, "--limit", "-n", help="En fazla kaç görev (0: hepsi)"),
+    offset: int = typer.Option(0, "--offset", help="Atlanacak görev sayısı"),
+    since: Optional[str] = typer.Option(None, "--since", help="Bu tarihten sonra oluşturulanlar (2h, 7d, 2024-01-31)"),
+    agent: Optional[str] = typer.Option(None, "--agent", "-a", help="Agent tipine göre filtrele"),
+    priority: Optional[str] = typer.Option(None, "--priority", "-p", help="Önceliğe göre filtrele"),
+    tag: Optional[str] = typer.Option(None, "--tag", "-t", help="Etikete göre filtrele"),
+    include_archive: bool = typer.Option(False, "--archive", help="Arşivlenmiş tamamlanmış görevleri de listele (--since aralığındaki segment'ler)"),
+    plain: bool = typer.Option(False, "--plain", help=PLAIN_HELP),
 ):
     """
     Queue listele.
 
+    Görevler okundukça yazdırılır; queue tamamen belleğe alınmaz.
+    --archive ile completed arşivinden yalnızca --since aralığıyla kesişen
+    segment'ler okunur.
+
     Example:
         odin list --status pending
-        odin list -s in-progress
+        odin list -s completed --since 1d --limit 50
+        odin list -s completed --agent backend --tag auth --offset 100 -n 100
+        odin list -s completed --archive --since 30d
+        odin list --plain            # id, agent, öncelik, tarih, görev (TAB ayrılmış)
     """
-    valid_statuses = ["pending", "in-progress", "completed", "failed", "dead-letter"]
+    valid_statuses = QUEUE_STATUSES
     if status not in valid_statuses:
-        console.print(f"[red]❌ Geçersiz durum: {status}[/red]")
-        console.print(f"[yellow]Geçerli durumlar: {', '.join(valid_statuses)}[/yellow]")
-        raise typer.Exit(1)
-
-    tasks = load_queue(status)
+        if not plain:
+            console.print(f"[yellow]Geçerli durumlar: {', '.join(valid_statuses)}[/yellow]")
+        fail(f"Geçersiz durum: {status}", plain)
+    if limit < 0 or offset < 0:
+        fail("--limit ve --offset negatif olamaz", plain)
+
+    try:
+        since_ts = parse_since(since) if since else None
+    except ValueError as e:
+        fail(str(e), plain)
+
+    if include_archive and status != "completed":
+        fail("--archive sadece --status completed ile kullanılabilir", plain)
+
+    store = get_store()
+    if include_archive:
+        from itertools import chain, islice
+        from queue_archive import create_archive
+        from queue_store import task_matches
+
+        # Yarıda kalmış rotasyondan dolayı hem arşivde hem sıcak queue'da
+        # duran görevler bir kez listelenir
+        hot_ids = {str(t.get("id")) for t in store.iter_query(status)}
+        archived = create_archive(QUEUE_DIR, load_queue_config()).iter_tasks(since=since_ts, exclude_ids=hot_ids)
+        matches = chain(
+            # Segment'ler tamamlanma zamanına göre elenir; --since oluşturma
+            # zamanına uygulanır (oluşturma <= tamamlanma olduğundan güvenli)
+            (t for t in archived if task_matches(t, agent, priority, tag, since_ts)),
+            store.iter_query(status, agent=agent, priority=priority, tag=tag, since=since_ts),
+        )
+        tasks = islice(matches, offset, offset + limit if limit else None)
+    else:
+        tasks = store.iter_query(
+            status,
+            agent=agent,
+            priority=priority,
+            tag=tag,
+            limit=limit or None,
+            offset=offset,
+            since=since_ts,
+        )
 
-    if not tasks:
-        console.print(f"[yellow]⚠️  {status} queue'si boş[/yellow]")
+    if plain:
+        write_lines(format_task(task) for task in tasks)
         return
 
-    # Tablo oluştur
-    table = Table(title=f"📋 Queue: {status}")
-    table.add_column("ID", style="cyan", width=8)
-    table.add_column("Görev", style="white", width=50)
-    table.add_column("Agent", style="blue", width=15)
-    table.add_column("Öncelik", style="yellow", width=10)
-    table.add_column("Tarih", style="dim", width=20)
-
+    shown = 0
     for task in tasks:
-        priority_style = {
-            "critical": "[red]CRITICAL[/red]",
-            "high": "[orange]HIGH[/orange]",
-            "normal": "[white]NORMAL[/white]",
-            "low": "[dim]LOW[/dim]",
-        }.get(task["priority"], task["priority"])
-
-        table.add_row(
-            task["id"],
-            task["description"][:47] + "..." if len(task["description"]) > 50 else task["description"],
-            task["agent"],
-            priority_style,
-            task["created_at"][:19],
-        )
+        if shown == 0:
+            console.print(f"\n[bold]📋 Queue: {status}[/bold]")
+            columns = list_columns()
+            console.print(format_list_row([c[0] for c in columns], ["bold"] * len(columns), columns), highlight=False)
+
+        task_priority = str(task.get("priority", ""))
+        console.print(format_list_row(
+            [
+                str(task.get("id", "")),
+                str(task.get("description", "")),
+                str(task.get("agent", "")),
+                task_priority.upper(),
+                str(task.get("created_at") or task.get("createdAt") or "")[:19],
+            ],
+            [c[2] for c in LIST_COLUMNS[:3]] + [PRIORITY_STYLES.get(task_priority, "yellow"), "dim"],
+            columns,
+        ), highlight=False)
+        shown += 1
+
+    if not shown:
+        console.print(f"[yellow]⚠️  {status} queue'sinde eşleşen görev yok[/yellow]")
+        return
 
-    console.print(table)
-    console.print(f"\n[dim]Toplam: {len(tasks)} görev[/dim]")
+    console.print(f"\n[dim]Gösterilen: {shown} görev[/dim]")
+    if limit and shown == limit:
+        console.print(f"[dim]💡 Sonraki sayfa: --offset {offset + limit} --limit {limit}[/dim]")
 
 
 @app.command()
 def kick(
-    task_id: Optional[str] = typer.Argument(None, help="Görev ID (boş bırakılırsa ilk pending görev)"),
+    task_id: Optional[str] = typer.Argument(None, help="Görev ID (boş bırakılırsa en öncelikli pending görev)"),
+    worker: Optional[str] = typer.Option(None, "--worker", "-w", help="Worker ID (varsayılan: host:pid)"),
+    plain: bool = typer.Option(False, "--plain", help=PLAIN_HELP),
 ):
     """
     Görevi başlat (queue'dan agent'e gönder).
 
-    Example:
-        odin kick           # İlk pending görevi başlat
-        odin kick abc123    # Spesifik görevi başlat
-    """
-    pending_tasks = load_queue("pending")
+    Claim atomiktir: aynı anda çalışan birden fazla worker aynı görevi alamaz.
+    ID verilmezse öncelik sırasıyla seçilir; bekleyen görevler queue.json >
+    queue.agingInterval saniyede bir öncelik seviyesi kazanır. Bağımlılıkları
+    (dependencies) tamamlanmamış görevler ve circuit'i OPEN olan agent'ların
+    görevleri atlanır. Bekleme süresi dolmuş circuit'te görev HALF_OPEN
+    probe'u olarak başlatılır (circuit-breaker.json > halfOpenMaxCalls).
 
-    if not pending_tasks:
-        console.print("[yellow]⚠️  Bekleyen görev yok[/yellow]")
-        return
+    Alınan görev monitoring.heartbeatTimeout saniyelik bir lease taşır;
+    'odin heartbeat' ile uzatılmazsa görev pending'e geri döner.
+    queue.maxInProgress doluysa yeni görev alınmaz (çıkış kodu 3).
 
-    # Task seç
-    if task_id:
-        # ID'ye göre bul
-        task_to_kick = None
-        for i, task in enumerate(pending_tasks):
-            if task["id"] == task_id:
-                task_to_kick = task
-                index = i
-                break
-
-        if not task_to_kick:
-            console.print(f"[red]❌ Görev bulunamadı: {task_id}[/red]")
+    Example:
+        odin kick                    # En öncelikli uygun görevi başlat
+        odin kick abc123             # Spesifik görevi başlat
+        odin kick --worker worker-1  # Worker ID ile claim
+        odin kick --plain            # Alınan görevi TAB ayrılmış tek satır yazar
+    """
+    import socket
+
+    from admission import AdmissionPolicy
+
+    store = get_store()
+    worker_id = worker or f"{socket.gethostname()}:{os.getpid()}"
+
+    if AdmissionPolicy.from_config(load_queue_config()).room(store, "in-progress") == 0:
+        fail("in-progress limiti dolu (queue.maxInProgress); çalışan görevlerin bitmesini bekleyin", plain, EXIT_QUEUE_FULL)
+
+    breaker = get_breaker()
+    task_to_kick = store.claim(worker_id, task_id=task_id, eligible=lambda task: breaker.allows(task.get("agent")))
+
+    if task_to_kick and not breaker.acquire(task_to_kick.get("agent"), task_to_kick["id"]):
+        # Probe hakkını başka bir worker aldı: görev sıraya geri döner
+        from queue_store import unclaim
+        store.move(unclaim(task_to_kick), "in-progress", "pending")
+        fail(f"Circuit HALF_OPEN: {task_to_kick.get('agent')} agent'ının probe hakları dolu", plain)
+
+    if not task_to_kick:
+        if task_id:
+            blocked = store.get("pending", task_id)
+            if not blocked:
+                fail(f"Görev bulunamadı: {task_id}", plain)
+            waiting = store.blockers(blocked)
+            if waiting:
+                reason = "Bağımlılıklar bitmedi: " + ", ".join(f"{dep} ({stat})" for dep, stat in waiting.items())
+            else:
+                reason = f"Circuit OPEN: {blocked.get('agent')} agent bloke"
+            if plain:
+                fail(reason, plain)
+            console.print(f"[red]🔴 {reason}[/red]")
+            console.print("[yellow]💡 Alternatif: 'odin kick' ile sıradaki uygun görevi dene[/yellow]")
             raise typer.Exit(1)
-    else:
-        # İlk görev
-        task_to_kick = pending_tasks[0]
-        index = 0
-
-    # Circuit kontrolü
-    agent = task_to_kick.get("agent")
-    if agent and agent != "auto":
-        circuit_state = check_circuit(agent)
-        if circuit_state == "OPEN":
-            console.print(f"[red]🔴 Circuit OPEN: {agent} agent bloke[/red]")
-            console.print(f"[yellow]💡 Alternatif: 'odin kick {pending_tasks[1]['id']}' ile diğer görevi dene[/yellow]")
+        if store.count("pending"):
+            reason = "Bekleyen görevlerin hiçbiri başlatılamıyor (bağımlılık bekliyor veya agent circuit'i OPEN)"
+            if plain:
+                fail(reason, plain)
+            console.print(f"[red]🔴 {reason}[/red]")
+            console.print("[yellow]💡 Bağımlılıkları görmek için: odin graph[/yellow]")
             raise typer.Exit(1)
+        if not plain:
+            console.print("[yellow]⚠️  Bekleyen görev yok[/yellow]")
+        return
 
-    # Task'ı pending'den sil, in-progress'e ekle
-    pending_tasks.pop(index)
-    save_queue("pending", pending_tasks)
-
-    task_to_kick["status"] = "in-progress"
-    task_to_kick["started_at"] = datetime.now().isoformat()
+    if plain:
+        write_lines([format_task(task_to_kick)])
+        return
 
-    in_progress_tasks = load_queue("in-progress")
-    in_progress_tasks.append(task_to_kick)
-    save_queue("in-progress", in_progress_tasks)
+    agent = task_to_kick.get("agent")
 
     # Çıktı
+    from rich.panel import Panel
     console.print(Panel.fit(
         f"[green]🚀 Görev başlatıldı[/green]\n\n"
         f"[cyan]ID:[/cyan] {task_to_kick['id']}\n"
         f"[cyan]Görev:[/cyan] {task_to_kick['description']}\n"
         f"[cyan]Agent:[/cyan] {agent or 'auto'}\n"
-        f"[cyan]Öncelik:[/cyan] {task_to_kick['priority']}\n\n"
+        f"[cyan]Öncelik:[/cyan] {task_to_kick['priority']}\n"
+        f"[cyan]Worker:[/cyan] {worker_id}\n"
+        f"[cyan]Lease:[/cyan] {task_to_kick.get('lease_expires_at', '')[:19]} (uzatmak için: odin heartbeat {task_to_kick['id']})\n\n"
         f"[dim]💡 Agent'in görevi tamamlamasını bekleyin veya 'odin list --status in-progress' ile takip edin[/dim]",
         title="⚡ Görev Başlatıldı",
         border_style="green"
@@ -279,16 +826,292 @@ def kick(
 
 
 @app.command()
-def status():
-    """Tüm queue durumlarını göster"""
+def complete(
+    task_id: str = typer.Argument(..., help="Görev ID"),
+    result: Optional[str] = typer.Option(None, "--result", "-r", help="Sonuç özeti"),
+    plain: bool = typer.Option(False, "--plain", help=PLAIN_HELP),
+):
+    """
+    Görevi tamamlandı olarak işaretle.
+
+    Görev in-progress (veya pending) queue'sundan completed'a taşınır; bu
+    göreve bağlı olup artık tüm bağımlılıkları biten görevler çalışmaya
+    hazır hale gelir. Başlatılmış görevin başarısı agent'ın circuit'ine
+    kaydedilir.
+
+    Example:
+        odin complete abc123
+        odin complete abc123 --result "PR #42 açıldı"
+        odin complete abc123 --plain   # Hazır hale gelen görev ID'lerini yazar
+    """
+    store = get_store()
+    source = next((stat for stat in ("in-progress", "pending") if store.get(stat, task_id)), None)
+    if source is None:
+        fail(f"Görev bulunamadı (in-progress / pending): {task_id}", plain)
+
+    task = store.get(source, task_id)
+    task["status"] = "completed"
+    task["completed_at"] = datetime.now().isoformat()
+    if result:
+        task["result"] = result
+
+    store.move(task, source, "completed")
+
+    # Tüm graf kurulmaz: yalnızca bu göreve bağlı pending görevlere bakılır
+    unblocked, waiting = [], []
+    for dependent in store.dependents(task_id):
+        (waiting if store.blockers(dependent) else unblocked).append(str(dependent["id"]))
+
+    if source == "in-progress":
+        from scheduler import parse_timestamp
+        started = parse_timestamp(task.get("started_at"))
+        duration = max(0.0, datetime.now().timestamp() - started) if started else 0.0
+        get_breaker().record(task.get("agent"), True, duration, token=task_id)
+
+    if plain:
+        write_lines(unblocked)
+        return
+
+    console.print(f"[green]✅ Görev tamamlandı: {task_id}[/green]")
+    for dependent in unblocked:
+        console.print(f"  [cyan]🔓 Hazır:[/cyan] {dependent}")
+    if waiting:
+        console.print(f"  [dim]Hâlâ başka bağımlılık bekleyen: {', '.join(waiting)}[/dim]")
+
+
+@app.command()
+def heartbeat(
+    task_id: str = typer.Argument(..., help="Görev ID"),
+    worker: Optional[str] = typer.Option(None, "--worker", "-w", help="Sadece görev bu worker'daysa uzat"),
+    plain: bool = typer.Option(False, "--plain", help=PLAIN_HELP),
+):
+    """
+    In-progress görevin lease'ini uzat.
+
+    Lease monitoring.heartbeatTimeout saniye uzatılır (görev başladıktan
+    sonra monitoring.taskTimeout'u aşamaz). Görev artık in-progress değilse
+    (lease dolup geri alındıysa) veya başka worker'daysa çıkış kodu 1'dir.
+
+    Example:
+        odin heartbeat abc123
+        odin heartbeat abc123 --worker worker-1 --plain   # Yeni bitiş zamanını yazar
+    """
+    expires = get_store().heartbeat(task_id, worker_id=worker)
+    if expires is None:
+        fail(f"Lease uzatılamadı (görev in-progress değil veya başka worker'da): {task_id}", plain)
+
+    until = datetime.fromtimestamp(expires).isoformat(timespec="seconds")
+    if plain:
+        write_lines([until])
+        return
+    console.print(f"[green]💓 Lease uzatıldı: {task_id} → {until}[/green]")
+
+
+@app.command()
+def reclaim(
+    plain: bool = typer.Option(False, "--plain", help=PLAIN_HELP),
+):
+    """
+    Lease'i dolan in-progress görevleri geri al.
+
+    Görevler retry_count artırılarak pending'e döner; queue.maxRetries
+    (veya görevin maxRetries alanı) aşıldıysa dead-letter'a taşınır.
+    'odin serve' ve 'odin run' bunu periyodik olarak kendisi yapar.
+
+    Example:
+        odin reclaim
+        odin reclaim --plain   # <queue>TAB<id> satırları
+    """
+    reclaimed = get_store().reclaim_expired()
+
+    if plain:
+        write_lines(f"{status}\t{task_id}" for status, ids in reclaimed.items() for task_id in ids)
+        return
+
+    if not any(reclaimed.values()):
+        console.print("[green]✅ Süresi dolmuş lease yok[/green]")
+        return
+    for task_id in reclaimed["pending"]:
+        console.print(f"[yellow]♻️  Pending'e döndü:[/yellow] {task_id}")
+    for task_id in reclaimed["dead-letter"]:
+        console.print(f"[red]💀 Dead-letter:[/red] {task_id}")
+
+
+@app.command()
+def ready(
+    limit: int = typer.Option(0, "--limit", "-n", help="En fazla kaç görev (0: hepsi)"),
+    plain: bool = typer.Option(False, "--plain", help=PLAIN_HELP),
+):
+    """
+    Çalışmaya hazır görevleri listele.
+
+    Bağımlılıklarının tamamı bitmiş pending görevler, 'odin kick' ile
+    alınacakları sırayla gösterilir.
+
+    Example:
+        odin ready
+        odin ready -n 5 --plain
+    """
+    if limit < 0:
+        fail("--limit negatif olamaz", plain)
+
+    tasks = get_store().ready(limit or None)
+
+    if plain:
+        write_lines(format_task(task) for task in tasks)
+        return
+
+    if not tasks:
+        console.print("[yellow]⚠️  Çalışmaya hazır görev yok[/yellow]")
+        return
+
+    console.print("\n[bold]🟢 Hazır Görevler[/bold]")
+    columns = list_columns()
+    console.print(format_list_row([c[0] for c in columns], ["bold"] * len(columns), columns), highlight=False)
+    for task in tasks:
+        task_priority = str(task.get("priority", ""))
+        console.print(format_list_row(
+            [
+                str(task.get("id", "")),
+                str(task.get("description", "")),
+                str(task.get("agent", "")),
+                task_priority.upper(),
+                str(task.get("created_at") or task.get("createdAt") or "")[:19],
+            ],
+            [c[2] for c in LIST_COLUMNS[:3]] + [PRIORITY_STYLES.get(task_priority, "yellow"), "dim"],
+            columns,
+        ), highlight=False)
+    console.print(f"\n[dim]Hazır: {len(tasks)} görev[/dim]")
+
+
+@app.command()
+def graph(
+    task_id: Optional[str] = typer.Argument(None, help="Sadece bu görevin bağımlılıkları"),
+    plain: bool = typer.Option(False, "--plain", help=PLAIN_HELP),
+):
+    """
+    Pending görevlerin bağımlılık grafını göster.
+
+    Her görev için durum (hazır / bekliyor / döngü) ve bekletilen
+    bağımlılıklar listelenir. Döngü varsa çıkış kodu 1'dir.
+
+    Example:
+        odin graph
+        odin graph abc123
+        odin graph --plain   # '<id>\\t<durum>\\t<bekleyen bağımlılıklar>' + 'cycle\\t<id'ler>'
+    """
+    store = get_store()
+    dependency_graph = store.dependency_graph()
+    cycles = dependency_graph.cycles()
+    in_cycle = {member for cycle in cycles for member in cycle}
+
+    if task_id is not None:
+        ids = [task_id]
+        if dependency_graph.status_of(task_id) != "pending":
+            fail(f"Pending görev bulunamadı: {task_id}", plain)
+    else:
+        ids = dependency_graph.pending_ids()
+
+    rows = []
+    for node in ids:
+        waiting = {dep: dependency_graph.status_of(dep) for dep in dependency_graph.dependencies(node)}
+        waiting = {dep: stat for dep, stat in waiting.items() if stat is not None}
+        if node in in_cycle:
+            state = "cycle"
+        elif dependency_graph.is_ready(node):
+            state = "ready"
+        else:
+            state = "waiting"
+        rows.append((node, state, waiting))
+
+    if plain:
+        write_lines(
+            [f"{node}\t{state}\t{','.join(waiting)}" for node, state, waiting in rows]
+            + [f"cycle\t{','.join(cycle)}" for cycle in cycles]
+        )
+        if cycles:
+            raise typer.Exit(1)
+        return
+
+    if not rows:
+        console.print("[yellow]⚠️  Pending görev yok[/yellow]")
+        return
+
+    # Bitmemiş queue'da olmayan bağımlılık completed'da / arşivde değilse
+    # hiç var olmamış (ya da silinmiş) demektir; tamamlandı gösterilmez
+    missing = set(missing_dependencies(store, {
+        dep for node, _, waiting in rows for dep in dependency_graph.dependencies(node) if dep not in waiting
+    }))
+    styles = {"ready": "green", "waiting": "yellow", "cycle": "red"}
+    labels = {"ready": "hazır", "waiting": "bekliyor", "cycle": "döngü"}
+    console.print("\n[bold cyan]🔗 Bağımlılık Grafı[/bold cyan]\n")
+    for node, state, waiting in rows:
+        style = styles[state]
+        console.print(f"  [{style}]{labels[state]:9}[/{style}] [cyan]{node}[/cyan]")
+        for dep in dependency_graph.dependencies(node):
+            if dep in waiting:
+                console.print(f"  {'':9}   └─ {dep} [dim]({waiting[dep]})[/dim]")
+            elif dep in missing:
+                console.print(f"  {'':9}   └─ [yellow]{dep} (bulunamadı)[/yellow]")
+            else:
+                console.print(f"  {'':9}   └─ [dim]{dep} (tamamlandı)[/dim]")
+        if task_id is not None:
+            for dependent in dependency_graph.dependents(node):
+                console.print(f"  {'':9}   ◀─ {dependent} [dim](bu göreve bağlı)[/dim]")
+
+    counts = {state: sum(1 for _, s, _ in rows if s == state) for state in styles}
+    console.print(
+        f"\n  [green]Hazır: {counts['ready']}[/green]  "
+        f"[yellow]Bekliyor: {counts['waiting']}[/yellow]  "
+        f"[red]Döngüde: {counts['cycle']}[/red]"
+    )
+    for cycle in cycles:
+        console.print(f"  [red]🔁 Döngü: {' → '.join(cycle + cycle[:1])}[/red]")
+    if cycles:
+        raise typer.Exit(1)
+
+
+@app.command()
+def status(
+    detail: bool = typer.Option(False, "--detail", "-d", help="Agent ve öncelik kırılımlarını göster"),
+    recount: bool = typer.Option(False, "--recount", help="Sayaçları task'lardan yeniden hesapla (onarım)"),
+    plain: bool = typer.Option(False, "--plain", help=PLAIN_HELP),
+):
+    """
+    Tüm queue durumlarını göster.
+
+    Sayılar store'un tuttuğu sayaçlardan okunur; queue dosyaları taranmaz.
+    Sayaçlar bozulduysa --recount ile task'lardan yeniden hesaplanır.
+
+    Example:
+        odin status
+        odin status --detail  # Agent / öncelik kırılımları
+        odin status --recount # Sayaçları onar
+        odin status --plain   # '<durum>\\t<sayı>' satırları (typer / rich yüklenmez)
+    """
+    store = get_store()
+    if recount:
+        for stat in QUEUE_STATUSES:
+            store.recount(stat)
+        if not plain:
+            console.print("[green]✅ Sayaçlar yeniden hesaplandı[/green]")
+
+    stats = {stat: store.stats(stat) for stat in QUEUE_STATUSES} if detail else None
+    counts = {stat: stats[stat]["total"] for stat in QUEUE_STATUSES} if stats else store.counts()
+
+    if plain:
+        write_lines(format_counts(counts))
+        if stats:
+            write_lines(line for stat in QUEUE_STATUSES for line in format_stats(stat, stats[stat]))
+        return
+
     console.print("\n[bold cyan]📊 Queue Durumları[/bold cyan]\n")
 
-    statuses = ["pending", "in-progress", "completed", "failed", "dead-letter"]
+    statuses = QUEUE_STATUSES
     total = 0
 
     for stat in statuses:
-        tasks = load_queue(stat)
-        count = len(tasks)
+        count = counts.get(stat, 0)
         total += count
 
         # Renkler
@@ -306,31 +1129,410 @@ def status():
 
         console.print(f"  [{color}]{stat:15}[/{color}] [{color}]{bar}[/{color}] [white]{count:3}[/white]")
 
+        if stats and count:
+            agents = ", ".join(f"{agent or '-'}: {n}" for agent, n in stats[stat]["agents"].items())
+            priorities = ", ".join(f"P{rank}: {n}" for rank, n in stats[stat]["priorities"].items())
+            console.print(f"  [dim]{'':15} agent    {agents}[/dim]")
+            console.print(f"  [dim]{'':15} öncelik  {priorities}[/dim]")
+
     console.print(f"\n  [dim]{'─' * 65}[/dim]")
     console.print(f"  [bold]{'TOPLAM':15}[/bold] [white]{total:46}[/white]\n")
 
+    from admission import AdmissionPolicy, queue_pressure
+    try:
+        pressure = queue_pressure(counts, AdmissionPolicy.from_config(load_queue_config()))
+    except ValueError:
+        return
+    if pressure["level"] != "ok":
+        full = ", ".join(f"{stat} {q['count']}/{q['limit']}" for stat, q in pressure["queues"].items() if q["state"] != "ok")
+        style = "red" if pressure["level"] == "full" else "yellow"
+        console.print(f"  [{style}]🚦 Backpressure: {pressure['level']} ({full})[/{style}]\n")
+
 
 @app.command()
-def scan():
-    """Proje tara ve context güncelle"""
-    import subprocess
+def backpressure(
+    plain: bool = typer.Option(False, "--plain", help=PLAIN_HELP),
+):
+    """
+    Queue doluluğu ve backpressure seviyesi.
+
+    Limitler queue.json > queue.max* alanlarından okunur. Seviye: ok,
+    slow (bir queue admission.highWatermark oranını aştı; üreticiler
+    yavaşlamalı) veya full (bir queue limitte).
+
+    Example:
+        odin backpressure
+        odin backpressure --plain   # 'level\t<seviye>' + queue satırları (typer / rich yüklenmez)
+    """
+    from admission import AdmissionPolicy
+    from admission import backpressure as queue_backpressure
+
+    try:
+        admission = AdmissionPolicy.from_config(load_queue_config())
+    except ValueError as e:
+        fail(str(e), plain)
+    pressure = queue_backpressure(get_store(), admission)
+
+    if plain:
+        write_lines(format_pressure(pressure))
+        return
+
+    styles = {"ok": "green", "slow": "yellow", "full": "red"}
+    console.print(f"\n[bold]🚦 Backpressure:[/bold] [{styles[pressure['level']]}]{pressure['level']}[/{styles[pressure['level']]}]"
+                  f" [dim](politika: {admission.policy})[/dim]\n")
+    for stat, q in pressure["queues"].items():
+        style = styles[q["state"]]
+        bar = "█" * min(30, int(q["ratio"] * 30))
+        console.print(
+            f"  {stat:15} [{style}]{bar:30}[/{style}] {q['count']:>6}/{q['limit']:<6} "
+            f"[{style}]{q['ratio']:.0%}[/{style}]"
+        )
+    console.print()
+
+
+@app.command()
+def dedup(
+    reset: bool = typer.Option(False, "--reset", help="Sayaçları sıfırla"),
+    plain: bool = typer.Option(False, "--plain", help=PLAIN_HELP),
+):
+    """
+    Görev tekrarı (dedup) istatistikleri.
+
+    hits: aktif bir görevle aynı içerikli eklemeler, misses: yeni görevler,
+    nearHits: vector memory'de benzeri bulunan eklemeler.
+
+    Example:
+        odin dedup
+        odin dedup --plain   # 'anahtar\tdeğer' satırları
+        odin dedup --reset
+    """
+    from dedup import DEFAULT_STATS_FILE, STAT_KEYS, DedupPolicy, hit_rate, read_stats
+
+    stats_file = STATE_DIR / DEFAULT_STATS_FILE
+    if reset:
+        stats_file.unlink(missing_ok=True)
+    stats = read_stats(stats_file)
+    rate = hit_rate(stats)
+
+    if plain:
+        write_lines([*(f"{key}\t{stats[key]}" for key in STAT_KEYS), f"hitRate\t{rate:.4f}"])
+        return
+
+    try:
+        policy = DedupPolicy.from_config(load_queue_config())
+    except ValueError as e:
+        fail(str(e), plain)
+    console.print(f"\n[bold]♻️  Dedup:[/bold] politika {policy.policy}"
+                  f"{f', near ≥ {policy.near_threshold:g}' if policy.near else ''}\n")
+    rows = [
+        ("Hit", "green", stats["hits"]),
+        ("Miss", "cyan", stats["misses"]),
+        ("Birleştirilen", "yellow", stats["merged"]),
+        ("Reddedilen", "red", stats["rejected"]),
+        ("Near hit", "blue", stats["nearHits"]),
+    ]
+    for label, style, value in rows:
+        console.print(f"  [{style}]{label + ':':15}[/{style}] {value}")
+    console.print(f"  [bold]{'Hit oranı:':15}[/bold] {rate:.1%}\n")
+
+
+@app.command()
+def compact():
+    """Queue journal'larını snapshot dosyalarına katla"""
+    store = get_store()
+    for stat in QUEUE_STATUSES:
+        store.compact(stat)
+    console.print("[green]✅ Queue journal'ları snapshot'a katlandı[/green]")
+
+
+@app.command()
+def export(
+    output_dir: Optional[Path] = typer.Option(None, "--dir", "-d", help="Çıktı dizini (varsayılan: .agent/queue)"),
+):
+    """
+    Aktif queue backend'ini tasks-<status>.json dosyalarına aktar.
+
+    SQLite backend kullanılırken queue.sh / dashboard.sh gibi JSON okuyan
+    script'ler için.
+    """
+    exported = get_store().export_json(output_dir or QUEUE_DIR)
+    for path in exported:
+        console.print(f"[green]✅ {path}[/green]")
 
-    console.print("[cyan]🔍 Proje taranıyor...[/cyan]")
 
-    result = subprocess.run(
-        ["python", ".agent/scripts/scanner.py"],
-        cwd=PROJECT_ROOT,
-        capture_output=True,
-        text=True
+@app.command()
+def archive(
+    window: Optional[int] = typer.Option(None, "--window", "-w", help="Sıcak queue'da tutulacak süre (saniye, varsayılan: queue.json > archive.window)"),
+    segments: bool = typer.Option(False, "--segments", help="Sadece segment listesini göster"),
+):
+    """
+    Eski tamamlanmış görevleri sıkıştırılmış arşiv segment'lerine taşı.
+
+    queue.json > archive.enabled açıksa 'odin update' ve 'odin serve' bunu
+    archive.rotateInterval saniyede bir otomatik yapar.
+
+    Example:
+        odin archive               # archive.window'dan eski görevleri taşı
+        odin archive --window 0    # Tüm tamamlanmış görevleri taşı
+        odin archive --segments    # Segment'leri listele
+    """
+    from queue_archive import DEFAULT_WINDOW, create_archive
+
+    config = load_queue_config()
+    task_archive = create_archive(QUEUE_DIR, config)
+
+    if not segments:
+        if window is None:
+            window = config.get("archive", {}).get("window", DEFAULT_WINDOW)
+        result = task_archive.rotate(get_store(), window)
+        console.print(
+            f"[green]✅ {result['archived']} görev arşivlendi[/green] "
+            f"[dim]({result['kept']} görev sıcak queue'da)[/dim]"
+        )
+
+    rows = task_archive.segments()
+    if not rows:
+        console.print("[yellow]⚠️  Arşiv segment'i yok[/yellow]")
+        return
+
+    console.print(f"\n[bold]🗄️  Arşiv: {task_archive.archive_dir}[/bold]")
+    for segment in rows:
+        console.print(
+            f"  [cyan]{segment['key']:10}[/cyan] [white]{segment['count']:7}[/white] görev  "
+            f"[dim]{segment.get('bytes', 0) / 1024:8.1f} KB  {segment['file']}[/dim]",
+            highlight=False,
+        )
+
+
+@app.command()
+def serve(
+    stop: bool = typer.Option(False, "--stop", help="Çalışan daemon'u durdur"),
+):
+    """
+    Queue daemon'unu başlat (ön planda çalışır).
+
+    Daemon queue'ları, circuit durumlarını ve agent kayıtlarını bellekte
+    tutar; mutasyonlar journal / WAL'a yazılır, snapshot'lar queue.json >
+    daemon.snapshotInterval saniyede bir alınır. Lease'i dolan in-progress
+    task'lar daemon.leaseSweepInterval saniyede bir geri alınır. Daemon
+    çalışırken add, list, kick ve status komutları socket üzerinden ona bağlanır.
+
+    Example:
+        odin serve &        # Arka planda başlat
+        odin serve --stop   # Durdur
+    """
+    import socket
+
+    if not hasattr(socket, "AF_UNIX"):
+        console.print("[red]❌ Bu platform Unix socket desteklemiyor[/red]")
+        raise typer.Exit(1)
+
+    from queue_daemon import DEFAULT_LEASE_SWEEP_INTERVAL, DEFAULT_SNAPSHOT_INTERVAL, DaemonClient, run_daemon
+
+    config = load_queue_config()
+    socket_path = get_daemon_socket(config)
+    client = DaemonClient(socket_path)
+    info = client.ping()
+
+    if stop:
+        if info is None:
+            console.print("[yellow]⚠️  Çalışan daemon yok[/yellow]")
+            return
+        client.request("shutdown")
+        console.print(f"[green]✅ Daemon durduruldu (pid {info['pid']})[/green]")
+        return
+
+    if info is not None:
+        console.print(f"[yellow]⚠️  Daemon zaten çalışıyor (pid {info['pid']}): {socket_path}[/yellow]")
+        raise typer.Exit(1)
+
+    snapshot_interval = config.get("daemon", {}).get("snapshotInterval", DEFAULT_SNAPSHOT_INTERVAL)
+    lease_sweep_interval = config.get("daemon", {}).get("leaseSweepInterval", DEFAULT_LEASE_SWEEP_INTERVAL)
+    console.print(f"[green]🛰️  Queue daemon başlatıldı (pid {os.getpid()}): {socket_path}[/green]")
+    from circuit_breaker import load_config as load_circuit_config
+    from queue_archive import maybe_rotate
+
+    run_daemon(
+        create_store(QUEUE_DIR, config),
+        socket_path,
+        STATE_DIR / "circuits.json",
+        STATE_DIR / "agents.json",
+        snapshot_interval=snapshot_interval,
+        maintenance=lambda store: maybe_rotate(store, QUEUE_DIR, config),
+        lease_sweep_interval=lease_sweep_interval,
+        circuit_config=load_circuit_config(PROJECT_ROOT),
     )
+    console.print("[dim]Daemon kapandı[/dim]")
 
-    if result.returncode == 0:
-        console.print("[green]✅ Tarama tamamlandı[/green]")
-        console.print(result.stdout)
-    else:
+
+@app.command()
+def run(
+    parallel: Optional[int] = typer.Option(None, "--parallel", "-j", help="Eşzamanlı task (varsayılan: execution.maxConcurrentTasks)"),
+    agents: Optional[int] = typer.Option(None, "--agents", help="Eşzamanlı agent tipi (varsayılan: execution.maxParallelAgents)"),
+    per_type: Optional[int] = typer.Option(None, "--per-type", help="Tip başına eşzamanlı task (varsayılan: execution.maxAgentsPerType)"),
+    command: Optional[str] = typer.Option(None, "--command", "-c", help="Agent komutu; {agent}, {id}, {task} yer tutucuları"),
+    timeout: Optional[float] = typer.Option(None, "--timeout", help="Task zaman aşımı, saniye (varsayılan: monitoring.taskTimeout)"),
+    max_tasks: int = typer.Option(0, "--max-tasks", "-n", help="Bu kadar task aldıktan sonra dur (0: sınırsız)"),
+    drain: bool = typer.Option(False, "--drain", help="Alınabilecek task kalmayınca çık"),
+    autoscale: Optional[bool] = typer.Option(None, "--autoscale/--no-autoscale", help="Slot sayısını yüke göre ayarla (varsayılan: scaling.enabled)"),
+    claim_auto: Optional[bool] = typer.Option(None, "--claim-auto/--no-claim-auto", help="Agent'ı 'auto' olan görevleri de al (varsayılan: execution.claimAuto)"),
+    plain: bool = typer.Option(False, "--plain", help=PLAIN_HELP),
+):
+    """
+    Worker pool'u çalıştır: task'ları claim edip agent'lara paralel dağıt.
+
+    queue.json > execution limitleri uygulanır: toplam eşzamanlı task
+    (maxConcurrentTasks), farklı agent tipi (maxParallelAgents) ve tip
+    başına task (maxAgentsPerType). Başarılı task'lar completed'a, hatalı
+    veya zaman aşımına uğrayanlar failed'a taşınır. Ctrl+C yeni task
+    almayı durdurur; çalışanların bitmesi beklenir.
+
+    --autoscale ile slot sayısı minWorkers'tan başlar; pending derinliği
+    ve slot kullanımına göre queue.json > scaling kurallarıyla büyür /
+    küçülür. Kararlar .agent/logs/scaling.jsonl dosyasına yazılır.
+
+    Çalışan task'ların lease'leri monitoring.heartbeatInterval saniyede bir
+    uzatılır; lease'i kaybedilen task'ın process'i durdurulur.
+
+    --agent'sız eklenen ('auto') görevler alınmaz; agent'ı orchestrator
+    atar (odin kick). Komut 'auto'yu yönlendiriyorsa --claim-auto.
+
+    Example:
+        odin run --drain
+        odin run --autoscale
+        odin run -j 4 --per-type 2
+        odin run --command "python stub_agent.py {agent} {task}" --drain --plain
+    """
+    import signal
+
+    from worker_pool import PoolLimits, create_pool
+
+    def on_event(event: str, task: dict, slot: int) -> None:
+        if plain:
+            write_lines([f"{event}\t{slot}\t{task['id']}\t{task.get('agent') or 'auto'}\t{task.get('status')}"])
+        elif event == "start":
+            console.print(f"[blue]▶ slot {slot:2}[/blue] [cyan]{task['id']}[/cyan] {task.get('agent') or 'auto'}")
+        else:
+            style = "green" if task.get("status") == "completed" else "red"
+            console.print(
+                f"[{style}]■ slot {slot:2}[/{style}] [cyan]{task['id']}[/cyan] "
+                f"{task.get('status')} [dim]({task.get('duration', 0):.1f}s)[/dim]"
+            )
+
+    def on_scale(event: dict) -> None:
+        if plain:
+            write_lines([f"scale\t{event['action']}\t{event['from']}\t{event['to']}\t{event['reason']}"])
+        else:
+            style = "magenta" if event["action"] == "scale-up" else "dim"
+            console.print(f"[{style}]⇅ {event['action']}: {event['from']} → {event['to']} slot ({event['reason']})[/{style}]")
+
+    config = load_queue_config()
+    try:
+        defaults = PoolLimits.from_config(config)
+        limits = PoolLimits(
+            parallel or defaults.max_concurrent,
+            agents or defaults.max_agents,
+            per_type or defaults.max_per_type,
+        )
+        pool = create_pool(
+            get_store(), PROJECT_ROOT, config, autoscale=autoscale,
+            limits=limits, command=command, task_timeout=timeout, on_event=on_event, on_scale=on_scale,
+            claim_auto=claim_auto,
+        )
+    except ValueError as e:
+        fail(str(e), plain)
+
+    def _stop(signum, frame):
+        pool.stop()
+
+    signal.signal(signal.SIGINT, _stop)
+    signal.signal(signal.SIGTERM, _stop)
+
+    if not plain:
+        limits = pool.limits
+        console.print(
+            f"[green]🏭 Worker pool: {limits.max_concurrent} slot, {limits.max_agents} agent tipi, "
+            f"tip başına {limits.max_per_type}[/green]"
+        )
+        if pool.autoscaler is not None:
+            console.print(f"[dim]Autoscale: {pool.active_slots} slot ile başlıyor[/dim]")
+
+    summary = pool.run(max_tasks=max_tasks or None, drain=drain)
+
+    if plain:
+        write_lines(
+            [f"summary\t{key}\t{summary[key]}" for key in ("claimed", "completed", "failed", "timeout", "lost", "deferred", "unrouted", "elapsed", "utilization")]
+            + [f"wait\t{key}\t{value}" for key, value in summary["wait"].items()]
+            + [f"slot\t{s['slot']}\t{s['tasks']}\t{s['busy']}\t{s['utilization']}" for s in summary["slots"]]
+            + [f"reclaimed\t{target}\t{n}" for target, n in summary["reclaimed"].items()]
+        )
+        if summary["scaling"]:
+            scaling = summary["scaling"]
+            write_lines(
+                [f"scaling\t{key}\t{scaling[key]}" for key in ("target", "min", "max", "slotSeconds")]
+                + [f"scaling\t{action}\t{n}" for action, n in scaling["events"].items()]
+            )
+        return
+
+    from rich.table import Table
+
+    table = Table(title="Slot Kullanımı")
+    table.add_column("Slot", justify="right")
+    table.add_column("Task", justify="right")
+    table.add_column("Meşgul (s)", justify="right")
+    table.add_column("Kullanım", justify="right")
+    for s in summary["slots"]:
+        table.add_row(str(s["slot"]), str(s["tasks"]), f"{s['busy']:.1f}", f"{s['utilization']:.0%}")
+    console.print(table)
+
+    wait = summary["wait"]
+    console.print(
+        f"\n[bold]Sonuç:[/bold] {summary['claimed']} task, "
+        f"[green]{summary['completed']} completed[/green], [red]{summary['failed']} failed[/red], "
+        f"[red]{summary['timeout']} zaman aşımı[/red] ({summary['elapsed']:.1f}s, "
+        f"ortalama kullanım {summary['utilization']:.0%})"
+    )
+    if wait["count"]:
+        console.print(
+            f"[bold]Queue bekleme:[/bold] ortalama {wait['mean']:.1f}s, p50 {wait['p50']:.1f}s, "
+            f"p95 {wait['p95']:.1f}s, max {wait['max']:.1f}s"
+        )
+    if summary["unrouted"]:
+        console.print(
+            f"[bold]Agent'sız:[/bold] [yellow]{summary['unrouted']} 'auto' görev pending'de "
+            f"(agent'ı orchestrator atar; --claim-auto ile alınır)[/yellow]"
+        )
+    if summary["deferred"]:
+        console.print(f"[bold]Circuit:[/bold] [yellow]{summary['deferred']} task probe hakkı olmadığı için pending'e bırakıldı[/yellow]")
+    if summary["lost"] or summary["reclaimed"]:
+        reclaimed = ", ".join(f"{target}: {n}" for target, n in summary["reclaimed"].items()) or "yok"
+        console.print(
+            f"[bold]Lease:[/bold] [yellow]{summary['lost']} task lease'i kaybedildi[/yellow], "
+            f"geri alınan: {reclaimed}"
+        )
+    if summary["scaling"]:
+        scaling = summary["scaling"]
+        events = ", ".join(f"{action}: {n}" for action, n in scaling["events"].items()) or "yok"
+        console.print(
+            f"[bold]Autoscale:[/bold] {scaling['min']}-{scaling['max']} slot (son: {scaling['target']}), "
+            f"{scaling['slotSeconds']:.0f} slot·sn, olaylar: {events}"
+        )
+
+
+@app.command()
+def scan():
+    """Proje tara ve context güncelle (tam tarama; scan manifest'i yeniden kurulur)"""
+    from scanner import update_scan
+
+    console.print("[cyan]🔍 Proje taranıyor...[/cyan]")
+
+    try:
+        update_scan(str(PROJECT_ROOT), force=True, verbose=True)
+    except OSError as e:
         console.print("[red]❌ Tarama başarısız[/red]")
-        console.print(result.stderr)
+        console.print(str(e))
         raise typer.Exit(1)
+    console.print("[green]✅ Tarama tamamlandı[/green]")
 
 
 @app.command()
@@ -375,6 +1577,10 @@ def agents():
     """Tüm agent tiplerini listele"""
     console.print("\n[bold cyan]🤖 Agent Tipleri[/bold cyan]\n")
 
+    from circuit_breaker import DEFAULT_STATE, get_all_circuits
+
+    circuits = get_all_circuits(STATE_DIR / "circuits.json")
+
     # Kategorilere göre分组
     categories = {
         "Core": ["orchestrator", "planner", "analyst"],
@@ -387,7 +1593,7 @@ def agents():
     for category, agents in categories.items():
         console.print(f"  [bold yellow]{category}[/bold yellow]")
         for agent in agents:
-            circuit_state = check_circuit(agent)
+            circuit_state = circuits.get(agent, {}).get("state", DEFAULT_STATE)
             circuit_icon = {
                 "CLOSED": "[green]✓[/green]",
                 "OPEN": "[red]✗[/red]",
@@ -399,52 +1605,57 @@ def agents():
 
 
 @app.command()
-def update():
-    """Active context ve memory dosyalarını güncelle"""
-    import subprocess
+def update(
+    full: bool = typer.Option(False, "--full", help="Scan manifest'ini yok say, tüm projeyi yeniden tara"),
+):
+    """
+    Active context ve memory dosyalarını güncelle.
+
+    Tarama artımlıdır (.agent/state/scan-manifest.json): yalnızca mtime'ı
+    değişen dizinler yeniden listelenir. active_context.md yalnızca queue
+    özeti veya tarama sonucu değiştiyse yeniden yazılır.
+    """
+    import re
+
+    from scanner import update_scan
 
     console.print("[cyan]🔄 Context güncelleniyor...[/cyan]\n")
 
-    # 1. Scanner çalıştır
+    # 1. Scanner (process içinde, artımlı)
     console.print("[dim]1. Proje taranıyor...[/dim]")
-    result = subprocess.run(
-        ["python", ".agent/scripts/scanner.py"],
-        cwd=PROJECT_ROOT,
-        capture_output=True,
-        text=True
-    )
-
-    if result.returncode != 0:
+    try:
+        scan_results, rescanned = update_scan(str(PROJECT_ROOT), force=full)
+    except OSError as e:
         console.print("[red]❌ Scanner başarısız[/red]")
-        console.print(result.stderr)
+        console.print(str(e))
         return
+    if not rescanned:
+        console.print("[dim]   Tarama sonucu değişmedi, context.md güncel[/dim]")
 
     # 2. Queue durumlarını al
     console.print("[dim]2. Queue durumları alınıyor...[/dim]")
-    statuses = ["pending", "in-progress", "completed", "failed", "dead-letter"]
-    queue_summary = {}
-    for stat in statuses:
-        tasks = load_queue(stat)
-        queue_summary[stat] = len(tasks)
+    from queue_archive import maybe_rotate
+
+    store = get_store()
+    rotated = maybe_rotate(store, QUEUE_DIR, load_queue_config())
+    if rotated and rotated["archived"]:
+        console.print(f"[dim]   {rotated['archived']} tamamlanmış görev arşivlendi[/dim]")
+    queue_summary = store.counts()
 
     # 3. Active context güncelle
     console.print("[dim]3. Active context güncelleniyor...[/dim]")
     active_file = STATE_DIR / "active_context.md"
 
-    # Mevcut içeriği oku
-    if active_file.exists():
-        content = active_file.read_text(encoding="utf-8")
-    else:
-        content = "# Active Context - Canlı Hafıza\n\n"
-
     # Tarih ve saat güncelle
     now = datetime.now()
     timestamp = now.strftime("%Y-%m-%d %H:%M")
+    scanned_at = str(scan_results.get("scan_date") or now.isoformat())[:16].replace("T", " ")
 
     # Güncel durum
     total_tasks = sum(queue_summary.values())
 
-    new_content = f"""# Active Context - Canlı Hafıza
+    def render(timestamp: str) -> str:
+        return f"""# Active Context - Canlı Hafıza
 
 > **Son Güncelleme:** {timestamp}
 > **Otomatik güncelleme** - `odin update`
@@ -486,7 +1697,7 @@ python odin.py active
 
 ### Proje Bilgileri
 - **Proje:** ODIN AI Agent System v1.0.0
-- **Scanner:** Son tarama {timestamp}
+- **Scanner:** Son tarama {scanned_at}
 - **Toplam Görev:** {total_tasks}
 - **Agent Sayısı:** 25 specialized agent
 
@@ -495,12 +1706,19 @@ python odin.py active
 **Bu dosya `odin update` komutu ile otomatik güncellenir.**
 """
 
-    active_file.parent.mkdir(parents=True, exist_ok=True)
-    active_file.write_text(new_content, encoding="utf-8")
-
-    console.print("[green]✅ Active context güncellendi[/green]\n")
+    # Girdiler (queue özeti, tarama) değişmediyse dosya yeniden yazılmaz
+    previous = active_file.read_text(encoding="utf-8") if active_file.exists() else None
+    previous_stamp = re.search(r"\*\*Son Güncelleme:\*\* (.+)", previous or "")
+    if previous_stamp and render(previous_stamp.group(1)) == previous:
+        timestamp = previous_stamp.group(1)
+        console.print("[green]✅ Active context zaten güncel[/green]\n")
+    else:
+        active_file.parent.mkdir(parents=True, exist_ok=True)
+        active_file.write_text(render(timestamp), encoding="utf-8")
+        console.print("[green]✅ Active context güncellendi[/green]\n")
 
     # 4. Özet göster
+    from rich.panel import Panel
     console.print(Panel.fit(
         f"[green]✅ Güncelleme tamamlandı[/green]\n\n"
         f"[cyan]Timestamp:[/cyan] {timestamp}\n"
@@ -514,6 +1732,7 @@ python odin.py active
 @app.command()
 def version():
     """Versiyon bilgisi"""
+    from rich.panel import Panel
     console.print(Panel.fit(
         "[bold cyan]🪦 ODIN AI Agent System[/bold cyan]\n\n"
         "[dim]Version:[/dim] [white]1.0.0[/white]\n"